@@ -58,7 +58,15 @@ class Config:
     """Run browser in headless mode (default: true)"""
     
     MAX_CONCURRENT_REQUESTS = int(os.getenv('MAX_CONCURRENT_REQUESTS', '3'))
-    """Maximum concurrent scraping requests (default: 3)"""
+    """Maximum concurrent scraping requests, e.g. Sportsbet match pages in flight (default: 3, 1 = sequential)"""
+    
+    BLOCK_HEAVY_ASSETS = os.getenv('BLOCK_HEAVY_ASSETS', 'true').lower() == 'true'
+    """Abort image/font/media and third-party analytics requests in Playwright contexts (default: true)"""
+    
+    BLOCKED_RESOURCE_TYPES = [
+        t.strip() for t in os.getenv('BLOCKED_RESOURCE_TYPES', 'image,font,media').split(',') if t.strip()
+    ]
+    """Playwright resource types aborted when BLOCK_HEAVY_ASSETS is on (default: image,font,media)"""
     
     # ========================================================================
     # Retry Configuration
@@ -75,8 +83,8 @@ class Config:
     # ========================================================================
     # API Configuration
     # ========================================================================
-    DATABALLR_BASE_URL = os.getenv('DATABALLR_BASE_URL', 'https://www.databallr.com')
-    """Base URL for DataBallr API"""
+    DATABALLR_BASE_URL = os.getenv('DATABALLR_BASE_URL', 'https://databallr.com')
+    """Base URL for DataBallr (player pages live under /last-games/)"""
     
     DATABALLR_API_KEY = os.getenv('DATABALLR_API_KEY', '')
     """API key for DataBallr (if required)"""
@@ -84,6 +92,24 @@ class Config:
     SPORTSBET_BASE_URL = os.getenv('SPORTSBET_BASE_URL', 'https://www.sportsbet.com.au')
     """Base URL for Sportsbet"""
     
+    SPORTSBET_CAPTURE_NETWORK = os.getenv('SPORTSBET_CAPTURE_NETWORK', 'false').lower() == 'true'
+    """Build Sportsbet markets/insights/team stats from captured JSON responses, HTML parsing as fallback (default: false)"""
+    
+    STATMUSE_BASE_URL = os.getenv('STATMUSE_BASE_URL', 'https://www.statmuse.com')
+    """Base URL for StatMuse"""
+    
+    STATMUSE_HTTP_FAST_PATH = os.getenv('STATMUSE_HTTP_FAST_PATH', 'true').lower() == 'true'
+    """Fetch server-rendered StatMuse pages over plain HTTP, browser only when the table is missing (default: true)"""
+    
+    LOCAL_SITE_SERVER = os.getenv('LOCAL_SITE_SERVER', '').rstrip('/')
+    """Local stand-in server (e.g. http://127.0.0.1:8765, see scrapers/site_server.py).
+    When set, the Sportsbet/StatMuse/DataBallr base URLs point at it."""
+    
+    if LOCAL_SITE_SERVER:
+        SPORTSBET_BASE_URL = f"{LOCAL_SITE_SERVER}/sportsbet"
+        STATMUSE_BASE_URL = f"{LOCAL_SITE_SERVER}/statmuse"
+        DATABALLR_BASE_URL = f"{LOCAL_SITE_SERVER}/databallr"
+    
     # ========================================================================
     # Caching Configuration
     # ========================================================================
@@ -103,6 +129,42 @@ class Config:
     CACHE_TTL_ROLE = int(os.getenv('CACHE_TTL_ROLE', '48'))
     """TTL for role data (hours, default: 48)"""
     
+    GAME_LOG_INCREMENTAL_REFRESH = os.getenv('GAME_LOG_INCREMENTAL_REFRESH', 'true').lower() == 'true'
+    """Refresh expired game logs by merging only games newer than the cache (default: true)"""
+    
+    CACHE_STALE_WHILE_REVALIDATE = os.getenv('CACHE_STALE_WHILE_REVALIDATE', 'true').lower() == 'true'
+    """Serve recently expired cache entries (stale=True) while a background refresh runs (default: true)"""
+    
+    HOT_CACHE_MAX_ENTRIES = int(os.getenv('HOT_CACHE_MAX_ENTRIES', '5000'))
+    """Max entries in DataCache's in-memory LRU tier (default: 5000)"""
+    
+    HOT_CACHE_MAX_MB = float(os.getenv('HOT_CACHE_MAX_MB', '64'))
+    """Approximate memory bound of DataCache's in-memory LRU tier in MB (default: 64)"""
+    
+    NEGATIVE_CACHE_ENABLED = os.getenv('NEGATIVE_CACHE_ENABLED', 'true').lower() == 'true'
+    """Remember players a source could not find/resolve and skip that source until the entry expires (default: true)"""
+    
+    NEGATIVE_CACHE_NOT_FOUND_TTL = float(os.getenv('NEGATIVE_CACHE_NOT_FOUND_TTL', '6'))
+    """How long a "not found on source" entry skips that source (hours, default: 6)"""
+    
+    NEGATIVE_CACHE_UNRESOLVED_TTL = float(os.getenv('NEGATIVE_CACHE_UNRESOLVED_TTL', '12'))
+    """How long an "ID unresolved" entry skips that source (hours, default: 12)"""
+    
+    CACHE_SWEEP_INTERVAL_HOURS = float(os.getenv('CACHE_SWEEP_INTERVAL_HOURS', '0'))
+    """Delete expired cache rows in the background every N hours while the pipeline runs (default: 0 = off)"""
+    
+    CACHE_GAME_LOG_SEASONS = int(os.getenv('CACHE_GAME_LOG_SEASONS', '2'))
+    """Seasons of stored game logs the sweep keeps, counting back from the newest cached season (default: 2, 0 = all)"""
+    
+    CACHE_GAME_LOG_RETENTION_DAYS = float(os.getenv('CACHE_GAME_LOG_RETENTION_DAYS', '30'))
+    """Sweep a player's stored game log when it has not been refreshed for N days (default: 30, never below the max staleness; 0 = keep)"""
+    
+    WARMUP_TIME_BUDGET_SECONDS = float(os.getenv('WARMUP_TIME_BUDGET_SECONDS', '900'))
+    """Time budget of one pre-slate cache warm-up pass (seconds, default: 900)"""
+    
+    PLAYER_INDEX_AUTO_BUILD = os.getenv('PLAYER_INDEX_AUTO_BUILD', 'true').lower() == 'true'
+    """Recompile data/cache/player_index.db when its source JSON files change (default: true; false = read the JSON instead)"""
+    
     # Market-specific tier thresholds
     MARKET_TIER_THRESHOLDS = {
         "player_prop": {"A": 65, "B": 50, "C": 35},
@@ -179,6 +241,12 @@ class Config:
     LOGS_DIR = Path(os.getenv('LOGS_DIR', 'logs'))
     """Directory for log files"""
     
+    FIXTURES_DIR = Path(os.getenv('FIXTURES_DIR', 'data/fixtures'))
+    """Directory for recorded page fixtures (see scrapers/fixtures.py)"""
+    
+    FIXTURE_MODE = os.getenv('FIXTURE_MODE', 'off').lower()
+    """Fixture mode: off (live), record (live + save pages) or replay (read saved pages, no network)"""
+    
     # ========================================================================
     # Validation
     # ========================================================================
@@ -198,6 +266,9 @@ class Config:
         if cls.RETRY_MAX_ATTEMPTS < 1:
             errors.append(f"RETRY_MAX_ATTEMPTS must be at least 1, got {cls.RETRY_MAX_ATTEMPTS}")
         
+        if cls.MAX_CONCURRENT_REQUESTS < 1:
+            errors.append(f"MAX_CONCURRENT_REQUESTS must be at least 1, got {cls.MAX_CONCURRENT_REQUESTS}")
+        
         if cls.SCRAPER_TIMEOUT < 1000:
             errors.append(f"SCRAPER_TIMEOUT must be at least 1000ms, got {cls.SCRAPER_TIMEOUT}")
         
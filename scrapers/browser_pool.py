@@ -0,0 +1,390 @@
+"""
+Shared Browser Pool
+===================
+Long-lived Chromium browser/context that hands out pages to the scrapers.
+
+Launching Chromium is the slowest part of a cold scrape. Before the pool,
+a 12-game slate paid for 13 launches (overview + one per match). The pool
+launches once, keeps one context warm and recycles pages between matches.
+
+Usage:
+    from scrapers.browser_pool import BrowserPool
+
+    with BrowserPool(headless=True) as pool:
+        games = scrape_nba_overview(pool=pool)
+        for game in games:
+            data = scrape_match_complete(game['url'], pool=pool)
+        print(pool.get_stats())
+"""
+
+import logging
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Any, List, Optional, Callable, Iterable, Tuple
+
+from playwright.sync_api import sync_playwright, Browser, BrowserContext, Page
+
+from scrapers.request_blocking import install_request_blocking
+
+logger = logging.getLogger(__name__)
+
+
+# ---------------------------------------------------------------------
+# Browser / Context Defaults
+# ---------------------------------------------------------------------
+LAUNCH_ARGS = [
+    '--disable-blink-features=AutomationControlled',
+    '--disable-dev-shm-usage',
+    '--no-sandbox',
+    '--disable-setuid-sandbox',
+    '--disable-web-security'
+]
+
+CONTEXT_OPTIONS = {
+    'viewport': {'width': 1920, 'height': 1080},
+    'user_agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'locale': 'en-AU',
+    'timezone_id': 'Australia/Sydney',
+    'extra_http_headers': {
+        'Accept-Language': 'en-AU,en;q=0.9',
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+        'Accept-Encoding': 'gzip, deflate, br',
+        'DNT': '1',
+        'Connection': 'keep-alive',
+        'Upgrade-Insecure-Requests': '1'
+    }
+}
+
+# Stealth scripts to avoid detection (registered on the context so every page gets them)
+STEALTH_SCRIPT = """
+    Object.defineProperty(navigator, 'webdriver', {
+        get: () => undefined
+    });
+
+    Object.defineProperty(navigator, 'plugins', {
+        get: () => [1, 2, 3, 4, 5]
+    });
+
+    Object.defineProperty(navigator, 'languages', {
+        get: () => ['en-AU', 'en-US', 'en']
+    });
+
+    window.chrome = {
+        runtime: {}
+    };
+"""
+
+
+class BrowserPool:
+    """
+    Owns one Playwright driver, one Chromium browser and one context.
+
+    Pages are handed out with acquire()/release() (or the page() context
+    manager). Released pages are blanked and kept idle for the next caller;
+    pages that errored are closed instead of recycled. If the browser
+    crashes it is relaunched on the next acquire.
+
+    Playwright's sync API is bound to the thread that started it, so a pool
+    must only be used from the thread that created it. Use map_with_pools()
+    to spread work over several pools in parallel.
+    """
+
+    def __init__(
+        self,
+        headless: bool = True,
+        max_idle_pages: int = 2,
+        launch_args: Optional[List[str]] = None,
+        context_options: Optional[Dict[str, Any]] = None,
+        init_script: Optional[str] = STEALTH_SCRIPT,
+        site: str = 'sportsbet'
+    ):
+        """
+        Initialize pool (browser is launched lazily on first acquire).
+
+        Args:
+            headless: Run browser in headless mode
+            max_idle_pages: Maximum released pages kept open for reuse
+            launch_args: Chromium launch args (default: LAUNCH_ARGS)
+            context_options: Options for browser.new_context (default: CONTEXT_OPTIONS)
+            init_script: Script added to the context before any page loads
+            site: Site key for the request-blocking allowlist (see scrapers.request_blocking)
+        """
+        self.headless = headless
+        self.max_idle_pages = max_idle_pages
+        self.launch_args = launch_args if launch_args is not None else list(LAUNCH_ARGS)
+        self.context_options = context_options if context_options is not None else dict(CONTEXT_OPTIONS)
+        self.init_script = init_script
+        self.site = site
+        self._blocking = None
+
+        self._playwright = None
+        self._browser: Optional[Browser] = None
+        self._context: Optional[BrowserContext] = None
+        self._idle_pages: List[Page] = []
+
+        self._stats = {
+            'browser_launches': 0,
+            'contexts_created': 0,
+            'pages_created': 0,
+            'pages_reused': 0,
+            'pages_discarded': 0,
+            'acquisitions': 0,
+        }
+
+    # -----------------------------------------------------------------
+    # Lifecycle
+    # -----------------------------------------------------------------
+    def _ensure_context(self) -> BrowserContext:
+        """Launch browser/context if not running (or relaunch after a crash)"""
+        if self._browser is not None and not self._browser.is_connected():
+            logger.warning("[POOL] Browser disconnected, relaunching")
+            self._browser = None
+            self._context = None
+            self._idle_pages = []
+
+        if self._playwright is None:
+            self._playwright = sync_playwright().start()
+
+        if self._browser is None:
+            self._browser = self._playwright.chromium.launch(
+                headless=self.headless,
+                args=self.launch_args
+            )
+            self._stats['browser_launches'] += 1
+            logger.debug(f"[POOL] Launched Chromium (launch #{self._stats['browser_launches']})")
+
+        if self._context is None:
+            self._context = self._browser.new_context(**self.context_options)
+            if self.init_script:
+                self._context.add_init_script(self.init_script)
+            policy = install_request_blocking(self._context, site=self.site)
+            if policy is not None:
+                self._blocking = policy
+            self._stats['contexts_created'] += 1
+
+        return self._context
+
+    def close(self):
+        """Close all pages, the context, the browser and the driver"""
+        for page in self._idle_pages:
+            try:
+                page.close()
+            except Exception:
+                pass
+        self._idle_pages = []
+
+        for closer in (self._context, self._browser):
+            if closer is not None:
+                try:
+                    closer.close()
+                except Exception:
+                    pass
+        self._context = None
+        self._browser = None
+
+        if self._playwright is not None:
+            try:
+                self._playwright.stop()
+            except Exception:
+                pass
+            self._playwright = None
+
+        logger.debug(f"[POOL] Closed ({self.format_stats()})")
+
+    def __enter__(self) -> 'BrowserPool':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+    # -----------------------------------------------------------------
+    # Pages
+    # -----------------------------------------------------------------
+    def acquire(self) -> Page:
+        """
+        Get a page, reusing an idle one when available.
+
+        Returns:
+            Playwright Page object (must be handed back with release())
+        """
+        context = self._ensure_context()
+        self._stats['acquisitions'] += 1
+
+        while self._idle_pages:
+            page = self._idle_pages.pop()
+            if not page.is_closed():
+                self._stats['pages_reused'] += 1
+                return page
+
+        page = context.new_page()
+        self._stats['pages_created'] += 1
+        return page
+
+    def release(self, page: Page, reusable: bool = True):
+        """
+        Return a page to the pool.
+
+        Args:
+            page: Page previously returned by acquire()
+            reusable: False to close the page instead of recycling it
+                      (e.g. after an error left it in an unknown state)
+        """
+        if page is None or page.is_closed():
+            return
+
+        if reusable and len(self._idle_pages) < self.max_idle_pages:
+            try:
+                # Drop the previous match's DOM so idle pages stay light
+                page.goto('about:blank')
+                self._idle_pages.append(page)
+                return
+            except Exception as e:
+                logger.debug(f"[POOL] Could not blank page for reuse: {e}")
+
+        try:
+            page.close()
+        except Exception:
+            pass
+        self._stats['pages_discarded'] += 1
+
+    @contextmanager
+    def page(self):
+        """
+        Context manager yielding a pooled page.
+
+        The page is recycled on normal exit and discarded if the body raises.
+        """
+        page = self.acquire()
+        reusable = False
+        try:
+            yield page
+            reusable = True
+        finally:
+            self.release(page, reusable=reusable)
+
+    # -----------------------------------------------------------------
+    # Stats
+    # -----------------------------------------------------------------
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get pool statistics.
+
+        'launches_saved' is the number of acquisitions that would have
+        launched their own browser without the pool.
+        """
+        stats = dict(self._stats)
+        stats['launches_saved'] = max(0, stats['acquisitions'] - stats['browser_launches'])
+        if self._blocking is not None:
+            stats['requests_blocked'] = self._blocking.stats['requests_blocked']
+            stats['est_bytes_saved'] = self._blocking.stats['est_bytes_saved']
+        return stats
+
+    def format_stats(self) -> str:
+        """One-line launch-vs-reuse summary for logs"""
+        return format_pool_stats(self.get_stats())
+
+
+def format_pool_stats(stats: Dict[str, int]) -> str:
+    """One-line launch-vs-reuse summary of get_stats()/combine_stats() output"""
+    return (
+        f"{stats.get('browser_launches', 0)} browser launch(es), "
+        f"{stats.get('acquisitions', 0)} page request(s), "
+        f"{stats.get('pages_reused', 0)} page(s) reused, "
+        f"{stats.get('launches_saved', 0)} launch(es) saved"
+    )
+
+
+def combine_stats(stats_list: Iterable[Dict[str, int]]) -> Dict[str, int]:
+    """Sum get_stats() dicts from several pools into one"""
+    combined: Dict[str, int] = {}
+    for stats in stats_list:
+        for key, value in stats.items():
+            combined[key] = combined.get(key, 0) + value
+    return combined
+
+
+def map_with_pools(
+    func: Callable[[Any, BrowserPool], Any],
+    items: Iterable[Any],
+    max_workers: int,
+    headless: bool = True,
+    pool: Optional[BrowserPool] = None,
+    throttle_seconds: float = 0.0
+) -> Tuple[List[Any], Dict[str, int]]:
+    """
+    Run func(item, pool) over items on up to max_workers browser pools in parallel.
+
+    Each worker thread owns its own BrowserPool (one browser, pages recycled
+    between items). If a pool is passed in, the calling thread works through
+    the queue with it as one of the workers, so no extra browser is launched
+    for that slot.
+
+    Args:
+        func: Callable taking (item, pool) and returning a result
+        items: Work items
+        max_workers: Maximum pages in flight at once (e.g. Config.MAX_CONCURRENT_REQUESTS)
+        headless: Run worker browsers in headless mode
+        pool: Optional pool owned by the calling thread to use as a worker
+        throttle_seconds: Pause between consecutive items on the same worker
+
+    Returns:
+        Tuple of (results, worker_stats) where results are in the same order
+        as items (None where func raised) and worker_stats combines the
+        get_stats() of the pools created here.
+    """
+    items = list(items)
+    results: List[Any] = [None] * len(items)
+    if not items:
+        return results, {}
+
+    work: "queue.Queue[Tuple[int, Any]]" = queue.Queue()
+    for index, item in enumerate(items):
+        work.put((index, item))
+
+    stats_lock = threading.Lock()
+    worker_stats: List[Dict[str, int]] = []
+
+    def drain(worker_pool: BrowserPool):
+        first = True
+        while True:
+            try:
+                index, item = work.get_nowait()
+            except queue.Empty:
+                return
+            if not first and throttle_seconds > 0:
+                time.sleep(throttle_seconds)
+            first = False
+            try:
+                results[index] = func(item, worker_pool)
+            except Exception as e:
+                logger.error(f"[POOL] Worker failed on item {index + 1}/{len(items)}: {e}")
+
+    def worker():
+        try:
+            with BrowserPool(headless=headless) as worker_pool:
+                drain(worker_pool)
+                with stats_lock:
+                    worker_stats.append(worker_pool.get_stats())
+        except Exception as e:
+            logger.error(f"[POOL] Worker thread crashed: {e}")
+
+    n_workers = max(1, min(max_workers, len(items)))
+    n_threads = n_workers - 1 if pool is not None else n_workers
+    threads = [
+        threading.Thread(target=worker, name=f"browser-pool-{i + 1}", daemon=True)
+        for i in range(n_threads)
+    ]
+    for thread in threads:
+        thread.start()
+
+    if pool is not None:
+        drain(pool)
+
+    for thread in threads:
+        thread.join()
+
+    logger.debug(f"[POOL] Processed {len(items)} item(s) on {n_workers} worker(s)")
+    return results, combine_stats(worker_stats)
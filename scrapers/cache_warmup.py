@@ -0,0 +1,349 @@
+"""
+Pre-Slate Cache Warm-Up
+=======================
+Fills the caches before tip-off so the real analysis run is (nearly) all
+cache hits.
+
+Today's games come from the NBA.com schedule (scrape_nba_schedule) and the
+Sportsbet overview (scrape_nba_overview); each game is expanded to its
+players through RotoWire lineups (falling back to NBA.com lineups). Work
+is then done in priority order until the time budget runs out:
+
+    1. player IDs                 (local lookups, always run)
+    2. starters' game logs        (earliest games first)
+    3. team stats                 (used by usage rate)
+    4. bench/questionable players' game logs
+    5. usage rates                (starters, then everyone else)
+
+Usage:
+    # One pass, 10 minute budget
+    python scrapers/cache_warmup.py --budget 600
+
+    # Re-warm every 30 minutes until stopped (expired entries get refreshed)
+    python scrapers/cache_warmup.py --every 30
+
+    # Extra names (e.g. known prop players) at starter priority
+    python scrapers/cache_warmup.py --players "Cooper Flagg" "Dylan Harper"
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import argparse
+import heapq
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from config.settings import Config
+
+logger = logging.getLogger(__name__)
+
+SEASON = "2024-25"
+
+# Lineup statuses that mean the player will not play (no props, skip)
+OUT_STATUSES = ('out', 'inactive', 'suspended', 'g league')
+
+# Task phases, lowest first (see module docstring)
+PHASE_STARTER_LOGS = 0
+PHASE_TEAM_STATS = 1
+PHASE_BENCH_LOGS = 2
+PHASE_STARTER_USAGE = 3
+PHASE_BENCH_USAGE = 4
+
+
+@dataclass(order=True)
+class WarmupTask:
+    """One cache fill, ordered by (phase, game order, player order)"""
+    priority: Tuple[int, int, int]
+    kind: str = field(compare=False)  # 'game_log', 'team_stats' or 'usage'
+    name: str = field(compare=False)  # Player or team name
+    team: str = field(default='', compare=False)
+
+
+# ---------------------------------------------------------------------
+# Slate
+# ---------------------------------------------------------------------
+def _team_key(team: str) -> str:
+    from scrapers.nba_schedule_scraper import normalize_team_name
+    return normalize_team_name(team)
+
+
+def collect_games(headless: bool = True, date: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Today's games (not yet started), schedule order first, then any extra
+    games only Sportsbet lists.
+
+    Returns:
+        List of {'away_team', 'home_team', 'game_time'}
+    """
+    games: List[Dict[str, Any]] = []
+    seen = set()
+
+    def add(away: str, home: str, game_time: Optional[str]):
+        key = (_team_key(away), _team_key(home))
+        if not all(key) or key in seen:
+            return
+        seen.add(key)
+        games.append({'away_team': away, 'home_team': home, 'game_time': game_time})
+
+    try:
+        from scrapers.nba_schedule_scraper import scrape_nba_schedule
+        for game in scrape_nba_schedule(headless=headless, date=date):
+            if game.status in ('UPCOMING', 'LIVE'):
+                add(game.away_team, game.home_team, game.game_time)
+    except Exception as e:
+        logger.warning(f"[WARMUP] NBA schedule unavailable: {e}")
+
+    try:
+        from scrapers.sportsbet_final_enhanced import scrape_nba_overview
+        for game in scrape_nba_overview(headless=headless):
+            if game.get('away_team', 'Unknown') != 'Unknown':
+                add(game['away_team'], game['home_team'], None)
+    except Exception as e:
+        logger.warning(f"[WARMUP] Sportsbet overview unavailable: {e}")
+
+    return games
+
+
+def collect_lineups(headless: bool = True, date: Optional[str] = None) -> Tuple[List, Any]:
+    """
+    Today's lineups: RotoWire, or NBA.com if RotoWire has none.
+
+    Returns:
+        (lineups, find_lineup_for_matchup function of the module that produced them)
+    """
+    try:
+        from scrapers.rotowire_scraper import scrape_rotowire_lineups, find_lineup_for_matchup
+        lineups = scrape_rotowire_lineups(headless=headless)
+        if lineups:
+            return lineups, find_lineup_for_matchup
+    except Exception as e:
+        logger.warning(f"[WARMUP] RotoWire lineups unavailable: {e}")
+
+    try:
+        from scrapers.nba_lineup_scraper import scrape_nba_lineups, find_lineup_for_matchup
+        return scrape_nba_lineups(headless=headless, date=date), find_lineup_for_matchup
+    except Exception as e:
+        logger.warning(f"[WARMUP] NBA.com lineups unavailable: {e}")
+    return [], None
+
+
+def collect_slate(headless: bool = True, date: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Today's games with their players.
+
+    Returns:
+        List of games (tip-off order) with 'players' ->
+        [{'name', 'team', 'starter', 'status'}]; players ruled out are dropped
+    """
+    games = collect_games(headless, date)
+    lineups, find_lineup = collect_lineups(headless, date)
+
+    for game in games:
+        game['players'] = []
+        lineup = find_lineup(lineups, game['away_team'], game['home_team']) if find_lineup else None
+        if lineup is None:
+            continue
+        for team_lineup in (lineup.away_team, lineup.home_team):
+            for players, starter in ((team_lineup.starters, True), (team_lineup.bench_news, False)):
+                for player in players:
+                    if (player.status or '').lower().startswith(OUT_STATUSES):
+                        continue
+                    game['players'].append({
+                        'name': player.name,
+                        'team': team_lineup.team_name,
+                        'starter': starter,
+                        'status': player.status,
+                    })
+
+    logger.info(
+        f"[WARMUP] Slate: {len(games)} game(s), "
+        f"{sum(len(game['players']) for game in games)} player(s) from lineups"
+    )
+    return games
+
+
+def build_tasks(games: List[Dict[str, Any]], extra_players: Optional[List[str]] = None) -> List[WarmupTask]:
+    """Warm-up tasks for a slate, in priority order"""
+    tasks: List[WarmupTask] = []
+    seen = set()
+
+    def add(phase: int, game_order: int, player_order: int, kind: str, name: str, team: str = ''):
+        if (kind, name) in seen:
+            return
+        seen.add((kind, name))
+        tasks.append(WarmupTask((phase, game_order, player_order), kind, name, team))
+
+    for order, name in enumerate(extra_players or []):
+        add(PHASE_STARTER_LOGS, -1, order, 'game_log', name)
+        add(PHASE_STARTER_USAGE, -1, order, 'usage', name)
+
+    for game_order, game in enumerate(games):
+        for team in (game['away_team'], game['home_team']):
+            add(PHASE_TEAM_STATS, game_order, 0, 'team_stats', team)
+        for player_order, player in enumerate(game.get('players', [])):
+            starter = player['starter']
+            add(PHASE_STARTER_LOGS if starter else PHASE_BENCH_LOGS,
+                game_order, player_order, 'game_log', player['name'], player['team'])
+            add(PHASE_STARTER_USAGE if starter else PHASE_BENCH_USAGE,
+                game_order, player_order, 'usage', player['name'], player['team'])
+
+    return sorted(tasks)
+
+
+# ---------------------------------------------------------------------
+# Warm-Up
+# ---------------------------------------------------------------------
+def _run_task(task: WarmupTask) -> str:
+    """Fill one cache entry; returns where it came from ('cache', 'fetched', 'none', ...)"""
+    if task.kind == 'game_log':
+        from scrapers.player_data_fetcher import get_player_game_log, get_last_fetch_source
+        game_log = get_player_game_log(task.name, season=SEASON)
+        return get_last_fetch_source() if game_log else 'none'
+
+    if task.kind == 'team_stats':
+        from scrapers.role_modifier import get_team_stats
+        from scrapers.tiered_cache import get_tiered_cache
+        team_stats = get_team_stats(task.name, season=SEASON)
+        return get_tiered_cache().last_tier() if team_stats else 'none'
+
+    if task.kind == 'usage':
+        from scrapers.player_data_fetcher import get_player_game_log
+        from scrapers.player_projection_model import PlayerProjectionModel
+        game_log = get_player_game_log(task.name, season=SEASON)
+        if not game_log:
+            return 'none'
+        # Same key the analysis uses: the pipeline resolves each player's
+        # context without player_team, so usage is keyed on team "Unknown"
+        context = PlayerProjectionModel().resolve_context(task.name, game_log)
+        return 'filled' if context.usage_rate is not None else 'none'
+
+    raise ValueError(f"Unknown warm-up task: {task.kind}")
+
+
+def warm_cache(
+    games: List[Dict[str, Any]],
+    budget_seconds: Optional[float] = None,
+    max_concurrent: Optional[int] = None,
+    extra_players: Optional[List[str]] = None
+) -> Dict[str, Any]:
+    """
+    Run warm-up tasks in priority order until done or out of time.
+
+    Tasks already running when the budget runs out are allowed to finish;
+    no new ones start.
+
+    Args:
+        games: Output of collect_slate()
+        budget_seconds: Time budget (default: Config.WARMUP_TIME_BUDGET_SECONDS)
+        max_concurrent: Tasks run at once (default: Config.MAX_CONCURRENT_REQUESTS)
+        extra_players: Additional player names, warmed at starter priority
+
+    Returns:
+        Dict with 'tasks', 'done', 'skipped', 'elapsed', 'player_ids' and
+        'by_kind' -> {kind: {outcome: count}}
+    """
+    if budget_seconds is None:
+        budget_seconds = Config.WARMUP_TIME_BUDGET_SECONDS
+    if max_concurrent is None:
+        max_concurrent = Config.MAX_CONCURRENT_REQUESTS
+    max_concurrent = max(1, max_concurrent)
+
+    start = time.perf_counter()
+    deadline = start + budget_seconds
+    tasks = build_tasks(games, extra_players)
+    stats: Dict[str, Any] = {'tasks': len(tasks), 'done': 0, 'skipped': 0, 'elapsed': 0.0, 'by_kind': {}}
+
+    # 1. Player IDs first: local lookups that every later cache key needs
+    from scrapers.data_cache import get_cache
+    cache = get_cache()
+    names = {task.name for task in tasks if task.kind != 'team_stats'}
+    resolved = sum(1 for name in names if cache.resolve_player_id(name) is not None)
+    stats['player_ids'] = {'resolved': resolved, 'unresolved': len(names) - resolved}
+
+    heap = list(tasks)
+    heapq.heapify(heap)
+    lock = threading.Lock()
+
+    def worker():
+        while True:
+            with lock:
+                if not heap or time.perf_counter() >= deadline:
+                    return
+                task = heapq.heappop(heap)
+            try:
+                outcome = _run_task(task)
+            except Exception as e:
+                logger.debug(f"[WARMUP] {task.kind} for {task.name} failed: {e}")
+                outcome = 'error'
+            with lock:
+                counts = stats['by_kind'].setdefault(task.kind, {})
+                counts[outcome] = counts.get(outcome, 0) + 1
+                stats['done'] += 1
+
+    logger.info(
+        f"[WARMUP] {len(tasks)} task(s), {max_concurrent} concurrent, {budget_seconds:.0f}s budget"
+    )
+    threads = [
+        threading.Thread(target=worker, name=f"warmup-{i}", daemon=True)
+        for i in range(min(max_concurrent, len(tasks)))
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    stats['skipped'] = len(heap)
+    stats['elapsed'] = time.perf_counter() - start
+    return stats
+
+
+def format_warmup_summary(stats: Dict[str, Any]) -> str:
+    """One-line summary of a warm_cache() run"""
+    by_kind = "; ".join(
+        f"{kind}: " + ", ".join(f"{outcome} {count}" for outcome, count in sorted(counts.items()))
+        for kind, counts in sorted(stats['by_kind'].items())
+    )
+    return (
+        f"{stats['done']}/{stats['tasks']} task(s) in {stats['elapsed']:.1f}s"
+        f" ({stats['skipped']} skipped for time)"
+        f", IDs {stats['player_ids']['resolved']} resolved/{stats['player_ids']['unresolved']} unresolved"
+        + (f" | {by_kind}" if by_kind else "")
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Warm the player data caches before tonight's slate")
+    parser.add_argument('--budget', type=float, default=None,
+                        help=f"Time budget in seconds (default: {Config.WARMUP_TIME_BUDGET_SECONDS:.0f})")
+    parser.add_argument('--concurrency', type=int, default=None, help="Tasks run at once")
+    parser.add_argument('--date', default=None, help="Slate date YYYY-MM-DD (default: today)")
+    parser.add_argument('--players', nargs='*', default=[], help="Extra player names to warm first")
+    parser.add_argument('--every', type=float, default=0.0,
+                        help="Repeat every N minutes until stopped (0 = run once)")
+    parser.add_argument('--headed', action='store_true', help="Show the browsers")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(message)s")
+
+    from scrapers.tiered_cache import format_tiered_summary
+
+    try:
+        while True:
+            games = collect_slate(headless=not args.headed, date=args.date)
+            stats = warm_cache(games, args.budget, args.concurrency, args.players)
+            logger.info(f"[WARMUP] {format_warmup_summary(stats)}")
+            logger.info(f"[WARMUP] Tiered cache: {format_tiered_summary()}")
+            if args.every <= 0:
+                break
+            time.sleep(args.every * 60)
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -4,9 +4,24 @@ SQLite Persistent Cache System
 Manages persistent caching of player data (minutes, usage, injuries, role) with TTL support.
 
 Cache Strategy:
-- Hot Cache: In-memory (current run)
+- Hot Cache: In-memory LRU (bounded by entry count and approximate bytes)
 - Warm Cache: SQLite (multi-run, persistent)
 - Cold Cache: Historical baselines (permanent)
+
+Stale-While-Revalidate:
+- Past its TTL an entry can still be served (flagged stale=True) until
+  its data type's max staleness, while a background worker refreshes it
+  with the refresher registered for that data type
+- Past max staleness the entry is a miss and the caller fetches (blocking)
+
+Concurrency:
+- One SQLite connection per thread (opened lazily, reused for the
+  thread's lifetime) in WAL mode, so readers never block each other or
+  the writer
+- Statements are fixed SQL strings, so sqlite3's per-connection
+  statement cache prepares each one once
+- get_many()/set_many() load or store a slate's worth of entries in one
+  transaction
 """
 
 import sqlite3
@@ -15,8 +30,15 @@ import logging
 from pathlib import Path
 from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime, timedelta
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, fields
+import queue
 import threading
+from collections import OrderedDict
+from typing import Callable, Hashable
+
+from config.settings import Config
+
+from scrapers.data_models import GameLogEntry
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +56,137 @@ class CacheEntry:
     last_updated: datetime
 
 
+# Typed columns of the game_logs table, in GameLogEntry field order
+GAME_LOG_COLUMNS: List[Tuple[str, str]] = [
+    (f.name, {int: 'INTEGER', float: 'REAL', bool: 'INTEGER'}.get(f.type, 'TEXT'))
+    for f in fields(GameLogEntry)
+]
+GAME_LOG_FIELDS = [name for name, _ in GAME_LOG_COLUMNS]
+GAME_LOG_NUMERIC_FIELDS = [name for name, sql_type in GAME_LOG_COLUMNS if sql_type != 'TEXT']
+
+
+class HotCache:
+    """
+    In-memory LRU tier in front of SQLite, bounded by entry count and by
+    approximate size (the entry's JSON length plus a fixed overhead).
+
+    Filled on every SQLite read and every write; least recently used
+    entries are evicted first. Hits, misses and evictions are counted per
+    data type.
+    """
+
+    # Rough per-entry cost of the key, CacheEntry and dict objects
+    ENTRY_OVERHEAD_BYTES = 512
+
+    def __init__(self, max_entries: int, max_bytes: int):
+        self.max_entries = max(1, max_entries)
+        self.max_bytes = max(1, max_bytes)
+        self._entries: 'OrderedDict[str, Tuple[CacheEntry, int]]' = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    def _count(self, data_type: str, counter: str, n: int = 1):
+        entry = self._stats.setdefault(data_type, {'hits': 0, 'misses': 0, 'evictions': 0})
+        entry[counter] += n
+
+    def get(self, key: str, data_type: str) -> Optional[CacheEntry]:
+        """Look up an entry (marks it most recently used)"""
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                self._count(data_type, 'misses')
+                return None
+            self._entries.move_to_end(key)
+            self._count(data_type, 'hits')
+            return item[0]
+
+    def put(self, key: str, entry: CacheEntry, size: int):
+        """Insert or replace an entry, evicting LRU entries past either bound"""
+        size += self.ENTRY_OVERHEAD_BYTES
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            self._entries[key] = (entry, size)
+            self._bytes += size
+            while len(self._entries) > 1 and (
+                len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+            ):
+                _, (evicted, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self._count(evicted.data_type, 'evictions')
+
+    def pop(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            item = self._entries.pop(key, None)
+            if item is None:
+                return None
+            self._bytes -= item[1]
+            return item[0]
+
+    def keys(self) -> List[str]:
+        with self._lock:
+            return list(self._entries)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Size, bounds and per-data-type hit/miss/eviction counters"""
+        with self._lock:
+            by_type = {data_type: dict(counters) for data_type, counters in self._stats.items()}
+            stats = {
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'max_entries': self.max_entries,
+                'max_bytes': self.max_bytes,
+            }
+        for counter in ('hits', 'misses', 'evictions'):
+            stats[counter] = sum(counters[counter] for counters in by_type.values())
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_rate'] = stats['hits'] / lookups if lookups else 0.0
+        for counters in by_type.values():
+            type_lookups = counters['hits'] + counters['misses']
+            counters['hit_rate'] = counters['hits'] / type_lookups if type_lookups else 0.0
+        stats['by_type'] = by_type
+        return stats
+
+
+class _Transaction:
+    """One BEGIN ... COMMIT/ROLLBACK on the calling thread's connection"""
+
+    def __init__(self, cache: 'DataCache', write: bool):
+        self.cache = cache
+        self.write = write
+        self.conn: Optional[sqlite3.Connection] = None
+
+    def __enter__(self) -> sqlite3.Connection:
+        if self.write:
+            self.cache._write_lock.acquire()
+        try:
+            self.conn = self.cache._connection()
+            self.conn.execute("BEGIN IMMEDIATE" if self.write else "BEGIN")
+        except BaseException:
+            if self.write:
+                self.cache._write_lock.release()
+            raise
+        return self.conn
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        try:
+            self.conn.execute("COMMIT" if exc_type is None else "ROLLBACK")
+        finally:
+            if self.write:
+                self.cache._write_lock.release()
+        return False
+
+
 class DataCache:
     """
     SQLite-based persistent cache for player data.
@@ -54,6 +207,79 @@ class DataCache:
     TTL_GAME_LOG = 168  # 7 days
     TTL_BASELINE = None  # Permanent
     
+    # Max staleness in hours (total age): expired entries younger than this
+    # are served stale while refreshing; equal to the TTL = never stale
+    MAX_STALE_MINUTES = 72
+    MAX_STALE_USAGE = 72
+    MAX_STALE_INJURIES = 6  # Injury news must be current
+    MAX_STALE_ROLE = 96
+    MAX_STALE_GAME_LOG = 336  # 14 days
+    
+    # Negative cache reasons (TTLs: Config.NEGATIVE_CACHE_*_TTL)
+    NEGATIVE_REASONS = ('not_found', 'unresolved')
+    
+    # Background threads running stale-entry refreshes
+    REFRESH_WORKERS = 2
+
+    # Seconds a writer waits on another connection's write lock
+    BUSY_TIMEOUT_SECONDS = 30.0
+
+    # Prepared statements (reused via each connection's statement cache)
+    SQL_SELECT = """
+        SELECT source, confidence_score, data_json, last_updated
+        FROM player_data_cache
+        WHERE player_name = ? AND team = ? AND date = ? AND data_type = ?
+    """
+    SQL_UPSERT = """
+        INSERT OR REPLACE INTO player_data_cache
+        (player_name, team, date, data_type, source, confidence_score, data_json, last_updated)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    """
+    SQL_DELETE = """
+        DELETE FROM player_data_cache
+        WHERE player_name = ? AND team = ? AND date = ? AND data_type = ?
+    """
+    SQL_GAME_LOG_INSERT = f"""
+        INSERT OR IGNORE INTO game_logs
+        (player_id, season, {', '.join(GAME_LOG_FIELDS)}, source, inserted_at)
+        VALUES (?, ?, {', '.join('?' for _ in GAME_LOG_FIELDS)}, ?, ?)
+    """
+    SQL_GAME_LOG_SYNC = """
+        INSERT INTO game_log_sync
+        (player_id, season, player_name, source, confidence_score, newest_game_date, fresh_through, last_updated)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(player_id, season) DO UPDATE SET
+            player_name = excluded.player_name,
+            source = excluded.source,
+            confidence_score = excluded.confidence_score,
+            newest_game_date = MAX(COALESCE(newest_game_date, ''), COALESCE(excluded.newest_game_date, '')),
+            fresh_through = COALESCE(excluded.fresh_through, fresh_through),
+            last_updated = excluded.last_updated
+    """
+    SQL_NEGATIVE_UPSERT = """
+        INSERT OR REPLACE INTO negative_cache
+        (player_key, season, source, reason, player_name, created_at, expires_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    """
+    SQL_NEGATIVE_SELECT = """
+        SELECT source, reason, created_at, expires_at
+        FROM negative_cache
+        WHERE player_key = ? AND season = ? AND expires_at > ?
+    """
+    # Fresh rows only (last_updated >= ?; pass '' to include expired rows),
+    # most recent first (LIMIT -1 = all)
+    SQL_GAME_LOG_RANGE = f"""
+        SELECT {', '.join(GAME_LOG_FIELDS)}
+        FROM game_logs
+        WHERE player_id = ? AND season = ?
+        AND EXISTS (
+            SELECT 1 FROM game_log_sync s
+            WHERE s.player_id = ? AND s.season = ? AND s.last_updated >= ?
+        )
+        ORDER BY game_date DESC
+        LIMIT ?
+    """
+    
     def __init__(self, db_path: Optional[Path] = None):
         """
         Initialize cache database.
@@ -67,20 +293,88 @@ class DataCache:
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         
-        # Thread lock for database operations
-        self._lock = threading.Lock()
+        # One connection per thread; writes are serialized in-process so
+        # threads queue on the lock instead of spinning on SQLITE_BUSY
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        self._write_lock = threading.Lock()
         
         # Initialize database
         self._init_database()
         
         # In-memory hot cache (current run only)
-        self._hot_cache: Dict[str, CacheEntry] = {}
+        self._hot_cache = HotCache(
+            max_entries=Config.HOT_CACHE_MAX_ENTRIES,
+            max_bytes=int(Config.HOT_CACHE_MAX_MB * 1024 * 1024)
+        )
+        
+        # Player name -> NBA player ID (None = unresolved, stored as a blob)
+        self._player_ids: Dict[str, Optional[int]] = {}
+        
+        # Stale-while-revalidate: data_type -> refresher(player_name, team, date)
+        self._refreshers: Dict[str, Callable[[str, str, str], Any]] = {}
+        self._refresh_lock = threading.Lock()
+        self._refresh_queue: Optional[queue.Queue] = None
+        self._refreshing: set = set()
+        self._swr_stats = {
+            'stale_served': 0,
+            'refreshes_scheduled': 0,
+            'refreshes_completed': 0,
+            'refreshes_failed': 0,
+        }
+        
+        # Maintenance: optional background TTL sweeper (see start_sweeper)
+        self._sweeper: Optional[threading.Thread] = None
+        self._sweeper_stop = threading.Event()
+        self._maintenance_stats = {'sweeps': 0, 'rows_swept': 0}
         
         logger.debug(f"Cache initialized: {self.db_path}")
     
+    def _connection(self) -> sqlite3.Connection:
+        """This thread's connection (opened on first use)"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            # Autocommit mode: transactions are opened explicitly (see _transaction)
+            conn = sqlite3.connect(
+                self.db_path,
+                timeout=self.BUSY_TIMEOUT_SECONDS,
+                isolation_level=None,
+                check_same_thread=False,
+                cached_statements=64
+            )
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
+    def _transaction(self, write: bool = False):
+        """
+        Context manager for one transaction on this thread's connection.
+
+        Read transactions take no lock (WAL gives each a consistent
+        snapshot); write transactions hold the in-process write lock and
+        take SQLite's write lock up front.
+        """
+        return _Transaction(self, write)
+
+    def close(self):
+        """Close every thread's connection (they reopen on next use)"""
+        with self._connections_lock:
+            for conn in self._connections:
+                try:
+                    conn.close()
+                except Exception:
+                    pass
+            self._connections.clear()
+        self._local = threading.local()
+
     def _init_database(self):
         """Create database tables if they don't exist"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._transaction(write=True) as conn:
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS player_data_cache (
                     player_name TEXT NOT NULL,
@@ -101,12 +395,60 @@ class DataCache:
                 ON player_data_cache(player_name, team, date, data_type)
             """)
             
-            conn.commit()
+            # One row per game; the primary key doubles as the range index
+            columns = ',\n'.join(f"{name} {sql_type}" for name, sql_type in GAME_LOG_COLUMNS)
+            conn.execute(f"""
+                CREATE TABLE IF NOT EXISTS game_logs (
+                    player_id INTEGER NOT NULL,
+                    season INTEGER NOT NULL,
+                    {columns},
+                    source TEXT NOT NULL,
+                    inserted_at TIMESTAMP NOT NULL,
+                    PRIMARY KEY (player_id, season, game_date)
+                ) WITHOUT ROWID
+            """)
+            
+            # Freshness per (player, season): TTL_GAME_LOG applies to last_updated
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS game_log_sync (
+                    player_id INTEGER NOT NULL,
+                    season INTEGER NOT NULL,
+                    player_name TEXT NOT NULL,
+                    source TEXT NOT NULL,
+                    confidence_score REAL NOT NULL,
+                    newest_game_date TEXT,
+                    fresh_through TEXT,
+                    last_updated TIMESTAMP NOT NULL,
+                    PRIMARY KEY (player_id, season)
+                )
+            """)
+            sync_columns = {row[1] for row in conn.execute("PRAGMA table_info(game_log_sync)")}
+            if 'fresh_through' not in sync_columns:
+                conn.execute("ALTER TABLE game_log_sync ADD COLUMN fresh_through TEXT")
+            
+            # Sources that could not find/resolve a player, skipped until expires_at
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS negative_cache (
+                    player_key TEXT NOT NULL,
+                    season TEXT NOT NULL,
+                    source TEXT NOT NULL,
+                    reason TEXT NOT NULL,
+                    player_name TEXT NOT NULL,
+                    created_at TIMESTAMP NOT NULL,
+                    expires_at TIMESTAMP NOT NULL,
+                    PRIMARY KEY (player_key, season, source)
+                ) WITHOUT ROWID
+            """)
     
     def _get_cache_key(self, player_name: str, team: str, date: str, data_type: str) -> str:
         """Generate cache key"""
         return f"{player_name}|{team}|{date}|{data_type}"
     
+    @property
+    def hot_cache(self) -> HotCache:
+        """The in-memory LRU tier (shared with TieredCache, keyed by _get_cache_key)"""
+        return self._hot_cache
+    
     def _get_ttl_hours(self, data_type: str) -> Optional[int]:
         """Get TTL in hours for data type"""
         ttl_map = {
@@ -119,12 +461,108 @@ class DataCache:
         }
         return ttl_map.get(data_type, self.TTL_MINUTES)  # Default to 24h
     
+    def _get_max_stale_hours(self, data_type: str) -> Optional[int]:
+        """Get max staleness in hours for data type (None = permanent)"""
+        ttl_hours = self._get_ttl_hours(data_type)
+        if ttl_hours is None:
+            return None
+        max_stale_map = {
+            'minutes': self.MAX_STALE_MINUTES,
+            'usage': self.MAX_STALE_USAGE,
+            'injuries': self.MAX_STALE_INJURIES,
+            'role': self.MAX_STALE_ROLE,
+            'game_log': self.MAX_STALE_GAME_LOG,
+        }
+        return max(ttl_hours, max_stale_map.get(data_type, ttl_hours))
+    
+    def can_serve_stale(self, data_type: str, age_hours: float) -> bool:
+        """Whether an expired entry of this age may be served while it refreshes"""
+        if not Config.CACHE_STALE_WHILE_REVALIDATE:
+            return False
+        max_stale = self._get_max_stale_hours(data_type)
+        return max_stale is None or age_hours < max_stale
+    
+    # -----------------------------------------------------------------
+    # Background Refresh
+    # -----------------------------------------------------------------
+    def register_refresher(self, data_type: str, refresher: Callable[[str, str, str], Any]):
+        """
+        Set the function that re-fetches (and re-caches) entries of a data type.
+        
+        Args:
+            data_type: Data type ('usage', 'minutes', ...)
+            refresher: Called as refresher(player_name, team, date) on a
+                       background thread; must store the fresh value with set()
+        """
+        self._refreshers[data_type] = refresher
+    
+    def schedule_refresh(self, key: Hashable, refresher: Callable[..., Any], *args) -> bool:
+        """
+        Run refresher(*args) on a background worker unless key is already queued.
+        
+        Returns:
+            True if a refresh was scheduled
+        """
+        with self._refresh_lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            self._swr_stats['refreshes_scheduled'] += 1
+            if self._refresh_queue is None:
+                self._refresh_queue = queue.Queue()
+                for i in range(self.REFRESH_WORKERS):
+                    threading.Thread(
+                        target=self._refresh_worker, name=f"cache-refresh-{i}", daemon=True
+                    ).start()
+        self._refresh_queue.put((key, refresher, args))
+        logger.debug(f"[CACHE] Background refresh scheduled: {key}")
+        return True
+    
+    def _refresh_worker(self):
+        while True:
+            key, refresher, args = self._refresh_queue.get()
+            try:
+                refresher(*args)
+                outcome = 'refreshes_completed'
+            except Exception as e:
+                logger.debug(f"[CACHE] Background refresh failed for {key}: {e}")
+                outcome = 'refreshes_failed'
+            finally:
+                with self._refresh_lock:
+                    self._refreshing.discard(key)
+                    self._swr_stats[outcome] += 1
+                self._refresh_queue.task_done()
+    
+    def pending_refreshes(self) -> int:
+        """Refreshes queued or running"""
+        with self._refresh_lock:
+            return len(self._refreshing)
+    
+    def note_stale_served(self):
+        """Count a stale value served by a caller-managed path (e.g. game logs)"""
+        with self._refresh_lock:
+            self._swr_stats['stale_served'] += 1
+    
+    def _serve_stale(self, key: Tuple[str, str, str, str], entry: CacheEntry) -> Optional[Dict[str, Any]]:
+        """Stale result for an expired entry, scheduling its refresh (None = must fetch)"""
+        data_type = key[3]
+        refresher = self._refreshers.get(data_type)
+        age_hours = (datetime.now() - entry.last_updated).total_seconds() / 3600.0
+        if refresher is None or not self.can_serve_stale(data_type, age_hours):
+            return None
+        self.schedule_refresh(key, refresher, *key[:3])
+        self.note_stale_served()
+        logger.debug(f"Cache hit (stale, {age_hours:.1f}h old): {self._get_cache_key(*key)}")
+        return self._format_entry(entry, stale=True)
+    
     def get(
         self,
         player_name: str,
         team: str,
         date: str,
-        data_type: str
+        data_type: str,
+        allow_stale: bool = True,
+        check_hot: bool = True
     ) -> Optional[Dict[str, Any]]:
         """
         Get cached data if valid.
@@ -134,75 +572,111 @@ class DataCache:
             team: Team name
             date: Date string (YYYY-MM-DD)
             data_type: Type of data ('minutes', 'usage', 'injuries', 'role', 'baseline')
+            allow_stale: Serve an expired entry (stale=True) while it refreshes
+                         in the background, if the data type allows it
+            check_hot: Look in the hot cache first (False when the caller just did)
         
         Returns:
-            Cached data dict with 'data', 'source', 'confidence_score', 'last_updated'
-            or None if not found or expired
+            Cached data dict with 'data', 'source', 'confidence_score', 'last_updated',
+            'stale' or None if not found or expired
         """
+        key = (player_name, team, date, data_type)
+        return self.get_many([key], allow_stale, check_hot).get(key)
+
+    def get_many(
+        self,
+        keys: List[Tuple[str, str, str, str]],
+        allow_stale: bool = True,
+        check_hot: bool = True
+    ) -> Dict[Tuple[str, str, str, str], Dict[str, Any]]:
+        """
+        Get many cached entries in one read transaction.
+        
+        Args:
+            keys: (player_name, team, date, data_type) tuples
+            allow_stale: Serve expired entries (stale=True) while they refresh
+            check_hot: Look in the hot cache first (False when the caller just did)
+        
+        Returns:
+            Dict of key -> cached data dict (same shape as get()) for every
+            key that was found and servable; misses are left out
+        """
+        results: Dict[Tuple[str, str, str, str], Dict[str, Any]] = {}
+        sqlite_keys = []
+        
         # Check hot cache first
-        cache_key = self._get_cache_key(player_name, team, date, data_type)
-        if cache_key in self._hot_cache:
-            entry = self._hot_cache[cache_key]
-            if self._is_valid(entry, data_type):
-                ttl_remaining = self._get_ttl_remaining(entry, data_type)
-                ttl_str = f"{ttl_remaining:.1f}h" if ttl_remaining is not None else "permanent"
-                logger.debug(f"Cache hit (hot): {cache_key}")
-                return {
-                    'data': entry.data_json,
-                    'source': entry.source,
-                    'confidence_score': entry.confidence_score,
-                    'last_updated': entry.last_updated.isoformat(),
-                    'ttl_remaining_hours': ttl_remaining
-                }
+        for key in dict.fromkeys(keys):
+            if not check_hot:
+                sqlite_keys.append(key)
+                continue
+            entry = self._hot_cache.get(self._get_cache_key(*key), key[3])
+            if entry is not None and self._is_valid(entry, key[3]):
+                logger.debug(f"Cache hit (hot): {self._get_cache_key(*key)}")
+                results[key] = self._format_entry(entry)
+                continue
+            stale = self._serve_stale(key, entry) if entry is not None and allow_stale else None
+            if stale is not None:
+                results[key] = stale
+            else:
+                sqlite_keys.append(key)
+        
+        if not sqlite_keys:
+            return results
         
         # Check SQLite cache
-        with self._lock:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
-                cursor = conn.execute("""
-                    SELECT source, confidence_score, data_json, last_updated
-                    FROM player_data_cache
-                    WHERE player_name = ? AND team = ? AND date = ? AND data_type = ?
-                """, (player_name, team, date, data_type))
+        expired = []
+        with self._transaction() as conn:
+            for key in sqlite_keys:
+                row = conn.execute(self.SQL_SELECT, key).fetchone()
+                if row is None:
+                    logger.debug(f"Cache miss: {self._get_cache_key(*key)}")
+                    continue
                 
-                row = cursor.fetchone()
-                if row:
-                    last_updated = datetime.fromisoformat(row['last_updated'])
-                    entry = CacheEntry(
-                        player_name=player_name,
-                        team=team,
-                        date=date,
-                        data_type=data_type,
-                        source=row['source'],
-                        confidence_score=row['confidence_score'],
-                        data_json=json.loads(row['data_json']),
-                        last_updated=last_updated
-                    )
-                    
-                    if self._is_valid(entry, data_type):
-                        # Add to hot cache
-                        self._hot_cache[cache_key] = entry
-                        ttl_remaining = self._get_ttl_remaining(entry, data_type)
-                        ttl_str = f"{ttl_remaining:.1f}h" if ttl_remaining is not None else "permanent"
-                        logger.debug(f"Cache hit (SQLite): {cache_key}")
-                        return {
-                            'data': entry.data_json,
-                            'source': entry.source,
-                            'confidence_score': entry.confidence_score,
-                            'last_updated': entry.last_updated.isoformat(),
-                            'ttl_remaining_hours': ttl_remaining
-                        }
-                    else:
-                        # Expired - remove from database
-                        conn.execute("""
-                            DELETE FROM player_data_cache
-                            WHERE player_name = ? AND team = ? AND date = ? AND data_type = ?
-                        """, (player_name, team, date, data_type))
-                        conn.commit()
-                        logger.debug(f"[CACHE] Expired entry removed: {cache_key}")
-        
-        logger.debug(f"Cache miss: {cache_key}")
-        return None
+                player_name, team, date, data_type = key
+                entry = CacheEntry(
+                    player_name=player_name,
+                    team=team,
+                    date=date,
+                    data_type=data_type,
+                    source=row['source'],
+                    confidence_score=row['confidence_score'],
+                    data_json=json.loads(row['data_json']),
+                    last_updated=datetime.fromisoformat(row['last_updated'])
+                )
+                size = len(row['data_json'])
+                
+                if self._is_valid(entry, data_type):
+                    # Add to hot cache
+                    self._hot_cache.put(self._get_cache_key(*key), entry, size)
+                    logger.debug(f"Cache hit (SQLite): {self._get_cache_key(*key)}")
+                    results[key] = self._format_entry(entry)
+                    continue
+                
+                stale = self._serve_stale(key, entry) if allow_stale else None
+                if stale is not None:
+                    self._hot_cache.put(self._get_cache_key(*key), entry, size)
+                    results[key] = stale
+                elif not self._is_within_max_stale(entry, data_type):
+                    expired.append(key)
+        
+        if expired:
+            # Past max staleness - remove from database
+            with self._transaction(write=True) as conn:
+                conn.executemany(self.SQL_DELETE, expired)
+            logger.debug(f"[CACHE] {len(expired)} expired entr{'y' if len(expired) == 1 else 'ies'} removed")
+        
+        return results
+
+    def _format_entry(self, entry: CacheEntry, stale: bool = False) -> Dict[str, Any]:
+        """Cache entry in the shape returned by get()"""
+        return {
+            'data': entry.data_json,
+            'source': entry.source,
+            'confidence_score': entry.confidence_score,
+            'last_updated': entry.last_updated.isoformat(),
+            'ttl_remaining_hours': self._get_ttl_remaining(entry, entry.data_type),
+            'stale': stale
+        }
     
     def set(
         self,
@@ -226,37 +700,54 @@ class DataCache:
             source: Data source ('statsmuse', 'databallr', 'inferred')
             confidence_score: Confidence in data (0.0-1.0)
         """
-        cache_key = self._get_cache_key(player_name, team, date, data_type)
-        now = datetime.now()
+        self.set_many([(player_name, team, date, data_type, data, source, confidence_score)])
+
+    def set_many(
+        self,
+        items: List[Tuple[str, str, str, str, Dict[str, Any], str, float]]
+    ):
+        """
+        Store many entries in one write transaction.
         
-        entry = CacheEntry(
-            player_name=player_name,
-            team=team,
-            date=date,
-            data_type=data_type,
-            source=source,
-            confidence_score=confidence_score,
-            data_json=data,
-            last_updated=now
-        )
+        Args:
+            items: (player_name, team, date, data_type, data, source, confidence_score) tuples
+        """
+        if not items:
+            return
         
-        # Add to hot cache
-        self._hot_cache[cache_key] = entry
+        now = datetime.now()
+        rows = []
+        for player_name, team, date, data_type, data, source, confidence_score in items:
+            entry = CacheEntry(
+                player_name=player_name,
+                team=team,
+                date=date,
+                data_type=data_type,
+                source=source,
+                confidence_score=confidence_score,
+                data_json=data,
+                last_updated=now
+            )
+            
+            data_json = json.dumps(data)
+            
+            # Add to hot cache
+            self._hot_cache.put(self._get_cache_key(player_name, team, date, data_type), entry, len(data_json))
+            rows.append((
+                player_name, team, date, data_type, source,
+                confidence_score, data_json, now.isoformat()
+            ))
         
         # Store in SQLite
-        with self._lock:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute("""
-                    INSERT OR REPLACE INTO player_data_cache
-                    (player_name, team, date, data_type, source, confidence_score, data_json, last_updated)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    player_name, team, date, data_type, source,
-                    confidence_score, json.dumps(data), now.isoformat()
-                ))
-                conn.commit()
+        with self._transaction(write=True) as conn:
+            conn.executemany(self.SQL_UPSERT, rows)
         
-        logger.debug(f"[CACHE] Stored: {cache_key} (source={source}, conf={confidence_score:.2f})")
+        if len(rows) == 1:
+            player_name, team, date, data_type, _, source, confidence_score = items[0]
+            cache_key = self._get_cache_key(player_name, team, date, data_type)
+            logger.debug(f"[CACHE] Stored: {cache_key} (source={source}, conf={confidence_score:.2f})")
+        else:
+            logger.debug(f"[CACHE] Stored {len(rows)} entries")
     
     def _is_valid(self, entry: CacheEntry, data_type: str) -> bool:
         """Check if cache entry is still valid (not expired)"""
@@ -269,6 +760,13 @@ class DataCache:
         age = datetime.now() - entry.last_updated
         return age < timedelta(hours=ttl_hours)
     
+    def _is_within_max_stale(self, entry: CacheEntry, data_type: str) -> bool:
+        """Check if an expired entry is still young enough to keep for stale serving"""
+        max_stale = self._get_max_stale_hours(data_type)
+        if max_stale is None:
+            return True
+        return datetime.now() - entry.last_updated < timedelta(hours=max_stale)
+    
     def _get_ttl_remaining(self, entry: CacheEntry, data_type: str) -> Optional[float]:
         """
         Calculate TTL remaining in hours for a cache entry.
@@ -317,24 +815,22 @@ class DataCache:
                                 keys_to_remove.append(key)
         
         for key in keys_to_remove:
-            del self._hot_cache[key]
+            self._hot_cache.pop(key)
         
         # Remove from SQLite
-        with self._lock:
-            with sqlite3.connect(self.db_path) as conn:
-                if data_type:
-                    conn.execute("""
-                        DELETE FROM player_data_cache
-                        WHERE player_name = ? AND (team = ? OR ? IS NULL)
-                        AND (date = ? OR ? IS NULL) AND data_type = ?
-                    """, (player_name, team, team, date, date, data_type))
-                else:
-                    conn.execute("""
-                        DELETE FROM player_data_cache
-                        WHERE player_name = ? AND (team = ? OR ? IS NULL)
-                        AND (date = ? OR ? IS NULL)
-                    """, (player_name, team, team, date, date))
-                conn.commit()
+        with self._transaction(write=True) as conn:
+            if data_type:
+                conn.execute("""
+                    DELETE FROM player_data_cache
+                    WHERE player_name = ? AND (team = ? OR ? IS NULL)
+                    AND (date = ? OR ? IS NULL) AND data_type = ?
+                """, (player_name, team, team, date, date, data_type))
+            else:
+                conn.execute("""
+                    DELETE FROM player_data_cache
+                    WHERE player_name = ? AND (team = ? OR ? IS NULL)
+                    AND (date = ? OR ? IS NULL)
+                """, (player_name, team, team, date, date))
         
         logger.debug(f"Cache invalidated: {player_name}" + (f" ({data_type})" if data_type else ""))
     
@@ -345,7 +841,7 @@ class DataCache:
     
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._transaction() as conn:
             cursor = conn.execute("""
                 SELECT 
                     COUNT(*) as total_entries,
@@ -363,13 +859,632 @@ class DataCache:
             """)
             by_type = {row[0]: row[1] for row in cursor.fetchall()}
             
-            return {
-                'total_entries': row[0],
-                'unique_players': row[1],
+            game_log_rows, game_log_players = conn.execute("""
+                SELECT COUNT(*), COUNT(DISTINCT player_id) FROM game_logs
+            """).fetchone()
+            
+            negative_entries = conn.execute(
+                "SELECT COUNT(*) FROM negative_cache WHERE expires_at > ?",
+                (datetime.now().isoformat(),)
+            ).fetchone()[0]
+            
+        by_type['game_log_rows'] = game_log_rows
+        by_type['game_log_players'] = game_log_players
+        return {
+            'total_entries': row[0],
+            'unique_players': row[1],
             'data_types': row[2],
             'by_type': by_type,
-            'hot_cache_size': len(self._hot_cache)
+            'hot_cache_size': len(self._hot_cache),
+            'hot_cache': self._hot_cache.get_stats(),
+            'negative_entries': negative_entries,
+            'connections': len(self._connections),
+            'stale_while_revalidate': dict(self._swr_stats, pending=self.pending_refreshes()),
+            'maintenance': dict(self._maintenance_stats, sweeper_running=self._sweeper is not None)
+        }
+    
+    # -----------------------------------------------------------------
+    # Maintenance
+    # -----------------------------------------------------------------
+    def sweep_expired(self) -> Dict[str, int]:
+        """
+        Delete entries that can no longer be served.
+        
+        player_data_cache rows older than their data type's max staleness
+        (the TTL for types without a stale window) are removed; baselines
+        (no TTL) are kept. Expired negative cache entries are removed too.
+        
+        Stored game logs (game_logs rows and their game_log_sync entry) are
+        kept past their TTL as the base for incremental refreshes, so they
+        are removed by retention instead: seasons older than
+        Config.CACHE_GAME_LOG_SEASONS (counted back from the newest cached
+        season) and players not refreshed for
+        Config.CACHE_GAME_LOG_RETENTION_DAYS.
+        
+        Returns:
+            Dict of data_type -> rows deleted (plus 'negative_cache',
+            'game_logs' and 'game_log_sync')
+        """
+        now = datetime.now()
+        deleted: Dict[str, int] = {}
+        with self._transaction(write=True) as conn:
+            data_types = [row[0] for row in conn.execute("SELECT DISTINCT data_type FROM player_data_cache")]
+            for data_type in data_types:
+                max_age_hours = self._get_max_stale_hours(data_type)
+                if max_age_hours is None:
+                    continue
+                cutoff = (now - timedelta(hours=max_age_hours)).isoformat()
+                count = conn.execute(
+                    "DELETE FROM player_data_cache WHERE data_type = ? AND last_updated < ?",
+                    (data_type, cutoff)
+                ).rowcount
+                if count:
+                    deleted[data_type] = count
+            count = conn.execute(
+                "DELETE FROM negative_cache WHERE expires_at <= ?", (now.isoformat(),)
+            ).rowcount
+            if count:
+                deleted['negative_cache'] = count
+            
+            stale_logs = []
+            newest_season = conn.execute("SELECT MAX(season) FROM game_log_sync").fetchone()[0]
+            if newest_season is not None and Config.CACHE_GAME_LOG_SEASONS > 0:
+                stale_logs.append(("season <= ?", newest_season - Config.CACHE_GAME_LOG_SEASONS))
+            if Config.CACHE_GAME_LOG_RETENTION_DAYS > 0:
+                # Never before the log stops being servable stale
+                retention_hours = max(Config.CACHE_GAME_LOG_RETENTION_DAYS * 24, self.MAX_STALE_GAME_LOG)
+                stale_logs.append(("last_updated < ?", (now - timedelta(hours=retention_hours)).isoformat()))
+            if stale_logs:
+                where = " OR ".join(clause for clause, _ in stale_logs)
+                params = [param for _, param in stale_logs]
+                counts = {
+                    'game_logs': conn.execute(f"""
+                        DELETE FROM game_logs WHERE EXISTS (
+                            SELECT 1 FROM game_log_sync
+                            WHERE game_log_sync.player_id = game_logs.player_id
+                              AND game_log_sync.season = game_logs.season
+                              AND ({where})
+                        )
+                    """, params).rowcount,
+                    'game_log_sync': conn.execute(
+                        f"DELETE FROM game_log_sync WHERE {where}", params
+                    ).rowcount,
+                }
+                deleted.update({table: count for table, count in counts.items() if count})
+        
+        total = sum(deleted.values())
+        self._maintenance_stats['sweeps'] += 1
+        self._maintenance_stats['rows_swept'] += total
+        logger.debug(f"[CACHE] Sweep removed {total} expired row(s): {deleted}")
+        return deleted
+    
+    def vacuum(self) -> Dict[str, int]:
+        """
+        Checkpoint the WAL and rebuild the database file to reclaim free pages.
+        
+        Returns:
+            Dict with 'bytes_before' and 'bytes_after' (database + WAL files)
+        """
+        bytes_before = self.file_size()
+        with self._write_lock:
+            conn = self._connection()
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            conn.execute("VACUUM")
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        bytes_after = self.file_size()
+        logger.info(f"[CACHE] Vacuum: {bytes_before / 1024:.0f} KB -> {bytes_after / 1024:.0f} KB")
+        return {'bytes_before': bytes_before, 'bytes_after': bytes_after}
+    
+    def file_size(self) -> int:
+        """Bytes on disk (database + WAL + shared-memory files)"""
+        total = 0
+        for suffix in ('', '-wal', '-shm'):
+            path = Path(str(self.db_path) + suffix)
+            if path.exists():
+                total += path.stat().st_size
+        return total
+    
+    def get_size_report(self) -> Dict[str, Any]:
+        """
+        Row and byte counts by table, data type and source.
+        
+        Bytes are payload bytes (key and JSON lengths; game log rows are
+        estimated from their columns), not page usage.
+        
+        Returns:
+            Dict with 'file_bytes', 'tables' -> {table: rows},
+            'by_type' -> {data_type: {source: {'rows', 'bytes', 'expired'}}}
+            (stored game logs under 'game_log_rows' and 'game_log_sync'; expired
+            = past TTL_GAME_LOG) and 'game_log_seasons' -> {season: {'players', 'rows'}}
+        """
+        now = datetime.now()
+        by_type: Dict[str, Dict[str, Dict[str, int]]] = {}
+        tables: Dict[str, int] = {}
+        with self._transaction() as conn:
+            for table in ('player_data_cache', 'game_logs', 'game_log_sync', 'negative_cache'):
+                tables[table] = conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+            
+            rows = conn.execute("""
+                SELECT data_type, source, COUNT(*),
+                       SUM(LENGTH(data_json) + LENGTH(player_name) + LENGTH(team) + LENGTH(date)),
+                       MIN(last_updated)
+                FROM player_data_cache
+                GROUP BY data_type, source
+            """).fetchall()
+            for data_type, source, count, nbytes, _ in rows:
+                ttl_hours = self._get_ttl_hours(data_type)
+                expired = 0
+                if ttl_hours is not None:
+                    cutoff = (now - timedelta(hours=ttl_hours)).isoformat()
+                    expired = conn.execute("""
+                        SELECT COUNT(*) FROM player_data_cache
+                        WHERE data_type = ? AND source = ? AND last_updated < ?
+                    """, (data_type, source, cutoff)).fetchone()[0]
+                by_type.setdefault(data_type, {})[source] = {
+                    'rows': count, 'bytes': nbytes or 0, 'expired': expired
+                }
+            
+            row_bytes = ' + '.join(
+                f"LENGTH(game_logs.{name})" if sql_type == 'TEXT' else '8' for name, sql_type in GAME_LOG_COLUMNS
+            )
+            game_log_cutoff = (now - timedelta(hours=self.TTL_GAME_LOG)).isoformat()
+            for source, count, nbytes, expired in conn.execute(f"""
+                SELECT game_logs.source, COUNT(*), SUM({row_bytes}),
+                       SUM(COALESCE(game_log_sync.last_updated < ?, 1))
+                FROM game_logs
+                LEFT JOIN game_log_sync
+                  ON game_log_sync.player_id = game_logs.player_id AND game_log_sync.season = game_logs.season
+                GROUP BY game_logs.source
+            """, (game_log_cutoff,)).fetchall():
+                by_type.setdefault('game_log_rows', {})[source] = {
+                    'rows': count, 'bytes': nbytes or 0, 'expired': expired or 0
+                }
+            for source, count, nbytes, expired in conn.execute("""
+                SELECT source, COUNT(*),
+                       SUM(LENGTH(player_name) + LENGTH(source) + LENGTH(last_updated)
+                           + COALESCE(LENGTH(newest_game_date), 0) + COALESCE(LENGTH(fresh_through), 0) + 24),
+                       SUM(last_updated < ?)
+                FROM game_log_sync GROUP BY source
+            """, (game_log_cutoff,)).fetchall():
+                by_type.setdefault('game_log_sync', {})[source] = {
+                    'rows': count, 'bytes': nbytes or 0, 'expired': expired or 0
+                }
+            
+            game_log_seasons = {
+                season: {'players': players, 'rows': 0}
+                for season, players in conn.execute(
+                    "SELECT season, COUNT(*) FROM game_log_sync GROUP BY season"
+                ).fetchall()
             }
+            for season, count in conn.execute("SELECT season, COUNT(*) FROM game_logs GROUP BY season").fetchall():
+                game_log_seasons.setdefault(season, {'players': 0, 'rows': 0})['rows'] = count
+        
+        return {
+            'file_bytes': self.file_size(),
+            'tables': tables,
+            'by_type': by_type,
+            'game_log_seasons': dict(sorted(game_log_seasons.items())),
+        }
+    
+    def start_sweeper(self, interval_hours: Optional[float] = None) -> bool:
+        """
+        Run sweep_expired() every interval_hours on a daemon thread.
+        
+        Args:
+            interval_hours: Sweep interval (default: Config.CACHE_SWEEP_INTERVAL_HOURS;
+                            0 = don't start)
+        
+        Returns:
+            True if a sweeper was started (False if disabled or already running)
+        """
+        if interval_hours is None:
+            interval_hours = Config.CACHE_SWEEP_INTERVAL_HOURS
+        if interval_hours <= 0 or self._sweeper is not None:
+            return False
+        
+        def run():
+            while not self._sweeper_stop.wait(interval_hours * 3600):
+                try:
+                    self.sweep_expired()
+                except Exception as e:
+                    logger.debug(f"[CACHE] Background sweep failed: {e}")
+        
+        # First sweep right away, then on the interval
+        try:
+            self.sweep_expired()
+        except Exception as e:
+            logger.debug(f"[CACHE] Initial sweep failed: {e}")
+        self._sweeper = threading.Thread(target=run, name="cache-sweeper", daemon=True)
+        self._sweeper.start()
+        return True
+    
+    def stop_sweeper(self):
+        """Stop the background sweeper (if running)"""
+        if self._sweeper is None:
+            return
+        self._sweeper_stop.set()
+        self._sweeper.join()
+        self._sweeper = None
+        self._sweeper_stop = threading.Event()
+    
+    # -----------------------------------------------------------------
+    # Negative Cache
+    # -----------------------------------------------------------------
+    @staticmethod
+    def _negative_key(player_name: str) -> str:
+        return ' '.join(player_name.lower().replace('.', '').split())
+    
+    def set_negative(
+        self,
+        player_name: str,
+        season: str,
+        source: str,
+        reason: str = 'not_found',
+        ttl_hours: Optional[float] = None
+    ):
+        """
+        Remember that a source could not serve a player.
+        
+        Args:
+            player_name: Player name
+            season: Season string (e.g., "2024-25")
+            source: Source that failed ('statsmuse', 'databallr', 'databallr_old')
+            reason: 'not_found' (source had no data) or 'unresolved' (no source ID)
+            ttl_hours: Override the configured TTL for the reason
+        """
+        if reason not in self.NEGATIVE_REASONS:
+            raise ValueError(f"Unknown negative cache reason: {reason}")
+        if ttl_hours is None:
+            ttl_hours = (
+                Config.NEGATIVE_CACHE_UNRESOLVED_TTL if reason == 'unresolved'
+                else Config.NEGATIVE_CACHE_NOT_FOUND_TTL
+            )
+        now = datetime.now()
+        with self._transaction(write=True) as conn:
+            conn.execute(self.SQL_NEGATIVE_UPSERT, (
+                self._negative_key(player_name), season, source, reason, player_name,
+                now.isoformat(), (now + timedelta(hours=ttl_hours)).isoformat()
+            ))
+        logger.debug(f"[CACHE] Negative entry: {player_name} ({season}) {reason} on {source} for {ttl_hours}h")
+    
+    def get_negative(self, player_name: str, season: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Unexpired negative entries for a player.
+        
+        Returns:
+            Dict of source -> {'reason', 'created_at', 'expires_at'}
+        """
+        with self._transaction() as conn:
+            rows = conn.execute(self.SQL_NEGATIVE_SELECT, (
+                self._negative_key(player_name), season, datetime.now().isoformat()
+            )).fetchall()
+        return {
+            source: {'reason': reason, 'created_at': created_at, 'expires_at': expires_at}
+            for source, reason, created_at, expires_at in rows
+        }
+    
+    def list_negative(self, include_expired: bool = False) -> List[Dict[str, Any]]:
+        """All negative entries (unexpired only by default), soonest expiry first"""
+        query = """
+            SELECT player_name, season, source, reason, created_at, expires_at
+            FROM negative_cache
+        """
+        params: Tuple = ()
+        if not include_expired:
+            query += " WHERE expires_at > ?"
+            params = (datetime.now().isoformat(),)
+        query += " ORDER BY expires_at"
+        with self._transaction() as conn:
+            rows = conn.execute(query, params).fetchall()
+        return [
+            dict(zip(('player_name', 'season', 'source', 'reason', 'created_at', 'expires_at'), row))
+            for row in rows
+        ]
+    
+    def clear_negative(
+        self,
+        player_name: Optional[str] = None,
+        source: Optional[str] = None,
+        expired_only: bool = False
+    ) -> int:
+        """
+        Delete negative entries.
+        
+        Args:
+            player_name: Only this player (None = all players)
+            source: Only this source (None = all sources)
+            expired_only: Only entries that have already expired
+        
+        Returns:
+            Number of entries deleted
+        """
+        conditions, params = [], []
+        if player_name:
+            conditions.append("player_key = ?")
+            params.append(self._negative_key(player_name))
+        if source:
+            conditions.append("source = ?")
+            params.append(source)
+        if expired_only:
+            conditions.append("expires_at <= ?")
+            params.append(datetime.now().isoformat())
+        query = "DELETE FROM negative_cache"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        with self._transaction(write=True) as conn:
+            deleted = conn.execute(query, params).rowcount
+        logger.debug(f"[CACHE] {deleted} negative entr{'y' if deleted == 1 else 'ies'} cleared")
+        return deleted
+    
+    # -----------------------------------------------------------------
+    # Game Logs (row per game)
+    # -----------------------------------------------------------------
+    def resolve_player_id(self, player_name: str) -> Optional[int]:
+        """NBA player ID for the game_logs table (memoized; None = unresolved)"""
+        if player_name not in self._player_ids:
+            player_id = None
+            try:
+                from scrapers.cache_utils import get_entity_id
+                player_id = get_entity_id("player", player_name)
+            except Exception as e:
+                logger.debug(f"[CACHE] Player ID lookup failed for {player_name}: {e}")
+            self._player_ids[player_name] = player_id
+        return self._player_ids[player_name]
+    
+    @staticmethod
+    def _season_year(season: str) -> int:
+        from scrapers.cache_utils import normalize_season_for_cache
+        return normalize_season_for_cache(season)
+    
+    def player_cache_key(self, player_name: str, season: str, data_type: str) -> str:
+        """
+        ID-based key for a player's data, e.g. "player_2544_2025_game_log"
+        (name-based key when the name does not resolve to an ID)
+        """
+        from scrapers.cache_utils import normalize_cache_key_by_id
+        
+        season_year = self._season_year(season)
+        player_id = self.resolve_player_id(player_name)
+        if player_id is not None:
+            return normalize_cache_key_by_id('player', player_id, season_year, data_type)
+        return f"player_name:{player_name.lower().strip()}_{season_year}_{data_type}"
+    
+    @staticmethod
+    def _game_to_row(game: Any) -> Optional[Tuple]:
+        """GameLogEntry/dict -> column values in GAME_LOG_FIELDS order"""
+        if isinstance(game, GameLogEntry):
+            return tuple(getattr(game, name) for name in GAME_LOG_FIELDS)
+        if not isinstance(game, dict):
+            try:
+                game = asdict(game)
+            except Exception:
+                logger.warning(f"[CACHE] Could not serialize game log entry: {type(game)}")
+                return None
+        if not game.get('game_date'):
+            return None
+        return tuple(game.get(name) for name in GAME_LOG_FIELDS)
+    
+    @staticmethod
+    def _row_to_entry(row: Tuple) -> GameLogEntry:
+        entry = GameLogEntry(*row)
+        entry.won = bool(entry.won)
+        return entry
+    
+    @staticmethod
+    def _row_to_dict(row: Tuple) -> Dict[str, Any]:
+        game = dict(zip(GAME_LOG_FIELDS, row))
+        game['won'] = bool(game['won'])
+        return game
+    
+    def append_game_log_rows(
+        self,
+        player_id: int,
+        season: str,
+        games: List[Any],
+        source: str,
+        confidence_score: float,
+        player_name: str = "",
+        fresh_through: Optional[str] = None
+    ) -> int:
+        """
+        Append games to the game_logs table and mark the log fresh.
+        
+        Append-only: a game already stored for (player_id, season, game_date)
+        is kept as is, so this also merges an incremental fetch.
+        
+        Args:
+            player_id: NBA player ID
+            season: Season string (e.g., "2024-25")
+            games: GameLogEntry objects or dicts
+            source: Data source ('statsmuse', 'databallr', 'inferred')
+            confidence_score: Confidence in data (0.0-1.0)
+            player_name: Player name (for reporting)
+            fresh_through: Date (YYYY-MM-DD) through which the source was
+                           checked; every completed game up to it is stored
+        
+        Returns:
+            Number of new rows inserted
+        """
+        season_year = self._season_year(season)
+        now = datetime.now().isoformat()
+        rows = []
+        for game in games:
+            values = self._game_to_row(game)
+            if values is not None:
+                rows.append((player_id, season_year) + values + (source, now))
+        newest = max((row[2] for row in rows), default=None)
+        
+        with self._transaction(write=True) as conn:
+            before = conn.total_changes
+            conn.executemany(self.SQL_GAME_LOG_INSERT, rows)
+            inserted = conn.total_changes - before
+            conn.execute(self.SQL_GAME_LOG_SYNC, (
+                player_id, season_year, player_name or str(player_id),
+                source, confidence_score, newest, fresh_through, now
+            ))
+        
+        logger.debug(f"[CACHE] Game log {player_name or player_id} ({season}): {inserted} new of {len(rows)} game(s)")
+        return inserted
+    
+    def get_game_log_sync(self, player_name: str, season: str) -> Optional[Dict[str, Any]]:
+        """
+        Freshness record of a row-stored game log (fresh or expired).
+        
+        Returns:
+            Dict with 'newest_game_date', 'fresh_through', 'last_updated',
+            'age_hours', 'source', 'confidence_score', or None if the player has no rows
+        """
+        player_id = self.resolve_player_id(player_name)
+        if player_id is None:
+            return None
+        row = self._connection().execute("""
+            SELECT newest_game_date, fresh_through, last_updated, source, confidence_score
+            FROM game_log_sync WHERE player_id = ? AND season = ?
+        """, (player_id, self._season_year(season))).fetchone()
+        if not row:
+            return None
+        sync = dict(row)
+        sync['age_hours'] = (datetime.now() - datetime.fromisoformat(sync['last_updated'])).total_seconds() / 3600.0
+        return sync
+    
+    def get_game_log_updated(self, player_name: str, season: str, team: str = "N/A") -> Optional[datetime]:
+        """When a cached game log was last fetched (row sync record, else the blob entry; expired included)"""
+        sync = self.get_game_log_sync(player_name, season)
+        if sync:
+            return datetime.fromisoformat(sync['last_updated'])
+        with self._transaction() as conn:
+            row = conn.execute(self.SQL_SELECT, (player_name, team, season, 'game_log')).fetchone()
+        return datetime.fromisoformat(row['last_updated']) if row else None
+    
+    def mark_game_log_fresh(self, player_name: str, season: str, fresh_through: str) -> bool:
+        """
+        Restart a row-stored game log's TTL after an incremental check.
+        
+        Args:
+            player_name: Player name
+            season: Season string (e.g., "2024-25")
+            fresh_through: Date (YYYY-MM-DD) through which the log is complete
+        
+        Returns:
+            True if the player had a game log to mark
+        """
+        player_id = self.resolve_player_id(player_name)
+        if player_id is None:
+            return False
+        with self._transaction(write=True) as conn:
+            cursor = conn.execute("""
+                UPDATE game_log_sync
+                SET last_updated = ?, fresh_through = MAX(COALESCE(fresh_through, ''), ?)
+                WHERE player_id = ? AND season = ?
+            """, (datetime.now().isoformat(), fresh_through, player_id, self._season_year(season)))
+        return cursor.rowcount > 0
+    
+    def read_game_log_rows(
+        self,
+        player_id: int,
+        season: str,
+        last_n: Optional[int] = None,
+        include_expired: bool = False
+    ) -> List[Tuple]:
+        """
+        Fresh game-log rows, most recent first, in one indexed query.
+        
+        Args:
+            player_id: NBA player ID
+            season: Season string (e.g., "2024-25")
+            last_n: Only the last N games (None = whole season)
+            include_expired: Also return rows past TTL_GAME_LOG (incremental refresh base)
+        
+        Returns:
+            Column tuples in GAME_LOG_FIELDS order (empty if missing or expired)
+        """
+        season_year = self._season_year(season)
+        if include_expired:
+            fresh_after = ''
+        else:
+            fresh_after = (datetime.now() - timedelta(hours=self.TTL_GAME_LOG)).isoformat()
+        conn = self._connection()
+        return [tuple(row) for row in conn.execute(self.SQL_GAME_LOG_RANGE, (
+            player_id, season_year, player_id, season_year, fresh_after,
+            last_n if last_n else -1
+        ))]
+    
+    def get_game_log_entries(
+        self,
+        player_name: str,
+        season: str,
+        last_n: Optional[int] = None,
+        team: str = "N/A",
+        include_expired: bool = False,
+        allow_stale: bool = True
+    ) -> Optional[List[GameLogEntry]]:
+        """
+        Get cached game log as GameLogEntry objects (no JSON decode for ID-resolved players).
+        
+        Args:
+            player_name: Player name
+            season: Season string (e.g., "2024-25")
+            last_n: Only the last N games (None = whole season)
+            team: Team name (blob fallback only)
+            include_expired: Also return rows past TTL_GAME_LOG (row-stored logs only)
+            allow_stale: Let the blob fallback serve an expired entry (see get())
+        
+        Returns:
+            List of GameLogEntry (most recent first) or None if not found/expired
+        """
+        player_id = self.resolve_player_id(player_name)
+        if player_id is not None:
+            rows = self.read_game_log_rows(player_id, season, last_n, include_expired)
+            if rows:
+                logger.debug(f"Cache hit (game_logs): {player_name} ({season}), {len(rows)} games")
+                return [self._row_to_entry(row) for row in rows]
+        
+        # Blob fallback (unresolved players, logs cached before the game_logs table)
+        games = self._get_game_log_blob(player_name, season, team, allow_stale)
+        if not games:
+            return None
+        entries = []
+        for game in games:
+            try:
+                entries.append(GameLogEntry(**game))
+            except Exception as e:
+                logger.debug(f"[CACHE] Error converting cached game entry: {e}")
+        return (entries[:last_n] if last_n else entries) or None
+    
+    def load_game_log_arrays(
+        self,
+        player_name: str,
+        season: str,
+        columns: Optional[List[str]] = None,
+        last_n: Optional[int] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Load a cached game log straight into NumPy arrays (one per column).
+        
+        Args:
+            player_name: Player name
+            season: Season string (e.g., "2024-25")
+            columns: Numeric columns to load (default: all of GAME_LOG_NUMERIC_FIELDS)
+            last_n: Only the last N games (None = whole season)
+        
+        Returns:
+            Dict of column -> np.ndarray (most recent first), plus 'game_date',
+            or None if the player has no fresh rows
+        """
+        import numpy as np
+        
+        player_id = self.resolve_player_id(player_name)
+        if player_id is None:
+            return None
+        rows = self.read_game_log_rows(player_id, season, last_n)
+        if not rows:
+            return None
+        
+        columns = columns or GAME_LOG_NUMERIC_FIELDS
+        by_column = dict(zip(GAME_LOG_FIELDS, zip(*rows)))
+        arrays = {name: np.asarray(by_column[name], dtype=float) for name in columns}
+        arrays['game_date'] = np.asarray(by_column['game_date'])
+        return arrays
     
     def get_game_log(
         self,
@@ -388,12 +1503,58 @@ class DataCache:
         Returns:
             List of game log entries (as dicts) or None if not found/expired
         """
-        cached = self.get(player_name, team, season, 'game_log')
+        player_id = self.resolve_player_id(player_name)
+        if player_id is not None:
+            rows = self.read_game_log_rows(player_id, season)
+            if rows:
+                return [self._row_to_dict(row) for row in rows]
+        return self._get_game_log_blob(player_name, season, team)
+    
+    def _get_game_log_blob(
+        self, player_name: str, season: str, team: str = "N/A", allow_stale: bool = True
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Game log stored as one JSON blob in player_data_cache"""
+        cached = self.get(player_name, team, season, 'game_log', allow_stale)
         if cached:
             # Game logs are stored as a list in the 'data' field
             return cached['data'].get('games', [])
         return None
     
+    def get_game_logs(
+        self,
+        player_names: List[str],
+        season: str,
+        team: str = "N/A",
+        allow_stale: bool = True
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Get cached game logs for many players in one transaction.
+        
+        Args:
+            player_names: Player names (e.g. everyone on tonight's slate)
+            season: Season string (e.g., "2024-25")
+            team: Team name (optional, defaults to "N/A" for game logs)
+            allow_stale: Let blob-stored logs be served expired (see get())
+        
+        Returns:
+            Dict of player name -> game log entries (as dicts), hits only
+        """
+        results: Dict[str, List[Dict[str, Any]]] = {}
+        blob_names = []
+        with self._transaction():
+            for name in player_names:
+                player_id = self.resolve_player_id(name)
+                rows = self.read_game_log_rows(player_id, season) if player_id is not None else []
+                if rows:
+                    results[name] = [self._row_to_dict(row) for row in rows]
+                else:
+                    blob_names.append(name)
+        
+        keys = [(name, team, season, 'game_log') for name in blob_names]
+        cached = self.get_many(keys, allow_stale)
+        results.update({key[0]: entry['data'].get('games', []) for key, entry in cached.items()})
+        return results
+    
     def set_game_log(
         self,
         player_name: str,
@@ -401,11 +1562,16 @@ class DataCache:
         game_logs: List[Any],
         source: str,
         confidence_score: float,
-        team: str = "N/A"
+        team: str = "N/A",
+        fresh_through: Optional[str] = None
     ):
         """
         Store game log in cache.
         
+        Players with a resolved NBA ID go to the row-per-game table (new
+        games are merged into what is already stored); anyone else is
+        stored as a JSON blob in player_data_cache.
+        
         Args:
             player_name: Player name
             season: Season string (e.g., "2024-25")
@@ -413,7 +1579,19 @@ class DataCache:
             source: Data source ('statsmuse', 'databallr', 'inferred')
             confidence_score: Confidence in data (0.0-1.0)
             team: Team name (optional, defaults to "N/A" for game logs)
+            fresh_through: Date through which the source was checked (row-stored logs)
         """
+        # The memory tier's copy predates these games (the caller puts the merged log back)
+        game_log_key = self.player_cache_key(player_name, season, 'game_log')
+        self._hot_cache.pop(self._get_cache_key(game_log_key, 'N/A', season, 'game_log'))
+        
+        player_id = self.resolve_player_id(player_name)
+        if player_id is not None:
+            self.append_game_log_rows(
+                player_id, season, game_logs, source, confidence_score, player_name, fresh_through
+            )
+            return
+        
         # Convert GameLogEntry objects to dicts if needed
         games_data = []
         for game in game_logs:
@@ -7,13 +7,18 @@ Scrapes player game logs and statistics from databallr.com
 import logging
 import re
 import time
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from pathlib import Path
 from datetime import datetime
 from bs4 import BeautifulSoup
 
 from playwright.sync_api import sync_playwright, Page, Browser, BrowserContext
 
+from config.settings import Config
+from scrapers.request_blocking import install_request_blocking
+from scrapers.player_name_index import PlayerNameIndex, load_name_index, normalize_player_name
+from scrapers.fixtures import DATABALLR_GAME_LOG, fixture_key, is_recording, is_replaying, load_fixture, record_fixture
+
 from ..core.schema_map import SchemaMapper, get_databallr_schema_mapper
 from ..core.backoff import RetryConfig, retry_request
 
@@ -81,7 +86,7 @@ class DataballrPlayerScraper:
         return name.lower().strip().replace('.', '').replace('  ', ' ')
     
     def _get_player_id(self, player_name: str) -> Optional[int]:
-        """Get player ID from cache with fuzzy matching"""
+        """Get player ID from cache with fuzzy matching (shared name index)"""
         normalized = self._normalize_player_name(player_name)
         
         # Try exact match first
@@ -89,19 +94,20 @@ class DataballrPlayerScraper:
         if player_id:
             return player_id
         
-        # Try fuzzy matching - check if any cache key contains the player's last name
-        # This handles cases like "Josh Hart" vs "Joshua Hart" or similar variations
+        index = load_name_index(self.player_cache_file) or PlayerNameIndex(self._player_cache)
+        player_id = index.resolve(player_name)
+        if player_id:
+            return player_id
+        
+        # Looser match over the index's candidates - check if a candidate contains the player's
+        # last and first name. This handles cases like "Josh Hart" vs "Joshua Hart"
         name_parts = normalized.split()
         if len(name_parts) >= 2:
-            last_name = name_parts[-1]
-            # Look for keys that end with the last name
-            for key, pid in self._player_cache.items():
-                if key.endswith(last_name) or last_name in key:
-                    # Additional check: first name should also match
-                    first_name = name_parts[0]
-                    if first_name in key or key.startswith(first_name):
-                        logger.debug(f"Fuzzy matched '{player_name}' to cache key '{key}'")
-                        return pid
+            first_name, last_name = name_parts[0], name_parts[-1]
+            for key in sorted(index.candidates(normalize_player_name(player_name))):
+                if last_name in key and (first_name in key or key.startswith(first_name)):
+                    logger.debug(f"Fuzzy matched '{player_name}' to cache key '{key}'")
+                    return index.get_exact(key)
         
         logger.debug(f"Player '{player_name}' (normalized: '{normalized}') not found in cache")
         return None
@@ -123,6 +129,7 @@ class DataballrPlayerScraper:
             user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             locale='en-US'
         )
+        install_request_blocking(context, site='databallr')
         context.add_init_script("""
             Object.defineProperty(navigator, 'webdriver', {get: () => undefined});
             Object.defineProperty(navigator, 'plugins', {get: () => [1, 2, 3, 4, 5]});
@@ -137,7 +144,7 @@ class DataballrPlayerScraper:
     
     def _navigate_to_player_page(self, page: Page, player_id: int, player_slug: str) -> bool:
         """Navigate to player's DataballR page"""
-        url = f"https://databallr.com/last-games/{player_id}/{player_slug}"
+        url = f"{Config.DATABALLR_BASE_URL}/last-games/{player_id}/{player_slug}"
         try:
             logger.debug(f"Navigating to: {url}")
             page.goto(url, timeout=30000, wait_until='domcontentloaded')
@@ -170,7 +177,7 @@ class DataballrPlayerScraper:
             logger.debug(traceback.format_exc())
             return False
     
-    def _extract_game_log_table(self, page: Page, last_n_games: int = 20) -> List[Dict]:
+    def _extract_game_log_table(self, page: Page, last_n_games: int = 20) -> Tuple[Optional[List[Dict]], Optional[str]]:
         """
         Extract game log from table view.
         
@@ -179,8 +186,10 @@ class DataballrPlayerScraper:
             last_n_games: Number of games to extract
         
         Returns:
-            List of game dicts
+            (games, html): list of game dicts (None if the page could not be
+            read) and the page HTML it was parsed from (kept for fixture recording)
         """
+        html = None
         try:
             # Wait for page to fully load
             page.wait_for_load_state('networkidle', timeout=10000)
@@ -208,6 +217,25 @@ class DataballrPlayerScraper:
             
             # Get page HTML
             html = page.content()
+            return self.parse_game_log_html(html, last_n_games), html
+        except Exception as e:
+            logger.error(f"Failed to extract game log: {e}")
+            import traceback
+            logger.debug(traceback.format_exc())
+            return None, html
+    
+    def parse_game_log_html(self, html: str, last_n_games: int = 20) -> List[Dict]:
+        """
+        Parse game log rows from a DataballR player page.
+        
+        Args:
+            html: Page HTML (live or from a recorded fixture)
+            last_n_games: Number of games to keep
+        
+        Returns:
+            List of game dicts
+        """
+        try:
             soup = BeautifulSoup(html, 'html.parser')
             
             games = []
@@ -342,7 +370,7 @@ class DataballrPlayerScraper:
         player_name: str,
         last_n_games: int = 20,
         retries: int = 3
-    ) -> List[Dict]:
+    ) -> Optional[List[Dict]]:
         """
         Get player game log from DataballR.
         
@@ -352,7 +380,8 @@ class DataballrPlayerScraper:
             retries: Number of retry attempts
         
         Returns:
-            List of game dicts
+            List of game dicts; empty if the player is not in the ID cache or
+            the page loaded without games, None if no attempt could load it
         """
         logger.info(f"[DataballR] Fetching {last_n_games} games for {player_name}")
         
@@ -369,6 +398,17 @@ class DataballrPlayerScraper:
         logger.debug(f"[DataballR] Found player ID {player_id} for {player_name}")
         player_slug = self._player_name_to_slug(player_name)
         
+        if is_replaying():
+            fixture = load_fixture(DATABALLR_GAME_LOG, fixture_key(player_name))
+            if fixture is None:
+                return None
+            games = self.parse_game_log_html(fixture.html, last_n_games)
+            for game in games:
+                game['player_name'] = player_name
+            return games
+        
+        answered = False  # A page was read (an empty result is a real "no games")
+        
         # Retry logic
         for attempt in range(retries):
             try:
@@ -386,9 +426,21 @@ class DataballrPlayerScraper:
                 
                 # Extract game log
                 logger.debug(f"[DataballR] Extracting game log for {player_name}...")
-                games = self._extract_game_log_table(page, last_n_games)
+                games, html = self._extract_game_log_table(page, last_n_games)
+                if games is None:
+                    games = []
+                else:
+                    answered = True
                 logger.debug(f"[DataballR] Extracted {len(games)} games for {player_name}")
                 
+                if is_recording() and html:
+                    record_fixture(
+                        DATABALLR_GAME_LOG,
+                        fixture_key(player_name),
+                        html,
+                        meta={'url': page.url, 'player_name': player_name, 'player_id': player_id}
+                    )
+                
                 # Add player_name to each game
                 for game in games:
                     game['player_name'] = player_name
@@ -410,6 +462,8 @@ class DataballrPlayerScraper:
                 if attempt < retries - 1:
                     time.sleep(2 ** attempt)
         
+        if answered:
+            return []
         logger.error(f"[DataballR] All attempts failed for {player_name}")
-        return []
+        return None
 
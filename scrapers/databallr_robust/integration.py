@@ -26,7 +26,7 @@ def get_player_game_log(
     retries: int = 3,
     use_cache: bool = True,
     headless: bool = True
-) -> List[GameLogEntry]:
+) -> Optional[List[GameLogEntry]]:
     """
     Get player game log from DataballR (compatible with existing interface).
     
@@ -41,7 +41,8 @@ def get_player_game_log(
         headless: Run browser in headless mode
     
     Returns:
-        List of GameLogEntry objects
+        List of GameLogEntry objects; empty if DataballR has no games for the
+        player, None if the page could not be scraped
     """
     if last_n_games is None:
         last_n_games = 20
@@ -54,6 +55,8 @@ def get_player_game_log(
     try:
         # Get game log
         games = scraper.get_player_game_log(player_name, last_n_games=last_n_games, retries=retries)
+        if games is None:
+            return None
         
         # Convert to GameLogEntry format
         game_log_entries = []
@@ -67,7 +70,7 @@ def get_player_game_log(
         
     except Exception as e:
         logger.error(f"[DataballR Robust] Failed to get game log for {player_name}: {e}")
-        return []
+        return None
     finally:
         # Cleanup handled by Playwright context manager
         pass
@@ -24,6 +24,10 @@ from datetime import datetime
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from utils.retry_utils import retry_scraper_call
+from config.settings import Config
+from scrapers.request_blocking import install_request_blocking
+from scrapers.player_name_index import load_name_index
+from scrapers.player_index_db import get_player_index, load_cache_mapping
 
 # Import GameLogEntry for data structure compatibility only
 try:
@@ -105,6 +109,7 @@ def launch_databallr_browser(headless: bool = True) -> Tuple:
         user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
         locale='en-US'
     )
+    install_request_blocking(context, site='databallr')
 
     # Anti-detection JavaScript
     context.add_init_script("""
@@ -123,13 +128,22 @@ def _player_name_to_slug(player_name: str) -> str:
     return player_name.lower().replace('.', '').replace(' ', '-').replace("'", '')
 
 
+# Player ID cache shared with nba_player_cache and the robust scraper
+DATABALLR_CACHE_FILE = Path(__file__).parent.parent / "data" / "cache" / "databallr_player_cache.json"
+
+
 def _load_databallr_cache() -> Dict[str, int]:
     """Load databallr player ID cache from file"""
-    cache_file = Path(__file__).parent.parent / "data" / "cache" / "databallr_player_cache.json"
+    cache_file = DATABALLR_CACHE_FILE
     
     if not cache_file.exists():
         return {}
     
+    # Compiled player index (no JSON parse) when it is up to date
+    name_to_id = load_cache_mapping(cache_file)
+    if name_to_id is not None:
+        return name_to_id
+    
     try:
         with open(cache_file, 'r', encoding='utf-8') as f:
             data = json.load(f)
@@ -139,22 +153,65 @@ def _load_databallr_cache() -> Dict[str, int]:
         return {}
 
 
+# Parsed player_stats_cache.json, reloaded only when the file changes
+_stats_cache_file: Tuple[Optional[float], Dict] = (None, {})
+
+
 def _load_stats_cache() -> Dict:
-    """Load pre-cached player stats from file"""
+    """Load pre-cached player stats from file (parsed once per file version)"""
+    global _stats_cache_file
     cache_file = Path(__file__).parent.parent / "data" / "cache" / "player_stats_cache.json"
     
     if not cache_file.exists():
         return {}
     
     try:
+        mtime = cache_file.stat().st_mtime
+        if _stats_cache_file[0] == mtime:
+            return _stats_cache_file[1]
         with open(cache_file, 'r', encoding='utf-8') as f:
             data = json.load(f)
-            return data.get('cache', {})
+        _stats_cache_file = (mtime, data.get('cache', {}))
+        return _stats_cache_file[1]
     except Exception as e:
         logger.warning(f"Failed to load stats cache: {e}")
         return {}
 
 
+def _load_player_stats_entry(key: str) -> Optional[Dict]:
+    """One player's player_stats_cache.json entry (compiled index row, else the parsed file)"""
+    index = get_player_index()
+    try:
+        if index.available('player_stats'):
+            return index.get_player_stats(key)
+    except Exception as e:
+        logger.debug(f"Compiled stats index read failed, using JSON: {e}")
+    return _load_stats_cache().get(key)
+
+
+def _get_cached_player_stats(player_name: str, season: str) -> Optional[Dict]:
+    """
+    Pre-fetched stats for a player (memory → SQLite → player_stats_cache.json).
+
+    Returns:
+        The player's stats cache entry ('timestamp', 'game_log', ...) or None
+    """
+    from scrapers.tiered_cache import get_tiered_cache
+
+    def from_file() -> Optional[Dict]:
+        player_stats = _load_player_stats_entry(player_name.lower().strip())
+        # Expired file entries are not copied into the faster tiers
+        return player_stats if _is_stats_cache_fresh(player_stats, max_age_hours=24) else None
+
+    return get_tiered_cache().get(
+        'player', player_name, season, 'databallr_stats',
+        origin=from_file,
+        max_age_hours=24,
+        source='databallr',
+        confidence_score=0.90
+    )
+
+
 def _is_stats_cache_fresh(player_stats: Dict, max_age_hours: int = 24) -> bool:
     """Check if cached stats are still fresh (< 24 hours old)"""
     if not player_stats or 'timestamp' not in player_stats:
@@ -178,7 +235,7 @@ def _save_player_to_cache(player_name: str, player_id: int, player_slug: str) ->
         player_id: Player ID from databallr
         player_slug: Player slug (for URL construction)
     """
-    cache_file = Path(__file__).parent.parent / "data" / "cache" / "databallr_player_cache.json"
+    cache_file = DATABALLR_CACHE_FILE
     cache_file.parent.mkdir(parents=True, exist_ok=True)
     
     # Load existing cache
@@ -211,16 +268,21 @@ def _get_player_id(player_name: str) -> Optional[int]:
     Get player ID from cache, fallback mapping, or return None.
     
     Checks in order:
-    1. Databallr cache file (if exists)
+    1. Databallr cache file (if exists) via the shared name index:
+       exact key, normalized name, then fuzzy match on the same last name
+       (a near miss like "nikola jokic" -> "nikola jovic" would scrape the
+       wrong player's games)
     2. Hardcoded fallback mapping
     """
     # Normalize: remove periods, extra spaces, lowercase
     player_name_normalized = player_name.lower().strip().replace('.', '').replace('  ', ' ')
     
-    # Try cache file first
-    cache = _load_databallr_cache()
-    if cache and player_name_normalized in cache:
-        return cache[player_name_normalized]
+    # Try cache file first (index is rebuilt only when the file changes)
+    index = load_name_index(DATABALLR_CACHE_FILE)
+    if index is not None:
+        player_id = index.resolve(player_name, match_last_name=True)
+        if player_id is not None:
+            return player_id
     
     # Fallback to hardcoded mapping
     if player_name_normalized in PLAYER_ID_FALLBACK:
@@ -253,7 +315,7 @@ def smart_search_player_databallr(page, player_name: str) -> Optional[Tuple[int,
     player_id = _get_player_id(player_name)
     if player_id:
         player_slug = _player_name_to_slug(player_name)
-        player_url = f"https://databallr.com/last-games/{player_id}/{player_slug}"
+        player_url = f"{Config.DATABALLR_BASE_URL}/last-games/{player_id}/{player_slug}"
         
         # Verify URL works
         try:
@@ -304,7 +366,7 @@ def search_player_databallr(page, player_name: str) -> Optional[str]:
         player_id, player_slug, player_url = result
         # smart_search already navigated and verified the page, so we can return the URL
         # But verify we're still on the right page
-        if page.url.startswith("https://databallr.com/last-games/"):
+        if page.url.startswith(f"{Config.DATABALLR_BASE_URL}/last-games/"):
             logger.debug(f"Found player: {player_name} (ID: {player_id})")
             return player_url
         else:
@@ -396,8 +458,8 @@ def _parse_table_row(cells) -> Optional[Dict]:
         return None
 
 
-def scrape_player_game_log_databallr(page, player_url: str, last_n_games: int = 20) -> List[Dict]:
-    """Scrape game log from player page using Table View."""
+def scrape_player_game_log_databallr(page, player_url: str, last_n_games: int = 20) -> Optional[List[Dict]]:
+    """Scrape game log from player page using Table View (None if the page failed)."""
     logger.debug(f"Scraping games from: {player_url}")
     try:
         if page.url != player_url:
@@ -459,7 +521,7 @@ def scrape_player_game_log_databallr(page, player_url: str, last_n_games: int =
         logger.error(f"[Databallr] Failed to scrape game log: {e}")
         import traceback
         logger.debug(traceback.format_exc())
-        return []
+        return None
 
 
 def map_to_game_log_entry(raw_game: Dict, player_name: str) -> GameLogEntry:
@@ -502,12 +564,15 @@ def get_player_game_log(
     retries: int = 3,
     use_cache: bool = True,
     headless: bool = True
-) -> List[GameLogEntry]:
+) -> Optional[List[GameLogEntry]]:
     """
     Get player game log from databallr.com.
     
     This function has retry logic - it will automatically retry up to 3 times
     with exponential backoff if scraping fails.
+    
+    Returns an empty list if the player is not in the ID cache or the page
+    loaded without games, None if the page could not be scraped at all.
     """
     if last_n_games is None:
         last_n_games = 20
@@ -525,12 +590,9 @@ def get_player_game_log(
     
     # Check stats cache for pre-fetched data (FAST PATH)
     if use_cache:
-        stats_cache = _load_stats_cache()
-        player_name_normalized = player_name.lower().strip()
+        player_stats = _get_cached_player_stats(player_name, season)
         
-        if player_name_normalized in stats_cache:
-            player_stats = stats_cache[player_name_normalized]
-            
+        if player_stats:
             # Use cached stats if fresh (<24 hours old)
             if _is_stats_cache_fresh(player_stats, max_age_hours=24):
                 logger.info(f"[Databallr] Using cached stats for {player_name} (cached {player_stats.get('game_count', 0)} games)")
@@ -555,6 +617,7 @@ def get_player_game_log(
     # Player IS in cache - proceed with fetching (can retry on network errors)
     p = None
     browser = None
+    answered = False  # A page loaded and was parsed (empty result is a real "no games")
     
     for attempt in range(retries):
         try:
@@ -575,6 +638,8 @@ def get_player_game_log(
             raw_games = scrape_player_game_log_databallr(page, player_url, last_n_games)
             browser.close()
             p.stop()
+            if raw_games is not None:
+                answered = True
             if not raw_games:
                 logger.warning(f"[Databallr] No games found for {player_name}")
                 if attempt < retries - 1:
@@ -597,5 +662,7 @@ def get_player_game_log(
                     pass
             if attempt < retries - 1:
                 time.sleep(2 ** attempt)
+    if answered:
+        return []
     logger.error(f"[Databallr] All attempts failed for {player_name}")
-    return []
+    return None
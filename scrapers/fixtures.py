@@ -0,0 +1,188 @@
+"""
+Recorded-Page Fixtures
+======================
+Record raw pages (and captured JSON responses) from live scrapes, and
+replay them later without a browser or network.
+
+Layout (under Config.FIXTURES_DIR, default data/fixtures):
+
+    sportsbet_match/<match-slug>.html      rendered match page after expansion
+    sportsbet_match/<match-slug>.json      {'meta': {...}, 'payloads': [{'url', 'payload'}, ...]}
+    sportsbet_overview/nba.html            NBA overview (slate) page
+    statmuse_game_log/<player-slug>.html
+    databallr_game_log/<player-slug>.html
+
+Modes (Config.FIXTURE_MODE / FIXTURE_MODE env var):
+    off     - live scraping only (default)
+    record  - live scraping, every page is also saved as a fixture
+    replay  - scrape_match_complete, scrape_player_game_log and
+              DataballrPlayerScraper read fixtures instead of the live site
+              (a missing fixture is a miss, never a live request)
+
+Usage:
+    FIXTURE_MODE=record python scrapers/unified_analysis_pipeline.py
+    FIXTURE_MODE=replay python scrapers/unified_analysis_pipeline.py
+    python scripts/benchmark_parsers.py
+"""
+
+import json
+import logging
+import re
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from config.settings import Config
+
+logger = logging.getLogger(__name__)
+
+SPORTSBET_MATCH = 'sportsbet_match'
+SPORTSBET_OVERVIEW = 'sportsbet_overview'
+STATMUSE_GAME_LOG = 'statmuse_game_log'
+DATABALLR_GAME_LOG = 'databallr_game_log'
+
+SOURCES = (SPORTSBET_MATCH, SPORTSBET_OVERVIEW, STATMUSE_GAME_LOG, DATABALLR_GAME_LOG)
+
+
+@dataclass
+class Fixture:
+    """One recorded page"""
+    source: str
+    key: str
+    html: str
+    payloads: List[Dict[str, Any]] = field(default_factory=list)  # [{'url', 'payload'}]
+    meta: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def payload_values(self) -> List[Any]:
+        """Decoded JSON payloads only (what ResponseCapture.payloads() yields)"""
+        return [record['payload'] for record in self.payloads]
+
+
+# ---------------------------------------------------------------------
+# Mode
+# ---------------------------------------------------------------------
+def fixture_mode() -> str:
+    """Current mode: 'off', 'record' or 'replay'"""
+    mode = (Config.FIXTURE_MODE or 'off').lower()
+    return mode if mode in ('off', 'record', 'replay') else 'off'
+
+
+def is_recording() -> bool:
+    return fixture_mode() == 'record'
+
+
+def is_replaying() -> bool:
+    return fixture_mode() == 'replay'
+
+
+# ---------------------------------------------------------------------
+# Keys / Paths
+# ---------------------------------------------------------------------
+def fixture_key(text: str) -> str:
+    """
+    File-safe key for a URL or player name.
+
+    URLs use their last path segment (the Sportsbet match slug).
+    """
+    if '://' in text:
+        text = text.rstrip('/').split('/')[-1]
+    key = re.sub(r'[^a-z0-9]+', '-', text.lower()).strip('-')
+    return key or 'unnamed'
+
+
+def _fixture_dir(source: str) -> Path:
+    return Path(Config.FIXTURES_DIR) / source
+
+
+# ---------------------------------------------------------------------
+# Record / Load
+# ---------------------------------------------------------------------
+def record_fixture(
+    source: str,
+    key: str,
+    html: str,
+    payloads: Optional[List[Dict[str, Any]]] = None,
+    meta: Optional[Dict[str, Any]] = None
+) -> Optional[Path]:
+    """
+    Save a page as a fixture (overwrites an existing one with the same key).
+
+    Args:
+        source: One of SOURCES
+        key: Fixture key (see fixture_key())
+        html: Raw page HTML
+        payloads: Captured JSON records [{'url', 'payload'}]
+        meta: Anything the replay needs besides the HTML (url, title, ...)
+
+    Returns:
+        Path of the HTML file, or None if saving failed
+    """
+    directory = _fixture_dir(source)
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+        html_path = directory / f"{key}.html"
+        html_path.write_text(html, encoding='utf-8')
+
+        sidecar = {
+            'meta': dict(meta or {}, recorded_at=datetime.now().isoformat()),
+            'payloads': payloads or [],
+        }
+        with open(directory / f"{key}.json", 'w', encoding='utf-8') as f:
+            json.dump(sidecar, f, ensure_ascii=False)
+
+        logger.info(f"[FIXTURE] Recorded {source}/{key} ({len(html) / 1024:.0f} KB, {len(payloads or [])} payloads)")
+        return html_path
+    except Exception as e:
+        logger.warning(f"[FIXTURE] Could not record {source}/{key}: {e}")
+        return None
+
+
+def load_fixture(source: str, key: str) -> Optional[Fixture]:
+    """
+    Load a recorded fixture.
+
+    Returns:
+        Fixture, or None if it was never recorded
+    """
+    directory = _fixture_dir(source)
+    html_path = directory / f"{key}.html"
+    if not html_path.exists():
+        logger.warning(f"[FIXTURE] No fixture for {source}/{key}")
+        return None
+
+    html = html_path.read_text(encoding='utf-8')
+    sidecar: Dict[str, Any] = {}
+    sidecar_path = directory / f"{key}.json"
+    if sidecar_path.exists():
+        try:
+            with open(sidecar_path, 'r', encoding='utf-8') as f:
+                sidecar = json.load(f)
+        except Exception as e:
+            logger.warning(f"[FIXTURE] Could not read {sidecar_path.name}: {e}")
+
+    return Fixture(
+        source=source,
+        key=key,
+        html=html,
+        payloads=sidecar.get('payloads', []),
+        meta=sidecar.get('meta', {})
+    )
+
+
+def list_fixtures(source: Optional[str] = None) -> List[Fixture]:
+    """Load every recorded fixture (of one source, or all)"""
+    return list(iter_fixtures(source))
+
+
+def iter_fixtures(source: Optional[str] = None) -> Iterator[Fixture]:
+    """Iterate recorded fixtures in key order"""
+    for src in ([source] if source else SOURCES):
+        directory = _fixture_dir(src)
+        if not directory.exists():
+            continue
+        for html_path in sorted(directory.glob('*.html')):
+            fixture = load_fixture(src, html_path.stem)
+            if fixture is not None:
+                yield fixture
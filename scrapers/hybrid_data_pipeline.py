@@ -15,7 +15,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import logging
 from typing import Dict, List, Optional
-from datetime import datetime, timedelta
+from datetime import datetime
 
 # Import scrapers
 from scrapers.statmuse_player_scraper import (
@@ -26,6 +26,8 @@ from scrapers.statmuse_player_scraper import (
 )
 from scrapers.databallr_scraper import get_player_game_log as databallr_get_game_log
 from scrapers.advanced_metrics import calculate_all_metrics
+from scrapers.single_flight import single_flight
+from scrapers.tiered_cache import get_tiered_cache
 
 logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(message)s")
 logger = logging.getLogger("hybrid_pipeline")
@@ -58,7 +60,6 @@ class HybridPlayerDataPipeline:
         self.use_cache = use_cache
         self.cache_ttl_hours = cache_ttl_hours
         self.default_season = default_season
-        self._cache = {}
     
     def get_player_full_profile(
         self,
@@ -90,20 +91,31 @@ class HybridPlayerDataPipeline:
             26.4 28.2
         """
         season = season or self.default_season
-        cache_key = f"{player_name}_{season}_full"
-        
-        # Check cache
-        if self.use_cache and cache_key in self._cache:
-            cached_data, cached_time = self._cache[cache_key]
-            age = datetime.now() - cached_time
-            ttl_delta = timedelta(hours=self.cache_ttl_hours)
-            if age < ttl_delta:
-                ttl_remaining = (ttl_delta - age).total_seconds() / 3600.0
-                logger.debug(f"Cache hit: {player_name} ({season})")
-                return cached_data
-            else:
-                logger.debug(f"Cache miss (expired): {player_name} ({season})")
-        
+
+        if not self.use_cache:
+            # Concurrent callers for the same player/season still share one fetch
+            return single_flight.do(
+                (player_name, season, 'full_profile'),
+                self._fetch_player_full_profile, player_name, season, include_databallr, headless
+            )
+
+        # Memory → SQLite → scrape, keyed by player ID and season
+        return get_tiered_cache().get(
+            'player', player_name, season, 'full_profile',
+            origin=lambda: self._fetch_player_full_profile(player_name, season, include_databallr, headless),
+            max_age_hours=self.cache_ttl_hours,
+            source='statsmuse',
+            confidence_score=0.85
+        )
+
+    def _fetch_player_full_profile(
+        self,
+        player_name: str,
+        season: str,
+        include_databallr: bool = True,
+        headless: bool = True
+    ) -> Optional[Dict]:
+        """get_player_full_profile() without caching or request coalescing"""
         logger.debug(f"Cache miss: {player_name} ({season}), fetching...")
         
         # 1. Get base profile from StatsMuse
@@ -126,7 +138,7 @@ class HybridPlayerDataPipeline:
             'rest_2_plus_days': None,
             'monthly': {},
             'vs_opponent': {},
-            'all': splits_list
+            'all': [split.to_dict() for split in splits_list]  # JSON-safe for the SQLite tier
         }
         
         for split in splits_list:
@@ -213,10 +225,6 @@ class HybridPlayerDataPipeline:
             'last_updated': datetime.now().isoformat()
         }
         
-        # Cache result
-        if self.use_cache:
-            self._cache[cache_key] = (full_profile, datetime.now())
-        
         return full_profile
     
     def get_player_context_for_bet(
@@ -4,9 +4,10 @@ Player ID Cache (Databallr Source)
 Manages a local cache of NBA player IDs from Databallr comprehensive cache.
 
 Features:
-- Loads from databallr_player_cache.json (comprehensive cache)
+- Loads from databallr_player_cache.json (comprehensive cache), queried
+  through the compiled player index (player_index_db) when it is up to date
 - Normalizes player names for consistent matching
-- Supports fuzzy matching with Levenshtein distance
+- Supports fuzzy matching via a prebuilt name index (player_name_index)
 - Manual override table for edge cases
 - Fast local lookups (no API calls needed)
 - Uses Databallr and Sportsbet as data sources only
@@ -17,13 +18,17 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import json
-import re
 from datetime import datetime, timedelta
 from typing import Dict, Optional, Tuple
 from pathlib import Path
 import logging
 from difflib import SequenceMatcher
 
+import sqlite3
+
+from scrapers.player_index_db import PlayerIndexDB, get_player_index, load_cache_mapping
+from scrapers.player_name_index import PlayerNameIndex, load_name_index, normalize_player_name
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("nba_player_cache")
 
@@ -41,42 +46,6 @@ PLAYER_CACHE_FILE = DATABALLR_CACHE_FILE  # Alias for compatibility
 MANUAL_OVERRIDES_FILE = CACHE_DIR / "nba_player_overrides.json"
 
 
-def normalize_player_name(name: str) -> str:
-    """
-    Normalize player name for consistent matching
-    
-    Steps:
-    1. Lowercase everything
-    2. Remove punctuation
-    3. Remove Jr., Sr., III, etc.
-    4. Convert multiple spaces → one
-    5. Trim whitespace
-    """
-    if not name:
-        return ""
-    
-    # Lowercase
-    normalized = name.lower()
-    
-    # Remove common suffixes (process longer ones first to avoid partial matches)
-    # e.g., "iii" must be processed before "ii" to avoid "murphy iii" -> "murphy i"
-    suffixes = ['jr.', 'jr', 'sr.', 'sr', 'iii', 'ii', 'iv', 'v']
-    for suffix in suffixes:
-        # Remove with comma and without, ensure word boundary at end
-        normalized = re.sub(rf',?\s*{re.escape(suffix)}\b', '', normalized, flags=re.IGNORECASE)
-    
-    # Remove punctuation
-    normalized = re.sub(r'[^\w\s]', '', normalized)
-    
-    # Convert multiple spaces to one
-    normalized = re.sub(r'\s+', ' ', normalized)
-    
-    # Trim whitespace
-    normalized = normalized.strip()
-    
-    return normalized
-
-
 def build_player_cache() -> Dict[str, int]:
     """
     DEPRECATED: This function is no longer used.
@@ -98,6 +67,12 @@ def load_player_cache() -> Tuple[Dict[str, int], bool]:
     """
     # Try databallr cache first (primary source)
     if DATABALLR_CACHE_FILE.exists():
+        # Compiled player index (no JSON parse) when it is up to date
+        name_to_id = load_cache_mapping(DATABALLR_CACHE_FILE)
+        if name_to_id:
+            logger.info(f"Loaded player cache from compiled index ({len(name_to_id)} entries)")
+            return name_to_id, False
+        
         try:
             with open(DATABALLR_CACHE_FILE, 'r', encoding='utf-8') as f:
                 cache_data = json.load(f)
@@ -195,6 +170,9 @@ def find_player_id_fuzzy(cache: Dict[str, int], normalized_name: str, threshold:
     """
     Find player ID using fuzzy matching
     
+    Builds a PlayerNameIndex over the cache for this call; PlayerIDCache
+    keeps a prebuilt one instead.
+    
     Args:
         cache: Player cache dictionary
         normalized_name: Normalized player name to search for
@@ -203,42 +181,16 @@ def find_player_id_fuzzy(cache: Dict[str, int], normalized_name: str, threshold:
     Returns:
         Player ID if found, None otherwise
     """
-    best_match = None
-    best_score = 0.0
-    
-    # Token matching: "john collins" should match "collins john"
-    name_tokens = set(normalized_name.split())
-    
-    for cached_name, player_id in cache.items():
-        # Try exact match first
-        if normalized_name == cached_name:
-            return player_id
-        
-        # Calculate similarity
-        score = similarity_score(normalized_name, cached_name)
-        
-        # Token matching bonus
-        cached_tokens = set(cached_name.split())
-        if name_tokens == cached_tokens:
-            score = max(score, 0.95)  # High score for token match
-        
-        if score > best_score:
-            best_score = score
-            best_match = player_id
-    
-    # Return if above threshold
-    if best_score >= threshold:
-        logger.debug(f"Fuzzy match: '{normalized_name}' -> score {best_score:.2f}")
-        return best_match
-    
-    return None
+    return PlayerNameIndex(cache).find(normalized_name, threshold)
 
 
 class PlayerIDCache:
     """Manages player ID cache from Databallr comprehensive cache (no API calls)"""
 
     def __init__(self):
-        self.cache: Dict[str, int] = {}
+        self._cache: Optional[Dict[str, int]] = None
+        self._index: Optional[PlayerNameIndex] = None
+        self._compiled: Optional[PlayerIndexDB] = None
         self.overrides: Dict[str, int] = {}
         # Performance tracking
         self.stats = {
@@ -256,15 +208,54 @@ class PlayerIDCache:
         # Load manual overrides first
         self.overrides = load_manual_overrides()
         
+        # Compiled player index: IDs are queried per lookup, nothing parsed up front
+        compiled = get_player_index()
+        if compiled.available('player_ids'):
+            self._compiled = compiled
+            logger.info(f"Player ID index ready ({compiled.count('player_ids')} entries, compiled from databallr)")
+            return
+        
         # Load cache from databallr (no refresh needed - it's a static file)
-        cache, _ = load_player_cache()
-        self.cache = cache
+        self._cache, _ = load_player_cache()
         
-        if self.cache:
+        if self._cache:
             logger.info(f"Loaded player cache ({len(self.cache)} entries) from databallr")
         else:
             logger.warning("No player cache loaded. Please run build_comprehensive_player_cache.py to create cache.")
     
+    @property
+    def cache(self) -> Dict[str, int]:
+        """Name -> player ID mapping (read from the compiled index on first access)"""
+        if self._cache is None:
+            self._cache = self._compiled.player_ids() if self._compiled is not None else {}
+        return self._cache
+    
+    @property
+    def index(self) -> PlayerNameIndex:
+        """Fuzzy-match index (built on first use, shared with the databallr resolvers)"""
+        if self._index is None:
+            shared = load_name_index(DATABALLR_CACHE_FILE) if DATABALLR_CACHE_FILE.exists() else None
+            self._index = shared if shared is not None and len(shared) else PlayerNameIndex(self.cache)
+        return self._index
+    
+    def _get_exact(self, normalized: str) -> Optional[int]:
+        """ID for a cache key or normalized name, without fuzzy matching"""
+        if self._compiled is not None and self._cache is None:
+            try:
+                player_id = self._compiled.get_player_id(normalized)
+                if player_id is None:
+                    player_id = self._compiled.get_player_id(normalized, normalized=True)
+                return player_id
+            except sqlite3.Error as e:
+                logger.debug(f"Compiled player index read failed, using JSON cache: {e}")
+                self._compiled = None
+                self._cache, _ = load_player_cache()
+        
+        player_id = self.cache.get(normalized)
+        if player_id is None and normalized in self.index:
+            player_id = self.index.find(normalized)
+        return player_id
+    
     def get_player_id(self, player_name: str) -> Optional[int]:
         """
         Get player ID from cache
@@ -290,13 +281,14 @@ class PlayerIDCache:
             self.stats['override_hits'] += 1
             return self.overrides[normalized]
 
-        # Check cache (exact match)
-        if normalized in self.cache:
+        # Check cache (exact match, raw or normalized key)
+        player_id = self._get_exact(normalized)
+        if player_id is not None:
             self.stats['cache_hits'] += 1
-            return self.cache[normalized]
+            return player_id
 
-        # Try fuzzy matching
-        fuzzy_match = find_player_id_fuzzy(self.cache, normalized, threshold=0.90)
+        # Try fuzzy matching (index narrows candidates, results memoized)
+        fuzzy_match = self.index.find(normalized, threshold=0.90)
         if fuzzy_match:
             self.stats['fuzzy_hits'] += 1
             return fuzzy_match
@@ -16,6 +16,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from playwright.sync_api import sync_playwright
+from scrapers.request_blocking import install_request_blocking
 from bs4 import BeautifulSoup
 import json
 import re
@@ -69,6 +70,7 @@ def scrape_nba_schedule(headless: bool = True, date: Optional[str] = None) -> Li
     with sync_playwright() as p:
         browser = p.chromium.launch(headless=headless)
         page = browser.new_page()
+        install_request_blocking(page, site='nba')
         
         try:
             # Load the page and wait for content
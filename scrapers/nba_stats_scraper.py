@@ -20,6 +20,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from playwright.sync_api import sync_playwright
+from scrapers.request_blocking import install_request_blocking
 from bs4 import BeautifulSoup
 import json
 import re
@@ -146,6 +147,7 @@ def scrape_player_stats(
     with sync_playwright() as p:
         browser = p.chromium.launch(headless=headless)
         page = browser.new_page()
+        install_request_blocking(page, site='nba')
         
         try:
             # Navigate to players page
@@ -218,6 +220,7 @@ def scrape_team_stats(
     with sync_playwright() as p:
         browser = p.chromium.launch(headless=headless)
         page = browser.new_page()
+        install_request_blocking(page, site='nba')
         
         try:
             page.goto(url, wait_until="domcontentloaded", timeout=30000)
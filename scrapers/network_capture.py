@@ -0,0 +1,177 @@
+"""
+Network Response Capture
+========================
+Subscribes to Playwright response events and keeps the JSON payloads a page
+loads for itself (XHR/fetch), so scrapers can build their data objects from
+the site's own API responses instead of re-parsing rendered HTML.
+
+Response bodies are read lazily: the event handler only filters on URL,
+resource type and content-type, and payloads() decodes the kept responses
+when asked (before the page navigates away).
+
+Usage:
+    from scrapers.network_capture import ResponseCapture
+
+    capture = ResponseCapture(url_patterns=[r'sportsbet\\.com\\.au'])
+    capture.attach(page)
+    page.goto(url)
+    ...
+    for payload in capture.payloads():
+        ...
+    capture.detach()
+"""
+
+import logging
+import re
+from typing import Any, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Skip bodies larger than this (analytics dumps, bundles mislabelled as JSON)
+MAX_PAYLOAD_BYTES = 5 * 1024 * 1024
+
+
+class ResponseCapture:
+    """
+    Collects JSON responses from a Playwright page.
+
+    Attach before navigation so early API calls are seen. Detach before the
+    page is handed back to a BrowserPool, otherwise the handler would keep
+    collecting on the next match.
+    """
+
+    def __init__(
+        self,
+        url_patterns: Optional[List[str]] = None,
+        resource_types: tuple = ('xhr', 'fetch'),
+        max_payload_bytes: int = MAX_PAYLOAD_BYTES
+    ):
+        """
+        Args:
+            url_patterns: Regexes a response URL must match (None = any URL)
+            resource_types: Playwright resource types to keep
+            max_payload_bytes: Skip bodies larger than this
+        """
+        self._url_patterns = [re.compile(p, re.I) for p in (url_patterns or [])]
+        self.resource_types = resource_types
+        self.max_payload_bytes = max_payload_bytes
+
+        self._page = None
+        self._responses: List[Any] = []
+        self._decoded: Dict[int, Any] = {}
+        self.stats = {
+            'responses_seen': 0,
+            'responses_kept': 0,
+            'payloads_decoded': 0,
+            'decode_failures': 0,
+            'bytes_decoded': 0,
+        }
+
+    # -----------------------------------------------------------------
+    # Attach / Detach
+    # -----------------------------------------------------------------
+    def attach(self, page) -> 'ResponseCapture':
+        """Start listening for responses on a page"""
+        self.detach()
+        self._page = page
+        page.on('response', self._on_response)
+        return self
+
+    def detach(self):
+        """Stop listening (safe to call more than once)"""
+        if self._page is not None:
+            try:
+                self._page.remove_listener('response', self._on_response)
+            except Exception:
+                pass
+            self._page = None
+
+    def _on_response(self, response):
+        """Keep JSON API responses (bodies are read later in payloads())"""
+        self.stats['responses_seen'] += 1
+        try:
+            if response.request.resource_type not in self.resource_types:
+                return
+            content_type = response.headers.get('content-type', '')
+            if 'json' not in content_type:
+                return
+            if self._url_patterns and not any(p.search(response.url) for p in self._url_patterns):
+                return
+            if response.status >= 400:
+                return
+        except Exception:
+            return
+
+        self._responses.append(response)
+        self.stats['responses_kept'] += 1
+
+    # -----------------------------------------------------------------
+    # Payloads
+    # -----------------------------------------------------------------
+    def payloads(self) -> Iterator[Any]:
+        """
+        Yield decoded JSON payloads of kept responses (in arrival order).
+
+        Bodies are decoded once and memoized.
+        """
+        for index, response in enumerate(self._responses):
+            if index in self._decoded:
+                if self._decoded[index] is not None:
+                    yield self._decoded[index]
+                continue
+
+            payload = None
+            try:
+                body = response.body()
+                if len(body) <= self.max_payload_bytes:
+                    payload = response.json()
+                    self.stats['payloads_decoded'] += 1
+                    self.stats['bytes_decoded'] += len(body)
+            except Exception as e:
+                self.stats['decode_failures'] += 1
+                logger.debug(f"[CAPTURE] Could not decode {response.url}: {e}")
+
+            self._decoded[index] = payload
+            if payload is not None:
+                yield payload
+
+    def records(self) -> List[Dict[str, Any]]:
+        """Decoded payloads with their URLs (for saving as fixtures)"""
+        list(self.payloads())  # make sure everything is decoded
+        records = []
+        for index, response in enumerate(self._responses):
+            payload = self._decoded.get(index)
+            if payload is not None:
+                records.append({'url': response.url, 'payload': payload})
+        return records
+
+    def clear(self):
+        """Forget captured responses (e.g. between two matches on one page)"""
+        self._responses = []
+        self._decoded = {}
+
+
+# ---------------------------------------------------------------------
+# JSON Tree Helpers
+# ---------------------------------------------------------------------
+def iter_json_nodes(node: Any) -> Iterator[Any]:
+    """Depth-first walk over every dict and list in a decoded JSON payload"""
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, dict):
+            yield current
+            stack.extend(reversed(list(current.values())))
+        elif isinstance(current, list):
+            yield current
+            stack.extend(reversed(current))
+
+
+def find_key(payloads: List[Any], key: str) -> List[Any]:
+    """Collect every value stored under `key` anywhere in the payloads"""
+    found = []
+    for payload in payloads:
+        for node in iter_json_nodes(payload):
+            if isinstance(node, dict) and key in node:
+                found.append(node[key])
+    return found
@@ -0,0 +1,203 @@
+"""
+Per-Page Parsed Document Cache
+==============================
+Serializes and parses a Playwright page's DOM once per DOM state and shares
+the result across extractors.
+
+Big Sportsbet match pages are several MB of HTML; without this cache every
+extractor called page.content() and built its own BeautifulSoup tree, so the
+same document was serialized and parsed 6+ times per match.
+
+Rules:
+- get_page_html()/get_page_soup() return the cached copy for the page's
+  current DOM state (building it on first use)
+- Anything that changes the DOM (clicks that expand/swap content) must call
+  invalidate_page_document(page) afterwards
+- A navigation to a different URL invalidates automatically
+- Uses lxml when installed (much faster), html.parser otherwise
+
+Extractors must treat the shared soup as read-only.
+"""
+
+import logging
+import threading
+from typing import Dict, Any, Optional
+
+from bs4 import BeautifulSoup
+
+logger = logging.getLogger(__name__)
+
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+
+class _PageDocument:
+    """Cached serialization/parse of one page's DOM state"""
+
+    __slots__ = ('page', 'url', 'html', 'soup')
+
+    def __init__(self, page, url: str, html: str):
+        self.page = page
+        self.url = url
+        self.html = html
+        self.soup: Optional[BeautifulSoup] = None
+
+
+_lock = threading.Lock()
+_documents: Dict[int, _PageDocument] = {}
+_stats = {
+    'serializations': 0,
+    'parses': 0,
+    'html_hits': 0,
+    'soup_hits': 0,
+    'invalidations': 0,
+    'bytes_serialized': 0,
+}
+
+
+def parse_html(html: str) -> BeautifulSoup:
+    """Parse HTML with the fastest available parser"""
+    return BeautifulSoup(html, HTML_PARSER)
+
+
+def _current_document(page) -> _PageDocument:
+    """Get the cached document for the page, serializing the DOM if needed"""
+    key = id(page)
+    url = page.url
+
+    with _lock:
+        doc = _documents.get(key)
+        # id() can be reused after a page is garbage collected, so compare identity too
+        if doc is not None and doc.page is page and doc.url == url:
+            return doc
+
+    html = page.content()
+    doc = _PageDocument(page, url, html)
+
+    with _lock:
+        _documents[key] = doc
+        _stats['serializations'] += 1
+        _stats['bytes_serialized'] += len(html)
+    return doc
+
+
+def get_page_html(page) -> str:
+    """
+    Get the page's serialized HTML for its current DOM state.
+
+    Args:
+        page: Playwright page object
+
+    Returns:
+        HTML string (shared; serialized once per DOM state)
+    """
+    key = id(page)
+    with _lock:
+        doc = _documents.get(key)
+        if doc is not None and doc.page is page and doc.url == page.url:
+            _stats['html_hits'] += 1
+            return doc.html
+    return _current_document(page).html
+
+
+def get_page_soup(page) -> BeautifulSoup:
+    """
+    Get a parsed BeautifulSoup tree for the page's current DOM state.
+
+    Args:
+        page: Playwright page object
+
+    Returns:
+        BeautifulSoup tree (shared and read-only; parsed once per DOM state)
+    """
+    doc = _current_document(page)
+    if doc.soup is not None:
+        with _lock:
+            _stats['soup_hits'] += 1
+        return doc.soup
+
+    soup = parse_html(doc.html)
+    with _lock:
+        doc.soup = soup
+        _stats['parses'] += 1
+    return soup
+
+
+def invalidate_page_document(page):
+    """
+    Drop the cached document for a page.
+
+    Call after any interaction that changes the DOM (clicks that expand
+    sections, toggle teams, load more content).
+    """
+    with _lock:
+        if _documents.pop(id(page), None) is not None:
+            _stats['invalidations'] += 1
+
+
+def get_document_stats() -> Dict[str, Any]:
+    """Get cache statistics (serializations/parses vs hits)"""
+    with _lock:
+        stats = dict(_stats)
+    stats['parser'] = HTML_PARSER
+    stats['cached_pages'] = len(_documents)
+    return stats
+
+
+# ---------------------------------------------------------------------
+# Document Views
+# ---------------------------------------------------------------------
+class LivePageDocument:
+    """
+    Read-only view of a live page for extractors that only need its markup.
+
+    html/soup go through the shared cache above, so nothing is serialized
+    or parsed unless an extractor actually asks for it.
+    """
+
+    def __init__(self, page):
+        self.page = page
+
+    @property
+    def html(self) -> str:
+        return get_page_html(self.page)
+
+    @property
+    def soup(self) -> BeautifulSoup:
+        return get_page_soup(self.page)
+
+    @property
+    def title(self) -> str:
+        try:
+            return self.page.title()
+        except Exception:
+            return ''
+
+
+class HtmlDocument:
+    """
+    Same interface as LivePageDocument for HTML recorded earlier (fixtures).
+
+    The soup is parsed on first access.
+    """
+
+    def __init__(self, html: str, title: Optional[str] = None):
+        self.html = html
+        self._soup: Optional[BeautifulSoup] = None
+        self._title = title
+
+    @property
+    def soup(self) -> BeautifulSoup:
+        if self._soup is None:
+            self._soup = parse_html(self.html)
+        return self._soup
+
+    @property
+    def title(self) -> str:
+        if self._title is None:
+            tag = self.soup.find('title')
+            self._title = tag.get_text(strip=True) if tag else ''
+        return self._title
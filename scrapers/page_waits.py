@@ -0,0 +1,291 @@
+"""
+Event-Driven Page Waits
+=======================
+Replacements for fixed time.sleep() calls in Playwright page interactions.
+
+Each wait returns as soon as its condition is met (selector visible, DOM
+quiet, network idle) and never takes longer than a timeout ceiling. The
+ceiling defaults to the fixed sleep it replaces ("budget"), so the worst
+case is no slower than before.
+
+Every wait records how long it actually took next to its old budget, so
+the saving can be seen per call site:
+
+    [WAIT] team toggle: 0.31s (fixed budget 1.5s)
+
+Usage:
+    from scrapers.page_waits import wait_for_dom_settle, wait_for_selector
+
+    button.click()
+    wait_for_dom_settle(page, budget=1.5, label="team toggle")
+"""
+
+import logging
+import threading
+import time
+from typing import Dict, Any, Optional
+
+logger = logging.getLogger(__name__)
+
+# Default quiet window for DOM settling (no mutations for this long = settled)
+DEFAULT_QUIET_MS = 400
+
+# Installs a MutationObserver that timestamps the last DOM change
+_MUTATION_PROBE = """
+() => {
+    if (!window.__pbMutationProbe) {
+        window.__pbLastMutation = performance.now();
+        window.__pbMutationProbe = new MutationObserver(() => {
+            window.__pbLastMutation = performance.now();
+        });
+        window.__pbMutationProbe.observe(document, {
+            childList: true, subtree: true, attributes: true, characterData: true
+        });
+    }
+    return true;
+}
+"""
+
+# Restarts the quiet window, so a wait needs one that begins after the action
+# (a probe left by an earlier wait would otherwise report an old mutation)
+_QUIET_WINDOW_RESET = "() => { window.__pbLastMutation = performance.now(); }"
+
+_DOM_QUIET_CHECK = "quiet => performance.now() - (window.__pbLastMutation || 0) >= quiet"
+
+
+# ---------------------------------------------------------------------
+# Wait Statistics
+# ---------------------------------------------------------------------
+_stats_lock = threading.Lock()
+_wait_stats: Dict[str, Dict[str, float]] = {}
+
+
+def _record(label: str, elapsed: float, budget: float, met: bool):
+    """Record one wait and log actual vs fixed budget"""
+    with _stats_lock:
+        entry = _wait_stats.setdefault(label, {
+            'count': 0,
+            'timeouts': 0,
+            'actual_seconds': 0.0,
+            'budget_seconds': 0.0,
+        })
+        entry['count'] += 1
+        entry['actual_seconds'] += elapsed
+        entry['budget_seconds'] += budget
+        if not met:
+            entry['timeouts'] += 1
+
+    status = "" if met else ", hit ceiling"
+    logger.debug(f"[WAIT] {label}: {elapsed:.2f}s (fixed budget {budget:.1f}s{status})")
+
+
+def get_wait_stats() -> Dict[str, Any]:
+    """
+    Get accumulated wait statistics.
+
+    Returns:
+        Dict with 'by_label' (count, timeouts, actual/budget seconds per call
+        site) and totals 'actual_seconds', 'budget_seconds', 'saved_seconds'
+    """
+    with _stats_lock:
+        by_label = {label: dict(entry) for label, entry in _wait_stats.items()}
+
+    actual = sum(e['actual_seconds'] for e in by_label.values())
+    budget = sum(e['budget_seconds'] for e in by_label.values())
+    return {
+        'by_label': by_label,
+        'actual_seconds': actual,
+        'budget_seconds': budget,
+        'saved_seconds': max(0.0, budget - actual),
+    }
+
+
+def format_wait_summary() -> str:
+    """One-line summary of time spent waiting vs the old fixed sleeps"""
+    stats = get_wait_stats()
+    waits = sum(e['count'] for e in stats['by_label'].values())
+    return (
+        f"{waits} wait(s), {stats['actual_seconds']:.1f}s waited "
+        f"vs {stats['budget_seconds']:.1f}s fixed budget "
+        f"({stats['saved_seconds']:.1f}s saved)"
+    )
+
+
+def reset_wait_stats():
+    """Clear accumulated wait statistics"""
+    with _stats_lock:
+        _wait_stats.clear()
+
+
+# ---------------------------------------------------------------------
+# Wait Strategies
+# ---------------------------------------------------------------------
+def wait_for_selector(
+    page,
+    selector: str,
+    budget: float,
+    timeout: Optional[float] = None,
+    state: str = "visible",
+    label: Optional[str] = None
+) -> bool:
+    """
+    Wait until a selector reaches the given state.
+
+    Args:
+        page: Playwright page object
+        selector: Selector to wait for
+        budget: Fixed sleep (seconds) this wait replaces
+        timeout: Ceiling in seconds (default: budget)
+        state: 'attached', 'detached', 'visible' or 'hidden'
+        label: Call-site label for stats/logging (default: selector)
+
+    Returns:
+        True if the condition was met, False if the ceiling was hit
+    """
+    timeout = budget if timeout is None else timeout
+    start = time.perf_counter()
+    met = True
+    try:
+        page.wait_for_selector(selector, state=state, timeout=int(timeout * 1000))
+    except Exception:
+        met = False
+    _record(label or selector, time.perf_counter() - start, budget, met)
+    return met
+
+
+def wait_for_dom_settle(
+    page,
+    budget: float,
+    timeout: Optional[float] = None,
+    quiet_ms: int = DEFAULT_QUIET_MS,
+    label: str = "dom settle"
+) -> bool:
+    """
+    Wait until the DOM has had no mutations for quiet_ms.
+
+    Used after clicks/scrolls that expand or swap content in place.
+
+    Args:
+        page: Playwright page object
+        budget: Fixed sleep (seconds) this wait replaces
+        timeout: Ceiling in seconds (default: budget)
+        quiet_ms: Mutation-free window that counts as settled
+        label: Call-site label for stats/logging
+
+    Returns:
+        True if the DOM settled, False if the ceiling was hit
+    """
+    timeout = budget if timeout is None else timeout
+    # Never wait for a quiet window longer than the ceiling itself
+    quiet_ms = min(quiet_ms, int(timeout * 1000))
+    start = time.perf_counter()
+    met = True
+    try:
+        page.evaluate(_MUTATION_PROBE)
+        page.evaluate(_QUIET_WINDOW_RESET)
+        page.wait_for_function(
+            _DOM_QUIET_CHECK,
+            arg=quiet_ms,
+            timeout=int(timeout * 1000),
+            polling=100
+        )
+    except Exception:
+        met = False
+    _record(label, time.perf_counter() - start, budget, met)
+    return met
+
+
+def wait_for_network_idle(
+    page,
+    budget: float,
+    timeout: Optional[float] = None,
+    label: str = "network idle"
+) -> bool:
+    """
+    Wait for the page's load-time network to go idle.
+
+    Playwright's 'networkidle' load state belongs to the navigation: once
+    the page has reached it, it is satisfied immediately, so this does not
+    wait for requests started later by clicks or scrolls. Wait on the
+    content those requests render instead (wait_for_selector/wait_for_content
+    with a selector).
+
+    Args:
+        page: Playwright page object
+        budget: Fixed sleep (seconds) this wait replaces
+        timeout: Ceiling in seconds (default: budget)
+        label: Call-site label for stats/logging
+
+    Returns:
+        True if the network went idle, False if the ceiling was hit
+    """
+    timeout = budget if timeout is None else timeout
+    start = time.perf_counter()
+    met = True
+    try:
+        page.wait_for_load_state('networkidle', timeout=int(timeout * 1000))
+    except Exception:
+        met = False
+    _record(label, time.perf_counter() - start, budget, met)
+    return met
+
+
+def wait_for_content(
+    page,
+    budget: float,
+    selector: Optional[str] = None,
+    quiet_ms: int = DEFAULT_QUIET_MS,
+    label: str = "content"
+) -> bool:
+    """
+    Wait until content is ready: its selector visible, or (without one)
+    load-time network idle followed by a quiet DOM, within one ceiling.
+
+    Pass a selector after in-page actions such as tab switches: the
+    'networkidle' load state only tracks the initial navigation and is
+    already met after a click, so only the rendered content is a real
+    readiness signal there.
+
+    Args:
+        page: Playwright page object
+        budget: Fixed sleep (seconds) this wait replaces; also the total ceiling
+        selector: Selector that marks the content as ready
+        quiet_ms: Mutation-free window used when no selector is given
+        label: Call-site label for stats/logging
+
+    Returns:
+        True if the content was ready, False if the ceiling was hit
+    """
+    start = time.perf_counter()
+    met = True
+
+    if selector:
+        try:
+            page.wait_for_selector(selector, state="visible", timeout=int(budget * 1000))
+        except Exception:
+            met = False
+        _record(label, time.perf_counter() - start, budget, met)
+        return met
+
+    deadline = start + budget
+    try:
+        page.wait_for_load_state('networkidle', timeout=int(budget * 1000))
+    except Exception:
+        met = False
+
+    remaining = max(0.0, deadline - time.perf_counter())
+    if met and remaining > 0:
+        try:
+            page.evaluate(_MUTATION_PROBE)
+            page.evaluate(_QUIET_WINDOW_RESET)
+            page.wait_for_function(
+                _DOM_QUIET_CHECK,
+                arg=min(quiet_ms, int(remaining * 1000)),
+                timeout=int(remaining * 1000),
+                polling=100
+            )
+        except Exception:
+            met = False
+
+    _record(label, time.perf_counter() - start, budget, met)
+    return met
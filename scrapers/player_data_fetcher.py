@@ -11,17 +11,261 @@ import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from typing import List, Optional
-from datetime import datetime
+from typing import Any, List, Optional, Tuple
+from datetime import date, datetime, timedelta
 import logging
+import threading
 
 from scrapers.data_models import GameLogEntry
+from scrapers.single_flight import single_flight
+from scrapers.tiered_cache import get_tiered_cache
 
 logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(message)s")
 logger = logging.getLogger("player_data_fetcher")
 
-# Fix #4: Per-run in-memory session cache to prevent duplicate scraping
-_session_cache = {}  # {(player_name, season): game_log}
+# Where the last get_player_game_log() call on this thread got its data
+# ('session', 'cache', 'stale', 'coalesced', 'statsmuse', 'databallr',
+# 'databallr_old' or 'none'), and when a log served from storage was fetched
+_fetch_source = threading.local()
+
+# Tiered cache tier -> fetch source reported for it
+_TIER_SOURCES = {'memory': 'session', 'sqlite': 'cache', 'coalesced': 'coalesced'}
+
+
+def get_last_fetch_source() -> str:
+    """
+    Source that served the calling thread's last get_player_game_log().
+
+    'stale' means the log is past its TTL and may be missing recent games:
+    it was served while a background refresh runs (stale-while-revalidate)
+    or because every source failed. Callers that weigh data freshness
+    should read this right after the call (see is_last_fetch_stale).
+    """
+    return getattr(_fetch_source, 'name', 'none')
+
+
+def is_last_fetch_stale() -> bool:
+    """Whether the calling thread's last get_player_game_log() returned a stale log"""
+    return get_last_fetch_source() == 'stale'
+
+
+def _stored_log_updated() -> Optional[datetime]:
+    """
+    When the log returned by this thread's last _fetch_player_game_log()
+    was fetched, if it came from storage (None = fetched just now)
+    """
+    return getattr(_fetch_source, 'updated', None)
+
+
+def _stored_log_age(player_name: str, season: str) -> Tuple[Optional[datetime], bool]:
+    """(last fetched, past TTL) of the stored log ((None, False) if none or unreadable)"""
+    try:
+        from scrapers.data_cache import get_cache
+        cache = get_cache()
+        updated = cache.get_game_log_updated(player_name, season)
+        if updated is None:
+            return None, False
+        return updated, datetime.now() - updated >= timedelta(hours=cache._get_ttl_hours('game_log'))
+    except Exception as e:
+        logger.debug(f"[CACHE] Could not read game log age for {player_name}: {e}")
+        return None, False
+
+
+def _served_from_storage(player_name: str, season: str):
+    """
+    Record that the returned log came from storage: its age for the tiered
+    cache (see _stored_log_updated) and 'stale' or 'cache' as the source
+    """
+    _fetch_source.updated, stale = _stored_log_age(player_name, season)
+    _fetch_source.name = 'stale' if stale else 'cache'
+
+
+def _completed_through() -> str:
+    """Latest date whose games are final before today's slate (yesterday)"""
+    return (date.today() - timedelta(days=1)).isoformat()
+
+
+def _games_since(since: str) -> Optional[int]:
+    """Upper bound on games played after `since` (for sources that take last_n_games)"""
+    try:
+        days = (date.today() - date.fromisoformat(since)).days
+    except ValueError:
+        return None
+    # Back-to-backs included, nobody plays more than ~2 games every 3 days
+    return max(3, min(82, (days * 2) // 3 + 2))
+
+
+def _game_date(game: Any) -> str:
+    if isinstance(game, dict):
+        return game.get('game_date') or ''
+    return getattr(game, 'game_date', '') or ''
+
+
+def _is_completed(game_date: str, since: Optional[str], completed: str) -> bool:
+    """A valid YYYY-MM-DD date after `since` (if given) and through `completed`"""
+    try:
+        date.fromisoformat(game_date)
+    except (TypeError, ValueError):
+        return False
+    return (since or '') < game_date <= completed
+
+
+def _negative_sources(player_name: str, season: str, use_cache: bool) -> dict:
+    """Sources negative-cached for this player (source -> entry), skipped until they expire"""
+    if not use_cache:
+        return {}
+    try:
+        from config.settings import Config
+        if not Config.NEGATIVE_CACHE_ENABLED:
+            return {}
+        from scrapers.data_cache import get_cache
+        negative = get_cache().get_negative(player_name, season)
+    except Exception as e:
+        logger.debug(f"[CACHE] Negative cache check failed: {e}")
+        return {}
+    for source, entry in negative.items():
+        logger.debug(f"[NEGATIVE] Skipping {source} for {player_name}: {entry['reason']} until {entry['expires_at']}")
+    return negative
+
+
+def _remember_miss(player_name: str, season: str, source: str, use_cache: bool, reason: str = 'not_found'):
+    """
+    Negative-cache a source that answered but had nothing for this player.
+
+    Only called for an empty list: sources return None (or raise) when the
+    page failed to load, timed out or the browser crashed, and those
+    failures are retried on the next call instead of being remembered.
+    """
+    if not use_cache:
+        return
+    try:
+        from config.settings import Config
+        if Config.NEGATIVE_CACHE_ENABLED:
+            from scrapers.data_cache import get_cache
+            get_cache().set_negative(player_name, season, source, reason)
+    except Exception as e:
+        logger.debug(f"[CACHE] Failed to store negative entry: {e}")
+
+
+def _statmuse_entries(statmuse_logs: List) -> List[GameLogEntry]:
+    """Convert StatMuse PlayerGameLog rows to GameLogEntry (undated rows are dropped)"""
+    game_log_entries = []
+    for log in statmuse_logs:
+        # Create GameLogEntry from StatMuse data
+        try:
+            # Parse date - GameLogEntry.game_date is a string, so keep as string
+            date_str = log.date
+            # Try to parse and validate, but keep as string for GameLogEntry
+            try:
+                # Try parsing to validate, then convert back to string in standard format
+                parsed_date = datetime.strptime(date_str, '%Y-%m-%d')
+                game_date_str = parsed_date.strftime('%Y-%m-%d')
+            except:
+                try:
+                    parsed_date = datetime.strptime(date_str, '%m/%d/%Y')
+                    game_date_str = parsed_date.strftime('%Y-%m-%d')
+                except:
+                    # An undated game would be stored (permanently) under a made-up date
+                    logger.debug(f"[STATSMUSE] Skipping game with unparseable date {date_str!r}")
+                    continue
+
+            # Create GameLogEntry (match GameLogEntry dataclass structure)
+            won = False
+            if hasattr(log, 'win_loss'):
+                won = log.win_loss == "W" or log.win_loss == "Win"
+
+            # Create matchup string
+            matchup_str = f"{log.opponent or 'Unknown'}"
+            if log.home_away == "HOME":
+                matchup_str = f"vs {matchup_str}"
+            else:
+                matchup_str = f"@ {matchup_str}"
+
+            entry = GameLogEntry(
+                game_date=game_date_str,  # string in YYYY-MM-DD format
+                game_id="",  # Not available from StatMuse
+                matchup=matchup_str,
+                home_away=log.home_away or "HOME",
+                opponent=log.opponent or "Unknown",
+                opponent_id=0,  # Not available from StatMuse
+                won=won,
+                points=int(log.points) if log.points else 0,
+                rebounds=int(log.rebounds) if log.rebounds else 0,
+                assists=int(log.assists) if log.assists else 0,
+                steals=int(log.steals) if log.steals else 0,
+                blocks=int(log.blocks) if log.blocks else 0,
+                turnovers=int(log.turnovers) if log.turnovers else 0,
+                minutes=float(log.minutes) if log.minutes else 0.0,
+                fg_made=int(log.fg_made) if log.fg_made else 0,
+                fg_attempted=int(log.fg_attempted) if log.fg_attempted else 0,
+                three_pt_made=int(log.three_made) if log.three_made else 0,
+                three_pt_attempted=int(log.three_attempted) if log.three_attempted else 0,
+                ft_made=int(log.ft_made) if log.ft_made else 0,
+                ft_attempted=int(log.ft_attempted) if log.ft_attempted else 0,
+                plus_minus=int(log.plus_minus) if hasattr(log, 'plus_minus') and log.plus_minus else 0,
+                team_points=0,  # Not available from StatMuse player logs
+                opponent_points=0,  # Not available from StatMuse player logs
+                total_points=0  # Not available from StatMuse player logs
+            )
+            game_log_entries.append(entry)
+        except Exception as e:
+            logger.debug(f"[STATSMUSE] Error converting log entry: {e}")
+            continue
+    return game_log_entries
+
+
+def _store_game_log(
+    player_name: str,
+    season: str,
+    game_log: List,
+    source: str,
+    confidence_score: float,
+    fetch_source: str,
+    last_n_games: Optional[int],
+    use_cache: bool,
+    since: Optional[str] = None
+) -> List:
+    """
+    Cache a freshly fetched game log and return the caller's slice.
+
+    Only completed games (dated through yesterday) are stored: the stored
+    log is append-only, so an in-progress game would keep its partial
+    stats. In incremental mode (since = newest cached game_date) only games
+    newer than `since` are merged into the stored log, and the merged
+    season log is returned.
+    """
+    completed = _completed_through()
+    new_games = [game for game in game_log if _is_completed(_game_date(game), since, completed)]
+    if since:
+        logger.debug(f"[INCREMENTAL] {player_name}: {len(new_games)} new game(s) since {since}")
+    elif len(new_games) < len(game_log):
+        logger.debug(f"[CACHE] {player_name}: not storing {len(game_log) - len(new_games)} game(s) after {completed}")
+
+    # Store in persistent cache
+    if use_cache:
+        try:
+            from scrapers.data_cache import get_cache
+            cache = get_cache()
+            cache.set_game_log(
+                player_name=player_name,
+                season=season,
+                game_logs=new_games,
+                source=source,
+                confidence_score=confidence_score,
+                team="N/A",
+                fresh_through=_completed_through()
+            )
+            if since:
+                merged = cache.get_game_log_entries(player_name, season)
+                if merged:
+                    game_log = merged
+        except Exception as e:
+            logger.debug(f"[CACHE] Failed to store game log in persistent cache: {e}")
+
+    # Memory tier holds the full (merged) log for the rest of the run
+    get_tiered_cache().put('player', player_name, season, 'game_log', game_log)
+    _fetch_source.name = fetch_source
+    return game_log[:last_n_games] if last_n_games else game_log
 
 
 def get_player_game_log(
@@ -29,10 +273,165 @@ def get_player_game_log(
     season: str = "2024-25",
     last_n_games: Optional[int] = None,
     retries: int = 2,
-    use_cache: bool = True
+    use_cache: bool = True,
+    skip_sources: Tuple[str, ...] = ()
 ) -> List[GameLogEntry]:
     """
     Get player game log - Priority: StatsMuse → DataballR → Inference.
+
+    Lookups go memory → SQLite → sources through the tiered cache
+    (scrapers/tiered_cache.py), keyed by player ID and season. Concurrent
+    calls for the same player share one fetch; the full log is fetched once
+    and each caller gets its own last_n_games slice.
+
+    Args:
+        player_name: Full player name (e.g., "LeBron James")
+        season: Season in format "YYYY-YY"
+        last_n_games: Optional limit to last N games
+        retries: Number of retry attempts
+        use_cache: Whether to use cached data
+        skip_sources: Sources not to try on a miss (e.g. ('statsmuse',) after
+                      fetch_game_logs_batch already failed for this player)
+
+    Returns:
+        List of GameLogEntry objects, most recent first
+    """
+    if not use_cache:
+        game_log = _fetch_player_game_log(player_name, season, None, retries, use_cache, skip_sources=skip_sources)
+        return game_log[:last_n_games] if last_n_games else game_log
+
+    tiered = get_tiered_cache()
+    game_log = tiered.get(
+        'player', player_name, season, 'game_log',
+        origin=lambda: _fetch_player_game_log(player_name, season, None, retries, use_cache, skip_sources=skip_sources),
+        origin_updated=_stored_log_updated
+    ) or []
+    tier = tiered.last_tier()
+    if tier in _TIER_SOURCES:
+        _fetch_source.name = _TIER_SOURCES[tier]
+    if tier == 'coalesced' and _stored_log_age(player_name, season)[1]:
+        # Shared another thread's fetch, which served the stored log past its TTL
+        _fetch_source.name = 'stale'
+    return game_log[:last_n_games] if last_n_games else game_log
+
+
+def _refresh_game_log(player_name: str, season: str, retries: int):
+    """Background refresh of a stale game log (merges games newer than the cache)"""
+    single_flight.do(
+        (player_name, season, 'game_log_refresh'),
+        _fetch_player_game_log, player_name, season, None, retries, True, True
+    )
+
+
+def _batch_misses(player_names: List[str], season: str, use_cache: bool) -> dict:
+    """
+    Players _fetch_player_game_log would fetch from a source right away
+    (nothing fresh stored, no stale log it may serve while refreshing,
+    StatsMuse not negative-cached) -> `since` for an incremental merge
+    (newest stored game_date, None = whole season)
+    """
+    if not use_cache:
+        return {name: None for name in player_names}
+
+    from scrapers.data_cache import get_cache
+    from config.settings import Config
+
+    cache = get_cache()
+    completed = _completed_through()
+    ttl_hours = cache._get_ttl_hours('game_log')
+    misses = {}
+    for name in player_names:
+        if 'statsmuse' in _negative_sources(name, season, use_cache):
+            continue
+        try:
+            # Sync record only (no row decode); blob-stored logs have none
+            sync = cache.get_game_log_sync(name, season)
+            if sync is None and cache.get_game_log_entries(name, season):
+                continue
+        except Exception as e:
+            logger.debug(f"[CACHE] Cache check failed for {name}: {e}")
+            sync = None
+        if sync and sync['age_hours'] < ttl_hours:
+            continue
+        if not sync or not sync.get('newest_game_date') or not Config.GAME_LOG_INCREMENTAL_REFRESH:
+            misses[name] = None
+        elif (sync.get('fresh_through') or '') >= completed or cache.can_serve_stale('game_log', sync['age_hours']):
+            # Served from storage without a fetch (see _fetch_player_game_log)
+            continue
+        else:
+            misses[name] = sync['newest_game_date']
+    return misses
+
+
+def fetch_game_logs_batch(
+    player_names: List[str],
+    season: str = "2024-25",
+    max_concurrent: Optional[int] = None,
+    use_cache: bool = True
+) -> dict:
+    """
+    Fetch many players' StatsMuse game logs on one browser.
+
+    Players whose log get_player_game_log would have to fetch go through
+    scrape_player_game_logs (HTTP fast path, then a single Chromium for
+    the rest) instead of one browser each. Fetched logs are stored as by
+    get_player_game_log, so later lookups are memory hits.
+
+    Args:
+        player_names: Players' full names
+        season: Season in format "YYYY-YY"
+        max_concurrent: Pages in flight at once (default: Config.MAX_CONCURRENT_REQUESTS)
+        use_cache: Whether to use cached data
+
+    Returns:
+        Dict of player name -> stored log for every player the batch tried;
+        empty if StatsMuse has no games for them (negative-cached), None if
+        the page could not be fetched. Players not in the dict need no fetch.
+    """
+    misses = _batch_misses(list(dict.fromkeys(player_names)), season, use_cache)
+    if not misses:
+        return {}
+
+    from scrapers.statmuse_player_scraper import scrape_player_game_logs
+
+    results = {}
+    try:
+        for name, statmuse_logs in scrape_player_game_logs(
+            list(misses), season=season, headless=True, max_concurrent=max_concurrent
+        ):
+            if statmuse_logs is None:
+                results[name] = None
+                continue
+            game_log_entries = _statmuse_entries(statmuse_logs)
+            if not game_log_entries:
+                if statmuse_logs == []:
+                    _remember_miss(name, season, 'statsmuse', use_cache)
+                results[name] = []
+                continue
+            results[name] = _store_game_log(
+                name, season, game_log_entries, 'statsmuse', 0.85,
+                'statsmuse', None, use_cache, misses[name]
+            )
+    except Exception as e:
+        logger.debug(f"[STATSMUSE] Batch fetch failed: {e}")
+
+    for name in misses:
+        results.setdefault(name, None)
+    logger.debug(f"[STATSMUSE] Batch: {sum(1 for log in results.values() if log)}/{len(misses)} game logs fetched")
+    return results
+
+
+def _fetch_player_game_log(
+    player_name: str,
+    season: str = "2024-25",
+    last_n_games: Optional[int] = None,
+    retries: int = 2,
+    use_cache: bool = True,
+    refresh: bool = False,
+    skip_sources: Tuple[str, ...] = ()
+) -> List[GameLogEntry]:
+    """
+    Fetch player game log - Priority: StatsMuse → DataballR → Inference.
     
     Data Priority (with confidence):
     1. StatsMuse (primary): confidence = 0.85
@@ -45,147 +444,84 @@ def get_player_game_log(
         last_n_games: Optional limit to last N games
         retries: Number of retry attempts
         use_cache: Whether to use cached data
+        refresh: Background revalidation - never serve stale
+        skip_sources: Sources not to try (as if negative-cached, but nothing is stored)
     
     Returns:
         List of GameLogEntry objects, most recent first
     """
-    # Fix #1: Check per-run session cache FIRST (before any HTTP calls or SQLite checks)
-    session_cache_key = (player_name, season)
-    if session_cache_key in _session_cache:
-        logger.debug(f"Session cache hit: {player_name} ({season})")
-        cached_log = _session_cache[session_cache_key]
-        if last_n_games:
-            return cached_log[:last_n_games]
-        return cached_log
+    _fetch_source.name = 'none'
+    _fetch_source.updated = None
     
-    # Check persistent SQLite cache BEFORE any HTTP calls
+    # Check persistent SQLite cache BEFORE any HTTP calls (expired logs are
+    # the base for incremental refresh)
+    since = None  # Newest cached game_date when refreshing incrementally
+    expired_log: List[GameLogEntry] = []
+    stale = False
     if use_cache:
         try:
             from scrapers.data_cache import get_cache
-            from scrapers.data_models import GameLogEntry
+            from config.settings import Config
             
             cache = get_cache()
-            cached_games = cache.get_game_log(player_name, season)
+            # Rows come back as GameLogEntry objects (no JSON decode)
+            game_log_entries = cache.get_game_log_entries(player_name, season)
             
-            if cached_games:
-                # Convert dicts back to GameLogEntry objects
-                game_log_entries = []
-                for game_dict in cached_games:
-                    try:
-                        entry = GameLogEntry(**game_dict)
-                        game_log_entries.append(entry)
-                    except Exception as e:
-                        logger.debug(f"[CACHE] Error converting cached game entry: {e}")
-                        continue
-                
-                if game_log_entries:
-                    logger.debug(f"Cache hit: {player_name} ({season}), {len(game_log_entries)} games")
-                    # Store in session cache for this run
-                    _session_cache[session_cache_key] = game_log_entries
-                    result = game_log_entries[:last_n_games] if last_n_games else game_log_entries
-                    return result
+            if not game_log_entries and Config.GAME_LOG_INCREMENTAL_REFRESH:
+                # Expired: keep the stored games and only fetch what is newer
+                sync = cache.get_game_log_sync(player_name, season)
+                if sync and sync.get('newest_game_date'):
+                    expired_log = cache.get_game_log_entries(player_name, season, include_expired=True) or []
+                if expired_log:
+                    if (sync.get('fresh_through') or '') >= _completed_through():
+                        # Already checked through yesterday; nothing newer can exist yet
+                        cache.mark_game_log_fresh(player_name, season, _completed_through())
+                        game_log_entries = expired_log
+                    elif not refresh and cache.can_serve_stale('game_log', sync['age_hours']):
+                        # Stale-while-revalidate: serve now, merge newer games in the background
+                        cache.schedule_refresh(
+                            (player_name, season, 'game_log'), _refresh_game_log, player_name, season, retries
+                        )
+                        cache.note_stale_served()
+                        game_log_entries = expired_log
+                        stale = True
+                    else:
+                        since = sync['newest_game_date']
+                        logger.debug(f"[INCREMENTAL] {player_name} ({season}): refreshing games after {since}")
+            
+            if game_log_entries:
+                logger.debug(f"Cache hit{' (stale)' if stale else ''}: {player_name} ({season}), {len(game_log_entries)} games")
+                _served_from_storage(player_name, season)
+                result = game_log_entries[:last_n_games] if last_n_games else game_log_entries
+                return result
         except Exception as e:
             logger.debug(f"[CACHE] Cache check failed: {e}, proceeding with scrape")
     
+    # Sources that recently could not find this player are skipped outright
+    negative = set(_negative_sources(player_name, season, use_cache)) | set(skip_sources)
+    
     # 1. Try StatsMuse FIRST (primary source)
     try:
         from scrapers.statmuse_player_scraper import scrape_player_game_log
         
-        logger.debug(f"[STATSMUSE] Fetching game log for {player_name} (primary)")
-        statmuse_logs = scrape_player_game_log(player_name, season=season, headless=True)
+        if 'statsmuse' in negative:
+            statmuse_logs = []
+        else:
+            logger.debug(f"[STATSMUSE] Fetching game log for {player_name} (primary)")
+            statmuse_logs = scrape_player_game_log(player_name, season=season, headless=True)
+            if statmuse_logs == []:
+                _remember_miss(player_name, season, 'statsmuse', use_cache)
         
         if statmuse_logs and len(statmuse_logs) > 0:
             # Convert StatMuse PlayerGameLog to GameLogEntry format
-            game_log_entries = []
-            for log in statmuse_logs[:last_n_games] if last_n_games else statmuse_logs:
-                # Create GameLogEntry from StatMuse data
-                try:
-                    # Parse date - GameLogEntry.game_date is a string, so keep as string
-                    date_str = log.date
-                    # Try to parse and validate, but keep as string for GameLogEntry
-                    try:
-                        # Try parsing to validate, then convert back to string in standard format
-                        parsed_date = datetime.strptime(date_str, '%Y-%m-%d')
-                        game_date_str = parsed_date.strftime('%Y-%m-%d')
-                    except:
-                        try:
-                            parsed_date = datetime.strptime(date_str, '%m/%d/%Y')
-                            game_date_str = parsed_date.strftime('%Y-%m-%d')
-                        except:
-                            # Use today's date as fallback
-                            game_date_str = datetime.now().strftime('%Y-%m-%d')
-                    
-                    # Create GameLogEntry (match GameLogEntry dataclass structure)
-                    won = False
-                    if hasattr(log, 'win_loss'):
-                        won = log.win_loss == "W" or log.win_loss == "Win"
-                    
-                    # Create matchup string
-                    matchup_str = f"{log.opponent or 'Unknown'}"
-                    if log.home_away == "HOME":
-                        matchup_str = f"vs {matchup_str}"
-                    else:
-                        matchup_str = f"@ {matchup_str}"
-                    
-                    entry = GameLogEntry(
-                        game_date=game_date_str,  # string in YYYY-MM-DD format
-                        game_id="",  # Not available from StatMuse
-                        matchup=matchup_str,
-                        home_away=log.home_away or "HOME",
-                        opponent=log.opponent or "Unknown",
-                        opponent_id=0,  # Not available from StatMuse
-                        won=won,
-                        points=int(log.points) if log.points else 0,
-                        rebounds=int(log.rebounds) if log.rebounds else 0,
-                        assists=int(log.assists) if log.assists else 0,
-                        steals=int(log.steals) if log.steals else 0,
-                        blocks=int(log.blocks) if log.blocks else 0,
-                        turnovers=int(log.turnovers) if log.turnovers else 0,
-                        minutes=float(log.minutes) if log.minutes else 0.0,
-                        fg_made=int(log.fg_made) if log.fg_made else 0,
-                        fg_attempted=int(log.fg_attempted) if log.fg_attempted else 0,
-                        three_pt_made=int(log.three_made) if log.three_made else 0,
-                        three_pt_attempted=int(log.three_attempted) if log.three_attempted else 0,
-                        ft_made=int(log.ft_made) if log.ft_made else 0,
-                        ft_attempted=int(log.ft_attempted) if log.ft_attempted else 0,
-                        plus_minus=int(log.plus_minus) if hasattr(log, 'plus_minus') and log.plus_minus else 0,
-                        team_points=0,  # Not available from StatMuse player logs
-                        opponent_points=0,  # Not available from StatMuse player logs
-                        total_points=0  # Not available from StatMuse player logs
-                    )
-                    game_log_entries.append(entry)
-                except Exception as e:
-                    logger.debug(f"[STATSMUSE] Error converting log entry: {e}")
-                    continue
+            game_log_entries = _statmuse_entries(statmuse_logs[:last_n_games] if last_n_games else statmuse_logs)
             
             if game_log_entries:
                 logger.debug(f"StatsMuse: {len(game_log_entries)} games for {player_name}")
-                # Store in session cache using (player_name, season) key
-                _session_cache[session_cache_key] = game_log_entries
-                
-                # Store in persistent cache
-                if use_cache:
-                    try:
-                        from scrapers.data_cache import get_cache
-                        cache = get_cache()
-                        # Try to get team from first game log entry, or use "N/A"
-                        team = "N/A"
-                        if game_log_entries and hasattr(game_log_entries[0], 'matchup'):
-                            # Extract team from matchup if possible
-                            pass  # Keep as "N/A" for now
-                        cache.set_game_log(
-                            player_name=player_name,
-                            season=season,
-                            game_logs=game_log_entries,
-                            source='statsmuse',
-                            confidence_score=0.85,
-                            team=team
-                        )
-                    except Exception as e:
-                        logger.debug(f"[CACHE] Failed to store game log in persistent cache: {e}")
-                
-                result = game_log_entries[:last_n_games] if last_n_games else game_log_entries
-                return result
+                return _store_game_log(
+                    player_name, season, game_log_entries, 'statsmuse', 0.85,
+                    'statsmuse', last_n_games, use_cache, since
+                )
                 
     except Exception as e:
         logger.debug(f"[STATSMUSE] Failed for {player_name}: {e}")
@@ -194,83 +530,69 @@ def get_player_game_log(
     try:
         from scrapers.databallr_robust.integration import get_player_game_log as get_databallr_log
         
-        logger.debug(f"[DATABALLR] Fetching game log for {player_name} (secondary)")
-        result = get_databallr_log(
-            player_name=player_name,
-            season=season,
-            last_n_games=last_n_games,
-            retries=retries,
-            use_cache=use_cache,
-            headless=True
-        )
+        if 'databallr' in negative:
+            result = []
+        else:
+            logger.debug(f"[DATABALLR] Fetching game log for {player_name} (secondary)")
+            result = get_databallr_log(
+                player_name=player_name,
+                season=season,
+                last_n_games=_games_since(since) if since else last_n_games,
+                retries=retries,
+                use_cache=use_cache,
+                headless=True
+            )
+            if result == []:
+                _remember_miss(player_name, season, 'databallr', use_cache)
         
         if result and len(result) > 0:
             logger.debug(f"DataballR: {len(result)} games for {player_name}")
-            # Store in session cache
-            _session_cache[session_cache_key] = result
-            
-            # Store in persistent cache
-            if use_cache:
-                try:
-                    from scrapers.data_cache import get_cache
-                    cache = get_cache()
-                    cache.set_game_log(
-                        player_name=player_name,
-                        season=season,
-                        game_logs=result,
-                        source='databallr',
-                        confidence_score=0.90,
-                        team="N/A"
-                    )
-                except Exception as e:
-                    logger.debug(f"[CACHE] Failed to store game log in persistent cache: {e}")
-            
-            return_result = result[:last_n_games] if last_n_games else result
-            return return_result
+            return _store_game_log(
+                player_name, season, result, 'databallr', 0.90,
+                'databallr', last_n_games, use_cache, since
+            )
             
     except Exception as e:
         logger.debug(f"[DATABALLR] Failed for {player_name}: {e}")
     
     # 3. Try original DataballR scraper as final fallback
     try:
-        from scrapers.databallr_scraper import get_player_game_log as get_databallr_log_old
+        from scrapers.databallr_scraper import get_player_game_log as get_databallr_log_old, _get_player_id
         
-        logger.debug(f"[DATABALLR-OLD] Fetching game log for {player_name} (fallback)")
-        result = get_databallr_log_old(
-            player_name=player_name,
-            season=season,
-            last_n_games=last_n_games,
-            retries=retries,
-            use_cache=use_cache,
-            headless=True
-        )
+        if 'databallr_old' in negative:
+            result = []
+        elif _get_player_id(player_name) is None:
+            # No DataballR ID: the scraper would return nothing
+            _remember_miss(player_name, season, 'databallr_old', use_cache, reason='unresolved')
+            result = []
+        else:
+            logger.debug(f"[DATABALLR-OLD] Fetching game log for {player_name} (fallback)")
+            result = get_databallr_log_old(
+                player_name=player_name,
+                season=season,
+                last_n_games=_games_since(since) if since else last_n_games,
+                retries=retries,
+                use_cache=use_cache,
+                headless=True
+            )
+            if result == []:
+                _remember_miss(player_name, season, 'databallr_old', use_cache)
         
         if result and len(result) > 0:
             logger.debug(f"DataballR (old): {len(result)} games for {player_name}")
-            # Store in session cache using (player_name, season) key
-            _session_cache[session_cache_key] = result
-            
-            # Store in persistent cache
-            if use_cache:
-                try:
-                    from scrapers.data_cache import get_cache
-                    cache = get_cache()
-                    cache.set_game_log(
-                        player_name=player_name,
-                        season=season,
-                        game_logs=result,
-                        source='databallr',
-                        confidence_score=0.90,
-                        team="N/A"
-                    )
-                except Exception as e:
-                    logger.debug(f"[CACHE] Failed to store game log in persistent cache: {e}")
-            
-            return_result = result[:last_n_games] if last_n_games else result
-            return return_result
+            return _store_game_log(
+                player_name, season, result, 'databallr', 0.90,
+                'databallr_old', last_n_games, use_cache, since
+            )
             
     except Exception as e:
         logger.debug(f"[DATABALLR-OLD] Failed for {player_name}: {e}")
     
+    if expired_log:
+        # Sources down: an expired log beats no log
+        logger.warning(f"[DATA] Refresh failed for {player_name}, using expired cached game log")
+        _served_from_storage(player_name, season)
+        return expired_log[:last_n_games] if last_n_games else expired_log
+    
     logger.warning(f"[DATA] No game log found for {player_name} from any source (StatsMuse, DataballR)")
     return []
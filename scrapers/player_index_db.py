@@ -0,0 +1,361 @@
+"""
+Compiled Player Index
+=====================
+Read-only SQLite compilation of the player JSON caches:
+
+    databallr_player_cache.json  -> player_ids   (name key -> player ID)
+    player_stats_cache.json      -> player_stats (name key -> stats JSON)
+
+The JSON files stay the editable source. The compiled file
+(data/cache/player_index.db) records each source's mtime and size; when a
+source changes the index is rebuilt (PLAYER_INDEX_AUTO_BUILD) into a
+temp file and swapped in atomically, so concurrent processes never see a
+half-written index.
+
+Lookups are lazy: nothing is parsed at import or startup, each query
+reads one row through a memory-mapped, read-only connection (one per
+thread), and per-player stats JSON is decoded only when asked for.
+
+Build step:
+    python scripts/build_player_index.py [--force]
+
+Usage:
+    from scrapers.player_index_db import get_player_index
+
+    index = get_player_index()
+    if index.available('player_ids'):
+        player_id = index.get_player_id("tim hardaway jr")
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import tempfile
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from config.settings import Config
+from scrapers.player_name_index import normalize_player_name
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR = Path(__file__).parent.parent / "data" / "cache"
+
+# Compiled source name -> editable JSON file
+DEFAULT_SOURCES: Dict[str, Path] = {
+    'player_ids': CACHE_DIR / "databallr_player_cache.json",
+    'player_stats': CACHE_DIR / "player_stats_cache.json",
+}
+
+
+class PlayerIndexDB:
+    """
+    Lazily queried, rebuild-on-change SQLite index over the player JSON caches.
+    """
+
+    # Bytes of the index file mapped into memory by each connection
+    MMAP_SIZE = 16 * 1024 * 1024
+
+    SCHEMA = """
+        CREATE TABLE sources (
+            name TEXT PRIMARY KEY,
+            path TEXT NOT NULL,
+            mtime REAL NOT NULL,
+            size INTEGER NOT NULL,
+            rows INTEGER NOT NULL,
+            built_at TEXT NOT NULL
+        );
+        CREATE TABLE player_ids (
+            name TEXT PRIMARY KEY,
+            normalized TEXT NOT NULL,
+            position INTEGER NOT NULL,
+            player_id INTEGER NOT NULL
+        ) WITHOUT ROWID;
+        CREATE INDEX idx_player_ids_normalized ON player_ids(normalized, position);
+        CREATE TABLE player_stats (
+            name TEXT PRIMARY KEY,
+            timestamp TEXT,
+            data TEXT NOT NULL
+        ) WITHOUT ROWID;
+    """
+
+    SQL_PLAYER_ID = "SELECT player_id FROM player_ids WHERE name = ?"
+
+    SQL_PLAYER_ID_NORMALIZED = """
+        SELECT player_id FROM player_ids WHERE normalized = ? ORDER BY position LIMIT 1
+    """
+
+    SQL_PLAYER_IDS = "SELECT name, player_id FROM player_ids ORDER BY position"
+
+    SQL_PLAYER_STATS = "SELECT data FROM player_stats WHERE name = ?"
+
+    def __init__(self, db_path: Optional[Path] = None, sources: Optional[Dict[str, Path]] = None):
+        """
+        Args:
+            db_path: Compiled index file (default: data/cache/player_index.db)
+            sources: Source name -> JSON file (default: DEFAULT_SOURCES)
+        """
+        self.db_path = Path(db_path) if db_path else CACHE_DIR / "player_index.db"
+        self.sources = dict(sources or DEFAULT_SOURCES)
+
+        # One read-only connection per thread, reopened when the file is swapped
+        self._local = threading.local()
+        self._build_lock = threading.Lock()
+        self._recorded: Optional[Dict[str, Tuple[float, int]]] = None
+        self._db_version: Optional[Tuple[int, float]] = None
+        # Source versions whose rebuild could not be swapped in (file in use)
+        self._swap_blocked: Optional[Dict[str, Tuple[float, int]]] = None
+
+    # -----------------------------------------------------------------
+    # Freshness
+    # -----------------------------------------------------------------
+    def available(self, source: str) -> bool:
+        """
+        True if the compiled copy of a source matches its JSON file.
+
+        A missing or stale copy is rebuilt first when PLAYER_INDEX_AUTO_BUILD
+        is on; False means callers should read the JSON file instead.
+        """
+        if self._is_fresh(source):
+            return True
+        if not Config.PLAYER_INDEX_AUTO_BUILD or not self.sources[source].exists():
+            return False
+        if self._swap_blocked is not None and self._swap_blocked == self._source_versions():
+            # Already failed to swap in a build of these versions; retry once they change
+            return False
+        try:
+            self.build()
+        except Exception as e:
+            logger.warning(f"[PLAYER INDEX] Rebuild failed, falling back to JSON: {e}")
+            return False
+        return self._is_fresh(source)
+
+    def _is_fresh(self, source: str) -> bool:
+        recorded = self._recorded_sources().get(source)
+        if recorded is None:
+            return False
+        try:
+            stat = self.sources[source].stat()
+        except OSError:
+            return False
+        return recorded == (stat.st_mtime, stat.st_size)
+
+    def _source_versions(self) -> Dict[str, Tuple[float, int]]:
+        versions = {}
+        for source, path in self.sources.items():
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            versions[source] = (stat.st_mtime, stat.st_size)
+        return versions
+
+    def _recorded_sources(self) -> Dict[str, Tuple[float, int]]:
+        """Source versions the compiled file was built from (re-read when the file is swapped)"""
+        try:
+            stat = self.db_path.stat()
+        except OSError:
+            return {}
+        version = (stat.st_ino, stat.st_mtime)
+        if self._recorded is None or self._db_version != version:
+            # New version: every thread's connection reopens on its next query
+            self._db_version = version
+            try:
+                rows = self._connection().execute("SELECT name, mtime, size FROM sources").fetchall()
+            except sqlite3.Error as e:
+                logger.debug(f"[PLAYER INDEX] Unreadable index {self.db_path.name}: {e}")
+                self._recorded = None
+                return {}
+            self._recorded = {name: (mtime, size) for name, mtime, size in rows}
+        return self._recorded
+
+    # -----------------------------------------------------------------
+    # Build
+    # -----------------------------------------------------------------
+    def build(self, force: bool = False) -> Dict[str, int]:
+        """
+        Compile every source into a fresh index file.
+
+        Args:
+            force: Rebuild even when all sources are unchanged
+
+        Returns:
+            Rows compiled per source ({} when nothing needed rebuilding)
+        """
+        with self._build_lock:
+            if not force and all(self._is_fresh(s) for s in self.sources if self.sources[s].exists()):
+                return {}
+
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(prefix=self.db_path.name, suffix='.tmp', dir=self.db_path.parent)
+            os.close(fd)
+            counts: Dict[str, int] = {}
+            try:
+                conn = sqlite3.connect(tmp_name)
+                try:
+                    conn.executescript(self.SCHEMA)
+                    for source, path in self.sources.items():
+                        if not path.exists():
+                            continue
+                        # Version read before parsing: an edit mid-build leaves the index stale, not wrong
+                        stat = path.stat()
+                        with open(path, 'r', encoding='utf-8') as f:
+                            data = json.load(f).get('cache', {})
+                        counts[source] = getattr(self, f'_compile_{source}')(conn, data)
+                        conn.execute(
+                            "INSERT INTO sources VALUES (?, ?, ?, ?, ?, ?)",
+                            (source, str(path), stat.st_mtime, stat.st_size,
+                             counts[source], datetime.now().isoformat())
+                        )
+                    conn.commit()
+                finally:
+                    conn.close()
+                # Windows cannot replace a file that is still open: drop this thread's handle first
+                self._close_local()
+                try:
+                    os.replace(tmp_name, self.db_path)
+                except PermissionError:
+                    # Still open elsewhere (other threads/processes): use the JSON until the sources change
+                    self._swap_blocked = self._source_versions()
+                    logger.warning(
+                        f"[PLAYER INDEX] {self.db_path.name} is in use, reading the JSON caches "
+                        f"until they change or the index is rebuilt"
+                    )
+                    raise
+            except Exception:
+                try:
+                    os.unlink(tmp_name)
+                except OSError:
+                    pass
+                raise
+
+            self._recorded = None
+            self._swap_blocked = None
+            logger.info(
+                f"[PLAYER INDEX] Compiled {self.db_path.name}: "
+                + ", ".join(f"{source} {rows}" for source, rows in counts.items())
+            )
+            return counts
+
+    @staticmethod
+    def _compile_player_ids(conn: sqlite3.Connection, name_to_id: Dict[str, int]) -> int:
+        rows = [
+            (name, normalize_player_name(name), position, int(player_id))
+            for position, (name, player_id) in enumerate(name_to_id.items())
+        ]
+        conn.executemany("INSERT OR IGNORE INTO player_ids VALUES (?, ?, ?, ?)", rows)
+        return len(rows)
+
+    @staticmethod
+    def _compile_player_stats(conn: sqlite3.Connection, stats: Dict[str, Dict]) -> int:
+        rows = [
+            (name, entry.get('timestamp') if isinstance(entry, dict) else None, json.dumps(entry))
+            for name, entry in stats.items()
+        ]
+        conn.executemany("INSERT OR IGNORE INTO player_stats VALUES (?, ?, ?)", rows)
+        return len(rows)
+
+    # -----------------------------------------------------------------
+    # Queries
+    # -----------------------------------------------------------------
+    def get_player_id(self, name: str, normalized: bool = False) -> Optional[int]:
+        """
+        Player ID by cache key ('tim hardaway jr'), or by normalize_player_name
+        form ('tim hardaway') when normalized=True
+        """
+        sql = self.SQL_PLAYER_ID_NORMALIZED if normalized else self.SQL_PLAYER_ID
+        row = self._query_one(sql, (name,))
+        return row[0] if row else None
+
+    def player_ids(self) -> Dict[str, int]:
+        """Full name key -> player ID mapping, in source order"""
+        return dict(self._connection().execute(self.SQL_PLAYER_IDS).fetchall())
+
+    def get_player_stats(self, name: str) -> Optional[Dict[str, Any]]:
+        """One player's player_stats_cache.json entry (decoded on demand)"""
+        row = self._query_one(self.SQL_PLAYER_STATS, (name,))
+        return json.loads(row[0]) if row else None
+
+    def count(self, source: str) -> int:
+        """Rows compiled for a source"""
+        row = self._query_one("SELECT rows FROM sources WHERE name = ?", (source,))
+        return row[0] if row else 0
+
+    def get_status(self) -> List[Dict[str, Any]]:
+        """Per-source compile info and whether it is still fresh"""
+        try:
+            rows = self._connection().execute(
+                "SELECT name, path, rows, built_at FROM sources ORDER BY name"
+            ).fetchall()
+        except sqlite3.Error:
+            rows = []
+        return [
+            {'source': name, 'path': path, 'rows': rows_, 'built_at': built_at, 'fresh': self._is_fresh(name)}
+            for name, path, rows_, built_at in rows
+        ]
+
+    # -----------------------------------------------------------------
+    # Connections
+    # -----------------------------------------------------------------
+    def _query_one(self, sql: str, params: tuple) -> Optional[tuple]:
+        return self._connection().execute(sql, params).fetchone()
+
+    def _connection(self) -> sqlite3.Connection:
+        """This thread's read-only connection (opened on first use)"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or getattr(self._local, 'version', None) != self._db_version:
+            self._close_local()
+            conn = sqlite3.connect(
+                f"file:{self.db_path}?mode=ro", uri=True,
+                check_same_thread=False, cached_statements=16
+            )
+            conn.execute(f"PRAGMA mmap_size={self.MMAP_SIZE}")
+            self._local.conn = conn
+            self._local.version = self._db_version
+        return conn
+
+    def _close_local(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            try:
+                conn.close()
+            except Exception:
+                pass
+            self._local.conn = None
+
+
+# Global index instance
+_player_index: Optional[PlayerIndexDB] = None
+_player_index_lock = threading.Lock()
+
+
+def get_player_index() -> PlayerIndexDB:
+    """Get or create the process-wide compiled player index"""
+    global _player_index
+    with _player_index_lock:
+        if _player_index is None:
+            _player_index = PlayerIndexDB()
+        return _player_index
+
+
+def load_cache_mapping(cache_file: Path) -> Optional[Dict[str, int]]:
+    """
+    Name key -> player ID mapping of a databallr-format cache file, from the
+    compiled index when it was built from that file
+
+    Returns:
+        The mapping, or None when the caller should parse the JSON itself
+    """
+    index = get_player_index()
+    source = index.sources.get('player_ids')
+    if source is None or Path(cache_file).resolve() != source.resolve():
+        return None
+    try:
+        if index.available('player_ids'):
+            return index.player_ids()
+    except sqlite3.Error as e:
+        logger.debug(f"[PLAYER INDEX] Read failed, falling back to JSON: {e}")
+    return None
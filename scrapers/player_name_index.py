@@ -0,0 +1,312 @@
+"""
+Player Name Index
+=================
+Prebuilt index for resolving player names to IDs.
+
+Fuzzy matching used to score the query against every cached name with
+SequenceMatcher. The index narrows that to a handful of candidates first:
+
+    tokens    - names sharing a whole word ("collins john" / "john collins")
+    phonetic  - names sharing a Soundex code for any word ("jokic" / "jokich")
+    trigrams  - names sharing at least half of the query's 3-grams (typos)
+
+and only those are scored (same scoring as before: SequenceMatcher ratio,
+0.95 for identical token sets). Results, including misses, are memoized
+per normalized name (least recently used dropped past MEMO_MAX_ENTRIES).
+
+Resolvers that must not guess (a missing "nikola jokic" scores 0.92
+against "nikola jovic") pass match_last_name=True: fuzzy hits then need
+the same last name or the same set of words.
+
+One index per cache file is shared by every resolver
+(nba_player_cache, databallr_scraper, DataballrPlayerScraper) and rebuilt
+when the file changes.
+
+Usage:
+    from scrapers.player_name_index import load_name_index
+
+    index = load_name_index(Path("data/cache/databallr_player_cache.json"))
+    player_id = index.resolve("Tim Hardaway Jr.")
+"""
+
+import json
+import logging
+import re
+import threading
+from collections import Counter, OrderedDict
+from difflib import SequenceMatcher
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Name suffixes dropped by normalize_player_name (longest first: "iii" before "ii")
+NAME_SUFFIXES = ['jr.', 'jr', 'sr.', 'sr', 'iii', 'ii', 'iv', 'v']
+_SUFFIX_PATTERNS = [re.compile(rf',?\s*{re.escape(suffix)}\b', re.IGNORECASE) for suffix in NAME_SUFFIXES]
+
+# Share of the query's trigrams a candidate must contain
+TRIGRAM_MIN_OVERLAP = 0.5
+
+# Most trigram candidates scored per lookup
+MAX_TRIGRAM_CANDIDATES = 50
+
+# Memoized lookups kept per index
+MEMO_MAX_ENTRIES = 8192
+
+
+@lru_cache(maxsize=8192)
+def normalize_player_name(name: str) -> str:
+    """
+    Normalize player name for consistent matching (memoized)
+
+    Steps:
+    1. Lowercase everything
+    2. Remove punctuation
+    3. Remove Jr., Sr., III, etc.
+    4. Convert multiple spaces → one
+    5. Trim whitespace
+    """
+    if not name:
+        return ""
+
+    normalized = name.lower()
+    for pattern in _SUFFIX_PATTERNS:
+        normalized = pattern.sub('', normalized)
+    normalized = re.sub(r'[^\w\s]', '', normalized)
+    normalized = re.sub(r'\s+', ' ', normalized)
+    return normalized.strip()
+
+
+def simple_key(name: str) -> str:
+    """Key format of databallr_player_cache.json ('tim hardaway jr', 'nickeil alexander-walker')"""
+    return name.lower().strip().replace('.', '').replace('  ', ' ')
+
+
+@lru_cache(maxsize=16384)
+def soundex(word: str) -> str:
+    """American Soundex code of one word ('' for words without letters)"""
+    letters = [c for c in word.lower() if c.isalpha()]
+    if not letters:
+        return ""
+    codes = {}
+    for digit, group in (('1', 'bfpv'), ('2', 'cgjkqsxz'), ('3', 'dt'), ('4', 'l'), ('5', 'mn'), ('6', 'r')):
+        for c in group:
+            codes[c] = digit
+
+    result = letters[0].upper()
+    previous = codes.get(letters[0], '')
+    for c in letters[1:]:
+        code = codes.get(c, '')
+        if code and code != previous:
+            result += code
+            if len(result) == 4:
+                break
+        if c not in 'hw':
+            previous = code
+    return result.ljust(4, '0')
+
+
+def _trigrams(text: str) -> Set[str]:
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class PlayerNameIndex:
+    """
+    Name → ID lookups with candidate buckets for fuzzy matching.
+
+    Thread-safe for concurrent lookups; the index itself is immutable
+    once built (build a new one when the underlying names change).
+    """
+
+    def __init__(self, name_to_id: Dict[str, int]):
+        """
+        Args:
+            name_to_id: Cached names (any normalization) -> player ID
+        """
+        self._raw: Dict[str, int] = dict(name_to_id)
+        self._exact: Dict[str, int] = {}
+        self._order: Dict[str, int] = {}
+        self._by_token: Dict[str, Set[str]] = {}
+        self._by_sound: Dict[str, Set[str]] = {}
+        self._by_trigram: Dict[str, Set[str]] = {}
+
+        for name, player_id in name_to_id.items():
+            normalized = normalize_player_name(name)
+            if not normalized or normalized in self._exact:
+                continue
+            self._exact[normalized] = player_id
+            self._order[normalized] = len(self._order)
+            for token in normalized.split():
+                self._by_token.setdefault(token, set()).add(normalized)
+                self._by_sound.setdefault(soundex(token), set()).add(normalized)
+            for trigram in _trigrams(normalized):
+                self._by_trigram.setdefault(trigram, set()).add(normalized)
+
+        self._memo: "OrderedDict[Tuple[str, float, bool], Optional[int]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {'lookups': 0, 'memo_hits': 0, 'exact': 0, 'fuzzy': 0, 'misses': 0, 'scored': 0}
+
+    def __len__(self) -> int:
+        return len(self._exact)
+
+    def __contains__(self, normalized_name: str) -> bool:
+        return normalized_name in self._exact
+
+    def get_exact(self, name: str) -> Optional[int]:
+        """ID for a name as stored in the cache file, or after normalization"""
+        player_id = self._raw.get(simple_key(name))
+        if player_id is None:
+            player_id = self._exact.get(normalize_player_name(name))
+        return player_id
+
+    def resolve(self, name: str, threshold: float = 0.90, match_last_name: bool = False) -> Optional[int]:
+        """
+        Resolve a player name (any format) to an ID.
+
+        Args:
+            name: Player name
+            threshold: Minimum fuzzy similarity (0.0 to 1.0)
+            match_last_name: Only accept fuzzy hits with the same last name
+                             (or the same words in any order)
+
+        Returns:
+            Player ID or None if no cached name is close enough
+        """
+        player_id = self._raw.get(simple_key(name))
+        if player_id is not None:
+            self._count('lookups', 'exact')
+            return player_id
+        return self.find(normalize_player_name(name), threshold, match_last_name)
+
+    def find(self, normalized_name: str, threshold: float = 0.90, match_last_name: bool = False) -> Optional[int]:
+        """resolve() for an already normalized name (memoized, misses included)"""
+        if not normalized_name:
+            self._count('lookups', 'misses')
+            return None
+
+        key = (normalized_name, threshold, match_last_name)
+        with self._lock:
+            self.stats['lookups'] += 1
+            if key in self._memo:
+                self.stats['memo_hits'] += 1
+                self._memo.move_to_end(key)
+                return self._memo[key]
+
+        player_id = self._exact.get(normalized_name)
+        if player_id is not None:
+            outcome = 'exact'
+        else:
+            player_id = self._find_fuzzy(normalized_name, threshold, match_last_name)
+            outcome = 'fuzzy' if player_id is not None else 'misses'
+
+        with self._lock:
+            self.stats[outcome] += 1
+            self._memo[key] = player_id
+            self._memo.move_to_end(key)
+            while len(self._memo) > MEMO_MAX_ENTRIES:
+                self._memo.popitem(last=False)
+        return player_id
+
+    def candidates(self, normalized_name: str) -> Set[str]:
+        """Cached names worth scoring against a normalized query"""
+        tokens = normalized_name.split()
+        found: Set[str] = set()
+        for token in tokens:
+            found |= self._by_token.get(token, set())
+            found |= self._by_sound.get(soundex(token), set())
+
+        query_trigrams = _trigrams(normalized_name)
+        counts = Counter()
+        for trigram in query_trigrams:
+            counts.update(self._by_trigram.get(trigram, ()))
+        min_overlap = max(1, int(len(query_trigrams) * TRIGRAM_MIN_OVERLAP))
+        found.update(
+            name for name, count in counts.most_common(MAX_TRIGRAM_CANDIDATES) if count >= min_overlap
+        )
+        return found
+
+    def _find_fuzzy(self, normalized_name: str, threshold: float, match_last_name: bool = False) -> Optional[int]:
+        best_name = None
+        best_score = 0.0
+        name_tokens = set(normalized_name.split())
+
+        candidates = self.candidates(normalized_name)
+        if match_last_name:
+            last_name = normalized_name.split()[-1]
+            candidates = {
+                cached_name for cached_name in candidates
+                if cached_name.split()[-1] == last_name or set(cached_name.split()) == name_tokens
+            }
+
+        # Score in cache order so ties resolve as a full scan would
+        candidates = sorted(candidates, key=self._order.__getitem__)
+        for cached_name in candidates:
+            score = SequenceMatcher(None, normalized_name, cached_name).ratio()
+            # Token matching: "john collins" should match "collins john"
+            if name_tokens == set(cached_name.split()):
+                score = max(score, 0.95)
+            if score > best_score:
+                best_score = score
+                best_name = cached_name
+
+        with self._lock:
+            self.stats['scored'] += len(candidates)
+        if best_name is not None and best_score >= threshold:
+            logger.debug(f"Fuzzy match: '{normalized_name}' -> '{best_name}' score {best_score:.2f}")
+            return self._exact[best_name]
+        return None
+
+    def _count(self, *counters: str):
+        with self._lock:
+            for counter in counters:
+                self.stats[counter] += 1
+
+
+# ---------------------------------------------------------------------
+# Shared Indexes
+# ---------------------------------------------------------------------
+_file_indexes: Dict[Path, Tuple[float, PlayerNameIndex]] = {}
+_file_indexes_lock = threading.Lock()
+
+
+def load_name_index(cache_file: Path) -> Optional[PlayerNameIndex]:
+    """
+    Index over a {'cache': {name: id}} JSON file, shared per file and
+    rebuilt only when the file's mtime changes.
+
+    Returns:
+        The index, or None if the file is missing or unreadable
+    """
+    cache_file = Path(cache_file).resolve()
+    try:
+        mtime = cache_file.stat().st_mtime
+    except OSError:
+        return None
+
+    with _file_indexes_lock:
+        cached = _file_indexes.get(cache_file)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        try:
+            # Compiled player index when it covers this file (no JSON parse)
+            from scrapers.player_index_db import load_cache_mapping
+            name_to_id = load_cache_mapping(cache_file)
+            if name_to_id is None:
+                with open(cache_file, 'r', encoding='utf-8') as f:
+                    name_to_id = json.load(f).get('cache', {})
+        except Exception as e:
+            logger.warning(f"Failed to load player name index from {cache_file.name}: {e}")
+            return cached[1] if cached is not None else None
+
+        index = PlayerNameIndex(name_to_id)
+        _file_indexes[cache_file] = (mtime, index)
+        logger.debug(f"Built player name index: {len(index)} names from {cache_file.name}")
+        return index
+
+
+def build_name_index(names: Iterable[Tuple[str, int]]) -> PlayerNameIndex:
+    """Index over in-memory (name, id) pairs"""
+    return PlayerNameIndex(dict(names))
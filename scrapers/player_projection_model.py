@@ -19,6 +19,17 @@ Usage:
         team_stats=team_stats,
         prop_line=25.5
     )
+
+    # I/O-free: resolve the player's context once, then project every stat/line
+    context = model.resolve_context("LeBron James", game_log_entries, player_team="Lakers")
+    projection = model.project_stat(..., context=context)
+
+    # Whole slate (alt lines included) in one vectorized pass
+    projections = model.project_many(
+        [{'player': "LeBron James", 'stat': "points", 'line': 25.5}, ...],
+        game_logs={"LeBron James": game_log_entries},
+        contexts={"LeBron James": context}
+    )
 """
 
 import math
@@ -32,6 +43,7 @@ from enum import Enum
 from scrapers.data_models import GameLogEntry
 from scrapers.sportsbet_final_enhanced import TeamStats, MatchStats
 from scrapers.player_archetype_classifier import classify_player
+from scrapers.role_modifier import PlayerContext, RoleModifierResult
 
 logger = logging.getLogger(__name__)
 
@@ -111,6 +123,28 @@ class StatProjection:
     role_modifier_details: Optional[Dict[str, Any]] = None  # Role modifier details (modifier, confidence, rationale, offensive_role, usage_state, minutes_state)
 
 
+@dataclass
+class _StatBasis:
+    """Line-independent part of a projection (shared by all lines of one player/stat)"""
+    rolling_stats_5: Optional[RollingStats]
+    rolling_stats_10: Optional[RollingStats]
+    rolling_stats_20: Optional[RollingStats]
+    primary_stats: RollingStats
+    minutes_proj: MinutesProjection
+    matchup_adj: MatchupAdjustments
+    role_change: RoleChange
+    expected_value: float
+    variance: float
+    std_dev: float
+    player_role: str
+    role_for_adjustment: str
+    role_modifier_result: Optional[RoleModifierResult]
+    archetype: Any  # PlayerArchetype
+    pvi_penalty: float
+    sample_size: int  # Valid games
+    log_size: int  # All games in the log
+
+
 def blend_probabilities(
     model_prob: float,
     market_prob: float,
@@ -170,7 +204,42 @@ class PlayerProjectionModel:
         self.min_minutes_threshold = 10.0  # Filter games with <10 minutes
         self.league_avg_pace = 100.0  # Approximate NBA league average pace
         self.role_change_threshold = 0.20  # 20% minutes change = role change
+        self.decay_rate = 0.1  # Rolling weighted mean: weight = exp(-decay_rate * games_ago)
+        
+    def resolve_context(
+        self,
+        player_name: str,
+        game_log: List[GameLogEntry],
+        player_team: Optional[str] = None,
+        teammate_roster: Optional[List[Dict[str, Any]]] = None
+    ) -> PlayerContext:
+        """
+        Resolve the I/O-bound inputs of project_stat once per player.
         
+        Fetches usage rate (cache → StatsMuse → DataballR → inference) and
+        teammate usage with the same team/date/game log project_stat would
+        use, so project_stat(context=...) gives the same result without I/O.
+        
+        Args:
+            player_name: Player name
+            game_log: List of GameLogEntry objects (most recent first)
+            player_team: Player's team name
+            teammate_roster: Optional list of dicts with 'name', 'usage_rate', 'availability'
+            
+        Returns:
+            PlayerContext for project_stat
+        """
+        from scrapers.role_modifier import resolve_player_context
+        
+        valid_games = [g for g in game_log if g.minutes >= self.min_minutes_threshold]
+        return resolve_player_context(
+            player_name=player_name,
+            team=player_team or "Unknown",
+            date=self._context_date(valid_games),
+            game_log=valid_games,
+            teammate_roster=teammate_roster
+        )
+    
     def project_stat(
         self,
         player_name: str,
@@ -180,11 +249,18 @@ class PlayerProjectionModel:
         opponent_team: Optional[str] = None,
         player_team: Optional[str] = None,
         team_stats: Optional[MatchStats] = None,
-        min_games: int = 5
+        min_games: int = 5,
+        context: Optional[PlayerContext] = None,
+        io_free: bool = False
     ) -> Optional[StatProjection]:
         """
         Project a player stat for the next game.
         
+        With a context (see resolve_context) the projection is pure
+        computation: no cache reads, scrapes or browsers. Without one the
+        role modifier fetches usage itself, unless io_free=True, in which
+        case the role modifier is skipped.
+        
         Args:
             player_name: Player name
             stat_type: Stat to project ("points", "rebounds", "assists", etc.)
@@ -194,32 +270,245 @@ class PlayerProjectionModel:
             player_team: Player's team name
             team_stats: MatchStats with team statistics
             min_games: Minimum games required for projection
+            context: Pre-resolved usage/teammates from resolve_context
+            io_free: Never do I/O (skip the role modifier when no context is given)
             
         Returns:
             StatProjection object or None if insufficient data
         """
         if not game_log or len(game_log) < min_games:
             return None
-            
+
         # Filter games with sufficient minutes
         valid_games = [g for g in game_log if g.minutes >= self.min_minutes_threshold]
-        
+
         if len(valid_games) < min_games:
             return None
-            
+
         # 1. Calculate rolling stats (5, 10, 20 games)
         rolling_stats_5 = self._calculate_rolling_stats(valid_games[:5], stat_type)
         rolling_stats_10 = self._calculate_rolling_stats(valid_games[:10], stat_type) if len(valid_games) >= 10 else None
         rolling_stats_20 = self._calculate_rolling_stats(valid_games[:20], stat_type) if len(valid_games) >= 20 else None
-        
+
         # Use best available rolling stats (prefer 20, then 10, then 5)
-        primary_stats = rolling_stats_20 or rolling_stats_10 or rolling_stats_5
-        if not primary_stats:
+        if not (rolling_stats_20 or rolling_stats_10 or rolling_stats_5):
             return None
-            
+
         # 2. Project minutes
         minutes_proj = self._project_minutes(valid_games)
-        
+
+        role_modifier_result = self._calculate_role_modifier(
+            player_name, player_team, valid_games, context, io_free
+        )
+        basis = self._stat_basis(
+            player_name, stat_type, valid_games, len(game_log),
+            (rolling_stats_5, rolling_stats_10, rolling_stats_20), minutes_proj,
+            opponent_team, player_team, team_stats, role_modifier_result
+        )
+
+        # 7. Calculate RAW probability using appropriate distribution
+        prob_over_line = self._calculate_probability_over_line(
+            stat_type, basis.expected_value, basis.std_dev, prop_line
+        )
+
+        # 11. PHASE 6: Calculate historical hit rate for confidence formula
+        historical_hit_rate = self._calculate_historical_hit_rate(
+            valid_games, stat_type, prop_line
+        )
+
+        return self._project_line(player_name, stat_type, basis, prob_over_line, historical_hit_rate)
+
+    def project_many(
+        self,
+        props: List[Dict[str, Any]],
+        game_logs: Dict[str, List[GameLogEntry]],
+        contexts: Optional[Dict[str, PlayerContext]] = None,
+        min_games: int = 5
+    ) -> List[Optional[StatProjection]]:
+        """
+        Project a slate of props (alt lines included) in one vectorized pass.
+
+        Every player's valid games are loaded into NumPy arrays once; rolling
+        5/10/20 means and variances, decay-weighted means, minutes projections,
+        over-line probabilities and historical hit rates are computed for all
+        (player, stat, line) rows together. Line-independent work (role,
+        archetype, role change) runs once per (player, stat), not per line.
+        Results match project_stat(..., context=contexts.get(player),
+        io_free=True) to floating-point tolerance.
+
+        Never does I/O: players without a context skip the role modifier.
+
+        Args:
+            props: Dicts with 'player', 'stat', 'line' and optionally
+                'player_team', 'opponent_team', 'team_stats'
+            game_logs: Player name -> GameLogEntry list (most recent first)
+            contexts: Player name -> PlayerContext from resolve_context
+            min_games: Minimum games required for projection
+
+        Returns:
+            One StatProjection (or None if insufficient data) per prop, in order
+        """
+        import numpy as np
+
+        contexts = contexts or {}
+        results: List[Optional[StatProjection]] = [None] * len(props)
+
+        # Players with enough valid games, in first-seen order
+        valid_by_player: Dict[str, List[GameLogEntry]] = {}
+        log_sizes: Dict[str, int] = {}
+        for prop in props:
+            name = prop['player']
+            if name in valid_by_player or name in log_sizes:
+                continue
+            game_log = game_logs.get(name) or []
+            log_sizes[name] = len(game_log)
+            if len(game_log) < min_games:
+                continue
+            valid_games = [g for g in game_log if g.minutes >= self.min_minutes_threshold]
+            if len(valid_games) >= min_games:
+                valid_by_player[name] = valid_games
+
+        if not valid_by_player:
+            return results
+
+        players = list(valid_by_player)
+        row_of = {name: i for i, name in enumerate(players)}
+        counts = np.array([len(valid_by_player[name]) for name in players])
+        max_games = int(counts.max())
+
+        def game_matrix(field: str):
+            """players x games matrix of one field (NaN padded / missing)"""
+            matrix = np.full((len(players), max_games), np.nan)
+            for i, name in enumerate(players):
+                values = [getattr(g, field, None) for g in valid_by_player[name]]
+                matrix[i, :len(values)] = [np.nan if v is None else v for v in values]
+            return matrix
+
+        # 2. Minutes projections for every player at once
+        minutes_projections = self._project_minutes_many(game_matrix('minutes'), counts)
+
+        # Line-independent basis per (player, stat, matchup); lines grouped under it
+        stat_matrices: Dict[str, Any] = {}
+        rolling_by_stat: Dict[str, List[Tuple]] = {}
+        role_modifiers: Dict[str, Any] = {}
+        bases: Dict[Tuple, Optional[_StatBasis]] = {}
+        line_rows: List[Tuple[int, Tuple, str, int, float]] = []
+
+        for index, prop in enumerate(props):
+            name = prop['player']
+            if name not in valid_by_player:
+                continue
+            stat_type = prop['stat']
+            if stat_type not in stat_matrices:
+                stat_matrices[stat_type] = game_matrix(stat_type)
+                rolling_by_stat[stat_type] = self._rolling_stats_many(stat_matrices[stat_type], counts)
+
+            key = (name, stat_type, prop.get('player_team'), prop.get('opponent_team'), id(prop.get('team_stats')))
+            if key not in bases:
+                row = row_of[name]
+                rolling = rolling_by_stat[stat_type][row]
+                if np.isnan(stat_matrices[stat_type][row, :counts[row]]).any():
+                    # Missing values shift decay weights: use the scalar path for this stat
+                    valid_games = valid_by_player[name]
+                    rolling = (
+                        self._calculate_rolling_stats(valid_games[:5], stat_type),
+                        self._calculate_rolling_stats(valid_games[:10], stat_type) if len(valid_games) >= 10 else None,
+                        self._calculate_rolling_stats(valid_games[:20], stat_type) if len(valid_games) >= 20 else None,
+                    )
+                if not any(rolling):
+                    bases[key] = None
+                else:
+                    if name not in role_modifiers:
+                        role_modifiers[name] = self._calculate_role_modifier(
+                            name, prop.get('player_team'), valid_by_player[name], contexts.get(name), True
+                        )
+                    bases[key] = self._stat_basis(
+                        name, stat_type, valid_by_player[name], log_sizes[name],
+                        rolling, minutes_projections[row],
+                        prop.get('opponent_team'), prop.get('player_team'), prop.get('team_stats'),
+                        role_modifiers[name]
+                    )
+            if bases[key] is not None:
+                line_rows.append((index, key, stat_type, row_of[name], float(prop['line'])))
+
+        if not line_rows:
+            return results
+
+        # 7. RAW probabilities for every line at once
+        stat_kinds = np.array([stat_type.lower() for _, _, stat_type, _, _ in line_rows])
+        means = np.array([bases[key].expected_value for _, key, _, _, _ in line_rows])
+        std_devs = np.array([bases[key].std_dev for _, key, _, _, _ in line_rows])
+        lines = np.array([line for _, _, _, _, line in line_rows])
+        probabilities = self._probability_over_lines(stat_kinds, means, std_devs, lines)
+
+        # 11. Historical hit rates: games strictly over each line / valid games
+        hit_rates = np.empty(len(line_rows))
+        for stat_type in {stat_type for _, _, stat_type, _, _ in line_rows}:
+            positions = [i for i, (_, _, s, _, _) in enumerate(line_rows) if s == stat_type]
+            rows = np.array([line_rows[i][3] for i in positions])
+            with np.errstate(invalid='ignore'):
+                hits = (stat_matrices[stat_type][rows] > lines[positions][:, None]).sum(axis=1)
+            hit_rates[positions] = hits / counts[rows]
+
+        for i, (index, key, stat_type, _, _) in enumerate(line_rows):
+            results[index] = self._project_line(
+                key[0], stat_type, bases[key], float(probabilities[i]), float(hit_rates[i])
+            )
+        return results
+
+    def _calculate_role_modifier(
+        self,
+        player_name: str,
+        player_team: Optional[str],
+        valid_games: List[GameLogEntry],
+        context: Optional[PlayerContext],
+        io_free: bool
+    ) -> Optional[RoleModifierResult]:
+        """8b. Advanced role modifier (minutes increase + teammate impact); None if skipped or failed"""
+        if context is None and io_free:
+            return None
+        try:
+            from scrapers.role_modifier import calculate_role_modifier
+
+            # Extract minutes from recent games
+            recent_minutes = [g.minutes for g in valid_games[:5] if hasattr(g, 'minutes') and g.minutes > 0]
+            historical_minutes = [g.minutes for g in valid_games[:15] if hasattr(g, 'minutes') and g.minutes > 0]
+
+            # With a context, usage and teammates are already resolved (no I/O);
+            # otherwise usage is fetched and the teammate roster is unknown
+            return calculate_role_modifier(
+                player_name=player_name,
+                team=context.team if context else (player_team or "Unknown"),
+                date=context.date if context else self._context_date(valid_games),
+                recent_minutes=recent_minutes,
+                historical_minutes=historical_minutes,
+                teammate_roster=None,
+                game_log=valid_games,
+                context=context
+            )
+        except Exception as e:
+            logger.debug(f"[ROLE MODIFIER] Failed to apply role modifier for {player_name}: {e}")
+            return None
+
+    def _stat_basis(
+        self,
+        player_name: str,
+        stat_type: str,
+        valid_games: List[GameLogEntry],
+        log_size: int,
+        rolling: Tuple[Optional[RollingStats], Optional[RollingStats], Optional[RollingStats]],
+        minutes_proj: MinutesProjection,
+        opponent_team: Optional[str],
+        player_team: Optional[str],
+        team_stats: Optional[MatchStats],
+        role_modifier_result: Optional[RoleModifierResult]
+    ) -> _StatBasis:
+        """Everything in a projection that does not depend on the prop line"""
+        rolling_stats_5, rolling_stats_10, rolling_stats_20 = rolling
+
+        # Use best available rolling stats (prefer 20, then 10, then 5)
+        primary_stats = rolling_stats_20 or rolling_stats_10 or rolling_stats_5
+
         # 3. Calculate matchup adjustments
         matchup_adj = self._calculate_matchup_adjustments(
             opponent_team, player_team, team_stats, stat_type
@@ -230,65 +519,21 @@ class PlayerProjectionModel:
 
         # 5. Adjust base projection for minutes and matchup
         base_expected = primary_stats.weighted_mean
-        
+
         # Minutes adjustment: scale by projected minutes ratio
         minutes_adjusted = base_expected * minutes_proj.minutes_ratio
-        
+
         # Matchup adjustment: apply pace and defense multipliers
         adjusted_expected = minutes_adjusted * matchup_adj.total_adjustment
-        
+
         # 6. Calculate variance (use primary stats variance, adjusted for minutes)
         adjusted_variance = primary_stats.variance * (minutes_proj.minutes_ratio ** 2)
         adjusted_std_dev = math.sqrt(adjusted_variance)
-        
-        # 7. Calculate RAW probability using appropriate distribution
-        prob_over_line = self._calculate_probability_over_line(
-            stat_type, adjusted_expected, adjusted_std_dev, prop_line
-        )
 
-        # 8. INFER PLAYER ROLE and apply role-based adjustments (FIX #3)
-        from scrapers.player_role_heuristics import infer_player_role, apply_role_adjustment
+        # 8. INFER PLAYER ROLE (FIX #3)
+        from scrapers.player_role_heuristics import infer_player_role
         role_info = infer_player_role(valid_games, stat_type)
         player_role = role_info.get('display_name', role_info.get('offensive_role', 'secondary_creator'))  # Use display name for compatibility
-        # Apply role adjustment to raw probability before calibration (use offensive_role for adjustment lookup)
-        role_for_adjustment = role_info.get('offensive_role', 'secondary_creator')
-        prob_over_line = apply_role_adjustment(prob_over_line, role_for_adjustment, stat_type)
-
-        # 8b. Apply advanced role modifier (minutes increase + teammate impact)
-        role_modifier_result = None
-        try:
-            from scrapers.role_modifier import calculate_role_modifier
-            from datetime import datetime
-            
-            # Extract minutes from recent games
-            recent_minutes = [g.minutes for g in valid_games[:5] if hasattr(g, 'minutes') and g.minutes > 0]
-            historical_minutes = [g.minutes for g in valid_games[:15] if hasattr(g, 'minutes') and g.minutes > 0]
-            
-            # Get game date (use most recent game date or current date)
-            game_date = datetime.now().strftime('%Y-%m-%d')
-            if valid_games and hasattr(valid_games[0], 'game_date'):
-                try:
-                    game_date = valid_games[0].game_date.strftime('%Y-%m-%d') if hasattr(valid_games[0].game_date, 'strftime') else str(valid_games[0].game_date)[:10]
-                except:
-                    pass
-            
-            # Calculate role modifier (teammate roster would need to be passed in, skip for now)
-            role_modifier_result = calculate_role_modifier(
-                player_name=player_name,
-                team=player_team or "Unknown",
-                date=game_date,
-                recent_minutes=recent_minutes,
-                historical_minutes=historical_minutes,
-                teammate_roster=None,  # TODO: Pass teammate roster when available
-                game_log=valid_games
-            )
-            
-            # Apply modifier to probability
-            if role_modifier_result and role_modifier_result.modifier > 0:
-                prob_over_line = min(0.99, prob_over_line + role_modifier_result.modifier)
-        except Exception as e:
-            logger.debug(f"[ROLE MODIFIER] Failed to apply role modifier for {player_name}: {e}")
-            role_modifier_result = None
 
         # 9. CLASSIFY PLAYER ARCHETYPE (determines probability cap)
         archetype = classify_player(
@@ -297,6 +542,59 @@ class PlayerProjectionModel:
             stat_type=stat_type
         )
 
+        # Prop Volatility Index (PVI) penalty, applied to confidence per line
+        pvi_penalty = self._calculate_volatility_penalty(
+            game_log=valid_games,
+            stat_type=stat_type,
+            minutes_proj=minutes_proj,
+            primary_stats=primary_stats
+        )
+
+        return _StatBasis(
+            rolling_stats_5=rolling_stats_5,
+            rolling_stats_10=rolling_stats_10,
+            rolling_stats_20=rolling_stats_20,
+            primary_stats=primary_stats,
+            minutes_proj=minutes_proj,
+            matchup_adj=matchup_adj,
+            role_change=role_change,
+            expected_value=adjusted_expected,
+            variance=adjusted_variance,
+            std_dev=adjusted_std_dev,
+            player_role=player_role,
+            # Use offensive_role for adjustment lookup
+            role_for_adjustment=role_info.get('offensive_role', 'secondary_creator'),
+            role_modifier_result=role_modifier_result,
+            archetype=archetype,
+            pvi_penalty=pvi_penalty,
+            sample_size=len(valid_games),
+            log_size=log_size
+        )
+
+    def _project_line(
+        self,
+        player_name: str,
+        stat_type: str,
+        basis: _StatBasis,
+        prob_over_line: float,
+        historical_hit_rate: float
+    ) -> StatProjection:
+        """Probability calibration and confidence for one line on top of a stat basis"""
+        primary_stats = basis.primary_stats
+        minutes_proj = basis.minutes_proj
+        matchup_adj = basis.matchup_adj
+        role_change = basis.role_change
+        role_modifier_result = basis.role_modifier_result
+        archetype = basis.archetype
+
+        # 8. Apply role adjustment to raw probability before calibration (FIX #3)
+        from scrapers.player_role_heuristics import apply_role_adjustment
+        prob_over_line = apply_role_adjustment(prob_over_line, basis.role_for_adjustment, stat_type)
+
+        # 8b. Apply advanced role modifier to probability
+        if role_modifier_result and role_modifier_result.modifier > 0:
+            prob_over_line = min(0.99, prob_over_line + role_modifier_result.modifier)
+
         # 10. Calculate CALIBRATED probability (single source of truth)
         # Apply volatility penalty, role penalty, and archetype cap
         calibrated_prob = self.get_calibrated_probability(
@@ -309,23 +607,18 @@ class PlayerProjectionModel:
         # CRITICAL FIX: Sample size should ONLY affect confidence, NOT probability
         # Probability reflects the true model estimate - sample size uncertainty is captured in confidence
         # DO NOT apply sample_reliability to probability - it silently kills valid props
-        sample_size = len(valid_games)
-        
+        sample_size = basis.sample_size
+
         # Ensure probability stays in valid range (but don't artificially reduce it)
         calibrated_prob = max(0.01, min(0.99, calibrated_prob))
 
-        # 11. PHASE 6: Calculate historical hit rate for confidence formula
-        historical_hit_rate = self._calculate_historical_hit_rate(
-            valid_games, stat_type, prop_line
-        )
-
         # 12. Calculate confidence score (4 components)
         # P2: Track base confidence BEFORE any penalties
         base_confidence = self._calculate_confidence_score(
             primary_stats, minutes_proj, role_change, matchup_adj, historical_hit_rate
         )
         confidence = base_confidence
-        
+
         # Fix #4: Rebounds-specific volatility penalty (-5% confidence unless stability conditions met)
         if stat_type == 'rebounds':
             avg_reb = primary_stats.mean if primary_stats else 0.0
@@ -334,7 +627,7 @@ class PlayerProjectionModel:
             if matchup_adj and matchup_adj.pace_multiplier:
                 # pace_multiplier >= 1.0 means matchup pace >= league average
                 opponent_pace_ok = matchup_adj.pace_multiplier >= 1.0
-            
+
             # Apply penalty unless ALL conditions met: avg_reb >= 10.5 AND minutes >= 30 AND pace >= league_avg
             if not (avg_reb >= 10.5 and avg_minutes >= 30.0 and opponent_pace_ok):
                 confidence_before_rebounds_penalty = confidence
@@ -342,17 +635,11 @@ class PlayerProjectionModel:
                 logger.debug(f"[REBOUNDS-VOLATILITY] {player_name}: -5% penalty applied (avg_reb={avg_reb:.1f}, min={avg_minutes:.1f}, pace_ok={opponent_pace_ok})")
             else:
                 logger.debug(f"[REBOUNDS-VOLATILITY] {player_name}: penalty waived (avg_reb={avg_reb:.1f}>=10.5, min={avg_minutes:.1f}>=30, pace_ok={opponent_pace_ok})")
-        
+
         # Apply Prop Volatility Index (PVI) penalty to confidence
-        pvi_penalty = self._calculate_volatility_penalty(
-            game_log=valid_games,
-            stat_type=stat_type,
-            minutes_proj=minutes_proj,
-            primary_stats=primary_stats
-        )
         # Max 50% confidence reduction from volatility
-        confidence *= (1 - pvi_penalty * 0.5)
-        
+        confidence *= (1 - basis.pvi_penalty * 0.5)
+
         # CRITICAL FIX: Apply sample-size reliability dampening to confidence ONLY
         # Sample size uncertainty affects how much we trust the probability, not the probability itself
         reliability_mult = sample_reliability(sample_size)
@@ -365,14 +652,14 @@ class PlayerProjectionModel:
 
         # Apply sample size confidence dampening
         # Get sample size from game log
-        sample_size = len(game_log) if game_log else 0
+        sample_size = basis.log_size
         if sample_size > 0:
             from scrapers.bet_validation import apply_sample_size_confidence_dampener
             confidence_before_dampening = confidence
             confidence = apply_sample_size_confidence_dampener(confidence, sample_size)
             if confidence != confidence_before_dampening:
                 logger.debug(f"[CONFIDENCE] {player_name} {stat_type}: before_damp={confidence_before_dampening:.1f}%, sample_size={sample_size}, dampened={confidence:.1f}%")
-        
+
         # P2: Apply confidence stack cap (relative cap prevents catastrophic drops)
         # Note: Edge boost will be applied later when probabilities are available for blending
         from scrapers.bet_validation import apply_confidence_stack_cap
@@ -399,21 +686,21 @@ class PlayerProjectionModel:
                 'usage_state': role_modifier_result.usage_state,
                 'minutes_state': role_modifier_result.minutes_state
             }
-        
+
         return StatProjection(
-            expected_value=adjusted_expected,
-            variance=adjusted_variance,
-            std_dev=adjusted_std_dev,
+            expected_value=basis.expected_value,
+            variance=basis.variance,
+            std_dev=basis.std_dev,
             probability_over_line=prob_over_line,  # RAW probability (after role adjustment)
             calibrated_probability=calibrated_prob,  # CALIBRATED probability (use this for EV/Fair Odds)
             confidence_score=confidence,
-            rolling_stats_5=rolling_stats_5,
-            rolling_stats_10=rolling_stats_10,
-            rolling_stats_20=rolling_stats_20,
+            rolling_stats_5=basis.rolling_stats_5,
+            rolling_stats_10=basis.rolling_stats_10,
+            rolling_stats_20=basis.rolling_stats_20,
             minutes_projection=minutes_proj,
             matchup_adjustments=matchup_adj,
             role_change=role_change,
-            player_role=player_role,  # FIX #3: Store inferred role for display
+            player_role=basis.player_role,  # FIX #3: Store inferred role for display
             distribution_type=self._get_distribution_type(stat_type),
             archetype_name=archetype.name,  # Player archetype classification
             archetype_cap=archetype.max_probability,  # Maximum probability for this archetype
@@ -421,6 +708,18 @@ class PlayerProjectionModel:
             role_modifier_details=role_modifier_dict  # Role modifier details for display
         )
 
+    def _context_date(self, valid_games: List[GameLogEntry]) -> str:
+        """Game date the role modifier keys usage on (most recent valid game, else today)"""
+        from datetime import datetime
+        
+        game_date = datetime.now().strftime('%Y-%m-%d')
+        if valid_games and hasattr(valid_games[0], 'game_date'):
+            try:
+                game_date = valid_games[0].game_date.strftime('%Y-%m-%d') if hasattr(valid_games[0].game_date, 'strftime') else str(valid_games[0].game_date)[:10]
+            except:
+                pass
+        return game_date
+
     def get_calibrated_probability(
         self,
         base_probability: float,
@@ -495,8 +794,7 @@ class PlayerProjectionModel:
             
         # Calculate weighted mean with exponential decay (more recent = higher weight)
         # Weight = exp(-decay_rate * index), where index 0 is most recent
-        decay_rate = 0.1  # Adjustable decay rate
-        weights = [math.exp(-decay_rate * i) for i in range(n)]
+        weights = [math.exp(-self.decay_rate * i) for i in range(n)]
         total_weight = sum(weights)
         
         weighted_sum = sum(val * weight for val, weight in zip(stat_values, weights))
@@ -1103,3 +1401,190 @@ class PlayerProjectionModel:
         else:
             return "normal"
 
+    # ------------------------------------------------------------------
+    # Vectorized batch path (project_many): NumPy versions of the scalar
+    # steps above, over players x games matrices (most recent game first,
+    # NaN padded past each player's count)
+    # ------------------------------------------------------------------
+    def _rolling_stats_many(
+        self, values, counts
+    ) -> List[Tuple[Optional[RollingStats], Optional[RollingStats], Optional[RollingStats]]]:
+        """_calculate_rolling_stats over valid_games[:5], [:10], [:20] for every player"""
+        import numpy as np
+
+        windows = []
+        for window, required in ((5, 1), (10, 10), (20, 20)):
+            sizes = np.minimum(counts, window)
+            width = min(window, values.shape[1])
+            in_window = np.arange(width)[None, :] < sizes[:, None]
+            block = np.where(in_window, values[:, :width], 0.0)
+
+            with np.errstate(invalid='ignore', divide='ignore'):
+                means = block.sum(axis=1) / sizes
+                squared = np.where(in_window, (block - means[:, None]) ** 2, 0.0)
+                variances = np.where(sizes > 1, squared.sum(axis=1) / (sizes - 1), 0.0)
+                # Weight = exp(-decay_rate * index), where index 0 is most recent
+                weights = np.where(in_window, np.exp(-self.decay_rate * np.arange(width))[None, :], 0.0)
+                weighted_means = (block * weights).sum(axis=1) / weights.sum(axis=1)
+
+            windows.append([
+                RollingStats(
+                    window_size=int(size),
+                    mean=float(mean),
+                    std_dev=math.sqrt(variance),
+                    variance=float(variance),
+                    sample_size=int(size),
+                    weighted_mean=float(weighted_mean)
+                ) if count >= required else None
+                for count, size, mean, variance, weighted_mean
+                in zip(counts, sizes, means, variances, weighted_means)
+            ])
+        return list(zip(*windows))
+
+    def _project_minutes_many(self, minutes, counts) -> List[MinutesProjection]:
+        """_project_minutes for every player"""
+        import numpy as np
+
+        def window_mean_std(window: int):
+            sizes = np.minimum(counts, window)
+            width = min(window, minutes.shape[1])
+            in_window = np.arange(width)[None, :] < sizes[:, None]
+            block = np.where(in_window, minutes[:, :width], 0.0)
+            means = block.sum(axis=1) / sizes
+            squared = np.where(in_window, (block - means[:, None]) ** 2, 0.0)
+            with np.errstate(invalid='ignore', divide='ignore'):
+                stdevs = np.where(sizes > 1, np.sqrt(squared.sum(axis=1) / (sizes - 1)), 0.0)
+            return means, stdevs
+
+        # Last 5 games / last 20 games (or all available)
+        recent_avg, _ = window_mean_std(5)
+        historical_avg, volatility = window_mean_std(20)
+
+        # PHASE 2.3: volatility penalty (see _project_minutes)
+        volatility_penalty = np.where(
+            volatility > 8.0, np.minimum(-0.12, -(volatility - 8.0) * 0.02),
+            np.where(volatility > 6.0, np.minimum(-0.08, -(volatility - 6.0) * 0.02), 0.0)
+        )
+
+        # 70% recent, 30% historical
+        projected_minutes = 0.7 * recent_avg + 0.3 * historical_avg
+        trend = np.where(
+            recent_avg > historical_avg * 1.05, "INCREASING",
+            np.where(recent_avg < historical_avg * 0.95, "DECREASING", "STABLE")
+        )
+        with np.errstate(invalid='ignore', divide='ignore'):
+            minutes_ratio = np.where(historical_avg > 0, projected_minutes / historical_avg, 1.0)
+
+        return [
+            MinutesProjection(
+                recent_avg=float(recent_avg[i]),
+                historical_avg=float(historical_avg[i]),
+                projected_minutes=float(projected_minutes[i]),
+                volatility=float(volatility[i]),
+                trend=str(trend[i]),
+                minutes_ratio=float(minutes_ratio[i]),
+                volatility_penalty=float(volatility_penalty[i])
+            )
+            for i in range(len(counts))
+        ]
+
+    def _probability_over_lines(self, stat_kinds, means, std_devs, lines):
+        """_calculate_probability_over_line for arrays of (lowercase stat, mean, std dev, line)"""
+        import numpy as np
+
+        probabilities = np.empty(len(lines))
+
+        points = stat_kinds == "points"
+        poisson = np.isin(stat_kinds, ["three_pt_made", "steals", "blocks"])
+        zero_inflated = np.isin(stat_kinds, ["rebounds", "assists"])
+        minutes = stat_kinds == "minutes"
+        normal = ~(points | poisson | zero_inflated | minutes)
+
+        # Points: negative binomial (called with std dev as its variance, like the scalar path)
+        probabilities[points] = self._negative_binomial_prob_many(means[points], std_devs[points], lines[points])
+        probabilities[poisson] = self._poisson_prob_many(means[poisson], lines[poisson])
+        probabilities[zero_inflated] = self._zero_inflated_poisson_prob_many(
+            means[zero_inflated], std_devs[zero_inflated], lines[zero_inflated]
+        )
+        probabilities[minutes] = self._truncated_normal_prob_many(
+            means[minutes], std_devs[minutes], lines[minutes], min_val=0.0, max_val=48.0
+        )
+
+        # Normal approximation
+        mean, std_dev, line = means[normal], std_devs[normal], lines[normal]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            over = 1.0 - self._normal_cdf_many((line - mean) / std_dev)
+        probabilities[normal] = np.where(std_dev == 0, (mean >= line).astype(float), over)
+        return probabilities
+
+    def _normal_cdf_many(self, z):
+        """_normal_cdf over an array"""
+        import numpy as np
+        try:
+            from scipy.special import erf
+        except ImportError:
+            erf = np.vectorize(math.erf, otypes=[float])
+        return 0.5 * (1 + erf(np.asarray(z, dtype=float) / math.sqrt(2)))
+
+    def _poisson_prob_many(self, mean, threshold):
+        """_poisson_prob over arrays"""
+        import numpy as np
+
+        k = np.floor(threshold)
+        exact = (mean > 0) & (threshold > 0) & (mean <= 20) & (k > 0)
+
+        # P(X < k) = sum(i=0 to k-1) of (lambda^i * e^-lambda) / i!, accumulated term by term
+        prob_less = np.zeros(len(mean))
+        term = np.exp(-np.where(exact, mean, 0.0))
+        for i in range(int(k[exact].max()) if exact.any() else 0):
+            prob_less += np.where(i < k, term, 0.0)
+            term = term * np.where(exact, mean, 0.0) / (i + 1)
+
+        # For large means, use normal approximation (continuity correction)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            normal_approx = 1.0 - self._normal_cdf_many((threshold - 0.5 - mean) / np.sqrt(mean))
+
+        return np.select(
+            [mean <= 0, threshold <= 0, mean > 20, k == 0],
+            [0.0, 1.0, normal_approx, 1.0],
+            default=1.0 - prob_less
+        )
+
+    def _negative_binomial_prob_many(self, mean, variance, threshold):
+        """_negative_binomial_prob over arrays"""
+        import numpy as np
+
+        poisson = self._poisson_prob_many(mean, threshold)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            normal_approx = 1.0 - self._normal_cdf_many((threshold - 0.5 - mean) / np.sqrt(variance))
+
+        return np.select(
+            [mean <= 0, threshold <= 0, variance <= mean, mean > 15],
+            [0.0, 1.0, poisson, normal_approx],
+            default=poisson
+        )
+
+    def _zero_inflated_poisson_prob_many(self, mean, variance, threshold):
+        """_zero_inflated_poisson_prob over arrays"""
+        import numpy as np
+
+        adjusted_mean = np.where(variance > mean * 1.5, mean * 1.1, mean)
+        return np.select(
+            [mean <= 0, threshold <= 0],
+            [0.0, 1.0],
+            default=self._poisson_prob_many(adjusted_mean, threshold)
+        )
+
+    def _truncated_normal_prob_many(self, mean, std_dev, threshold, min_val: float = 0.0, max_val: float = 48.0):
+        """_truncated_normal_prob over arrays"""
+        import numpy as np
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            phi_threshold = self._normal_cdf_many((threshold - mean) / std_dev)
+            phi_min = self._normal_cdf_many((min_val - mean) / std_dev)
+            phi_max = self._normal_cdf_many((max_val - mean) / std_dev)
+            norm_const = phi_max - phi_min
+            truncated = 1.0 - (phi_threshold - phi_min) / norm_const
+
+        degenerate = (std_dev == 0) | (norm_const == 0)
+        return np.where(degenerate, (mean >= threshold).astype(float), truncated)
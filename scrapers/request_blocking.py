@@ -0,0 +1,288 @@
+"""
+Request Blocking Policy
+=======================
+Route interception shared by every Playwright context the scrapers create.
+
+None of the data we scrape lives in images, fonts, video or third-party
+analytics, but a Sportsbet match page pulls in several MB of them. The
+policy aborts those requests before they hit the network and counts what
+was saved.
+
+Per-site allowlists keep anything a site needs to work (e.g. the Akamai
+bot-manager pixel on Sportsbet, which is an image but must load or the
+page gets challenged).
+
+Usage:
+    from scrapers.request_blocking import install_request_blocking
+
+    context = browser.new_context(...)
+    install_request_blocking(context, site='statmuse')
+
+Configuration (config.settings.Config):
+    BLOCK_HEAVY_ASSETS      - master switch (default: true)
+    BLOCKED_RESOURCE_TYPES  - comma-separated Playwright resource types
+"""
+
+import logging
+import re
+import threading
+from typing import Dict, Any, Iterable, List, Optional
+
+from config.settings import Config
+
+logger = logging.getLogger(__name__)
+
+
+# ---------------------------------------------------------------------
+# Policy Defaults
+# ---------------------------------------------------------------------
+# Third-party trackers/ads (matched against the request URL)
+ANALYTICS_PATTERNS = [
+    r'google-analytics\.com',
+    r'googletagmanager\.com',
+    r'googlesyndication\.com',
+    r'googleadservices\.com',
+    r'doubleclick\.net',
+    r'facebook\.(?:net|com)/tr',
+    r'connect\.facebook\.net',
+    r'hotjar\.com',
+    r'segment\.(?:io|com)',
+    r'newrelic\.com',
+    r'nr-data\.net',
+    r'optimizely\.com',
+    r'scorecardresearch\.com',
+    r'quantserve\.com',
+    r'adnxs\.com',
+    r'taboola\.com',
+    r'outbrain\.com',
+    r'amplitude\.com',
+    r'mixpanel\.com',
+    r'bat\.bing\.com',
+    r'tiktok\.com/i18n/pixel',
+    r'snap\.licdn\.com',
+    r'sentry\.io',
+]
+
+# URLs that must always load, per site
+SITE_ALLOWLISTS: Dict[str, List[str]] = {
+    'sportsbet': [
+        r'/akam/',              # Akamai bot-manager sensor/pixel
+    ],
+    'statmuse': [],
+    'databallr': [],
+    'nba': [],
+    'rotowire': [],
+}
+
+# Rough transfer sizes used to estimate bytes saved (aborted requests never
+# report a size, so 'est_bytes_saved' is a per-request guess, not a measurement)
+ESTIMATED_BYTES = {
+    'image': 40 * 1024,
+    'font': 35 * 1024,
+    'media': 500 * 1024,
+    'analytics': 60 * 1024,
+}
+
+
+# ---------------------------------------------------------------------
+# Shared Counters
+# ---------------------------------------------------------------------
+_stats_lock = threading.Lock()
+_site_stats: Dict[str, Dict[str, int]] = {}
+
+
+def _new_counters() -> Dict[str, int]:
+    return {
+        'requests_seen': 0,
+        'requests_blocked': 0,
+        'requests_allowlisted': 0,
+        'est_bytes_saved': 0,
+    }
+
+
+class RequestBlockingPolicy:
+    """
+    Aborts heavy/tracking requests on a Playwright context or page.
+
+    One policy object can be installed on many contexts (e.g. one per
+    browser pool); its counters are also rolled into the module-wide
+    per-site totals returned by get_blocking_stats().
+    """
+
+    def __init__(
+        self,
+        site: str = 'default',
+        blocked_resource_types: Optional[Iterable[str]] = None,
+        analytics_patterns: Optional[List[str]] = None,
+        allowlist: Optional[List[str]] = None
+    ):
+        """
+        Args:
+            site: Site key for allowlist lookup and stats ('sportsbet', 'statmuse', ...)
+            blocked_resource_types: Playwright resource types to abort
+                                    (default: Config.BLOCKED_RESOURCE_TYPES)
+            analytics_patterns: URL regexes for third-party analytics (default: ANALYTICS_PATTERNS)
+            allowlist: URL regexes that are never blocked (default: SITE_ALLOWLISTS[site])
+        """
+        self.site = site
+        if blocked_resource_types is None:
+            blocked_resource_types = Config.BLOCKED_RESOURCE_TYPES
+        self.blocked_resource_types = frozenset(blocked_resource_types)
+
+        patterns = ANALYTICS_PATTERNS if analytics_patterns is None else analytics_patterns
+        self._analytics = re.compile('|'.join(patterns), re.I) if patterns else None
+
+        allow = SITE_ALLOWLISTS.get(site, []) if allowlist is None else allowlist
+        self._allowlist = re.compile('|'.join(allow), re.I) if allow else None
+
+        self.stats = _new_counters()
+        self.blocked_by_reason: Dict[str, int] = {}
+
+    # -----------------------------------------------------------------
+    # Routing
+    # -----------------------------------------------------------------
+    def install(self, target) -> 'RequestBlockingPolicy':
+        """
+        Route all requests of a context (or page) through this policy.
+
+        Args:
+            target: Playwright BrowserContext or Page
+        """
+        target.route('**/*', self._handle_route)
+        return self
+
+    async def install_async(self, target) -> 'RequestBlockingPolicy':
+        """install() for playwright.async_api contexts/pages"""
+        await target.route('**/*', self._handle_route_async)
+        return self
+
+    def block_reason(self, url: str, resource_type: str) -> Optional[str]:
+        """
+        Decide whether a request should be blocked.
+
+        Returns:
+            Reason key ('image', 'font', 'media', 'analytics', ...) or None to allow
+        """
+        if resource_type == 'document':
+            return None
+        if self._allowlist is not None and self._allowlist.search(url):
+            return None
+        if resource_type in self.blocked_resource_types:
+            return resource_type
+        if self._analytics is not None and self._analytics.search(url):
+            return 'analytics'
+        return None
+
+    def _decide(self, request) -> Optional[str]:
+        """Block reason for a routed request (and count it)"""
+        reason = self.block_reason(request.url, request.resource_type)
+        allowlisted = (
+            reason is None
+            and self._allowlist is not None
+            and request.resource_type in self.blocked_resource_types
+        )
+        self._count(reason, allowlisted)
+        return reason
+
+    def _handle_route(self, route):
+        reason = self._decide(route.request)
+        try:
+            if reason is not None:
+                route.abort('blockedbyclient')
+            else:
+                route.continue_()
+        except Exception as e:
+            # Page/context already closed while the request was in flight
+            logger.debug(f"[BLOCK] Route for {route.request.url[:80]} not handled: {e}")
+
+    async def _handle_route_async(self, route):
+        reason = self._decide(route.request)
+        try:
+            if reason is not None:
+                await route.abort('blockedbyclient')
+            else:
+                await route.continue_()
+        except Exception as e:
+            logger.debug(f"[BLOCK] Route for {route.request.url[:80]} not handled: {e}")
+
+    def _count(self, reason: Optional[str], allowlisted: bool):
+        saved = ESTIMATED_BYTES.get(reason, 0) if reason else 0
+        with _stats_lock:
+            site_stats = _site_stats.setdefault(self.site, _new_counters())
+            for counters in (self.stats, site_stats):
+                counters['requests_seen'] += 1
+                if reason is not None:
+                    counters['requests_blocked'] += 1
+                    counters['est_bytes_saved'] += saved
+                elif allowlisted:
+                    counters['requests_allowlisted'] += 1
+            if reason is not None:
+                self.blocked_by_reason[reason] = self.blocked_by_reason.get(reason, 0) + 1
+
+
+def install_request_blocking(target, site: str = 'default') -> Optional[RequestBlockingPolicy]:
+    """
+    Install the configured blocking policy on a context or page.
+
+    Args:
+        target: Playwright BrowserContext or Page
+        site: Site key ('sportsbet', 'statmuse', 'databallr', 'nba', 'rotowire')
+
+    Returns:
+        The installed policy, or None if Config.BLOCK_HEAVY_ASSETS is off
+    """
+    if not Config.BLOCK_HEAVY_ASSETS:
+        return None
+    try:
+        return RequestBlockingPolicy(site=site).install(target)
+    except Exception as e:
+        logger.warning(f"[BLOCK] Could not install request blocking for {site}: {e}")
+        return None
+
+
+async def install_request_blocking_async(target, site: str = 'default') -> Optional[RequestBlockingPolicy]:
+    """install_request_blocking() for playwright.async_api contexts/pages"""
+    if not Config.BLOCK_HEAVY_ASSETS:
+        return None
+    try:
+        return await RequestBlockingPolicy(site=site).install_async(target)
+    except Exception as e:
+        logger.warning(f"[BLOCK] Could not install request blocking for {site}: {e}")
+        return None
+
+
+# ---------------------------------------------------------------------
+# Reporting
+# ---------------------------------------------------------------------
+def get_blocking_stats() -> Dict[str, Any]:
+    """
+    Get requests blocked and estimated bytes saved across all policies.
+
+    Returns:
+        Dict with 'by_site' counters and totals 'requests_seen',
+        'requests_blocked', 'requests_allowlisted', 'est_bytes_saved'
+    """
+    with _stats_lock:
+        by_site = {site: dict(counters) for site, counters in _site_stats.items()}
+
+    totals = _new_counters()
+    for counters in by_site.values():
+        for key in totals:
+            totals[key] += counters[key]
+    totals['by_site'] = by_site
+    return totals
+
+
+def format_blocking_summary() -> str:
+    """One-line summary of requests blocked and estimated bytes saved"""
+    stats = get_blocking_stats()
+    return (
+        f"{stats['requests_blocked']}/{stats['requests_seen']} request(s) blocked, "
+        f"~{stats['est_bytes_saved'] / (1024 * 1024):.1f} MB saved (estimated)"
+    )
+
+
+def reset_blocking_stats():
+    """Clear the module-wide counters"""
+    with _stats_lock:
+        _site_stats.clear()
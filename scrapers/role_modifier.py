@@ -8,6 +8,8 @@ Features:
 - Teammate usage impact calculation
 - Starter minutes increase detection
 - Role modifier with confidence scaling (max +5% probability boost)
+- PlayerContext: usage and teammate inputs resolved once per player, so
+  the modifier itself can be computed without I/O
 """
 
 import logging
@@ -16,6 +18,8 @@ from datetime import datetime
 from dataclasses import dataclass
 from scrapers.data_cache import get_cache
 from scrapers.data_models import GameLogEntry
+from scrapers.single_flight import single_flight
+from scrapers.tiered_cache import get_tiered_cache
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +35,67 @@ class RoleModifierResult:
     minutes_state: str = "stable"  # stable/volatile/capped
 
 
+@dataclass
+class PlayerContext:
+    """
+    Per-player role modifier inputs, resolved once ahead of projections
+    (resolve_player_context) so calculate_role_modifier does no I/O
+    """
+    player_name: str
+    team: str
+    date: str  # Usage cache date (YYYY-MM-DD)
+    usage_rate: Optional[float] = None
+    usage_confidence: float = 0.0
+    teammate_roster: Optional[List[Dict[str, Any]]] = None  # 'name', 'usage_rate' (filled in), 'availability'
+
+
+def resolve_player_context(
+    player_name: str,
+    team: str,
+    date: str,
+    game_log: Optional[List[GameLogEntry]] = None,
+    teammate_roster: Optional[List[Dict[str, Any]]] = None
+) -> PlayerContext:
+    """
+    Fetch everything calculate_role_modifier needs for one player.
+    
+    Usage comes from fetch_usage_rate (cache → StatsMuse → DataballR →
+    inference); teammates that are not AVAILABLE get their usage rate
+    filled in from the cache (15.0 if unknown).
+    
+    Args:
+        player_name: Player name
+        team: Team name
+        date: Game date (YYYY-MM-DD)
+        game_log: Optional game log for usage inference
+        teammate_roster: Optional list of teammate availability/usage data
+    
+    Returns:
+        PlayerContext for calculate_role_modifier(context=...)
+    """
+    usage_rate, usage_conf = fetch_usage_rate(player_name, team, date, game_log)
+    
+    roster = None
+    if teammate_roster:
+        roster = []
+        for teammate in teammate_roster:
+            teammate = dict(teammate)
+            availability = teammate.get('availability', 'AVAILABLE').upper()
+            if teammate.get('usage_rate') is None and availability in ('OUT', 'QUESTIONABLE'):
+                cached = get_cache().get(teammate.get('name', ''), team, date, 'usage')
+                teammate['usage_rate'] = cached['data'].get('usage_rate', 15.0) if cached else 15.0
+            roster.append(teammate)
+    
+    return PlayerContext(
+        player_name=player_name,
+        team=team,
+        date=date,
+        usage_rate=usage_rate,
+        usage_confidence=usage_conf,
+        teammate_roster=roster
+    )
+
+
 def fetch_usage_rate(
     player_name: str,
     team: str,
@@ -56,10 +121,55 @@ def fetch_usage_rate(
         - usage_rate: Usage rate as percentage (0-100) or None if unavailable
         - confidence: Confidence in data source (0.0-1.0)
     """
+    # Concurrent callers for the same player/date share one fetch
+    return single_flight.do(
+        (player_name, date, 'usage'),
+        _fetch_usage_rate, player_name, team, date, game_log
+    )
+
+
+def get_team_stats(team_name: str, season: str = "2024-25"):
+    """
+    Team season stats from StatMuse, cached per team ID and season.
+    
+    Returns:
+        statmuse_scraper.TeamStats or None if unavailable
+    """
+    from scrapers.statmuse_scraper import scrape_team_stats, TeamStats
+    
+    def scrape() -> Optional[Dict[str, Any]]:
+        team_stats = scrape_team_stats(team_name, season=season, headless=True)
+        return team_stats.to_dict() if team_stats else None
+    
+    data = get_tiered_cache().get(
+        'team', team_name, season, 'team_stats',
+        origin=scrape, source='statsmuse', confidence_score=0.85
+    )
+    return TeamStats(**data) if data else None
+
+
+def _refresh_usage_rate(player_name: str, team: str, date: str):
+    """Background refresher for stale 'usage' cache entries"""
+    single_flight.do(
+        (player_name, date, 'usage'),
+        _fetch_usage_rate, player_name, team, date, None, True
+    )
+
+
+def _fetch_usage_rate(
+    player_name: str,
+    team: str,
+    date: str,
+    game_log: Optional[List[GameLogEntry]] = None,
+    refresh: bool = False
+) -> Tuple[Optional[float], float]:
+    """fetch_usage_rate() without request coalescing (refresh=True skips the cache read)"""
     cache = get_cache()
+    # Expired usage is served stale while this refreshes it in the background
+    cache.register_refresher('usage', _refresh_usage_rate)
     
     # Check cache first
-    cached = cache.get(player_name, team, date, 'usage')
+    cached = None if refresh else cache.get(player_name, team, date, 'usage')
     if cached:
         usage_data = cached['data']
         return usage_data.get('usage_rate'), cached['confidence_score']
@@ -71,7 +181,6 @@ def fetch_usage_rate(
     # 1. Try StatsMuse (primary) - HIGHEST CONFIDENCE
     try:
         from scrapers.statmuse_player_scraper import scrape_player_profile
-        from scrapers.statmuse_scraper import scrape_team_stats
         from scrapers.advanced_metrics import calculate_usage_rate
         
         # Get player profile from StatsMuse
@@ -81,7 +190,7 @@ def fetch_usage_rate(
             # Try to calculate actual usage rate using team stats
             try:
                 # Get team stats for accurate usage calculation
-                team_stats = scrape_team_stats(profile.team or team, season="2024-25", headless=True)
+                team_stats = get_team_stats(profile.team or team, season="2024-25")
                 
                 if team_stats:
                     # Build player stats dict for usage calculation
@@ -317,7 +426,6 @@ def calculate_teammate_impact(
     
     impact_score = 0.0
     rationale = []
-    cache = get_cache()
     
     for teammate in teammate_roster:
         teammate_name = teammate.get('name', '')
@@ -338,7 +446,7 @@ def calculate_teammate_impact(
         usage_rate = teammate.get('usage_rate')
         if usage_rate is None:
             # Try to fetch from cache or estimate
-            cached = cache.get(teammate_name, team, date, 'usage')
+            cached = get_cache().get(teammate_name, team, date, 'usage')
             if cached:
                 usage_rate = cached['data'].get('usage_rate', 15.0)
             else:
@@ -362,7 +470,8 @@ def calculate_role_modifier(
     recent_minutes: List[float],
     historical_minutes: List[float],
     teammate_roster: Optional[List[Dict[str, Any]]] = None,
-    game_log: Optional[List[GameLogEntry]] = None
+    game_log: Optional[List[GameLogEntry]] = None,
+    context: Optional[PlayerContext] = None
 ) -> RoleModifierResult:
     """
     Calculate role modifier for probability adjustment.
@@ -382,10 +491,15 @@ def calculate_role_modifier(
         historical_minutes: List of minutes from last 15-20 games
         teammate_roster: Optional list of teammate availability/usage data
         game_log: Optional game log for usage inference
+        context: Pre-resolved usage and teammates (no I/O); replaces
+            teammate_roster and the usage fetch when given
     
     Returns:
         RoleModifierResult with modifier, confidence, and rationale
     """
+    if context is not None:
+        teammate_roster = context.teammate_roster
+    
     modifier = 0.0
     rationale = []
     
@@ -416,7 +530,10 @@ def calculate_role_modifier(
     modifier = min(modifier, 0.05)
     
     # 3. Scale by usage confidence
-    usage_rate, usage_conf = fetch_usage_rate(player_name, team, date, game_log)
+    if context is not None:
+        usage_rate, usage_conf = context.usage_rate, context.usage_confidence
+    else:
+        usage_rate, usage_conf = fetch_usage_rate(player_name, team, date, game_log)
     modifier *= usage_conf
     
     # Overall confidence is minimum of usage confidence and minutes confidence
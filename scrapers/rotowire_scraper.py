@@ -21,6 +21,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from playwright.sync_api import sync_playwright
+from scrapers.request_blocking import install_request_blocking
 from bs4 import BeautifulSoup
 import json
 import re
@@ -93,6 +94,7 @@ def scrape_rotowire_lineups(headless: bool = True) -> List[GameLineup]:
     with sync_playwright() as p:
         browser = p.chromium.launch(headless=headless)
         page = browser.new_page()
+        install_request_blocking(page, site='rotowire')
 
         try:
             # Load the page
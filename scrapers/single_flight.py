@@ -0,0 +1,146 @@
+"""
+Single-Flight Request Coalescing
+================================
+With player fetches running in parallel, two workers asking for the same
+player at the same time would both miss the cache and both hit StatMuse.
+A single-flight group lets the first caller for a key do the fetch while
+any concurrent callers for that key wait and share its result (or its
+exception). Nothing is cached here: once the fetch finishes the key is
+free again, and the next call goes back through the caller's own caches.
+
+Keys are (player, season, data_type) tuples, e.g.
+("LeBron James", "2024-25", "game_log").
+
+Usage:
+    from scrapers.single_flight import single_flight
+
+    game_log = single_flight.do((player_name, season, 'game_log'), fetch, player_name, season)
+"""
+
+import logging
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class _InFlight:
+    """One fetch in progress"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.owner = threading.get_ident()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls that share a key into one execution.
+
+    Thread-safe. A call made by the thread that is already running the
+    fetch for the same key (re-entrant fetch) runs directly instead of
+    waiting on itself.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._in_flight: Dict[Hashable, _InFlight] = {}
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    def do(self, key: Hashable, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Run fn(*args, **kwargs), or wait for the in-progress run with the same key.
+
+        Args:
+            key: (player, season, data_type) tuple
+            fn: Fetch function
+
+        Returns:
+            fn's result (shared by every caller coalesced onto this run)
+
+        Raises:
+            Whatever fn raised, in the leader and in every waiter
+        """
+        with self._lock:
+            call = self._in_flight.get(key)
+            if call is not None and call.owner == threading.get_ident():
+                call = None
+                leader = None
+            elif call is None:
+                call = _InFlight()
+                self._in_flight[key] = call
+                leader = True
+            else:
+                leader = False
+            self._count(key, 'executed' if leader is not False else 'coalesced')
+
+        if leader is None:
+            return fn(*args, **kwargs)
+
+        if not leader:
+            logger.debug(f"[SINGLE-FLIGHT] Waiting on in-flight fetch for {key}")
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn(*args, **kwargs)
+            return call.result
+        except BaseException as e:
+            call.error = e
+            with self._lock:
+                self._count(key, 'errors')
+            raise
+        finally:
+            with self._lock:
+                self._in_flight.pop(key, None)
+            call.done.set()
+
+    def _count(self, key: Hashable, counter: str):
+        data_type = key[-1] if isinstance(key, tuple) and key else 'default'
+        entry = self._stats.setdefault(str(data_type), {'executed': 0, 'coalesced': 0, 'errors': 0})
+        entry[counter] += 1
+
+    def in_flight(self) -> int:
+        """Number of fetches currently running"""
+        with self._lock:
+            return len(self._in_flight)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Coalescing counters.
+
+        Returns:
+            Dict with totals 'executed', 'coalesced', 'errors' and
+            'by_type' -> {data_type: {...}}
+        """
+        with self._lock:
+            by_type = {data_type: dict(entry) for data_type, entry in self._stats.items()}
+
+        totals = {'executed': 0, 'coalesced': 0, 'errors': 0}
+        for entry in by_type.values():
+            for counter in totals:
+                totals[counter] += entry[counter]
+        totals['by_type'] = by_type
+        return totals
+
+    def reset_stats(self):
+        with self._lock:
+            self._stats.clear()
+
+
+# Process-wide group shared by the player data fetchers
+single_flight = SingleFlight()
+
+
+def get_single_flight_stats() -> Dict[str, Any]:
+    """Counters of the shared group (see SingleFlight.get_stats)"""
+    return single_flight.get_stats()
+
+
+def format_single_flight_summary() -> str:
+    """One-line summary of fetches run vs coalesced"""
+    stats = get_single_flight_stats()
+    return f"{stats['executed']} fetch(es) run, {stats['coalesced']} coalesced"
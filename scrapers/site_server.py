@@ -0,0 +1,331 @@
+"""
+Local Site Server
+=================
+Stand-in for Sportsbet, StatMuse and DataBallR that serves recorded
+fixtures (see scrapers/fixtures.py) with configurable latency, errors and
+throttling, so full-slate runs can be load-tested on a laptop.
+
+Each site lives under its own prefix:
+
+    http://127.0.0.1:8765/sportsbet/...   recorded Sportsbet overview/match pages + JSON
+    http://127.0.0.1:8765/statmuse/...    recorded StatMuse game logs
+    http://127.0.0.1:8765/databallr/...   recorded DataBallR player pages
+    http://127.0.0.1:8765/__stats         per-site request counters (JSON)
+
+Pages are matched on the path of the URL they were recorded from. Served
+HTML carries a CSP that stops site scripts from running, so the recorded
+DOM stays as captured and no request leaves the machine.
+
+Usage:
+    # 1. Record fixtures from a live run
+    FIXTURE_MODE=record python scrapers/unified_analysis_pipeline.py
+
+    # 2. Start the server (200ms +-100ms latency, 5% 500s, 2% 429s, 5 req/s per site)
+    python scrapers/site_server.py --latency-ms 200 --jitter-ms 100 \\
+        --error-rate 0.05 --throttle-rate 0.02 --rate-limit 5 --seed 42
+
+    # 3. Point the pipeline at it
+    LOCAL_SITE_SERVER=http://127.0.0.1:8765 python scrapers/unified_analysis_pipeline.py
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import argparse
+import json
+import logging
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+from scrapers.fixtures import Fixture, iter_fixtures
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PORT = 8765
+
+SITE_HOSTS = {
+    'sportsbet': 'sportsbet.com.au',
+    'statmuse': 'statmuse.com',
+    'databallr': 'databallr.com',
+}
+
+# Keep recorded pages inert: no site JS, so nothing re-renders or calls live APIs
+HTML_HEADERS = {
+    'Content-Type': 'text/html; charset=utf-8',
+    'Content-Security-Policy': "script-src 'none'",
+}
+
+
+def _site_for_url(url: str) -> Optional[str]:
+    host = urlsplit(url).netloc.lower()
+    for site, domain in SITE_HOSTS.items():
+        if host.endswith(domain):
+            return site
+    return None
+
+
+def _route_key(path: str, query: str = '') -> str:
+    path = path.rstrip('/') or '/'
+    return f"{path}?{query}" if query else path
+
+
+class _TokenBucket:
+    """Requests-per-second limiter (one per site)"""
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        self.tokens = rate
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def take(self) -> bool:
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.rate, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1.0:
+                self.tokens -= 1.0
+                return True
+            return False
+
+
+class SiteServer:
+    """
+    Threaded HTTP server over the recorded fixture corpus.
+
+    Can run in the foreground (serve_forever) or in a background thread
+    (start/stop, or as a context manager) for in-process load tests.
+    """
+
+    def __init__(
+        self,
+        host: str = '127.0.0.1',
+        port: int = DEFAULT_PORT,
+        latency_ms: float = 0.0,
+        jitter_ms: float = 0.0,
+        error_rate: float = 0.0,
+        throttle_rate: float = 0.0,
+        rate_limit: float = 0.0,
+        seed: Optional[int] = None
+    ):
+        """
+        Args:
+            host: Interface to bind
+            port: Port to bind (0 = any free port)
+            latency_ms: Delay added to every response
+            jitter_ms: Random +/- spread around latency_ms
+            error_rate: Fraction of requests answered with 500
+            throttle_rate: Fraction of requests answered with 429
+            rate_limit: Requests/second per site before 429s (0 = unlimited)
+            seed: RNG seed so error/429 patterns are reproducible
+        """
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.rate_limit = rate_limit
+
+        self._rng = random.Random(seed)
+        self._rng_lock = threading.Lock()
+        self._buckets = {site: _TokenBucket(rate_limit) for site in SITE_HOSTS} if rate_limit > 0 else {}
+
+        self._routes: Dict[Tuple[str, str], Tuple[str, bytes]] = {}
+        self._stats_lock = threading.Lock()
+        self.stats: Dict[str, Dict[str, int]] = {}
+        self.load_routes()
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                server._handle(self)
+
+            def log_message(self, format, *args):
+                logger.debug(f"[SITE] {self.address_string()} {format % args}")
+
+        self._httpd = ThreadingHTTPServer((host, port), Handler)
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    # -----------------------------------------------------------------
+    # Routes
+    # -----------------------------------------------------------------
+    def load_routes(self) -> int:
+        """(Re)build the route table from the fixtures directory"""
+        routes: Dict[Tuple[str, str], Tuple[str, bytes]] = {}
+        for fixture in iter_fixtures():
+            self._add_fixture(routes, fixture)
+        self._routes = routes
+        logger.info(f"[SITE] Loaded {len(routes)} route(s) from fixtures")
+        return len(routes)
+
+    @staticmethod
+    def _add_fixture(routes: Dict, fixture: Fixture):
+        url = fixture.meta.get('url')
+        site = _site_for_url(url) if url else None
+        if site:
+            routes[(site, _route_key(urlsplit(url).path))] = ('html', fixture.html.encode('utf-8'))
+
+        for record in fixture.payloads:
+            record_site = _site_for_url(record.get('url', ''))
+            if not record_site:
+                continue
+            parts = urlsplit(record['url'])
+            body = json.dumps(record['payload']).encode('utf-8')
+            routes[(record_site, _route_key(parts.path, parts.query))] = ('json', body)
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    # -----------------------------------------------------------------
+    # Request Handling
+    # -----------------------------------------------------------------
+    def _count(self, site: str, key: str):
+        with self._stats_lock:
+            entry = self.stats.setdefault(site, {
+                'requests': 0, 'served': 0, 'not_found': 0, 'errors': 0, 'throttled': 0,
+            })
+            entry['requests'] += 1
+            if key != 'requests':
+                entry[key] += 1
+
+    def _roll(self, rate: float) -> bool:
+        if rate <= 0:
+            return False
+        with self._rng_lock:
+            return self._rng.random() < rate
+
+    def _delay(self):
+        if self.latency_ms <= 0 and self.jitter_ms <= 0:
+            return
+        with self._rng_lock:
+            jitter = self._rng.uniform(-self.jitter_ms, self.jitter_ms) if self.jitter_ms else 0.0
+        time.sleep(max(0.0, self.latency_ms + jitter) / 1000.0)
+
+    def _handle(self, handler: BaseHTTPRequestHandler):
+        parts = urlsplit(handler.path)
+        segments = parts.path.lstrip('/').split('/', 1)
+        site = segments[0]
+        path = '/' + (segments[1] if len(segments) > 1 else '')
+
+        if site == '__stats':
+            with self._stats_lock:
+                body = json.dumps(self.stats, indent=2).encode('utf-8')
+            self._send(handler, 200, body, {'Content-Type': 'application/json'})
+            return
+
+        if site not in SITE_HOSTS:
+            self._send(handler, 404, b'Unknown site', {'Content-Type': 'text/plain'})
+            return
+
+        self._delay()
+
+        bucket = self._buckets.get(site)
+        if (bucket is not None and not bucket.take()) or self._roll(self.throttle_rate):
+            self._count(site, 'throttled')
+            self._send(handler, 429, b'Too Many Requests', {'Content-Type': 'text/plain', 'Retry-After': '1'})
+            return
+
+        if self._roll(self.error_rate):
+            self._count(site, 'errors')
+            self._send(handler, 500, b'Injected error', {'Content-Type': 'text/plain'})
+            return
+
+        route = self._routes.get((site, _route_key(path, parts.query))) or self._routes.get((site, _route_key(path)))
+        if route is None:
+            self._count(site, 'not_found')
+            self._send(handler, 404, b'No fixture recorded for this URL', {'Content-Type': 'text/plain'})
+            return
+
+        kind, body = route
+        headers = HTML_HEADERS if kind == 'html' else {'Content-Type': 'application/json'}
+        self._count(site, 'served')
+        self._send(handler, 200, body, headers)
+
+    @staticmethod
+    def _send(handler: BaseHTTPRequestHandler, status: int, body: bytes, headers: Dict[str, str]):
+        try:
+            handler.send_response(status)
+            for name, value in headers.items():
+                handler.send_header(name, value)
+            handler.send_header('Content-Length', str(len(body)))
+            handler.end_headers()
+            handler.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    # -----------------------------------------------------------------
+    # Lifecycle
+    # -----------------------------------------------------------------
+    def serve_forever(self):
+        logger.info(f"[SITE] Serving fixtures on {self.url}")
+        self._httpd.serve_forever()
+
+    def start(self) -> 'SiteServer':
+        """Serve from a background thread"""
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name='site-server', daemon=True)
+        self._thread.start()
+        logger.info(f"[SITE] Serving fixtures on {self.url}")
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> 'SiteServer':
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+        return False
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            return {site: dict(entry) for site, entry in self.stats.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve recorded Sportsbet/StatMuse/DataBallR fixtures locally")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--latency-ms', type=float, default=0.0, help="Delay added to every response")
+    parser.add_argument('--jitter-ms', type=float, default=0.0, help="Random +/- spread around the latency")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="Fraction of requests answered with 500")
+    parser.add_argument('--throttle-rate', type=float, default=0.0, help="Fraction of requests answered with 429")
+    parser.add_argument('--rate-limit', type=float, default=0.0, help="Requests/second per site before 429s (0 = off)")
+    parser.add_argument('--seed', type=int, default=None, help="RNG seed for reproducible error/429 patterns")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(message)s")
+
+    server = SiteServer(
+        host=args.host,
+        port=args.port,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        rate_limit=args.rate_limit,
+        seed=args.seed
+    )
+    print(f"Point the pipeline at it with: LOCAL_SITE_SERVER={server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print(json.dumps(server.get_stats(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
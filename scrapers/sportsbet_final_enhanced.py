@@ -10,14 +10,12 @@ Usage:
   python sportsbet_final_enhanced.py
 """
 
-from playwright.sync_api import sync_playwright
-from bs4 import BeautifulSoup
 import json
 import time
 import re
 import random
 from datetime import datetime
-from typing import List, Dict, Optional, Tuple
+from typing import Iterator, List, Dict, Optional, Tuple, Any
 from dataclasses import dataclass, asdict, field
 from pathlib import Path
 import logging
@@ -27,10 +25,24 @@ import sys
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from utils.retry_utils import retry_scraper_call
+from config.settings import Config
+from scrapers.browser_pool import BrowserPool
+from scrapers.page_waits import wait_for_content, wait_for_dom_settle
+from scrapers.network_capture import ResponseCapture, iter_json_nodes, find_key
+from scrapers.page_documents import (
+    get_page_html, get_page_soup, invalidate_page_document, parse_html,
+    LivePageDocument, HtmlDocument
+)
+from scrapers.fixtures import (
+    SPORTSBET_MATCH, SPORTSBET_OVERVIEW, fixture_key, is_recording, is_replaying, load_fixture, record_fixture
+)
 
 logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(message)s")
 logger = logging.getLogger("sportsbet_final_enhanced")
 
+# Rendered once the Stats & Insights tab has received its data
+INSIGHTS_READY_SELECTOR = 'text=/Season Results/i'
+
 
 @dataclass
 class BettingMarket:
@@ -433,7 +445,8 @@ def click_team_toggle(page, team_name: str) -> bool:
                 if button.is_visible(timeout=2000):
                     logger.info(f"Clicking team toggle for {team_name} using selector: {selector}")
                     button.click()
-                    time.sleep(1.5)  # Wait for data to swap
+                    invalidate_page_document(page)
+                    wait_for_dom_settle(page, budget=1.5, label="team toggle")  # Wait for data to swap
                     return True
             except Exception as e:
                 logger.debug(f"Selector {selector} failed: {e}")
@@ -504,7 +517,8 @@ def click_more_button(page, section_name: str) -> bool:
                     if more_button.is_visible(timeout=1000):
                         logger.info(f"Clicking More button in {section_name}")
                         more_button.click()
-                        time.sleep(1.5)  # Wait for content expansion
+                        invalidate_page_document(page)
+                        wait_for_dom_settle(page, budget=1.5, label="more button")  # Wait for content expansion
                         return True
                 except:
                     continue
@@ -519,7 +533,8 @@ def click_more_button(page, section_name: str) -> bool:
                     if button.is_visible():
                         logger.info(f"Clicking More button (global search) for {section_name}")
                         button.click()
-                        time.sleep(1.5)
+                        invalidate_page_document(page)
+                        wait_for_dom_settle(page, budget=1.5, label="more button")
                         return True
             except:
                 continue
@@ -571,10 +586,11 @@ def click_show_tip_buttons(page, max_buttons: int = 50) -> int:
                         if button.is_visible(timeout=1000):
                             logger.debug(f"Clicking Show Tip button {i+1}")
                             button.click()
+                            invalidate_page_document(page)
                             clicked_count += 1
 
                             # Wait for expansion animation
-                            time.sleep(0.5)
+                            wait_for_dom_settle(page, budget=0.5, label="show tip")
 
                             # Random delay to avoid detection
                             time.sleep(random.uniform(0.1, 0.3))
@@ -635,17 +651,13 @@ def click_display_more_insights(page, max_clicks: int = 5) -> int:
                     if button.is_visible(timeout=2000):
                         logger.info(f"Clicking Display More button (attempt {attempt + 1})")
                         button.click()
+                        invalidate_page_document(page)
                         click_count += 1
                         button_found = True
 
-                        # Wait for new content to load
-                        time.sleep(2)
-
-                        # Wait for network to settle
-                        try:
-                            page.wait_for_load_state('networkidle', timeout=5000)
-                        except:
-                            pass  # Continue even if networkidle times out
+                        # Wait for new content to load and render
+                        # (ceiling covers the old 2s sleep + 5s networkidle wait)
+                        wait_for_dom_settle(page, budget=7.0, label="display more")
 
                         break  # Found and clicked, move to next attempt
                 except:
@@ -763,27 +775,7 @@ def extract_match_insights(html: str) -> List[MatchInsight]:
         else:
             logger.info(f"Sample insight: {insights_data[0] if insights_data else 'N/A'}")
 
-        for insight_obj in insights_data:
-            fact = insight_obj.get('fact', '')
-            tags = insight_obj.get('tags', [])
-
-            # Extract target bet info
-            target_bet = insight_obj.get('targetBet', {})
-            market = target_bet.get('market')
-            result = target_bet.get('result')
-            odds = target_bet.get('price')
-            icon = target_bet.get('icon')
-
-            insight = MatchInsight(
-                fact=fact,
-                tags=tags,
-                market=market,
-                result=result,
-                odds=odds,
-                icon=icon
-            )
-
-            insights.append(insight)
+        insights.extend(_build_match_insights(insights_data))
 
     except json.JSONDecodeError as e:
         logger.error(f"JSON parsing error: {e}")
@@ -797,6 +789,387 @@ def extract_match_insights(html: str) -> List[MatchInsight]:
     return insights
 
 
+def _build_match_insights(insights_data: List[Dict]) -> List[MatchInsight]:
+    """Build MatchInsight objects from raw matchInsights JSON objects"""
+    insights = []
+
+    for insight_obj in insights_data:
+        if not isinstance(insight_obj, dict):
+            continue
+
+        fact = insight_obj.get('fact', '')
+        tags = insight_obj.get('tags', [])
+
+        # Extract target bet info
+        target_bet = insight_obj.get('targetBet', {}) or {}
+        market = target_bet.get('market')
+        result = target_bet.get('result')
+        odds = target_bet.get('price')
+        icon = target_bet.get('icon')
+
+        insight = MatchInsight(
+            fact=fact,
+            tags=tags,
+            market=market,
+            result=result,
+            odds=odds,
+            icon=icon
+        )
+
+        insights.append(insight)
+
+    return insights
+
+
+# ============================================================
+# NETWORK CAPTURE EXTRACTION (JSON payloads the page loads itself)
+# ============================================================
+
+def extract_match_insights_from_payloads(payloads: List[Any]) -> List[MatchInsight]:
+    """
+    Extract match insights from captured JSON responses.
+
+    Looks for the same "matchInsights" arrays that are embedded in the HTML.
+
+    Returns:
+        List of MatchInsight objects (empty if none were captured)
+    """
+    insight_objects = []
+    seen_facts = set()
+
+    for value in find_key(payloads, 'matchInsights'):
+        if not isinstance(value, list):
+            continue
+        for obj in value:
+            if not isinstance(obj, dict):
+                continue
+            fact = obj.get('fact', '')
+            if fact in seen_facts:
+                continue
+            seen_facts.add(fact)
+            insight_objects.append(obj)
+
+    insights = _build_match_insights(insight_objects)
+    logger.info(f"Extracted {len(insights)} match insights from network payloads")
+    return insights
+
+
+def _selection_price(selection: Dict) -> Optional[float]:
+    """Decimal price of a selection object (several API shapes)"""
+    candidates = [selection.get('price'), selection.get('winPrice'), selection.get('odds'), selection.get('decimalPrice')]
+    for value in candidates:
+        if isinstance(value, dict):
+            value = value.get('winPrice') or value.get('decimal') or value.get('odds')
+        try:
+            if value is not None:
+                price = float(value)
+                if price > 1.0:
+                    return price
+        except (TypeError, ValueError):
+            continue
+    return None
+
+
+def match_teams(url: str, document) -> Tuple[str, str]:
+    """
+    (away, home) team names for a match page.
+
+    Parsed from the URL slug ("away-team-at-home-team-123"), falling back
+    to the page title (document.title) when the slug has no "at".
+    """
+    # Try the URL slug first
+    away_team = "Unknown"
+    home_team = "Unknown"
+
+    try:
+        slug = url.rstrip('/').split('/')[-1]
+        parts = slug.split('-')
+        if 'at' in parts:
+            idx = parts.index('at')
+            away_tokens = parts[:idx]
+            home_tokens = parts[idx+1:]
+            def normalize(tokens):
+                cleaned = [t for t in tokens if not t.isdigit()]
+                return ' '.join([t.capitalize() for t in cleaned])
+            away_team = normalize(away_tokens)
+            home_team = normalize(home_tokens)
+    except Exception:
+        pass
+
+    # If slug parse failed, fall back to title heuristic
+    if away_team == "Unknown" or home_team == "Unknown":
+        title = document.title
+        # Capture sequences of capitalized words (handles 2-3 word names)
+        teams = re.findall(r'([A-Z][a-z]+(?: [A-Z][a-z]+)+)', title)
+        away_team = teams[0] if len(teams) > 0 else away_team
+        home_team = teams[1] if len(teams) > 1 else home_team
+
+    return away_team, home_team
+
+
+# Keys that tie a JSON object to a Sportsbet event
+_EVENT_ID_KEYS = ('eventId', 'eventExternalId', 'event_id')
+
+
+def match_event_id(url: str) -> Optional[str]:
+    """Sportsbet event ID: the trailing number of a match URL slug (None if absent)"""
+    match = re.search(r'-(\d+)/?$', url or '')
+    return match.group(1) if match else None
+
+
+def _node_event_id(node: Dict) -> Optional[str]:
+    """Event a JSON object declares itself part of (eventId-style key, or the id of an event with markets)"""
+    for key in _EVENT_ID_KEYS:
+        if node.get(key) is not None:
+            return str(node[key])
+    if 'markets' in node and node.get('id') is not None:
+        return str(node['id'])
+    return None
+
+
+def _iter_event_nodes(payload: Any) -> Iterator[Tuple[Dict, Optional[str]]]:
+    """(dict, owning event ID) for every object in a payload; the owner is the nearest event ID on its path"""
+    stack = [(payload, None)]
+    while stack:
+        current, owner = stack.pop()
+        if isinstance(current, dict):
+            owner = _node_event_id(current) or owner
+            yield current, owner
+            stack.extend((value, owner) for value in reversed(list(current.values())))
+        elif isinstance(current, list):
+            stack.extend((value, owner) for value in reversed(current))
+
+
+def payloads_for_event(records: List[Dict[str, Any]], event_id: Optional[str]) -> List[Any]:
+    """
+    Captured payloads that belong to one match.
+
+    A record is kept when its request URL contains the event ID or its JSON
+    references the event; captures of other events (and unrelated sportsbet
+    XHRs) are dropped. Without an event ID every payload is kept.
+
+    Args:
+        records: Captured JSON records [{'url', 'payload'}]
+        event_id: The match's event ID (see match_event_id)
+    """
+    if not event_id:
+        return [record['payload'] for record in records]
+    kept = []
+    for record in records:
+        if event_id in (record.get('url') or '') or any(
+            owner == event_id for _, owner in _iter_event_nodes(record['payload'])
+        ):
+            kept.append(record['payload'])
+    logger.debug(f"{len(kept)}/{len(records)} captured payloads belong to event {event_id}")
+    return kept
+
+
+def extract_markets_from_payloads(
+    payloads: List[Any],
+    away_team: str,
+    home_team: str,
+    event_id: Optional[str] = None
+) -> List[BettingMarket]:
+    """
+    Extract betting markets from captured JSON responses.
+
+    Any object with a "selections" (or "outcomes") list whose entries carry
+    a name and a decimal price is treated as a market. Handicap/total points
+    are appended to the selection name the way the rendered page shows them.
+    With an event_id, markets nested under a different event are skipped.
+
+    Returns:
+        List of BettingMarket objects (empty if none were captured)
+    """
+    markets = []
+    seen = set()
+
+    for payload in payloads:
+        for node, owner in _iter_event_nodes(payload):
+            if event_id and owner is not None and owner != event_id:
+                continue
+            selections = node.get('selections') or node.get('outcomes')
+            if not isinstance(selections, list):
+                continue
+
+            for selection in selections:
+                if not isinstance(selection, dict):
+                    continue
+                name = selection.get('name') or selection.get('resultName') or selection.get('outcomeName')
+                odds_value = _selection_price(selection)
+                if not name or odds_value is None:
+                    continue
+
+                selection_text = str(name).strip()
+                points = selection.get('points', selection.get('handicap', selection.get('line')))
+                if points is not None and str(points) not in selection_text:
+                    try:
+                        selection_text = f"{selection_text} ({float(points):+g})"
+                    except (TypeError, ValueError):
+                        pass
+
+                market_key = f"{selection_text}_{odds_value}"
+                if market_key in seen:
+                    continue
+                seen.add(market_key)
+
+                category = categorize_market(selection_text, away_team, home_team)
+
+                line = None
+                line_match = re.search(r'[+-]?\d+\.?\d*', selection_text)
+                if line_match and category in ['handicap', 'total']:
+                    line = line_match.group()
+
+                team = None
+                if away_team.split()[-1] in selection_text:
+                    team = away_team
+                elif home_team.split()[-1] in selection_text:
+                    team = home_team
+
+                markets.append(BettingMarket(
+                    selection_text=selection_text,
+                    odds=odds_value,
+                    team=team,
+                    line=line,
+                    market_category=category
+                ))
+
+    logger.info(f"Extracted {len(markets)} betting markets from network payloads")
+    return markets
+
+
+# Game lines every match page offers (category -> selections): a capture
+# that has them all needs no HTML parse
+_CORE_MARKETS = {'moneyline': 2, 'handicap': 2, 'total': 2}
+
+
+def network_markets_complete(markets: List[BettingMarket]) -> bool:
+    """Whether captured markets cover every core game line (see _CORE_MARKETS)"""
+    counts: Dict[str, int] = {}
+    for market in markets:
+        counts[market.market_category] = counts.get(market.market_category, 0) + 1
+    return all(counts.get(category, 0) >= needed for category, needed in _CORE_MARKETS.items())
+
+
+def merge_markets(network: List[BettingMarket], html: List[BettingMarket]) -> Tuple[List[BettingMarket], str]:
+    """
+    Combine network and rendered-HTML markets.
+
+    The two sources word selections differently, so they are merged per
+    market category rather than per selection: each category comes from
+    whichever source found more selections in it (network on ties). A
+    partial capture (e.g. a lazily loaded market group that never arrived)
+    therefore cannot hide what the page rendered.
+
+    Returns:
+        (markets, source) where source is 'network', 'html' or 'network+html'
+    """
+    def counts(markets):
+        by_category: Dict[str, int] = {}
+        for market in markets:
+            by_category[market.market_category] = by_category.get(market.market_category, 0) + 1
+        return by_category
+
+    network_counts, html_counts = counts(network), counts(html)
+    from_html = {
+        category for category, count in html_counts.items()
+        if count > network_counts.get(category, 0)
+    }
+    merged = [m for m in network if m.market_category not in from_html]
+    used_network = bool(merged)
+    merged += [m for m in html if m.market_category in from_html]
+
+    if used_network and from_html:
+        return merged, 'network+html'
+    return merged, 'network' if used_network else 'html'
+
+
+# Stat labels (as shown on the Stats & Insights tab) -> TeamStats attribute
+_TEAM_STAT_LABELS = [
+    (re.compile(r'Points\s+For', re.I), 'avg_points_for'),
+    (re.compile(r'Points\s+Against', re.I), 'avg_points_against'),
+    (re.compile(r'Winning\s+Margin', re.I), 'avg_winning_margin'),
+    (re.compile(r'Losing\s+Margin', re.I), 'avg_losing_margin'),
+    (re.compile(r'Total\s+(Match\s+)?Points', re.I), 'avg_total_points'),
+    (re.compile(r'Favou?rite\s+Record', re.I), 'favorite_win_pct'),
+    (re.compile(r'Underdog\s+Record', re.I), 'underdog_win_pct'),
+    (re.compile(r'Clutch\s+Win', re.I), 'clutch_win_pct'),
+    (re.compile(r'Reliability', re.I), 'reliability_pct'),
+    (re.compile(r'Comeback', re.I), 'comeback_pct'),
+    (re.compile(r'Choke', re.I), 'choke_pct'),
+]
+
+_TEAM_STAT_VALUE_KEYS = [
+    ('away', 'home'),
+    ('awayValue', 'homeValue'),
+    ('awayTeam', 'homeTeam'),
+    ('awayStat', 'homeStat'),
+]
+
+
+def _stat_number(value: Any) -> Optional[float]:
+    """Number from a stat value like 113.1, "113.1" or "60.0%" """
+    if isinstance(value, dict):
+        value = value.get('value', value.get('displayValue'))
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    if isinstance(value, str):
+        match = re.search(r'(\d+\.?\d*)', value)
+        if match:
+            return float(match.group(1))
+    return None
+
+
+def extract_team_stats_from_payloads(payloads: List[Any], away_team: str, home_team: str) -> Optional[MatchStats]:
+    """
+    Extract team statistics from captured JSON responses.
+
+    Matches stat rows by their label (same labels the HTML parser looks
+    for) and reads the away/home values next to it.
+
+    Returns:
+        MatchStats object, or None if no stat rows were captured
+    """
+    away_stats = TeamStats(team_name=away_team)
+    home_stats = TeamStats(team_name=home_team)
+    found = 0
+
+    for payload in payloads:
+        for node in iter_json_nodes(payload):
+            if not isinstance(node, dict):
+                continue
+            label = node.get('label') or node.get('name') or node.get('title') or node.get('statName')
+            if not isinstance(label, str):
+                continue
+
+            attr = None
+            for pattern, attr_name in _TEAM_STAT_LABELS:
+                if pattern.search(label):
+                    attr = attr_name
+                    break
+            if attr is None or getattr(away_stats, attr) is not None:
+                continue
+
+            for away_key, home_key in _TEAM_STAT_VALUE_KEYS:
+                if away_key in node and home_key in node:
+                    away_value = _stat_number(node[away_key])
+                    home_value = _stat_number(node[home_key])
+                    if away_value is not None and home_value is not None:
+                        setattr(away_stats, attr, away_value)
+                        setattr(home_stats, attr, home_value)
+                        found += 1
+                    break
+
+    if not found:
+        return None
+
+    logger.info(f"Extracted {found} team stat rows from network payloads")
+    return MatchStats(
+        away_team_stats=away_stats,
+        home_team_stats=home_stats
+    )
+
+
 def extract_insight_cards_from_dom(page) -> List[InsightCard]:
     """
     Extract all insight cards from the DOM (after expanding).
@@ -809,8 +1182,7 @@ def extract_insight_cards_from_dom(page) -> List[InsightCard]:
     try:
         logger.info("Extracting insight cards from DOM...")
 
-        html = page.content()
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = get_page_soup(page)
 
         # Try multiple card container patterns
         card_selectors = [
@@ -957,8 +1329,7 @@ def extract_match_preview(page) -> Optional[MatchPreview]:
     try:
         logger.info("Extracting match preview text...")
 
-        html = page.content()
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = get_page_soup(page)
 
         # Try multiple preview section patterns
         preview_selectors = [
@@ -1062,9 +1433,9 @@ def extract_season_results(page, away_team: str, home_team: str) -> Tuple[List[S
         # Extract away team results
         logger.info(f"Extracting season results for {away_team}...")
         if click_team_toggle(page, away_team):
-            time.sleep(1)  # Wait for data to load
+            wait_for_dom_settle(page, budget=1.0, label="season results toggle")  # Wait for data to load
             click_more_button(page, "Season Results")  # Expand all games
-            time.sleep(1)  # Wait for expansion
+            wait_for_dom_settle(page, budget=1.0, label="season results expand")  # Wait for expansion
             away_results = _parse_season_results(page, away_team)
             logger.info(f"Extracted {len(away_results)} games for {away_team}")
         else:
@@ -1073,9 +1444,9 @@ def extract_season_results(page, away_team: str, home_team: str) -> Tuple[List[S
         # Extract home team results
         logger.info(f"Extracting season results for {home_team}...")
         if click_team_toggle(page, home_team):
-            time.sleep(1)  # Wait for data to load
+            wait_for_dom_settle(page, budget=1.0, label="season results toggle")  # Wait for data to load
             click_more_button(page, "Season Results")  # Expand all games
-            time.sleep(1)  # Wait for expansion
+            wait_for_dom_settle(page, budget=1.0, label="season results expand")  # Wait for expansion
             home_results = _parse_season_results(page, home_team)
             logger.info(f"Extracted {len(home_results)} games for {home_team}")
         else:
@@ -1103,9 +1474,7 @@ def _parse_season_results(page, team_name: str) -> List[SeasonGameResult]:
     results = []
     
     try:
-        html = page.content()
-        from bs4 import BeautifulSoup
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = get_page_soup(page)
         
         # Find all game rows with dates (format: DD/MM/YY)
         date_pattern = re.compile(r'\d{2}/\d{2}/\d{2}')
@@ -1228,12 +1597,10 @@ def extract_head_to_head(page, away_team: str, home_team: str) -> List[HeadToHea
         
         # Click More button to expand all matchups
         click_more_button(page, "Head to Head")
-        time.sleep(1)  # Wait for expansion
+        wait_for_dom_settle(page, budget=1.0, label="head to head expand")  # Wait for expansion
         
         # Parse the H2H games
-        html = page.content()
-        from bs4 import BeautifulSoup
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = get_page_soup(page)
         
         # Find H2H section in HTML
         h2h_heading = soup.find(string=re.compile(r'Head to Head', re.I))
@@ -1427,8 +1794,7 @@ def extract_season_results_from_page(page, away_team: str, home_team: str) -> Op
     try:
         logger.info("Extracting season results...")
         
-        html = page.content()
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = get_page_soup(page)
         
         results = {
             'away_team': away_team,
@@ -1545,8 +1911,7 @@ def extract_season_results_from_page(page, away_team: str, home_team: str) -> Di
     
     try:
         logger.info("Extracting season results from page...")
-        html = page.content()
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = get_page_soup(page)
         
         # Find the Season Results section
         season_section = soup.find(string=re.compile(r'2025/26 Season Results', re.I))
@@ -1675,6 +2040,16 @@ def extract_team_stats_from_page(page, away_team: str, home_team: str) -> Option
     """
     Extract team statistics from the Stats & Insights tab.
 
+    Returns:
+        MatchStats object with both teams' statistics
+    """
+    return extract_team_stats_from_soup(get_page_soup(page), away_team, home_team)
+
+
+def extract_team_stats_from_soup(soup, away_team: str, home_team: str) -> Optional[MatchStats]:
+    """
+    Extract team statistics from a parsed Stats & Insights page.
+
     Returns:
         MatchStats object with both teams' statistics
     """
@@ -1699,10 +2074,6 @@ def extract_team_stats_from_page(page, away_team: str, home_team: str) -> Option
         away_stats = TeamStats(team_name=away_team)
         home_stats = TeamStats(team_name=home_team)
 
-        # Get the page content
-        html = page.content()
-        soup = BeautifulSoup(html, 'html.parser')
-
         # Extract Records section (Average Points, Margins, Total)
         logger.info("Looking for Records section...")
         records_section = soup.find('h3', string=re.compile(r'Records', re.I))
@@ -1922,8 +2293,294 @@ def extract_team_stats_from_page(page, away_team: str, home_team: str) -> Option
         return None
 
 
+def extract_markets_from_html(html: str, away_team: str, home_team: str) -> List[BettingMarket]:
+    """
+    Extract betting markets from the rendered match page HTML.
+
+    Returns:
+        List of BettingMarket objects
+    """
+    return extract_markets_from_soup(parse_html(html), away_team, home_team)
+
+
+def extract_markets_from_soup(soup, away_team: str, home_team: str) -> List[BettingMarket]:
+    """
+    Extract betting markets from a parsed match page.
+
+    Returns:
+        List of BettingMarket objects
+    """
+    odds_elements = soup.find_all('span', {'data-automation-id': re.compile(r'outcome-text')})
+
+    markets = []
+    seen = set()
+
+    for odds_elem in odds_elements:
+        try:
+            odds_value = float(odds_elem.get_text(strip=True))
+        except:
+            continue
+
+        parent = odds_elem.parent
+        for _ in range(4):
+            if parent:
+                parent = parent.parent
+
+        if not parent:
+            continue
+
+        full_text = parent.get_text(strip=True)
+        selection_text = full_text.replace(str(odds_value), '').strip()
+
+        market_key = f"{selection_text}_{odds_value}"
+        if market_key in seen:
+            continue
+        seen.add(market_key)
+
+        category = categorize_market(selection_text, away_team, home_team)
+
+        line = None
+        line_match = re.search(r'[+-]?\d+\.?\d*', selection_text)
+        if line_match and category in ['handicap', 'total']:
+            line = line_match.group()
+
+        team = None
+        if away_team.split()[-1] in selection_text:
+            team = away_team
+        elif home_team.split()[-1] in selection_text:
+            team = home_team
+
+        market = BettingMarket(
+            selection_text=selection_text,
+            odds=odds_value,
+            team=team,
+            line=line,
+            market_category=category
+        )
+
+        markets.append(market)
+
+    logger.info(f"Extracted {len(markets)} betting markets")
+    # Secondary extraction for moneyline using outcome price and name labels
+    logger.info("Secondary extraction for moneyline markets...")
+    price_spans = soup.find_all('span', {'data-automation-id': re.compile(r'outcome-price-text')})
+    for price in price_spans:
+        try:
+            odds_value = float(price.get_text(strip=True))
+        except:
+            continue
+        container = price
+        for _ in range(6):
+            if container and container.parent:
+                container = container.parent
+        if not container:
+            continue
+        name_span = container.find('span', {'data-automation-id': re.compile(r'outcome-name')})
+        selection_text = None
+        if name_span:
+            selection_text = name_span.get_text(strip=True)
+        else:
+            txt = container.get_text(" ", strip=True)
+            for t in [away_team, home_team]:
+                last = t.split()[-1]
+                if last and last.lower() in txt.lower():
+                    selection_text = t
+                    break
+        if not selection_text:
+            continue
+        category = categorize_market(selection_text, away_team, home_team)
+        team = None
+        sel_lower = selection_text.lower()
+        away_last = away_team.split()[-1].lower()
+        home_last = home_team.split()[-1].lower()
+        if away_team.lower() in sel_lower or away_last in sel_lower:
+            team = away_team
+        elif home_team.lower() in sel_lower or home_last in sel_lower:
+            team = home_team
+        market_key = f"{selection_text}_{odds_value}"
+        if team and category == 'moneyline' and market_key not in seen:
+            markets.append(BettingMarket(
+                selection_text=selection_text,
+                odds=odds_value,
+                team=team,
+                line=None,
+                market_category='moneyline'
+            ))
+            seen.add(market_key)
+
+    return markets
+
+
+def extract_match_data(
+    url: str,
+    document,
+    payloads: List[Any],
+    stats_clicked: bool
+) -> CompleteMatchData:
+    """
+    Build CompleteMatchData from an expanded match page.
+
+    Works the same on a live page (LivePageDocument) and on a recorded
+    fixture (HtmlDocument), so parsers can be replayed and benchmarked
+    offline.
+
+    Args:
+        url: Sportsbet match URL (team names come from its slug)
+        document: Object with .html, .soup and .title of the expanded page
+        payloads: Captured JSON records [{'url', 'payload'}] (empty = HTML parsing only)
+        stats_clicked: Whether the Stats & Insights tab was opened
+    """
+    away_team, home_team = match_teams(url, document)
+    logger.info(f"Match: {away_team} @ {home_team}")
+
+    # Only this match's captures (the page also loads other events' data)
+    event_id = match_event_id(url)
+    payloads = payloads_for_event(payloads, event_id)
+
+    # Extract betting markets (network payloads; the rendered HTML is parsed
+    # only when the capture is missing a core game line)
+    logger.info("Extracting betting markets...")
+    network_markets = extract_markets_from_payloads(payloads, away_team, home_team, event_id) if payloads else []
+    if network_markets_complete(network_markets):
+        markets, extraction_sources = network_markets, {'markets': 'network'}
+    else:
+        markets = extract_markets_from_soup(document.soup, away_team, home_team)
+        extraction_sources = {'markets': 'html'}
+        if network_markets:
+            markets, extraction_sources['markets'] = merge_markets(network_markets, markets)
+
+    # Extract match insights (network payloads first, embedded HTML JSON as fallback)
+    logger.info("Extracting match insights...")
+    insights = extract_match_insights_from_payloads(payloads) if payloads else []
+    extraction_sources['insights'] = 'network' if insights else 'html'
+    if not insights:
+        html = document.html
+        # Check if matchInsights exists in the HTML
+        if 'matchInsights' in html:
+            logger.info("matchInsights found in HTML, extracting...")
+        else:
+            logger.warning("matchInsights NOT found in HTML - insights may not have loaded")
+        insights = extract_match_insights(html)
+
+    # Enhance insights with total lines for over/under markets
+    for insight in insights:
+        if insight.market and 'Total' in insight.market and insight.result in ['Over', 'Under']:
+            # Find matching total market to get the line
+            for market in markets:
+                if market.market_category == 'total' and market.odds == insight.odds:
+                    if market.line:
+                        # Add line to market name
+                        line_value = market.line.replace('+', '')
+                        insight.market = f"{insight.market} ({insight.result} {line_value})"
+                        break
+
+    # Extract team insights (season results + head-to-head) if Stats tab was clicked
+    team_insights = None
+    extraction_errors = []
+    
+    if stats_clicked:
+        try:
+            # DISABLED: Season results and H2H extraction from Sportsbet
+            # These sections are never available, and trying to scrape them wastes 15+ seconds per game
+            # We get this data from StatMuse instead (faster and more reliable)
+            logger.info("Skipping team insights extraction (use StatMuse for team seasonal data)")
+
+            # Create empty TeamInsights since we don't extract from Sportsbet anymore
+            team_insights = TeamInsights(
+                away_team=away_team,
+                home_team=home_team,
+                away_season_results=[],
+                home_season_results=[],
+                head_to_head=[],
+                extraction_errors=[]
+            )
+
+            logger.info(f"Team insights extracted: 0 away games, 0 home games, 0 H2H games (use StatMuse instead)")
+
+        except Exception as e:
+            logger.error(f"[CRITICAL] Error creating team insights: {e}")
+            import traceback
+            traceback.print_exc()
+            # Create empty TeamInsights with error
+            team_insights = TeamInsights(
+                away_team=away_team,
+                home_team=home_team,
+                extraction_errors=[{
+                    "component": "team_insights",
+                    "error": f"Critical failure: {str(e)}",
+                    "timestamp": datetime.now().isoformat()
+                }]
+            )
+    
+    # Extract team statistics (if Stats tab was clicked)
+    match_stats = None
+    if stats_clicked:
+        match_stats = extract_team_stats_from_payloads(payloads, away_team, home_team) if payloads else None
+        extraction_sources['team_stats'] = 'network' if match_stats else 'html'
+        if match_stats is None:
+            match_stats = extract_team_stats_from_soup(document.soup, away_team, home_team)
+
+    # ============================================================
+    # EXTRACTION STATISTICS TRACKING
+    # ============================================================
+
+    # Track extraction success rates
+    insights_extraction_stats = {
+        'total_json_insights': len(insights),  # From embedded JSON
+        'total_dom_insights': len(insight_cards) if 'insight_cards' in locals() else 0,  # From DOM extraction
+        'combined_insights': len(insights) + (len(insight_cards) if 'insight_cards' in locals() else 0),
+        'show_tip_buttons_clicked': show_tip_clicks if 'show_tip_clicks' in locals() else 0,
+        'display_more_clicks': display_more_clicks if 'display_more_clicks' in locals() else 0,
+        'match_preview_found': (match_preview is not None) if 'match_preview' in locals() else False,
+        'season_results_away': len(team_insights.away_season_results) if team_insights else 0,
+        'season_results_home': len(team_insights.home_season_results) if team_insights else 0,
+        'head_to_head_games': len(team_insights.head_to_head) if team_insights else 0,
+        'team_stats_populated': match_stats is not None,
+        'network_payloads': len(payloads),
+        'extraction_sources': extraction_sources,
+    }
+
+    logger.info("=" * 60)
+    logger.info("EXTRACTION SUMMARY")
+    logger.info("=" * 60)
+    for key, value in insights_extraction_stats.items():
+        logger.info(f"{key}: {value}")
+    logger.info("=" * 60)
+
+    complete_data = CompleteMatchData(
+        away_team=away_team,
+        home_team=home_team,
+        url=url,
+        scraped_at=datetime.now().isoformat(),
+        all_markets=markets,
+        match_insights=insights,
+        match_stats=match_stats,
+        team_insights=team_insights,
+        match_preview=match_preview if 'match_preview' in locals() else None,
+        insight_cards=insight_cards if 'insight_cards' in locals() else [],
+        insights_extraction_stats=insights_extraction_stats
+    )
+
+    return complete_data
+
+
+def _replay_match(url: str, capture_network: bool) -> Optional[CompleteMatchData]:
+    """scrape_match_complete() from a recorded fixture (no browser, no network)"""
+    fixture = load_fixture(SPORTSBET_MATCH, fixture_key(url))
+    if fixture is None:
+        return None
+    document = HtmlDocument(fixture.html, title=fixture.meta.get('title'))
+    payloads = fixture.payloads if capture_network else []
+    return extract_match_data(url, document, payloads, fixture.meta.get('stats_clicked', True))
+
+
 @retry_scraper_call(max_attempts=3, min_wait=2.0, max_wait=10.0)
-def scrape_match_complete(url: str, headless: bool = True) -> Optional[CompleteMatchData]:
+def scrape_match_complete(
+    url: str,
+    headless: bool = True,
+    pool: Optional[BrowserPool] = None,
+    capture_network: Optional[bool] = None
+) -> Optional[CompleteMatchData]:
     """
     Scrape complete match data including:
     - Betting markets
@@ -1931,96 +2588,85 @@ def scrape_match_complete(url: str, headless: bool = True) -> Optional[CompleteM
     
     This function has retry logic - it will automatically retry up to 3 times
     with exponential backoff if scraping fails.
+
+    Args:
+        url: Sportsbet match URL
+        headless: Run browser in headless mode (ignored when pool is given)
+        pool: Shared BrowserPool to take a page from. If None, a private
+              browser is launched and closed for this call.
+        capture_network: Build markets/insights/team stats from the JSON
+              responses the page loads (HTML parsers remain the fallback).
+              Default: Config.SPORTSBET_CAPTURE_NETWORK
     """
 
     logger.info(f"Scraping complete match data: {url}")
 
-    with sync_playwright() as p:
-        # Launch with more realistic browser args
-        browser = p.chromium.launch(
-            headless=headless,
-            args=[
-                '--disable-blink-features=AutomationControlled',
-                '--disable-dev-shm-usage',
-                '--no-sandbox',
-                '--disable-setuid-sandbox',
-                '--disable-web-security'
-            ]
-        )
+    if capture_network is None:
+        capture_network = Config.SPORTSBET_CAPTURE_NETWORK
 
-        # More realistic browser context
-        context = browser.new_context(
-            viewport={'width': 1920, 'height': 1080},
-            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            locale='en-AU',
-            timezone_id='Australia/Sydney',
-            extra_http_headers={
-                'Accept-Language': 'en-AU,en;q=0.9',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-                'Accept-Encoding': 'gzip, deflate, br',
-                'DNT': '1',
-                'Connection': 'keep-alive',
-                'Upgrade-Insecure-Requests': '1'
-            }
-        )
+    if is_replaying():
+        return _replay_match(url, capture_network)
 
-        page = context.new_page()
+    # Recording keeps the JSON responses too, even when extraction uses HTML only
+    recording = is_recording()
 
-        # Add stealth scripts to avoid detection
-        page.add_init_script("""
-            Object.defineProperty(navigator, 'webdriver', {
-                get: () => undefined
-            });
+    owns_pool = pool is None
+    if owns_pool:
+        pool = BrowserPool(headless=headless)
 
-            Object.defineProperty(navigator, 'plugins', {
-                get: () => [1, 2, 3, 4, 5]
-            });
-
-            Object.defineProperty(navigator, 'languages', {
-                get: () => ['en-AU', 'en-US', 'en']
-            });
-
-            window.chrome = {
-                runtime: {}
-            };
-        """)
+    page = pool.acquire()
+    page_ok = True
+    capture = None
+    if capture_network or recording:
+        capture = ResponseCapture(url_patterns=[r'sportsbet\.com\.au']).attach(page)
 
+    try:
+        page.goto(url, wait_until="load", timeout=60000)
+        page.wait_for_selector('[data-automation-id*="outcome-text"]', timeout=10000)
+
+        # Scroll to load all content
+        logger.info("Scrolling to load content...")
+        for i in range(10):
+            page.evaluate("window.scrollBy(0, 800)")
+            wait_for_dom_settle(page, budget=0.3, quiet_ms=150, label="match scroll")
+        invalidate_page_document(page)
+
+        # Click Stats & Insights tab to load insights data
+        logger.info("Looking for Stats & Insights tab...")
+        stats_clicked = False
         try:
-            page.goto(url, wait_until="load", timeout=60000)
-            page.wait_for_selector('[data-automation-id*="outcome-text"]', timeout=10000)
-
-            # Scroll to load all content
-            logger.info("Scrolling to load content...")
-            for i in range(10):
-                page.evaluate("window.scrollBy(0, 800)")
-                time.sleep(0.3)
-
-            # Click Stats & Insights tab to load insights data
-            logger.info("Looking for Stats & Insights tab...")
-            stats_clicked = False
-            try:
-                stats_tab = page.locator('text=/Stats.*Insights/i').first
-                if stats_tab.is_visible(timeout=2000):
-                    logger.info("Clicking Stats & Insights tab...")
-                    stats_tab.click()
-                    
-                    # Wait for content to load
-                    logger.info("Waiting 20 seconds for Stats & Insights to fully load...")
-                    time.sleep(20)
-                    
-                    # Check what we have
-                    test_text = page.evaluate("() => document.body.innerText")
-                    if "Season Results" in test_text:
-                        logger.info("✓ Season Results IS in page text")
-                    else:
-                        logger.warning("✗ Season Results NOT in page text")
-                    
-                    # Count scores
-                    scores = re.findall(r'\d{2,3}-\d{2,3}', test_text)
-                    logger.info(f"Found {len(scores)} score patterns after clicking tab")
-                    
-                    stats_clicked = True
+            stats_tab = page.locator('text=/Stats.*Insights/i').first
+            if stats_tab.is_visible(timeout=2000):
+                logger.info("Clicking Stats & Insights tab...")
+                stats_tab.click()
+                invalidate_page_document(page)
+                
+                # Wait for the insights data to render (Season Results section, 20s ceiling).
+                # networkidle was met at page load, so it says nothing about the tab's XHR.
+                logger.info("Waiting for Stats & Insights to fully load...")
+                wait_for_content(page, budget=20.0, selector=INSIGHTS_READY_SELECTOR, label="stats & insights tab")
+                
+                # Check what we have
+                test_text = page.evaluate("() => document.body.innerText")
+                if "Season Results" in test_text:
+                    logger.info("✓ Season Results IS in page text")
+                else:
+                    logger.warning("✗ Season Results NOT in page text")
+                
+                # Count scores
+                scores = re.findall(r'\d{2,3}-\d{2,3}', test_text)
+                logger.info(f"Found {len(scores)} score patterns after clicking tab")
+                
+                stats_clicked = True
 
+                # Network capture mode: the tab's data arrived as JSON, so the
+                # expand-and-click choreography below is not needed
+                network_ready = capture_network and bool(
+                    find_key(payloads_for_event(capture.records(), match_event_id(url)), 'matchInsights')
+                )
+                if network_ready:
+                    logger.info("Stats & Insights data captured from network - skipping DOM expansion")
+                else:
                     # Click on "Stats" sub-tab to ensure we're on the right view
                     try:
                         # Try multiple selectors for the Stats tab
@@ -2031,31 +2677,34 @@ def scrape_match_complete(url: str, headless: bool = True) -> Optional[CompleteM
                                 if stats_subtab.is_visible(timeout=1000):
                                     logger.info(f"Clicking Stats sub-tab with selector: {selector}")
                                     stats_subtab.click()
-                                    time.sleep(3)  # Wait longer for content
+                                    invalidate_page_document(page)
+                                    wait_for_dom_settle(page, budget=3.0, label="stats sub-tab")  # Wait longer for content
                                     stats_found = True
                                     break
                             except:
                                 continue
-                        
+                    
                         if not stats_found:
                             logger.info("No Stats sub-tab found - may already be on Stats view")
                     except Exception as e:
                         logger.info(f"Stats sub-tab interaction: {e}")
-                    
+                
                     # Scroll down aggressively to load all sections
                     logger.info("Scrolling to load all sections...")
                     for i in range(10):
                         page.evaluate(f"window.scrollBy(0, {500 * (i + 1)})")
-                        time.sleep(0.5)
-                    
+                        wait_for_dom_settle(page, budget=0.5, quiet_ms=200, label="stats scroll")
+                
                     # Scroll back to top
                     page.evaluate("window.scrollTo(0, 0)")
-                    time.sleep(1)
-                    
+                    wait_for_dom_settle(page, budget=1.0, quiet_ms=200, label="stats scroll")
+                
                     # Scroll down again slowly
                     for i in range(5):
                         page.evaluate("window.scrollBy(0, 800)")
-                        time.sleep(1)
+                        wait_for_dom_settle(page, budget=1.0, quiet_ms=200, label="stats scroll")
+                    # Lazy-loaded sections changed the DOM
+                    invalidate_page_document(page)
 
                     # ============================================================
                     # INSIGHTS EXTRACTION (from embedded JSON in HTML)
@@ -2063,9 +2712,9 @@ def scrape_match_complete(url: str, headless: bool = True) -> Optional[CompleteM
                     # Insights are extracted from embedded JSON in HTML, not from DOM manipulation
                     # Phases 1-5 (DOM extraction) removed - they don't find anything useful
                     # Insights will be extracted directly from HTML JSON later
-                    
+                
                     logger.debug("Skipping DOM-based insight extraction (insights come from embedded JSON)")
-                    
+                
                     # ============================================================
                     # END: INSIGHTS EXTRACTION
                     # ============================================================
@@ -2077,29 +2726,31 @@ def scrape_match_complete(url: str, headless: bool = True) -> Optional[CompleteM
                         season_results_heading = page.locator('text=/2025\\/26 Season Results/i').first
                         if season_results_heading.is_visible(timeout=2000):
                             logger.info("Found Season Results section")
-                            
+                        
                             # Click the away team button (first circle button)
                             try:
                                 away_button = page.locator('button[aria-label*="' + away_team + '"], button:has-text("' + away_team.split()[-1] + '")').first
                                 if away_button.is_visible(timeout=1000):
                                     logger.info(f"Clicking {away_team} button...")
                                     away_button.click()
-                                    time.sleep(2)
+                                    invalidate_page_document(page)
+                                    wait_for_dom_settle(page, budget=2.0, label="team button")
                             except Exception as e:
                                 logger.debug(f"Could not click away team button: {e}")
-                            
+                        
                             # Click the home team button (second circle button)
                             try:
                                 home_button = page.locator('button[aria-label*="' + home_team + '"], button:has-text("' + home_team.split()[-1] + '")').first
                                 if home_button.is_visible(timeout=1000):
                                     logger.info(f"Clicking {home_team} button...")
                                     home_button.click()
-                                    time.sleep(2)
+                                    invalidate_page_document(page)
+                                    wait_for_dom_settle(page, budget=2.0, label="team button")
                             except Exception as e:
                                 logger.debug(f"Could not click home team button: {e}")
                     except Exception as e:
                         logger.debug(f"Error with team toggle buttons: {e}")
-                    
+                
                     # DISABLED: Season Results scraping - it's never available on Sportsbet
                     # We get team seasonal data from StatMuse instead (faster and more reliable)
                     # This saves ~15 seconds per game
@@ -2112,493 +2763,240 @@ def scrape_match_complete(url: str, headless: bool = True) -> Optional[CompleteM
                         logger.info(f"Saved Stats & Insights screenshot to {screenshot_path}")
                     except Exception as e:
                         logger.debug(f"Could not save screenshot: {e}")
-                    
+                
                     logger.info("Finished expanding all data sections")
-            except Exception as e:
-                logger.warning(f"Could not click Stats & Insights tab: {e}")
-
-            # Get team names
-            # First try robust extraction from URL slug as fallback
-            away_team = "Unknown"
-            home_team = "Unknown"
-
-            try:
-                slug = url.rstrip('/').split('/')[-1]
-                parts = slug.split('-')
-                if 'at' in parts:
-                    idx = parts.index('at')
-                    away_tokens = parts[:idx]
-                    home_tokens = parts[idx+1:]
-                    def normalize(tokens):
-                        cleaned = [t for t in tokens if not t.isdigit()]
-                        return ' '.join([t.capitalize() for t in cleaned])
-                    away_team = normalize(away_tokens)
-                    home_team = normalize(home_tokens)
-            except Exception:
-                pass
-
-            # If slug parse failed, fall back to title heuristic
-            if away_team == "Unknown" or home_team == "Unknown":
-                title = page.title()
-                # Capture sequences of capitalized words (handles 2-3 word names)
-                teams = re.findall(r'([A-Z][a-z]+(?: [A-Z][a-z]+)+)', title)
-                away_team = teams[0] if len(teams) > 0 else away_team
-                home_team = teams[1] if len(teams) > 1 else home_team
-
-            logger.info(f"Match: {away_team} @ {home_team}")
-
-            # Get HTML
-            html = page.content()
-
-            # Extract betting markets
-            logger.info("Extracting betting markets...")
-            soup = BeautifulSoup(html, 'html.parser')
-            odds_elements = soup.find_all('span', {'data-automation-id': re.compile(r'outcome-text')})
-
-            markets = []
-            seen = set()
-
-            for odds_elem in odds_elements:
-                try:
-                    odds_value = float(odds_elem.get_text(strip=True))
-                except:
-                    continue
-
-                parent = odds_elem.parent
-                for _ in range(4):
-                    if parent:
-                        parent = parent.parent
-
-                if not parent:
-                    continue
-
-                full_text = parent.get_text(strip=True)
-                selection_text = full_text.replace(str(odds_value), '').strip()
-
-                market_key = f"{selection_text}_{odds_value}"
-                if market_key in seen:
-                    continue
-                seen.add(market_key)
-
-                category = categorize_market(selection_text, away_team, home_team)
-
-                line = None
-                line_match = re.search(r'[+-]?\d+\.?\d*', selection_text)
-                if line_match and category in ['handicap', 'total']:
-                    line = line_match.group()
-
-                team = None
-                if away_team.split()[-1] in selection_text:
-                    team = away_team
-                elif home_team.split()[-1] in selection_text:
-                    team = home_team
-
-                market = BettingMarket(
-                    selection_text=selection_text,
-                    odds=odds_value,
-                    team=team,
-                    line=line,
-                    market_category=category
-                )
-
-                markets.append(market)
-
-            logger.info(f"Extracted {len(markets)} betting markets")
-            # Secondary extraction for moneyline using outcome price and name labels
-            logger.info("Secondary extraction for moneyline markets...")
-            price_spans = soup.find_all('span', {'data-automation-id': re.compile(r'outcome-price-text')})
-            for price in price_spans:
-                try:
-                    odds_value = float(price.get_text(strip=True))
-                except:
-                    continue
-                container = price
-                for _ in range(6):
-                    if container and container.parent:
-                        container = container.parent
-                if not container:
-                    continue
-                name_span = container.find('span', {'data-automation-id': re.compile(r'outcome-name')})
-                selection_text = None
-                if name_span:
-                    selection_text = name_span.get_text(strip=True)
-                else:
-                    txt = container.get_text(" ", strip=True)
-                    for t in [away_team, home_team]:
-                        last = t.split()[-1]
-                        if last and last.lower() in txt.lower():
-                            selection_text = t
-                            break
-                if not selection_text:
-                    continue
-                category = categorize_market(selection_text, away_team, home_team)
-                team = None
-                sel_lower = selection_text.lower()
-                away_last = away_team.split()[-1].lower()
-                home_last = home_team.split()[-1].lower()
-                if away_team.lower() in sel_lower or away_last in sel_lower:
-                    team = away_team
-                elif home_team.lower() in sel_lower or home_last in sel_lower:
-                    team = home_team
-                market_key = f"{selection_text}_{odds_value}"
-                if team and category == 'moneyline' and market_key not in seen:
-                    markets.append(BettingMarket(
-                        selection_text=selection_text,
-                        odds=odds_value,
-                        team=team,
-                        line=None,
-                        market_category='moneyline'
-                    ))
-                    seen.add(market_key)
-
-            # Extract match insights from HTML
-            logger.info("Extracting match insights...")
-            # Check if matchInsights exists in the HTML
-            if 'matchInsights' in html:
-                logger.info("matchInsights found in HTML, extracting...")
-            else:
-                logger.warning("matchInsights NOT found in HTML - insights may not have loaded")
-            insights = extract_match_insights(html)
-
-            # Enhance insights with total lines for over/under markets
-            for insight in insights:
-                if insight.market and 'Total' in insight.market and insight.result in ['Over', 'Under']:
-                    # Find matching total market to get the line
-                    for market in markets:
-                        if market.market_category == 'total' and market.odds == insight.odds:
-                            if market.line:
-                                # Add line to market name
-                                line_value = market.line.replace('+', '')
-                                insight.market = f"{insight.market} ({insight.result} {line_value})"
-                                break
-
-            # Extract team insights (season results + head-to-head) if Stats tab was clicked
-            team_insights = None
-            extraction_errors = []
-            
-            if stats_clicked:
-                try:
-                    # DISABLED: Season results and H2H extraction from Sportsbet
-                    # These sections are never available, and trying to scrape them wastes 15+ seconds per game
-                    # We get this data from StatMuse instead (faster and more reliable)
-                    logger.info("Skipping team insights extraction (use StatMuse for team seasonal data)")
-
-                    # Create empty TeamInsights since we don't extract from Sportsbet anymore
-                    team_insights = TeamInsights(
-                        away_team=away_team,
-                        home_team=home_team,
-                        away_season_results=[],
-                        home_season_results=[],
-                        head_to_head=[],
-                        extraction_errors=[]
-                    )
-
-                    logger.info(f"Team insights extracted: 0 away games, 0 home games, 0 H2H games (use StatMuse instead)")
-
-                except Exception as e:
-                    logger.error(f"[CRITICAL] Error creating team insights: {e}")
-                    import traceback
-                    traceback.print_exc()
-                    # Create empty TeamInsights with error
-                    team_insights = TeamInsights(
-                        away_team=away_team,
-                        home_team=home_team,
-                        extraction_errors=[{
-                            "component": "team_insights",
-                            "error": f"Critical failure: {str(e)}",
-                            "timestamp": datetime.now().isoformat()
-                        }]
-                    )
-            
-            # Extract team statistics (if Stats tab was clicked)
-            match_stats = None
-            if stats_clicked:
-                match_stats = extract_team_stats_from_page(page, away_team, home_team)
-
-            # ============================================================
-            # EXTRACTION STATISTICS TRACKING
-            # ============================================================
-
-            # Track extraction success rates
-            insights_extraction_stats = {
-                'total_json_insights': len(insights),  # From embedded JSON
-                'total_dom_insights': len(insight_cards) if 'insight_cards' in locals() else 0,  # From DOM extraction
-                'combined_insights': len(insights) + (len(insight_cards) if 'insight_cards' in locals() else 0),
-                'show_tip_buttons_clicked': show_tip_clicks if 'show_tip_clicks' in locals() else 0,
-                'display_more_clicks': display_more_clicks if 'display_more_clicks' in locals() else 0,
-                'match_preview_found': (match_preview is not None) if 'match_preview' in locals() else False,
-                'season_results_away': len(team_insights.away_season_results) if team_insights else 0,
-                'season_results_home': len(team_insights.home_season_results) if team_insights else 0,
-                'head_to_head_games': len(team_insights.head_to_head) if team_insights else 0,
-                'team_stats_populated': match_stats is not None,
-            }
-
-            logger.info("=" * 60)
-            logger.info("EXTRACTION SUMMARY")
-            logger.info("=" * 60)
-            for key, value in insights_extraction_stats.items():
-                logger.info(f"{key}: {value}")
-            logger.info("=" * 60)
-
-            complete_data = CompleteMatchData(
-                away_team=away_team,
-                home_team=home_team,
-                url=url,
-                scraped_at=datetime.now().isoformat(),
-                all_markets=markets,
-                match_insights=insights,
-                match_stats=match_stats,
-                team_insights=team_insights,
-                match_preview=match_preview if 'match_preview' in locals() else None,
-                insight_cards=insight_cards if 'insight_cards' in locals() else [],
-                insights_extraction_stats=insights_extraction_stats
+        except Exception as e:
+            logger.warning(f"Could not click Stats & Insights tab: {e}")
+
+        # Record the expanded page before it is handed back to the pool
+        if recording:
+            record_fixture(
+                SPORTSBET_MATCH,
+                fixture_key(url),
+                get_page_html(page),
+                payloads=capture.records() if capture else [],
+                meta={'url': url, 'title': page.title(), 'stats_clicked': stats_clicked}
             )
 
-            return complete_data
+        payloads = capture.records() if capture and capture_network else []
+        return extract_match_data(url, LivePageDocument(page), payloads, stats_clicked)
 
-        except Exception as e:
-            logger.error(f"Error: {e}")
-            import traceback
-            traceback.print_exc()
-            return None
+    except Exception as e:
+        logger.error(f"Error: {e}")
+        import traceback
+        traceback.print_exc()
+        page_ok = False
+        return None
 
-        finally:
-            browser.close()
+    finally:
+        if capture:
+            capture.detach()
+        invalidate_page_document(page)
+        pool.release(page, reusable=page_ok)
+        if owns_pool:
+            pool.close()
 
 
 @retry_scraper_call(max_attempts=3, min_wait=2.0, max_wait=10.0)
-def scrape_nba_overview(headless: bool = True) -> List[Dict]:
+def scrape_nba_overview(headless: bool = True, pool: Optional[BrowserPool] = None) -> List[Dict]:
     """
     Scrape NBA overview to get all games.
     
     This function has retry logic - it will automatically retry up to 3 times
     with exponential backoff if scraping fails.
+
+    Args:
+        headless: Run browser in headless mode (ignored when pool is given)
+        pool: Shared BrowserPool to take a page from. If None, a private
+              browser is launched and closed for this call.
     """
 
-    url = "https://www.sportsbet.com.au/betting/basketball-us/nba"
+    url = f"{Config.SPORTSBET_BASE_URL}/betting/basketball-us/nba"
     logger.info(f"Scraping NBA overview: {url}")
 
-    with sync_playwright() as p:
-        # Launch with more realistic browser args
-        browser = p.chromium.launch(
-            headless=headless,
-            args=[
-                '--disable-blink-features=AutomationControlled',
-                '--disable-dev-shm-usage',
-                '--no-sandbox',
-                '--disable-setuid-sandbox',
-                '--disable-web-security'
-            ]
-        )
+    owns_pool = pool is None
+    if owns_pool:
+        pool = BrowserPool(headless=headless)
 
-        # More realistic browser context
-        context = browser.new_context(
-            viewport={'width': 1920, 'height': 1080},
-            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            locale='en-AU',
-            timezone_id='Australia/Sydney',
-            extra_http_headers={
-                'Accept-Language': 'en-AU,en;q=0.9',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-                'Accept-Encoding': 'gzip, deflate, br',
-                'DNT': '1',
-                'Connection': 'keep-alive',
-                'Upgrade-Insecure-Requests': '1'
-            }
-        )
+    page = pool.acquire()
+    page_ok = True
 
-        page = context.new_page()
+    try:
+        # Changed from "networkidle" to "load" for better reliability
+        logger.info("Attempting to load page (timeout: 60s)...")
+        page.goto(url, wait_until="load", timeout=60000)
+        logger.info("Page loaded, waiting for dynamic content...")
+        
+        # Wait for dynamic content to load (game links rendered, 8s ceiling)
+        wait_for_content(page, budget=8.0, selector='a[href*="/betting/basketball-us/nba/"]', label="overview load")
+
+        # Try scrolling to trigger lazy loading (with delays to appear more human)
+        page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+        wait_for_dom_settle(page, budget=3.0, label="overview scroll")
+        page.evaluate("window.scrollTo(0, 0)")
+        wait_for_dom_settle(page, budget=3.0, label="overview scroll")
+        invalidate_page_document(page)
+
+        # Wait for game links to appear with multiple strategies
+        selectors_to_try = [
+            'a[href*="/betting/basketball-us/nba"]',
+            'a[href*="/betting/basketball"]',
+            '[data-testid*="game"]',
+            '[class*="event"]',
+            '[class*="match"]'
+        ]
+        
+        found_selector = None
+        for selector in selectors_to_try:
+            try:
+                page.wait_for_selector(selector, timeout=5000)
+                logger.info(f"Found content using selector: {selector}")
+                found_selector = selector
+                break
+            except:
+                continue
+        
+        if not found_selector:
+            logger.warning("No content selectors found, continuing anyway...")
 
-        # Add stealth scripts to avoid detection
-        page.add_init_script("""
-            Object.defineProperty(navigator, 'webdriver', {
-                get: () => undefined
-            });
+        # Take screenshot for debugging
+        screenshot_file = Path(__file__).parent.parent / "debug" / "sportsbet_nba_page.png"
+        screenshot_file.parent.mkdir(parents=True, exist_ok=True)
+        page.screenshot(path=str(screenshot_file), full_page=False)
+        logger.info(f"Saved screenshot to {screenshot_file}")
 
-            Object.defineProperty(navigator, 'plugins', {
-                get: () => [1, 2, 3, 4, 5]
-            });
+        html = get_page_html(page)
+        soup = get_page_soup(page)
 
-            Object.defineProperty(navigator, 'languages', {
-                get: () => ['en-AU', 'en-US', 'en']
-            });
+        # Debug: Save HTML to see what we're getting
+        debug_file = Path(__file__).parent.parent / "debug" / "sportsbet_nba_page.html"
+        debug_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(debug_file, 'w', encoding='utf-8') as f:
+            f.write(html)
+        logger.info(f"Saved page HTML to {debug_file}")
 
-            window.chrome = {
-                runtime: {}
-            };
-        """)
+        if is_recording():
+            record_fixture(SPORTSBET_OVERVIEW, 'nba', html, meta={'url': url})
 
-        try:
-            # Changed from "networkidle" to "load" for better reliability
-            logger.info("Attempting to load page (timeout: 60s)...")
-            page.goto(url, wait_until="load", timeout=60000)
-            logger.info("Page loaded, waiting for dynamic content...")
-            
-            # RATE LIMITING: Wait longer for dynamic content to load
-            time.sleep(8)  # Increased from 5 to 8 seconds
-
-            # Try scrolling to trigger lazy loading (with delays to appear more human)
-            page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-            time.sleep(3)  # Increased from 2 to 3 seconds
-            page.evaluate("window.scrollTo(0, 0)")
-            time.sleep(3)  # Increased from 2 to 3 seconds
-
-            # Wait for game links to appear with multiple strategies
-            selectors_to_try = [
-                'a[href*="/betting/basketball-us/nba"]',
-                'a[href*="/betting/basketball"]',
-                '[data-testid*="game"]',
-                '[class*="event"]',
-                '[class*="match"]'
-            ]
-            
-            found_selector = None
-            for selector in selectors_to_try:
-                try:
-                    page.wait_for_selector(selector, timeout=5000)
-                    logger.info(f"Found content using selector: {selector}")
-                    found_selector = selector
-                    break
-                except:
-                    continue
-            
-            if not found_selector:
-                logger.warning("No content selectors found, continuing anyway...")
-
-            # Take screenshot for debugging
-            screenshot_file = Path(__file__).parent.parent / "debug" / "sportsbet_nba_page.png"
-            screenshot_file.parent.mkdir(parents=True, exist_ok=True)
-            page.screenshot(path=str(screenshot_file), full_page=False)
-            logger.info(f"Saved screenshot to {screenshot_file}")
-
-            html = page.content()
-            soup = BeautifulSoup(html, 'html.parser')
-
-            # Debug: Save HTML to see what we're getting
-            debug_file = Path(__file__).parent.parent / "debug" / "sportsbet_nba_page.html"
-            debug_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(debug_file, 'w', encoding='utf-8') as f:
-                f.write(html)
-            logger.info(f"Saved page HTML to {debug_file}")
-
-            # Try multiple strategies to find game links
-            links = []
-            
-            # Strategy 1: Direct NBA game links
-            links = soup.find_all('a', href=re.compile(r'/betting/basketball-us/nba/.*-\d+$'))
-            logger.info(f"Strategy 1: Found {len(links)} NBA game links with pattern '/betting/basketball-us/nba/.*-\\d+$'")
-            
-            # Strategy 2: Any basketball links ending with numbers
-            if not links:
-                links = soup.find_all('a', href=re.compile(r'/betting/basketball.*-\d+$'))
-                logger.info(f"Strategy 2: Found {len(links)} basketball links ending with numbers")
+        # Try multiple strategies to find game links
+        links = []
+        
+        # Strategy 1: Direct NBA game links
+        links = soup.find_all('a', href=re.compile(r'/betting/basketball-us/nba/.*-\d+$'))
+        logger.info(f"Strategy 1: Found {len(links)} NBA game links with pattern '/betting/basketball-us/nba/.*-\\d+$'")
+        
+        # Strategy 2: Any basketball links ending with numbers
+        if not links:
+            links = soup.find_all('a', href=re.compile(r'/betting/basketball.*-\d+$'))
+            logger.info(f"Strategy 2: Found {len(links)} basketball links ending with numbers")
+        
+        # Strategy 3: Links containing NBA and team names
+        if not links:
+            all_basketball_links = soup.find_all('a', href=re.compile(r'/betting/basketball'))
+            logger.info(f"Strategy 3: Found {len(all_basketball_links)} total basketball links")
             
-            # Strategy 3: Links containing NBA and team names
-            if not links:
-                all_basketball_links = soup.find_all('a', href=re.compile(r'/betting/basketball'))
-                logger.info(f"Strategy 3: Found {len(all_basketball_links)} total basketball links")
-                
-                # Filter for NBA-specific patterns
-                for link in all_basketball_links:
+            # Filter for NBA-specific patterns
+            for link in all_basketball_links:
+                href = link.get('href', '')
+                if '/nba/' in href and any(team in href.lower() for team in ['lakers', 'celtics', 'warriors', 'heat', 'knicks', 'bulls', 'mavericks']):
+                    links.append(link)
+            logger.info(f"Strategy 3: Filtered to {len(links)} NBA links with team names")
+        
+        # Strategy 4: Look for data attributes or other indicators
+        if not links:
+            # Try finding by data attributes
+            game_elements = soup.find_all(attrs={'data-testid': re.compile(r'game|match|event', re.I)})
+            for elem in game_elements:
+                link_elem = elem.find('a', href=re.compile(r'/betting'))
+                if link_elem:
+                    links.append(link_elem)
+            logger.info(f"Strategy 4: Found {len(links)} links via data attributes")
+        
+        # Debug: Show first few links found
+        if links:
+            logger.info("Sample links found:")
+            for link in links[:5]:
+                href = link.get('href', 'NO HREF')
+                text = link.get_text(strip=True)[:50]
+                logger.info(f"  {href} - '{text}'")
+        else:
+            logger.warning("No game links found! Checking page structure...")
+            # Try to find any links at all
+            all_links = soup.find_all('a', href=True)
+            logger.info(f"Total links on page: {len(all_links)}")
+            if all_links:
+                logger.info("Sample links on page:")
+                for link in all_links[:10]:
                     href = link.get('href', '')
-                    if '/nba/' in href and any(team in href.lower() for team in ['lakers', 'celtics', 'warriors', 'heat', 'knicks', 'bulls', 'mavericks']):
-                        links.append(link)
-                logger.info(f"Strategy 3: Filtered to {len(links)} NBA links with team names")
+                    if '/betting' in href:
+                        logger.info(f"  {href}")
+
+        games = []
+        seen_urls = set()
+
+        for link in links[:30]:  # Increased limit
+            href = link.get('href')
+            if not href:
+                continue
             
-            # Strategy 4: Look for data attributes or other indicators
-            if not links:
-                # Try finding by data attributes
-                game_elements = soup.find_all(attrs={'data-testid': re.compile(r'game|match|event', re.I)})
-                for elem in game_elements:
-                    link_elem = elem.find('a', href=re.compile(r'/betting'))
-                    if link_elem:
-                        links.append(link_elem)
-                logger.info(f"Strategy 4: Found {len(links)} links via data attributes")
+            # Normalize href
+            if href.startswith('/'):
+                href = f"{Config.SPORTSBET_BASE_URL}{href}"
+            elif not href.startswith('http'):
+                continue
             
-            # Debug: Show first few links found
-            if links:
-                logger.info("Sample links found:")
-                for link in links[:5]:
-                    href = link.get('href', 'NO HREF')
-                    text = link.get_text(strip=True)[:50]
-                    logger.info(f"  {href} - '{text}'")
-            else:
-                logger.warning("No game links found! Checking page structure...")
-                # Try to find any links at all
-                all_links = soup.find_all('a', href=True)
-                logger.info(f"Total links on page: {len(all_links)}")
-                if all_links:
-                    logger.info("Sample links on page:")
-                    for link in all_links[:10]:
-                        href = link.get('href', '')
-                        if '/betting' in href:
-                            logger.info(f"  {href}")
-
-            games = []
-            seen_urls = set()
-
-            for link in links[:30]:  # Increased limit
-                href = link.get('href')
-                if not href:
-                    continue
-                
-                # Normalize href
-                if href.startswith('/'):
-                    href = f"https://www.sportsbet.com.au{href}"
-                elif not href.startswith('http'):
-                    continue
-                
-                if href in seen_urls:
-                    continue
+            if href in seen_urls:
+                continue
 
-                seen_urls.add(href)
+            seen_urls.add(href)
+            
+            # Try to extract team names from URL
+            try:
+                url_parts = href.split('/')
+                last_part = url_parts[-1] if url_parts else ''
                 
-                # Try to extract team names from URL
-                try:
-                    url_parts = href.split('/')
-                    last_part = url_parts[-1] if url_parts else ''
-                    
-                    # Remove trailing numbers
-                    if '-' in last_part:
-                        teams_str = last_part.rsplit('-', 1)[0]
-                        teams = teams_str.replace('-', ' ').title().split(' At ')
+                # Remove trailing numbers
+                if '-' in last_part:
+                    teams_str = last_part.rsplit('-', 1)[0]
+                    teams = teams_str.replace('-', ' ').title().split(' At ')
+                else:
+                    # Try to get from link text
+                    link_text = link.get_text(strip=True)
+                    if ' @ ' in link_text or ' vs ' in link_text.lower():
+                        teams = re.split(r' @ | vs ', link_text, flags=re.I)
                     else:
-                        # Try to get from link text
-                        link_text = link.get_text(strip=True)
-                        if ' @ ' in link_text or ' vs ' in link_text.lower():
-                            teams = re.split(r' @ | vs ', link_text, flags=re.I)
-                        else:
-                            teams = ['Unknown', 'Unknown']
-                    
-                    games.append({
-                        'url': href,
-                        'away_team': teams[0].strip() if len(teams) > 0 else 'Unknown',
-                        'home_team': teams[1].strip() if len(teams) > 1 else 'Unknown',
-                        'teams_str': ' @ '.join(teams) if len(teams) >= 2 else 'Unknown'
-                    })
-                except Exception as e:
-                    logger.debug(f"Error parsing link {href}: {e}")
-                    # Still add the game with URL
-                    games.append({
-                        'url': href,
-                        'away_team': 'Unknown',
-                        'home_team': 'Unknown',
-                        'teams_str': 'Unknown'
-                    })
-
-            logger.info(f"Successfully extracted {len(games)} games")
-            return games
+                        teams = ['Unknown', 'Unknown']
+                
+                games.append({
+                    'url': href,
+                    'away_team': teams[0].strip() if len(teams) > 0 else 'Unknown',
+                    'home_team': teams[1].strip() if len(teams) > 1 else 'Unknown',
+                    'teams_str': ' @ '.join(teams) if len(teams) >= 2 else 'Unknown'
+                })
+            except Exception as e:
+                logger.debug(f"Error parsing link {href}: {e}")
+                # Still add the game with URL
+                games.append({
+                    'url': href,
+                    'away_team': 'Unknown',
+                    'home_team': 'Unknown',
+                    'teams_str': 'Unknown'
+                })
+
+        logger.info(f"Successfully extracted {len(games)} games")
+        return games
 
-        except Exception as e:
-            logger.error(f"Error scraping NBA overview: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
-            return []
-        finally:
-            try:
-                browser.close()
-            except:
-                pass
+    except Exception as e:
+        logger.error(f"Error scraping NBA overview: {e}")
+        import traceback
+        logger.error(traceback.format_exc())
+        page_ok = False
+        return []
+    finally:
+        invalidate_page_document(page)
+        pool.release(page, reusable=page_ok)
+        if owns_pool:
+            pool.close()
 
 
 if __name__ == "__main__":
@@ -30,6 +30,8 @@ from pathlib import Path
 from playwright.sync_api import sync_playwright, Page, Browser, BrowserContext
 from bs4 import BeautifulSoup
 
+from scrapers.request_blocking import install_request_blocking
+
 # ---------------------------------------------------------------------
 # Logging Setup
 # ---------------------------------------------------------------------
@@ -220,6 +222,8 @@ class SportsbetScraper:
             }
         )
 
+        install_request_blocking(self.context, site='sportsbet')
+
         # Remove automation indicators
         self.context.add_init_script("""
             // Remove webdriver property
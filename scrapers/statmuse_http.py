@@ -0,0 +1,123 @@
+"""
+StatMuse HTTP Fast Path
+=======================
+StatMuse answer pages (game logs, team stats) are server-rendered: the
+tables are already in the initial HTML. Fetching them over a pooled HTTP
+session skips the browser launch, scroll and settle sleeps entirely.
+
+Callers parse the returned HTML with the same parsers they use on the
+browser's page.content(), and fall back to Playwright only when the
+response has no table (blocked, challenge page, layout change).
+
+Usage:
+    from scrapers.statmuse_http import fetch_statmuse_html
+
+    html = fetch_statmuse_html(url)
+    if html is None:
+        ...  # Playwright fallback
+"""
+
+import logging
+import threading
+from typing import Dict, Any, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from config.settings import Config
+
+logger = logging.getLogger(__name__)
+
+REQUEST_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+}
+
+# Connect/read timeout in seconds
+REQUEST_TIMEOUT = (5, 20)
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+_stats_lock = threading.Lock()
+_stats = {
+    'requests': 0,
+    'table_hits': 0,
+    'table_missing': 0,
+    'errors': 0,
+    'bytes': 0,
+}
+
+
+def _get_session() -> requests.Session:
+    """Shared keep-alive session (connection pool sized for concurrent fetches)"""
+    global _session
+    with _session_lock:
+        if _session is None:
+            pool_size = max(4, Config.MAX_CONCURRENT_REQUESTS * 2)
+            retry = Retry(
+                total=Config.RETRY_MAX_ATTEMPTS,
+                backoff_factor=Config.RETRY_MIN_WAIT / 2,
+                status_forcelist=(429, 500, 502, 503, 504),
+                allowed_methods=frozenset(['GET']),
+                respect_retry_after_header=True,
+                raise_on_status=False
+            )
+            adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+            session = requests.Session()
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            session.headers.update(REQUEST_HEADERS)
+            _session = session
+        return _session
+
+
+def _count(key: str, nbytes: int = 0):
+    with _stats_lock:
+        _stats['requests'] += 1
+        _stats[key] += 1
+        _stats['bytes'] += nbytes
+
+
+def fetch_statmuse_html(url: str) -> Optional[str]:
+    """
+    Fetch a server-rendered StatMuse page over HTTP.
+
+    Args:
+        url: StatMuse page URL
+
+    Returns:
+        Page HTML if it contains a table, None if the caller should fall back
+        to the browser (disabled, HTTP error, or no table in the response)
+    """
+    if not Config.STATMUSE_HTTP_FAST_PATH:
+        return None
+
+    try:
+        response = _get_session().get(url, timeout=REQUEST_TIMEOUT)
+    except requests.RequestException as e:
+        logger.debug(f"[STATMUSE HTTP] {url}: {e}")
+        _count('errors')
+        return None
+
+    if response.status_code != 200:
+        logger.debug(f"[STATMUSE HTTP] {url}: HTTP {response.status_code}")
+        _count('errors')
+        return None
+
+    html = response.text
+    if '<table' not in html:
+        logger.debug(f"[STATMUSE HTTP] {url}: no table in response, needs browser")
+        _count('table_missing', len(html))
+        return None
+
+    _count('table_hits', len(html))
+    return html
+
+
+def get_fetch_stats() -> Dict[str, Any]:
+    """HTTP fast-path counters (table_missing = browser fallbacks)"""
+    with _stats_lock:
+        return dict(_stats)
@@ -14,13 +14,22 @@ import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+import asyncio
 import logging
+import queue
+import threading
 import time
 import json
-from typing import List, Optional, Dict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Iterator, List, Optional, Dict, Tuple
 from dataclasses import dataclass, asdict
 from datetime import datetime
 from playwright.sync_api import sync_playwright, Page
+from config.settings import Config
+from scrapers.request_blocking import install_request_blocking, install_request_blocking_async
+from scrapers.page_documents import parse_html
+from scrapers.statmuse_http import fetch_statmuse_html
+from scrapers.fixtures import STATMUSE_GAME_LOG, fixture_key, is_recording, is_replaying, load_fixture, record_fixture
 
 # Use centralized logging
 from config.logging_config import get_logger
@@ -124,6 +133,11 @@ def _player_name_to_slug(player_name: str) -> str:
     return player_name.lower().replace(" ", "-").replace("'", "")
 
 
+def _game_log_url(player_name: str) -> str:
+    """StatMuse game-log URL (must NOT include the season - that breaks the page)"""
+    return f"{Config.STATMUSE_BASE_URL}/nba/ask/{_player_name_to_slug(player_name)}-game-log"
+
+
 def _parse_float(text: str) -> float:
     """Parse float from text, handling % and other characters"""
     try:
@@ -179,6 +193,161 @@ def robust_page_load(page: Page, url: str, max_retries: int = 3) -> bool:
     return False
 
 
+def parse_player_profile_html(html: str, player_name: str, season: str) -> Optional[PlayerProfile]:
+    """
+    Parse a StatMuse player stats page.
+
+    Args:
+        html: Page HTML (over HTTP or from the browser)
+        player_name: Player's full name (copied into the profile)
+        season: Season string
+
+    Returns:
+        PlayerProfile, or None if the page has no season stats
+    """
+    soup = parse_html(html)
+    
+    # Initialize profile
+    profile = PlayerProfile(
+        player_name=player_name,
+        team="",
+        season=season
+    )
+    
+    # Extract bio info from text or headers
+    # StatMuse structure varies, so we'll look for common patterns
+    
+    # Find team name (usually in title or near player name)
+    title = soup.find('title')
+    if title:
+        title_text = title.get_text()
+        # Pattern: "Player Name Stats | Team"
+        if '|' in title_text:
+            parts = title_text.split('|')
+            if len(parts) > 1:
+                profile.team = parts[1].strip().replace(' Stats', '')
+    
+    # Find stats table
+    tables = soup.find_all('table')
+    
+    for table in tables:
+        headers = []
+        header_row = table.find('thead')
+        if header_row:
+            headers = [th.get_text(strip=True) for th in header_row.find_all('th')]
+        
+        # Look for season average row
+        tbody = table.find('tbody')
+        if tbody:
+            rows = tbody.find_all('tr')
+            
+            # Process first data row (usually season average)
+            if rows:
+                cells = rows[0].find_all('td')
+                
+                if len(cells) >= 3:
+                    # Map headers to values
+                    # Temp vars for totals
+                    total_points = 0.0
+                    total_rebounds = 0.0
+                    total_assists = 0.0
+                    
+                    # Map headers to values
+                    for i, header in enumerate(headers):
+                        if i >= len(cells):
+                            break
+                        
+                        value = cells[i].get_text(strip=True)
+                        
+                        # Parse based on header
+                        try:
+                            if header in ['GP', 'G', 'Games']:
+                                profile.games_played = _parse_int(value)
+                            elif header in ['GS', 'Started']:
+                                profile.games_started = _parse_int(value)
+                            elif header in ['MIN', 'MPG', 'MP']:
+                                # MIN is usually MPG, MP is sometimes Total Minutes
+                                val = _parse_float(value)
+                                if header == 'MP' and val > 60: # Likely total minutes
+                                    pass # Ignore total minutes for now or divide later if needed
+                                else:
+                                    profile.minutes = val
+                            elif header == 'PPG':
+                                profile.points = _parse_float(value)
+                            elif header == 'PTS': # Usually total points if PPG exists, or could be PPG
+                                # If value is > 50, it's definitely total
+                                val = _parse_float(value)
+                                if val > 60:
+                                    total_points = val
+                                else:
+                                    # Could be PPG (e.g. 30.5)
+                                    # We generally prefer 'PPG' header if it exists
+                                    if profile.points == 0:
+                                         profile.points = val
+                            elif header in ['RPG', 'TRB']: # TRB can be total
+                                profile.rebounds = _parse_float(value)
+                            elif header == 'REB':
+                                val = _parse_float(value)
+                                if val > 30: # Likely total
+                                    total_rebounds = val
+                                else:
+                                    if profile.rebounds == 0:
+                                        profile.rebounds = val
+                            elif header == 'APG':
+                                profile.assists = _parse_float(value)
+                            elif header == 'AST':
+                                val = _parse_float(value)
+                                if val > 20: # Likely total
+                                    total_assists = val
+                                else:
+                                    if profile.assists == 0:
+                                        profile.assists = val
+                            elif header in ['STL', 'SPG']:
+                                profile.steals = _parse_float(value)
+                            elif header in ['BLK', 'BPG']:
+                                profile.blocks = _parse_float(value)
+                            elif header in ['TOV', 'TOPG']:
+                                profile.turnovers = _parse_float(value)
+                            elif header in ['FG%']:
+                                profile.fg_pct = _parse_float(value)
+                            elif header in ['FGM']:
+                                profile.fg_made = _parse_float(value)
+                            elif header in ['FGA']:
+                                profile.fg_attempted = _parse_float(value)
+                            elif header in ['3P%']:
+                                profile.three_pct = _parse_float(value)
+                            elif header in ['3PM']:
+                                profile.three_made = _parse_float(value)
+                            elif header in ['3PA']:
+                                profile.three_attempted = _parse_float(value)
+                            elif header in ['FT%']:
+                                profile.ft_pct = _parse_float(value)
+                            elif header in ['FTM']:
+                                profile.ft_made = _parse_float(value)
+                            elif header in ['FTA']:
+                                profile.ft_attempted = _parse_float(value)
+                        except Exception as e:
+                            logger.debug(f"Error parsing {header}: {e}")
+                            continue
+                    
+                    # Post-processing: Calculate averages from totals if needed
+                    if profile.games_played > 0:
+                        if profile.points == 0 and total_points > 0:
+                            profile.points = round(total_points / profile.games_played, 1)
+                        if profile.rebounds == 0 and total_rebounds > 0:
+                            profile.rebounds = round(total_rebounds / profile.games_played, 1)
+                        if profile.assists == 0 and total_assists > 0:
+                            profile.assists = round(total_assists / profile.games_played, 1)
+                    
+                    # If we found stats, we can stop
+                    if profile.games_played > 0:
+                        break
+    
+    if profile.games_played == 0:
+        return None
+    return profile
+
+
 def scrape_player_profile(
     player_name: str,
     season: str = "2024-25",
@@ -203,13 +372,23 @@ def scrape_player_profile(
     
     # Try multiple URL patterns (StatMuse has different formats)
     urls_to_try = [
-        f"https://www.statmuse.com/nba/ask/{player_slug}-stats-{season}",
-        f"https://www.statmuse.com/nba/ask/{player_slug}-{season}",
-        f"https://www.statmuse.com/nba/player/{player_slug}"
+        f"{Config.STATMUSE_BASE_URL}/nba/ask/{player_slug}-stats-{season}",
+        f"{Config.STATMUSE_BASE_URL}/nba/ask/{player_slug}-{season}",
+        f"{Config.STATMUSE_BASE_URL}/nba/player/{player_slug}"
     ]
     
     logger.debug(f"Scraping profile: {player_name} ({season})")
     
+    # Fast path: answer pages are server-rendered, no browser needed
+    for url in urls_to_try:
+        html = fetch_statmuse_html(url)
+        if html is None:
+            continue
+        profile = parse_player_profile_html(html, player_name, season)
+        if profile is not None:
+            logger.debug(f"Scraped profile over HTTP: {profile.games_played} GP, {profile.points} PPG")
+            return profile
+    
     try:
         with sync_playwright() as p:
             browser = p.chromium.launch(
@@ -220,6 +399,7 @@ def scrape_player_profile(
                 viewport={'width': 1920, 'height': 1080},
                 user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
             )
+            install_request_blocking(context, site='statmuse')
             page = context.new_page()
             
             # Try each URL until one works
@@ -241,147 +421,8 @@ def scrape_player_profile(
             html = page.content()
             browser.close()
             
-            # Parse the HTML
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(html, 'html.parser')
-            
-            # Initialize profile
-            profile = PlayerProfile(
-                player_name=player_name,
-                team="",
-                season=season
-            )
-            
-            # Extract bio info from text or headers
-            # StatMuse structure varies, so we'll look for common patterns
-            
-            # Find team name (usually in title or near player name)
-            title = soup.find('title')
-            if title:
-                title_text = title.get_text()
-                # Pattern: "Player Name Stats | Team"
-                if '|' in title_text:
-                    parts = title_text.split('|')
-                    if len(parts) > 1:
-                        profile.team = parts[1].strip().replace(' Stats', '')
-            
-            # Find stats table
-            tables = soup.find_all('table')
-            
-            for table in tables:
-                headers = []
-                header_row = table.find('thead')
-                if header_row:
-                    headers = [th.get_text(strip=True) for th in header_row.find_all('th')]
-                
-                # Look for season average row
-                tbody = table.find('tbody')
-                if tbody:
-                    rows = tbody.find_all('tr')
-                    
-                    # Process first data row (usually season average)
-                    if rows:
-                        cells = rows[0].find_all('td')
-                        
-                        if len(cells) >= 3:
-                            # Map headers to values
-                            # Temp vars for totals
-                            total_points = 0.0
-                            total_rebounds = 0.0
-                            total_assists = 0.0
-                            
-                            # Map headers to values
-                            for i, header in enumerate(headers):
-                                if i >= len(cells):
-                                    break
-                                
-                                value = cells[i].get_text(strip=True)
-                                
-                                # Parse based on header
-                                try:
-                                    if header in ['GP', 'G', 'Games']:
-                                        profile.games_played = _parse_int(value)
-                                    elif header in ['GS', 'Started']:
-                                        profile.games_started = _parse_int(value)
-                                    elif header in ['MIN', 'MPG', 'MP']:
-                                        # MIN is usually MPG, MP is sometimes Total Minutes
-                                        val = _parse_float(value)
-                                        if header == 'MP' and val > 60: # Likely total minutes
-                                            pass # Ignore total minutes for now or divide later if needed
-                                        else:
-                                            profile.minutes = val
-                                    elif header == 'PPG':
-                                        profile.points = _parse_float(value)
-                                    elif header == 'PTS': # Usually total points if PPG exists, or could be PPG
-                                        # If value is > 50, it's definitely total
-                                        val = _parse_float(value)
-                                        if val > 60:
-                                            total_points = val
-                                        else:
-                                            # Could be PPG (e.g. 30.5)
-                                            # We generally prefer 'PPG' header if it exists
-                                            if profile.points == 0:
-                                                 profile.points = val
-                                    elif header in ['RPG', 'TRB']: # TRB can be total
-                                        profile.rebounds = _parse_float(value)
-                                    elif header == 'REB':
-                                        val = _parse_float(value)
-                                        if val > 30: # Likely total
-                                            total_rebounds = val
-                                        else:
-                                            if profile.rebounds == 0:
-                                                profile.rebounds = val
-                                    elif header == 'APG':
-                                        profile.assists = _parse_float(value)
-                                    elif header == 'AST':
-                                        val = _parse_float(value)
-                                        if val > 20: # Likely total
-                                            total_assists = val
-                                        else:
-                                            if profile.assists == 0:
-                                                profile.assists = val
-                                    elif header in ['STL', 'SPG']:
-                                        profile.steals = _parse_float(value)
-                                    elif header in ['BLK', 'BPG']:
-                                        profile.blocks = _parse_float(value)
-                                    elif header in ['TOV', 'TOPG']:
-                                        profile.turnovers = _parse_float(value)
-                                    elif header in ['FG%']:
-                                        profile.fg_pct = _parse_float(value)
-                                    elif header in ['FGM']:
-                                        profile.fg_made = _parse_float(value)
-                                    elif header in ['FGA']:
-                                        profile.fg_attempted = _parse_float(value)
-                                    elif header in ['3P%']:
-                                        profile.three_pct = _parse_float(value)
-                                    elif header in ['3PM']:
-                                        profile.three_made = _parse_float(value)
-                                    elif header in ['3PA']:
-                                        profile.three_attempted = _parse_float(value)
-                                    elif header in ['FT%']:
-                                        profile.ft_pct = _parse_float(value)
-                                    elif header in ['FTM']:
-                                        profile.ft_made = _parse_float(value)
-                                    elif header in ['FTA']:
-                                        profile.ft_attempted = _parse_float(value)
-                                except Exception as e:
-                                    logger.debug(f"Error parsing {header}: {e}")
-                                    continue
-                            
-                            # Post-processing: Calculate averages from totals if needed
-                            if profile.games_played > 0:
-                                if profile.points == 0 and total_points > 0:
-                                    profile.points = round(total_points / profile.games_played, 1)
-                                if profile.rebounds == 0 and total_rebounds > 0:
-                                    profile.rebounds = round(total_rebounds / profile.games_played, 1)
-                                if profile.assists == 0 and total_assists > 0:
-                                    profile.assists = round(total_assists / profile.games_played, 1)
-                            
-                            # If we found stats, we can stop
-                            if profile.games_played > 0:
-                                break
-            
-            if profile.games_played == 0:
+            profile = parse_player_profile_html(html, player_name, season)
+            if profile is None:
                 logger.warning(f"No stats found for {player_name}")
                 return None
             
@@ -417,7 +458,7 @@ def scrape_player_splits(
         List of PlayerSplitStats objects
     """
     player_slug = _player_name_to_slug(player_name)
-    url = f"https://www.statmuse.com/nba/ask/{player_slug}-splits-{season}"
+    url = f"{Config.STATMUSE_BASE_URL}/nba/ask/{player_slug}-splits-{season}"
     
     logger.debug(f"Scraping splits: {player_name} ({season})")
     
@@ -433,6 +474,7 @@ def scrape_player_splits(
                 viewport={'width': 1920, 'height': 1080},
                 user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
             )
+            install_request_blocking(context, site='statmuse')
             page = context.new_page()
             
             if not robust_page_load(page, url):
@@ -531,11 +573,140 @@ def scrape_player_splits(
 
 
 
+def parse_player_game_log_html(html: str, player_name: str) -> List[PlayerGameLog]:
+    """
+    Parse a StatMuse game-log page.
+
+    Args:
+        html: Page HTML (live or from a recorded fixture)
+        player_name: Player's full name (copied into each log)
+
+    Returns:
+        List of PlayerGameLog objects (most recent first)
+    """
+    soup = parse_html(html)
+    logs = []
+    
+    # Find all tables
+    tables = soup.find_all('table')
+    logger.debug(f"Found {len(tables)} tables")
+    
+    for table in tables:
+        headers = []
+        header_row = table.find('thead')
+        if header_row:
+            headers = [th.get_text(strip=True) for th in header_row.find_all('th')]
+        
+        tbody = table.find('tbody')
+        if tbody:
+            rows = tbody.find_all('tr')
+            
+            for row in rows:
+                cells = row.find_all('td')
+                if len(cells) < 5: # Need basic info
+                    continue
+                
+                # First cell is usually DATE (or NAME in some views, but game log starts with DATE)
+                date_str = cells[0].get_text(strip=True)
+                
+                # Skip header rows embedded in body or invalid rows
+                if not date_str or date_str == 'DATE' or 'Season' in date_str:
+                    continue
+                    
+                # Initialize log
+                log = PlayerGameLog(
+                    player_name=player_name,
+                    date=date_str,
+                    opponent="",
+                    home_away="",
+                    win_loss=""
+                )
+                
+                # Extract stats from cells
+                try:
+                    for i, header in enumerate(headers):
+                        if i >= len(cells):
+                            break
+                        
+                        value = cells[i].get_text(strip=True)
+                        
+                        try:
+                            if header == 'OPP' or header == 'Opp':
+                                log.opponent = value
+                                if 'vs' in value:
+                                    log.home_away = "HOME"
+                                elif '@' in value:
+                                    log.home_away = "AWAY"
+                            elif header == 'W/L':
+                                log.win_loss = value
+                            elif header in ['MIN', 'MP']:
+                                log.minutes = _parse_float(value)
+                            elif header in ['PTS', 'TM']: # TM sometimes used for points? Unlikely but check
+                                log.points = _parse_int(value)
+                            elif header in ['REB', 'TRB']:
+                                log.rebounds = _parse_int(value)
+                            elif header in ['AST']:
+                                log.assists = _parse_int(value)
+                            elif header in ['STL']:
+                                log.steals = _parse_int(value)
+                            elif header in ['BLK']:
+                                log.blocks = _parse_int(value)
+                            elif header in ['TOV']:
+                                log.turnovers = _parse_int(value)
+                            elif header in ['PF']:
+                                log.fouls = _parse_int(value)
+                            elif header in ['FGM']:
+                                log.fg_made = _parse_int(value)
+                            elif header in ['FGA']:
+                                log.fg_attempted = _parse_int(value)
+                            elif header in ['FG%']:
+                                log.fg_pct = _parse_float(value)
+                            elif header in ['3PM']:
+                                log.three_made = _parse_int(value)
+                            elif header in ['3PA']:
+                                log.three_attempted = _parse_int(value)
+                            elif header in ['3P%']:
+                                log.three_pct = _parse_float(value)
+                            elif header in ['FTM']:
+                                log.ft_made = _parse_int(value)
+                            elif header in ['FTA']:
+                                log.ft_attempted = _parse_int(value)
+                            elif header in ['FT%']:
+                                log.ft_pct = _parse_float(value)
+                            elif header in ['+/-']:
+                                log.plus_minus = _parse_int(value)
+                        except Exception as e:
+                            # logger.debug(f"Error parsing {header}: {e}")
+                            continue
+                
+                except Exception as e:
+                    logger.warning(f"Error parsing game log row: {e}")
+                    continue
+                
+                logs.append(log)
+    
+    return logs
+
+
+def _game_log_over_http(player_name: str, url: str) -> Optional[List[PlayerGameLog]]:
+    """Game log via the HTTP fast path, or None if the browser is needed"""
+    html = fetch_statmuse_html(url)
+    if html is None:
+        return None
+
+    if is_recording():
+        record_fixture(STATMUSE_GAME_LOG, fixture_key(player_name), html, meta={'url': url, 'player_name': player_name})
+
+    logs = parse_player_game_log_html(html, player_name)
+    logger.debug(f"Scraped {len(logs)} games over HTTP")
+    return logs
+
+
 def scrape_player_game_log(
     player_name: str,
     season: str = "2024-25",
     headless: bool = True
-) -> List[PlayerGameLog]:
+) -> Optional[List[PlayerGameLog]]:
     """
     Scrape player game log from StatMuse.
     
@@ -545,17 +716,24 @@ def scrape_player_game_log(
         headless: Run browser in headless mode
     
     Returns:
-        List of PlayerGameLog objects (most recent first)
+        List of PlayerGameLog objects (most recent first); empty if the page
+        loaded without games, None if it could not be fetched
     """
-    player_slug = _player_name_to_slug(player_name)
     # NOTE: StatMuse game-log URLs should NOT include season/year - it breaks the scraper
     # Working format: https://www.statmuse.com/nba/ask/{player_slug}-game-log
     # Broken format: https://www.statmuse.com/nba/ask/{player_slug}-game-log-2024-25
-    url = f"https://www.statmuse.com/nba/ask/{player_slug}-game-log"
+    url = _game_log_url(player_name)
     
     logger.debug(f"Scraping game log: {player_name}")
     
-    logs = []
+    if is_replaying():
+        fixture = load_fixture(STATMUSE_GAME_LOG, fixture_key(player_name))
+        return parse_player_game_log_html(fixture.html, player_name) if fixture else None
+
+    # Fast path: the table is server-rendered, no browser needed
+    logs = _game_log_over_http(player_name, url)
+    if logs is not None:
+        return logs
     
     try:
         with sync_playwright() as p:
@@ -567,11 +745,12 @@ def scrape_player_game_log(
                 viewport={'width': 1920, 'height': 1080},
                 user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
             )
+            install_request_blocking(context, site='statmuse')
             page = context.new_page()
             
             if not robust_page_load(page, url):
                 browser.close()
-                return logs
+                return None
             
             # Scroll to load all games
             page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
@@ -580,113 +759,218 @@ def scrape_player_game_log(
             html = page.content()
             browser.close()
             
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(html, 'html.parser')
-            
-            # Find all tables
-            tables = soup.find_all('table')
-            logger.debug(f"Found {len(tables)} tables")
-            
-            for table in tables:
-                headers = []
-                header_row = table.find('thead')
-                if header_row:
-                    headers = [th.get_text(strip=True) for th in header_row.find_all('th')]
-                
-                tbody = table.find('tbody')
-                if tbody:
-                    rows = tbody.find_all('tr')
-                    
-                    for row in rows:
-                        cells = row.find_all('td')
-                        if len(cells) < 5: # Need basic info
-                            continue
-                        
-                        # First cell is usually DATE (or NAME in some views, but game log starts with DATE)
-                        date_str = cells[0].get_text(strip=True)
-                        
-                        # Skip header rows embedded in body or invalid rows
-                        if not date_str or date_str == 'DATE' or 'Season' in date_str:
-                            continue
-                            
-                        # Initialize log
-                        log = PlayerGameLog(
-                            player_name=player_name,
-                            date=date_str,
-                            opponent="",
-                            home_away="",
-                            win_loss=""
-                        )
-                        
-                        # Extract stats from cells
-                        try:
-                            for i, header in enumerate(headers):
-                                if i >= len(cells):
-                                    break
-                                
-                                value = cells[i].get_text(strip=True)
-                                
-                                try:
-                                    if header == 'OPP' or header == 'Opp':
-                                        log.opponent = value
-                                        if 'vs' in value:
-                                            log.home_away = "HOME"
-                                        elif '@' in value:
-                                            log.home_away = "AWAY"
-                                    elif header == 'W/L':
-                                        log.win_loss = value
-                                    elif header in ['MIN', 'MP']:
-                                        log.minutes = _parse_float(value)
-                                    elif header in ['PTS', 'TM']: # TM sometimes used for points? Unlikely but check
-                                        log.points = _parse_int(value)
-                                    elif header in ['REB', 'TRB']:
-                                        log.rebounds = _parse_int(value)
-                                    elif header in ['AST']:
-                                        log.assists = _parse_int(value)
-                                    elif header in ['STL']:
-                                        log.steals = _parse_int(value)
-                                    elif header in ['BLK']:
-                                        log.blocks = _parse_int(value)
-                                    elif header in ['TOV']:
-                                        log.turnovers = _parse_int(value)
-                                    elif header in ['PF']:
-                                        log.fouls = _parse_int(value)
-                                    elif header in ['FGM']:
-                                        log.fg_made = _parse_int(value)
-                                    elif header in ['FGA']:
-                                        log.fg_attempted = _parse_int(value)
-                                    elif header in ['FG%']:
-                                        log.fg_pct = _parse_float(value)
-                                    elif header in ['3PM']:
-                                        log.three_made = _parse_int(value)
-                                    elif header in ['3PA']:
-                                        log.three_attempted = _parse_int(value)
-                                    elif header in ['3P%']:
-                                        log.three_pct = _parse_float(value)
-                                    elif header in ['FTM']:
-                                        log.ft_made = _parse_int(value)
-                                    elif header in ['FTA']:
-                                        log.ft_attempted = _parse_int(value)
-                                    elif header in ['FT%']:
-                                        log.ft_pct = _parse_float(value)
-                                    elif header in ['+/-']:
-                                        log.plus_minus = _parse_int(value)
-                                except Exception as e:
-                                    # logger.debug(f"Error parsing {header}: {e}")
-                                    continue
-                        
-                        except Exception as e:
-                            logger.warning(f"Error parsing game log row: {e}")
-                            continue
-                        
-                        logs.append(log)
-            
+            if is_recording():
+                record_fixture(STATMUSE_GAME_LOG, fixture_key(player_name), html, meta={'url': url, 'player_name': player_name})
+
+            logs = parse_player_game_log_html(html, player_name)
             logger.debug(f"Scraped {len(logs)} games")
             return logs
             
     except Exception as e:
         logger.error(f"Error scraping player game log: {e}")
-        return logs
+        return None
+
+
+# =============================================================================
+# BATCH GAME LOGS (one browser, several concurrent pages)
+# =============================================================================
+
+_BATCH_DONE = object()
+
+
+async def _async_page_load(page, url: str, max_retries: int = 2) -> bool:
+    """robust_page_load() for async pages (same strategies, shorter retry pauses)"""
+    strategies = [
+        {"wait_until": "load", "timeout": 60000},
+        {"wait_until": "domcontentloaded", "timeout": 45000},
+        {"wait_until": "commit", "timeout": 30000}
+    ]
+
+    for attempt in range(max_retries):
+        for strategy_idx, strategy in enumerate(strategies):
+            try:
+                await page.goto(url, **strategy)
+                await page.wait_for_selector('table, .player-card, .stats-table', timeout=10000)
+                return True
+            except Exception as e:
+                logger.debug(f"Strategy {strategy_idx + 1} failed for {url}: {e}")
+
+        if attempt < max_retries - 1:
+            await asyncio.sleep((attempt + 1) * 3)
+
+    logger.error(f"All attempts failed to load: {url}")
+    return False
+
+
+async def _async_fetch_game_log(context, semaphore, player_name: str, cancelled: threading.Event):
+    """Load one game-log page on its own tab and parse it (logs None if it could not be fetched)"""
+    async with semaphore:
+        if cancelled.is_set():
+            return player_name, None
+
+        url = _game_log_url(player_name)
+        page = await context.new_page()
+        try:
+            if not await _async_page_load(page, url):
+                return player_name, None
+
+            # Scroll to load all games, then wait for the table to stop changing
+            await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+            try:
+                await page.wait_for_load_state('networkidle', timeout=2000)
+            except Exception:
+                pass
+
+            html = await page.content()
+        except Exception as e:
+            logger.error(f"Error scraping player game log for {player_name}: {e}")
+            return player_name, None
+        finally:
+            try:
+                await page.close()
+            except Exception:
+                pass
+
+    if is_recording():
+        record_fixture(STATMUSE_GAME_LOG, fixture_key(player_name), html, meta={'url': url, 'player_name': player_name})
+
+    logs = parse_player_game_log_html(html, player_name)
+    logger.debug(f"Scraped {len(logs)} games for {player_name}")
+    return player_name, logs
+
+
+async def _async_game_log_batch(
+    player_names: List[str],
+    headless: bool,
+    max_concurrent: int,
+    results: "queue.Queue",
+    cancelled: threading.Event
+):
+    """Fetch all game logs on one browser/context, pushing each result as it finishes"""
+    from playwright.async_api import async_playwright
+
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(
+            headless=headless,
+            args=['--disable-blink-features=AutomationControlled']
+        )
+        try:
+            context = await browser.new_context(
+                viewport={'width': 1920, 'height': 1080},
+                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+            )
+            await install_request_blocking_async(context, site='statmuse')
+
+            semaphore = asyncio.Semaphore(max_concurrent)
+            tasks = [
+                asyncio.ensure_future(_async_fetch_game_log(context, semaphore, name, cancelled))
+                for name in player_names
+            ]
+            for finished in asyncio.as_completed(tasks):
+                results.put(await finished)
+        finally:
+            await browser.close()
+
+
+def scrape_player_game_logs(
+    player_names: List[str],
+    season: str = "2024-25",
+    headless: bool = True,
+    max_concurrent: Optional[int] = None
+) -> Iterator[Tuple[str, Optional[List[PlayerGameLog]]]]:
+    """
+    Scrape game logs for many players over a single browser.
+
+    Pages are fetched over the HTTP fast path first. For players whose
+    response has no table, one Chromium is launched for the rest of the
+    batch; each gets its own tab, with up to max_concurrent tabs loading at
+    once. Results are yielded as soon as each player finishes (not in input
+    order).
+
+    Args:
+        player_names: Players' full names (duplicates are fetched once)
+        season: Season string (kept for parity with scrape_player_game_log;
+                game-log URLs are not season specific)
+        headless: Run browser in headless mode
+        max_concurrent: Tabs in flight at once (default: Config.MAX_CONCURRENT_REQUESTS)
+
+    Yields:
+        (player_name, logs) tuples; logs is empty if the page loaded without
+        games and None if it could not be fetched (as scrape_player_game_log)
+    """
+    names = list(dict.fromkeys(player_names))
+    if not names:
+        return
+
+    if is_replaying():
+        for name in names:
+            yield name, scrape_player_game_log(name, season=season)
+        return
+
+    if max_concurrent is None:
+        max_concurrent = Config.MAX_CONCURRENT_REQUESTS
+    max_concurrent = max(1, min(max_concurrent, len(names)))
+
+    # Fast path first: most pages come back with their table over plain HTTP
+    if Config.STATMUSE_HTTP_FAST_PATH:
+        browser_needed = []
+        with ThreadPoolExecutor(max_workers=max_concurrent, thread_name_prefix="statmuse-http") as executor:
+            futures = {
+                executor.submit(_game_log_over_http, name, _game_log_url(name)): name
+                for name in names
+            }
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    logs = future.result()
+                except Exception as e:
+                    logger.debug(f"HTTP fast path failed for {name}: {e}")
+                    logs = None
+                if logs is None:
+                    browser_needed.append(name)
+                else:
+                    yield name, logs
+
+        if not browser_needed:
+            return
+        logger.info(f"{len(browser_needed)}/{len(names)} game logs need the browser")
+        needed = set(browser_needed)
+        names = [name for name in names if name in needed]
+        max_concurrent = min(max_concurrent, len(names))
+
+    logger.info(f"Scraping {len(names)} game logs on one browser ({max_concurrent} concurrent pages)")
+
+    # The async driver runs on its own thread/event loop so callers can stay synchronous
+    results: "queue.Queue" = queue.Queue()
+    cancelled = threading.Event()
+
+    def run():
+        try:
+            asyncio.run(_async_game_log_batch(names, headless, max_concurrent, results, cancelled))
+        except Exception as e:
+            logger.error(f"Batch game-log scrape failed: {e}")
+        finally:
+            results.put(_BATCH_DONE)
+
+    worker = threading.Thread(target=run, name="statmuse-batch", daemon=True)
+    worker.start()
+
+    pending = set(names)
+    try:
+        while True:
+            item = results.get()
+            if item is _BATCH_DONE:
+                break
+            pending.discard(item[0])
+            yield item
+    finally:
+        # Consumer stopped early: let in-flight pages finish, start no new ones
+        cancelled.set()
+
+    # Players never reached because the browser failed
+    for name in names:
+        if name in pending:
+            yield name, None
 
 
 # Export main classes and functions
@@ -696,7 +980,10 @@ __all__ = [
     'PlayerSplitStats',
     'scrape_player_profile',
     'scrape_player_splits',
-    'scrape_player_game_log'
+    'scrape_player_game_log',
+    'scrape_player_game_logs',
+    'parse_player_profile_html',
+    'parse_player_game_log_html'
 ]
 
 
@@ -13,6 +13,8 @@ import time
 from typing import List, Optional
 from dataclasses import dataclass, asdict
 from playwright.sync_api import sync_playwright, Page
+from scrapers.request_blocking import install_request_blocking
+from scrapers.statmuse_http import fetch_statmuse_html
 from bs4 import BeautifulSoup
 
 # Import team ID mapping
@@ -142,6 +144,93 @@ def robust_page_load(page: Page, url: str, max_retries: int = 3) -> bool:
     return False
 
 
+def parse_team_stats_html(html: str, team_name: str, season: str) -> Optional[TeamStats]:
+    """
+    Parse a StatMuse team stats page.
+
+    Args:
+        html: Page HTML (browser or HTTP fast path)
+        team_name: Full team name
+        season: Season string
+
+    Returns:
+        TeamStats object or None if the page has no stats table
+    """
+    soup = BeautifulSoup(html, 'html.parser')
+
+    # Initialize team stats (team_name passed as parameter)
+    team_stats = TeamStats(team_name=team_name, season=season)
+
+    # Find the stats table
+    tables = soup.find_all('table')
+
+    if not tables:
+        logger.warning("No tables found on page")
+        return None
+
+    # Look for team stats table (first table usually)
+    team_table = tables[0]
+
+    # Extract headers
+    headers = []
+    header_row = team_table.find('thead')
+    if header_row:
+        headers = [th.get_text(strip=True) for th in header_row.find_all('th')]
+        logger.debug(f"Found headers: {headers[:5]}...")
+
+    # Extract team row data
+    tbody = team_table.find('tbody')
+    if tbody:
+        rows = tbody.find_all('tr')
+
+        for row in rows:
+            cells = row.find_all('td')
+            if len(cells) < 5:
+                continue
+
+            # Extract stats from cells
+            try:
+                idx = 0
+                for i, header in enumerate(headers):
+                    if i >= len(cells):
+                        break
+
+                    value = cells[i].get_text(strip=True)
+
+                    # Parse numeric values
+                    try:
+                        if header == 'GP' or header == 'G':
+                            team_stats.games_played = int(value)
+                        elif header == 'PTS':
+                            team_stats.points = float(value)
+                        elif header == 'REB' or header == 'TRB':
+                            team_stats.rebounds = float(value)
+                        elif header == 'AST':
+                            team_stats.assists = float(value)
+                        elif header == 'STL':
+                            team_stats.steals = float(value)
+                        elif header == 'BLK':
+                            team_stats.blocks = float(value)
+                        elif header == 'TOV':
+                            team_stats.turnovers = float(value)
+                        elif header == 'FG%':
+                            team_stats.fg_pct = float(value)
+                        elif header == '3P%':
+                            team_stats.three_pct = float(value)
+                        elif header == 'FT%':
+                            team_stats.ft_pct = float(value)
+                    except (ValueError, AttributeError):
+                        continue
+
+                break  # Only process first data row
+
+            except Exception as e:
+                logger.error(f"Error parsing row: {e}")
+                continue
+
+    return team_stats
+
+
 def scrape_team_stats(team_name: str, season: str = "2025-26", headless: bool = True) -> Optional[TeamStats]:
     """
     Scrape team statistics from StatMuse (robust version with correct URLs).
@@ -163,6 +252,15 @@ def scrape_team_stats(team_name: str, season: str = "2025-26", headless: bool =
     logger.info(f"Scraping team stats: {team_name} ({season})")
     logger.info(f"URL: {url}")
 
+    # Fast path: the table is server-rendered, no browser needed
+    html = fetch_statmuse_html(url)
+    if html is not None:
+        team_stats = parse_team_stats_html(html, team_name, season)
+        if team_stats and (team_stats.games_played or team_stats.points):
+            logger.info(f"Successfully scraped over HTTP: {team_stats.games_played} GP, {team_stats.points} PPG")
+            return team_stats
+        logger.debug(f"HTTP page for {team_name} had no usable stats table, falling back to browser")
+
     try:
         with sync_playwright() as p:
             browser = p.chromium.launch(
@@ -180,6 +278,7 @@ def scrape_team_stats(team_name: str, season: str = "2025-26", headless: bool =
                     'Accept-Encoding': 'gzip, deflate, br'
                 }
             )
+            install_request_blocking(context, site='statmuse')
             page = context.new_page()
 
             # Robust page load
@@ -189,82 +288,11 @@ def scrape_team_stats(team_name: str, season: str = "2025-26", headless: bool =
 
             # Get page content
             html = page.content()
-            soup = BeautifulSoup(html, 'html.parser')
-
-            # Initialize team stats (team_name passed as parameter)
-            team_stats = TeamStats(team_name=team_name, season=season)
-
-            # Find the stats table
-            tables = soup.find_all('table')
-
-            if not tables:
-                logger.warning("No tables found on page")
-                browser.close()
-                return None
-
-            # Look for team stats table (first table usually)
-            team_table = tables[0]
-
-            # Extract headers
-            headers = []
-            header_row = team_table.find('thead')
-            if header_row:
-                headers = [th.get_text(strip=True) for th in header_row.find_all('th')]
-                logger.debug(f"Found headers: {headers[:5]}...")
-
-            # Extract team row data
-            tbody = team_table.find('tbody')
-            if tbody:
-                rows = tbody.find_all('tr')
-
-                for row in rows:
-                    cells = row.find_all('td')
-                    if len(cells) < 5:
-                        continue
-
-                    # Extract stats from cells
-                    try:
-                        idx = 0
-                        for i, header in enumerate(headers):
-                            if i >= len(cells):
-                                break
-
-                            value = cells[i].get_text(strip=True)
-
-                            # Parse numeric values
-                            try:
-                                if header == 'GP' or header == 'G':
-                                    team_stats.games_played = int(value)
-                                elif header == 'PTS':
-                                    team_stats.points = float(value)
-                                elif header == 'REB' or header == 'TRB':
-                                    team_stats.rebounds = float(value)
-                                elif header == 'AST':
-                                    team_stats.assists = float(value)
-                                elif header == 'STL':
-                                    team_stats.steals = float(value)
-                                elif header == 'BLK':
-                                    team_stats.blocks = float(value)
-                                elif header == 'TOV':
-                                    team_stats.turnovers = float(value)
-                                elif header == 'FG%':
-                                    team_stats.fg_pct = float(value)
-                                elif header == '3P%':
-                                    team_stats.three_pct = float(value)
-                                elif header == 'FT%':
-                                    team_stats.ft_pct = float(value)
-                            except (ValueError, AttributeError):
-                                continue
-
-                        break  # Only process first data row
-
-                    except Exception as e:
-                        logger.error(f"Error parsing row: {e}")
-                        continue
-
             browser.close()
 
-            logger.info(f"Successfully scraped: {team_stats.games_played} GP, {team_stats.points} PPG")
+            team_stats = parse_team_stats_html(html, team_name, season)
+            if team_stats:
+                logger.info(f"Successfully scraped: {team_stats.games_played} GP, {team_stats.points} PPG")
             return team_stats
 
     except Exception as e:
@@ -296,6 +324,7 @@ def scrape_player_stats(team_name: str, season: str = "2025-26", headless: bool
                 viewport={'width': 1920, 'height': 1080},
                 user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
             )
+            install_request_blocking(context, site='statmuse')
             page = context.new_page()
 
             # Robust page load
@@ -444,6 +473,7 @@ def scrape_team_splits(team_name: str, season: str = "2025-26", headless: bool =
                 viewport={'width': 1920, 'height': 1080},
                 user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
             )
+            install_request_blocking(context, site='statmuse')
             page = context.new_page()
 
             # Robust page load
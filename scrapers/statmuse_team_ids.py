@@ -4,6 +4,8 @@ StatMuse Team ID Mapping
 Correct team IDs and URL formats extracted from actual StatMuse URLs.
 """
 
+from config.settings import Config
+
 # Team name to StatMuse slug and ID mapping
 TEAM_STATMUSE_MAPPING = {
     # Eastern Conference
@@ -86,7 +88,7 @@ def get_statmuse_url(team_name: str, season_year: str = "2026", endpoint: str =
     else:
         team_part = f"{slug}-{team_id}"
 
-    base_url = f"https://www.statmuse.com/nba/team/{team_part}"
+    base_url = f"{Config.STATMUSE_BASE_URL}/nba/team/{team_part}"
 
     if endpoint:
         # Insert endpoint before season year
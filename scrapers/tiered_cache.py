@@ -0,0 +1,360 @@
+"""
+Tiered Cache
+============
+One cache API for player (and team) data in front of every source:
+
+    memory  - DataCache's hot LRU of live objects, one copy per key per
+              process (SQLite reads and writes fill it under the same key)
+    sqlite  - DataCache (game logs: row-per-game table; everything else:
+              player_data_cache, keyed by entity ID)
+    origin  - the caller's fetch function, run once per key at a time
+              (concurrent callers are coalesced via single_flight)
+
+Keys are built with cache_utils.normalize_cache_key_by_id from the
+entity's numeric ID, the season year and the data type, e.g.
+"player_2544_2025_game_log", so "LeBron James" and "Lebron James" share
+one entry. Names that do not resolve to an ID fall back to a name key
+(counted as 'unresolved' in the stats).
+
+Usage:
+    from scrapers.tiered_cache import get_tiered_cache
+
+    game_log = get_tiered_cache().get(
+        'player', player_name, season, 'game_log',
+        origin=lambda: fetch_game_log(player_name, season)
+    )
+"""
+
+import logging
+import threading
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional
+
+from scrapers.data_cache import CacheEntry, DataCache, HotCache, get_cache
+from scrapers.data_models import GameLogEntry
+from scrapers.single_flight import single_flight
+
+logger = logging.getLogger(__name__)
+
+# Rough in-memory cost of one GameLogEntry (for the memory bound)
+GAME_LOG_ENTRY_BYTES = 600
+
+
+class TieredCache:
+    """
+    Memory → SQLite → origin lookups keyed by (entity ID, season, data type).
+
+    Game logs are persisted by their origin (player_data_fetcher merges
+    new games into the row table); every other data type is persisted
+    here when the origin returns a value.
+    """
+
+    def __init__(self, data_cache: Optional[DataCache] = None):
+        """
+        Args:
+            data_cache: SQLite tier (default: the global DataCache); its hot
+                        cache is the memory tier
+        """
+        self.data_cache = data_cache or get_cache()
+        self.memory: HotCache = self.data_cache.hot_cache
+        self._local = threading.local()
+        self._stats_lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    # -----------------------------------------------------------------
+    # Keys
+    # -----------------------------------------------------------------
+    def resolve_id(self, entity_type: str, name: str) -> Optional[int]:
+        """Numeric ID for a player/team name (None = unresolved)"""
+        if entity_type == 'player':
+            return self.data_cache.resolve_player_id(name)
+        try:
+            from scrapers.cache_utils import get_entity_id
+            return get_entity_id(entity_type, name)
+        except Exception as e:
+            logger.debug(f"[TIERED] ID lookup failed for {entity_type} '{name}': {e}")
+            return None
+
+    def key_for(self, entity_type: str, name: str, season: str, data_type: str) -> str:
+        """Cache key (ID-based when the name resolves)"""
+        from scrapers.cache_utils import normalize_cache_key_by_id, normalize_season_for_cache
+
+        if entity_type == 'player':
+            # Same key DataCache.set_game_log invalidates
+            return self.data_cache.player_cache_key(name, season, data_type)
+        season_year = normalize_season_for_cache(season)
+        entity_id = self.resolve_id(entity_type, name)
+        if entity_id is not None:
+            return normalize_cache_key_by_id(entity_type, entity_id, season_year, data_type)
+        return f"{entity_type}_name:{name.lower().strip()}_{season_year}_{data_type}"
+
+    # -----------------------------------------------------------------
+    # Lookups
+    # -----------------------------------------------------------------
+    def get(
+        self,
+        entity_type: str,
+        name: str,
+        season: str,
+        data_type: str,
+        origin: Optional[Callable[[], Any]] = None,
+        max_age_hours: Optional[float] = None,
+        source: str = 'origin',
+        confidence_score: float = 0.0,
+        origin_updated: Optional[Callable[[], Optional[datetime]]] = None
+    ) -> Optional[Any]:
+        """
+        Look up a value through memory, SQLite, then origin.
+
+        Args:
+            entity_type: 'player' or 'team'
+            name: Entity name
+            season: Season string (e.g., "2024-25")
+            data_type: 'game_log', 'full_profile', ...
+            origin: Fetch function for a miss (None = cache tiers only)
+            max_age_hours: Max age for this lookup (default: DataCache TTL for the type)
+            source: Source recorded when an origin value is persisted
+            confidence_score: Confidence recorded when an origin value is persisted
+            origin_updated: Called on the origin's thread after it ran; returns when
+                            the value was last fetched if the origin served it from
+                            storage (stale/expired fallback), None if it is new. Such
+                            values keep that age in memory (or skip it if already
+                            expired) and are not persisted again.
+
+        Returns:
+            The cached or fetched value, or None (empty origin results are not cached)
+        """
+        key = self.key_for(entity_type, name, season, data_type)
+        self._count(data_type, 'lookups')
+        if key.startswith(f"{entity_type}_name:"):
+            self._count(data_type, 'unresolved')
+
+        value = self._memory_get(key, season, data_type, max_age_hours)
+        if value is not None:
+            return self._hit('memory', data_type, value)
+
+        # Promoted into memory by the read, with its original timestamp
+        value = self._sqlite_get(name, season, data_type, key, max_age_hours)
+        if value is not None:
+            return self._hit('sqlite', data_type, value)
+
+        if origin is None:
+            self._local.tier = 'miss'
+            self._count(data_type, 'misses')
+            return None
+
+        ran_here = []
+
+        def run_origin():
+            ran_here.append(True)
+            return origin()
+
+        value = single_flight.do((key, season, data_type), run_origin)
+        self._local.tier = 'origin' if ran_here else 'coalesced'
+        self._count(data_type, 'origin' if ran_here else 'coalesced')
+        if not value:
+            self._count(data_type, 'misses')
+            return value
+
+        if ran_here:
+            last_updated = origin_updated() if origin_updated else None
+            if last_updated is None:
+                self.put(
+                    entity_type, name, season, data_type, value,
+                    persist=data_type != 'game_log', source=source, confidence_score=confidence_score
+                )
+            elif not self._expired(data_type, last_updated, max_age_hours):
+                self._memory_put(key, season, data_type, value, last_updated)
+        return value
+
+    def put(
+        self,
+        entity_type: str,
+        name: str,
+        season: str,
+        data_type: str,
+        value: Any,
+        persist: bool = False,
+        source: str = 'origin',
+        confidence_score: float = 0.0
+    ):
+        """
+        Store a value in the memory tier (and SQLite if persist=True).
+
+        Game logs should be persisted through DataCache.set_game_log so new
+        games are merged into the row table; use persist=False for them.
+        """
+        key = self.key_for(entity_type, name, season, data_type)
+        # A SQLite write also fills the memory tier (same key)
+        if not (persist and self._sqlite_put(name, season, data_type, key, value, source, confidence_score)):
+            self._memory_put(key, season, data_type, value)
+
+    def warm_game_logs(self, player_names: List[str], season: str) -> int:
+        """
+        Load cached game logs for many players into memory in one SQLite read.
+
+        Returns:
+            Number of players now served from memory
+        """
+        warmed = 0
+        for name, games in self.data_cache.get_game_logs(player_names, season, allow_stale=False).items():
+            try:
+                entries = [GameLogEntry(**game) for game in games]
+            except TypeError as e:
+                logger.debug(f"[TIERED] Skipping warm-up for {name}: {e}")
+                continue
+            if entries:
+                key = self.key_for('player', name, season, 'game_log')
+                self._memory_put(key, season, 'game_log', entries, self.data_cache.get_game_log_updated(name, season))
+                warmed += 1
+        return warmed
+
+    def invalidate(self, entity_type: str, name: str, season: str, data_type: str):
+        """Drop a key from the memory tier (SQLite keeps its own TTLs)"""
+        key = self.key_for(entity_type, name, season, data_type)
+        self.memory.pop(self._memory_key(key, season, data_type))
+
+    def last_tier(self) -> str:
+        """Tier that served this thread's last get(): memory, sqlite, origin, coalesced or miss"""
+        return getattr(self._local, 'tier', 'miss')
+
+    # -----------------------------------------------------------------
+    # Tiers
+    # -----------------------------------------------------------------
+    def _memory_key(self, key: str, season: str, data_type: str) -> str:
+        """Hot cache key: the one DataCache files the SQLite entry under"""
+        return self.data_cache._get_cache_key(key, 'N/A', season, data_type)
+
+    def _memory_get(self, key: str, season: str, data_type: str, max_age_hours: Optional[float]) -> Optional[Any]:
+        memory_key = self._memory_key(key, season, data_type)
+        entry = self.memory.get(memory_key, data_type)
+        if entry is None:
+            return None
+        if self._expired(data_type, entry.last_updated, max_age_hours):
+            self.memory.pop(memory_key)
+            return None
+        return entry.data_json
+
+    def _expired(self, data_type: str, last_updated: datetime, max_age_hours: Optional[float]) -> bool:
+        """Older than max_age_hours (default: DataCache TTL for the type)"""
+        if max_age_hours is None:
+            max_age_hours = self.data_cache._get_ttl_hours(data_type)
+        return max_age_hours is not None and datetime.now() - last_updated >= timedelta(hours=max_age_hours)
+
+    def _memory_put(
+        self, key: str, season: str, data_type: str, value: Any, last_updated: Optional[datetime] = None
+    ):
+        entry = CacheEntry(
+            player_name=key, team='N/A', date=season, data_type=data_type,
+            source='memory', confidence_score=0.0, data_json=value,
+            last_updated=last_updated or datetime.now()
+        )
+        self.memory.put(self._memory_key(key, season, data_type), entry, _estimate_size(value))
+
+    def _sqlite_get(
+        self, name: str, season: str, data_type: str, key: str, max_age_hours: Optional[float]
+    ) -> Optional[Any]:
+        """Fresh SQLite value (never stale-served), promoted into memory with its original age"""
+        try:
+            if data_type == 'game_log':
+                entries = self.data_cache.get_game_log_entries(name, season, allow_stale=False)
+                if entries:
+                    self._memory_put(key, season, data_type, entries, self.data_cache.get_game_log_updated(name, season))
+                return entries
+            # The memory tier was just checked; a valid hit is put there by DataCache
+            cached = self.data_cache.get(key, 'N/A', season, data_type, allow_stale=False, check_hot=False)
+            if not cached:
+                return None
+            if max_age_hours is not None:
+                age = datetime.now() - datetime.fromisoformat(cached['last_updated'])
+                if age >= timedelta(hours=max_age_hours):
+                    return None
+            return cached['data']
+        except Exception as e:
+            logger.debug(f"[TIERED] SQLite read failed for {key}: {e}")
+            return None
+
+    def _sqlite_put(
+        self, name: str, season: str, data_type: str, key: str,
+        value: Any, source: str, confidence_score: float
+    ) -> bool:
+        """Persist a value (True if that also filled the memory tier, as DataCache.set does)"""
+        try:
+            if data_type == 'game_log':
+                self.data_cache.set_game_log(name, season, value, source, confidence_score)
+                return False
+            self.data_cache.set(key, 'N/A', season, data_type, value, source, confidence_score)
+            return True
+        except Exception as e:
+            logger.warning(f"[TIERED] SQLite write failed for {key}: {e}")
+            return False
+
+    # -----------------------------------------------------------------
+    # Stats
+    # -----------------------------------------------------------------
+    def _hit(self, tier: str, data_type: str, value: Any) -> Any:
+        self._local.tier = tier
+        self._count(data_type, tier)
+        return value
+
+    def _count(self, data_type: str, counter: str):
+        with self._stats_lock:
+            entry = self._stats.setdefault(data_type, {
+                'lookups': 0, 'memory': 0, 'sqlite': 0, 'origin': 0,
+                'coalesced': 0, 'misses': 0, 'unresolved': 0,
+            })
+            entry[counter] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Per-tier hit counts and rates (overall and by data type).
+
+        memory_hit_rate is over all lookups; sqlite_hit_rate over lookups
+        that reached SQLite; origin counts fetches actually run.
+        """
+        with self._stats_lock:
+            by_type = {data_type: dict(counters) for data_type, counters in self._stats.items()}
+
+        totals = {counter: sum(c[counter] for c in by_type.values()) for counter in (
+            'lookups', 'memory', 'sqlite', 'origin', 'coalesced', 'misses', 'unresolved'
+        )}
+        for counters in list(by_type.values()) + [totals]:
+            lookups = counters['lookups']
+            reached_sqlite = lookups - counters['memory']
+            counters['memory_hit_rate'] = counters['memory'] / lookups if lookups else 0.0
+            counters['sqlite_hit_rate'] = counters['sqlite'] / reached_sqlite if reached_sqlite else 0.0
+        totals['by_type'] = by_type
+        totals['memory_tier'] = self.memory.get_stats()
+        return totals
+
+
+def _estimate_size(value: Any) -> int:
+    if isinstance(value, list):
+        return len(value) * GAME_LOG_ENTRY_BYTES
+    if isinstance(value, dict):
+        return len(str(value))
+    return GAME_LOG_ENTRY_BYTES
+
+
+# Global tiered cache instance
+_tiered_cache: Optional[TieredCache] = None
+_tiered_cache_lock = threading.Lock()
+
+
+def get_tiered_cache() -> TieredCache:
+    """Get or create the process-wide tiered cache"""
+    global _tiered_cache
+    with _tiered_cache_lock:
+        if _tiered_cache is None:
+            _tiered_cache = TieredCache()
+        return _tiered_cache
+
+
+def format_tiered_summary() -> str:
+    """One-line per-tier hit summary"""
+    stats = get_tiered_cache().get_stats()
+    return (
+        f"{stats['lookups']} lookup(s): memory {stats['memory']} ({stats['memory_hit_rate']:.0%}), "
+        f"sqlite {stats['sqlite']} ({stats['sqlite_hit_rate']:.0%}), "
+        f"origin {stats['origin']} (+{stats['coalesced']} coalesced), {stats['misses']} miss(es)"
+    )
@@ -41,7 +41,7 @@ from datetime import datetime
 from typing import List, Dict, Optional, Tuple
 import time
 
-from scrapers.player_data_fetcher import get_player_game_log
+from scrapers.player_data_fetcher import get_player_game_log, is_last_fetch_stale
 from scrapers.data_models import GameLogEntry
 from scrapers.player_projection_model import PlayerProjectionModel
 from scrapers.fade_detection import detect_fades
@@ -57,6 +57,12 @@ logger = get_logger(__name__)
 
 # Imports for Sportsbet scraping
 from scrapers.sportsbet_final_enhanced import scrape_nba_overview, scrape_match_complete
+from scrapers.browser_pool import BrowserPool, map_with_pools, combine_stats, format_pool_stats
+from scrapers.page_waits import format_wait_summary
+from scrapers.page_documents import get_document_stats
+from scrapers.request_blocking import format_blocking_summary
+from scrapers.single_flight import format_single_flight_summary
+from scrapers.tiered_cache import format_tiered_summary, get_tiered_cache
 from scrapers.insights_to_value_analysis import analyze_all_insights
 
 # Use HYBRID PIPELINE (StatsMuse primary + DataballR supplementary)
@@ -96,10 +102,6 @@ try:
 except ImportError:
     pass  # Cache optional
 
-# Session-level game log cache (numeric ID-based keys)
-# Format: "player_{player_id}_{season_year}" -> (List[GameLogEntry], datetime)
-_session_game_log_cache: Dict[str, Tuple[List, datetime]] = {}
-
 
 def get_player_game_log(
     player_name: str,
@@ -140,6 +142,129 @@ def get_player_game_log(
     return game_log_entries if game_log_entries else []
 
 
+def get_player_context(
+    model: PlayerProjectionModel,
+    player_name: str,
+    game_log: List,
+    contexts: Dict,
+    player_team: Optional[str] = None
+):
+    """
+    Resolve a player's projection context (usage, teammates) once per run.
+
+    All I/O of a projection happens here; project_stat(context=...) is then
+    pure computation for every stat and line of the player.
+
+    Args:
+        model: Projection model the context is resolved for
+        player_name: Player's full name
+        game_log: Player's game log (most recent first)
+        contexts: Per-run cache of resolved contexts (player name -> context)
+        player_team: Player's team name, if known
+
+    Returns:
+        PlayerContext, or None if resolution failed (projection runs without
+        the role modifier)
+    """
+    if player_name not in contexts:
+        try:
+            contexts[player_name] = model.resolve_context(player_name, game_log, player_team=player_team)
+        except Exception as e:
+            logger.debug(f"  [CONTEXT] Could not resolve context for {player_name}: {e}")
+            contexts[player_name] = None
+    return contexts[player_name]
+
+
+def project_props(
+    model: PlayerProjectionModel,
+    props: List[Dict],
+    contexts: Dict,
+    team_stats=None,
+    headless: bool = True
+) -> Dict[Tuple[str, str, float], Optional[object]]:
+    """
+    Project a batch of props in one vectorized pass (project_many).
+
+    Game logs (memory hits after prefetch_slate_players) and contexts are
+    loaded once per player, then every prop is projected together instead
+    of one project_stat call each.
+
+    Args:
+        model: Projection model
+        props: Dicts with 'player', 'stat' and 'line'
+        contexts: Per-run cache of resolved contexts (player name -> context)
+        team_stats: MatchStats for matchup adjustments (shared by all props)
+        headless: Passed to get_player_game_log
+
+    Returns:
+        Dict of (player, stat, line) -> StatProjection (None = insufficient
+        data). Props left out (fewer than 5 games, or the batch failed) go
+        through the caller's project_stat path.
+    """
+    game_logs: Dict[str, List] = {}
+    batch = []
+    seen = set()
+    for prop in props:
+        player_name = prop['player']
+        key = (player_name, prop['stat'], prop['line'])
+        if key in seen:
+            continue
+        seen.add(key)
+
+        if player_name not in game_logs:
+            try:
+                game_log = get_player_game_log(
+                    player_name=player_name, last_n_games=20, headless=headless, retries=3, use_cache=True
+                ) or []
+            except Exception as e:
+                logger.debug(f"  Could not load game log for {player_name}: {e}")
+                game_log = []
+            if game_log and isinstance(game_log[0], dict):
+                game_log = [GameLogEntry(**g) if isinstance(g, dict) else g for g in game_log]
+            game_logs[player_name] = game_log
+            if len(game_log) >= 5:
+                get_player_context(model, player_name, game_log, contexts)
+
+        if len(game_logs[player_name]) >= 5:
+            batch.append({'player': player_name, 'stat': prop['stat'], 'line': prop['line'], 'team_stats': team_stats})
+
+    if not batch:
+        return {}
+    try:
+        projections = model.project_many(batch, game_logs, contexts, min_games=5)
+    except Exception as e:
+        logger.warning(f"  [PROJECTION ERROR] Batch projection failed, projecting props one at a time: {e}")
+        logger.debug(traceback.format_exc())
+        return {}
+    return {(prop['player'], prop['stat'], prop['line']): projection for prop, projection in zip(batch, projections)}
+
+
+def match_stats_for_projection(match_stats):
+    """
+    MatchStats for the projection model's matchup adjustments (scraped match
+    stats may arrive as dicts); None if unavailable
+    """
+    if not match_stats or not isinstance(match_stats, dict):
+        return match_stats or None
+    try:
+        from scrapers.sportsbet_final_enhanced import MatchStats, TeamStats
+        away_stats_dict = match_stats.get('away_team_stats', {})
+        home_stats_dict = match_stats.get('home_team_stats', {})
+        if not (away_stats_dict and home_stats_dict):
+            return None
+        # Convert dicts to TeamStats objects
+        away_stats = TeamStats(**away_stats_dict) if isinstance(away_stats_dict, dict) else away_stats_dict
+        home_stats = TeamStats(**home_stats_dict) if isinstance(home_stats_dict, dict) else home_stats_dict
+        return MatchStats(
+            away_team_stats=away_stats,
+            home_team_stats=home_stats,
+            data_range=match_stats.get('data_range', '')
+        )
+    except Exception as e:
+        logger.debug(f"  Could not convert team_stats dict to MatchStats: {e}")
+        return None
+
+
 def extract_player_props_from_markets(all_markets: List) -> Tuple[List[Dict], List[str]]:
     """
     Extract player prop markets from all Sportsbet markets.
@@ -258,108 +383,294 @@ def extract_player_props_from_markets(all_markets: List) -> Tuple[List[Dict], Li
     return props, player_names_seen
 
 
-def scrape_games(max_games: int, headless: bool = True) -> List[Dict]:
+def collect_slate_players(games_data: List[Dict]) -> List[str]:
     """
-    Scrape NBA games from Sportsbet with all data needed for analysis.
+    Unique player names across the slate's props, prop insights and market players.
 
     Returns:
-        List of game dicts with: game_info, team_markets, team_insights, match_stats, player_props
+        Player names in first-seen order
     """
-    logger.debug("Scraping NBA games from Sportsbet...")
+    players: Dict[str, None] = {}
+
+    def add(name):
+        name = (name or '').strip()
+        if name and name != 'Unknown':
+            players.setdefault(name, None)
+
+    for game_data in games_data:
+        for prop in game_data.get('player_props', []) or []:
+            add(prop.get('player'))
+        for insight in game_data.get('team_insights', []) or []:
+            insight_dict = {
+                'fact': _safe_insight_get(insight, 'fact', ''),
+                'market': _safe_insight_get(insight, 'market', ''),
+                'result': _safe_insight_get(insight, 'result', '')
+            }
+            if _is_player_prop_insight(insight_dict):
+                prop_info = _extract_prop_info_from_insight(insight_dict)
+                if prop_info:
+                    add(prop_info.get('player'))
+        for name in game_data.get('market_players', []) or []:
+            add(name)
+
+    return list(players)
+
+
+def prefetch_slate_players(games_data: List[Dict], max_concurrent: Optional[int] = None) -> Dict:
+    """
+    Fetch game logs for every player on the slate before analysis.
+
+    Players that need a fetch get their StatsMuse logs in one batch on a
+    single browser (fetch_game_logs_batch); the rest of the slate (cache
+    hits, and DataballR for players StatsMuse could not serve) goes through
+    get_player_game_log in parallel. Logs land in the tiered cache's memory
+    tier, which analyze_team_bets, analyze_player_props and rank_all_bets
+    read through get_player_game_log.
+
+    Args:
+        games_data: Output of scrape_games()
+        max_concurrent: Players fetched at once (default: Config.MAX_CONCURRENT_REQUESTS)
+
+    Returns:
+        Dict with 'players', 'fetched', 'missing', 'stale' (players whose log
+        is past its TTL), 'elapsed' and per-source 'sources' -> {source: {'count', 'seconds'}}
+    """
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+    from config.settings import Config
+    from scrapers.player_data_fetcher import (
+        get_player_game_log as _get_log_statsmuse_first,
+        get_last_fetch_source,
+        fetch_game_logs_batch
+    )
+
+    if max_concurrent is None:
+        max_concurrent = Config.MAX_CONCURRENT_REQUESTS
+    max_concurrent = max(1, max_concurrent)
+
+    players = collect_slate_players(games_data)
+    stats = {'players': len(players), 'fetched': 0, 'missing': [], 'stale': [], 'elapsed': 0.0, 'sources': {}}
+    if not players:
+        return stats
+
+    def fetch_one(player_name: str, skip_sources: Tuple[str, ...] = ()) -> Tuple[str, List, str, float]:
+        start = time.perf_counter()
+        try:
+            game_log = _get_log_statsmuse_first(
+                player_name=player_name, season="2024-25", retries=3, use_cache=True, skip_sources=skip_sources
+            )
+            source = get_last_fetch_source()
+        except Exception as e:
+            logger.debug(f"  Prefetch failed for {player_name}: {e}")
+            game_log, source = [], 'none'
+        return player_name, game_log or [], source, time.perf_counter() - start
+
+    # Load the slate's cached logs into the memory tier in one SQLite transaction
     try:
-        games = scrape_nba_overview(headless=headless)
+        warmed = get_tiered_cache().warm_game_logs(players, "2024-25")
+        logger.debug(f"  {warmed}/{len(players)} player(s) already in the persistent cache")
     except Exception as e:
-        logger.error(f"Failed to scrape NBA overview: {e}")
-        import traceback
-        logger.debug(traceback.format_exc())
-        return []
+        logger.debug(f"  Bulk cache read failed: {e}")
 
-    if not games:
-        logger.error("Failed to get games from Sportsbet")
-        return []
+    logger.info(f"Prefetching game logs for {len(players)} player(s) ({min(max_concurrent, len(players))} concurrent)")
+    start = time.perf_counter()
+
+    # StatsMuse misses in one batch: one browser for the slate, not one per player
+    batch_start = time.perf_counter()
+    try:
+        batched = fetch_game_logs_batch(players, "2024-25", max_concurrent=max_concurrent)
+    except Exception as e:
+        logger.debug(f"  Batch prefetch failed: {e}")
+        batched = {}
+    fetched = {name for name, game_log in batched.items() if game_log}
+    if fetched:
+        stats['sources']['statsmuse'] = {'count': len(fetched), 'seconds': time.perf_counter() - batch_start}
+        stats['fetched'] += len(fetched)
+
+    # Everyone else: cache hits, and DataballR for players the batch could not serve
+    remaining = [name for name in players if name not in fetched]
+    with ThreadPoolExecutor(max_workers=max(1, min(max_concurrent, len(remaining)))) as executor:
+        futures = [
+            executor.submit(fetch_one, name, ('statsmuse',) if name in batched else ())
+            for name in remaining
+        ]
+        for future in as_completed(futures):
+            player_name, game_log, source, seconds = future.result()
+            entry = stats['sources'].setdefault(source, {'count': 0, 'seconds': 0.0})
+            entry['count'] += 1
+            entry['seconds'] += seconds
+            if game_log:
+                stats['fetched'] += 1
+                if source == 'stale':
+                    stats['stale'].append(player_name)
+            else:
+                stats['missing'].append(player_name)
+    stats['elapsed'] = time.perf_counter() - start
 
-    # Limit to actual games available
-    actual_max = min(max_games, len(games))
-    logger.info(f"Found {len(games)} games, analyzing {actual_max}")
+    by_source = ", ".join(
+        f"{source}: {entry['count']} in {entry['seconds']:.1f}s"
+        for source, entry in sorted(stats['sources'].items(), key=lambda item: -item[1]['count'])
+    )
+    logger.info(
+        f"Prefetched {stats['fetched']}/{stats['players']} player(s) in {stats['elapsed']:.1f}s ({by_source})"
+    )
+    if stats['stale']:
+        logger.warning(
+            f"{len(stats['stale'])} player(s) analysed on stale game logs (refreshing): {', '.join(sorted(stats['stale']))}"
+        )
+    logger.info(f"Request coalescing: {format_single_flight_summary()}")
+    logger.info(f"Tiered cache: {format_tiered_summary()}")
+    return stats
 
-    results = []
-    for i, game in enumerate(games[:actual_max], 1):
-        logger.debug(f"Game {i}/{min(max_games, len(games))}: {game['away_team']} @ {game['home_team']}")
 
+def scrape_games(max_games: int, headless: bool = True, max_concurrent: Optional[int] = None) -> List[Dict]:
+    """
+    Scrape NBA games from Sportsbet with all data needed for analysis.
+
+    Match pages are scraped in parallel on up to max_concurrent browser
+    pools (one Chromium each, pages recycled between matches). The pool
+    that scrapes the overview is reused as one of the workers.
+
+    Args:
+        max_games: Maximum number of games to scrape
+        headless: Run browsers in headless mode
+        max_concurrent: Match pages in flight at once
+                        (default: Config.MAX_CONCURRENT_REQUESTS, 1 = sequential)
+
+    Returns:
+        List of game dicts with: game_info, team_markets, team_insights, match_stats, player_props
+        (in slate order, regardless of which worker finished first)
+    """
+    if max_concurrent is None:
+        from config.settings import Config
+        max_concurrent = Config.MAX_CONCURRENT_REQUESTS
+    max_concurrent = max(1, max_concurrent)
+
+    with BrowserPool(headless=headless) as pool:
+        logger.debug("Scraping NBA games from Sportsbet...")
         try:
-            # Get complete match data
-            match_data = scrape_match_complete(game['url'], headless=headless)
+            games = scrape_nba_overview(pool=pool)
+        except Exception as e:
+            logger.error(f"Failed to scrape NBA overview: {e}")
+            import traceback
+            logger.debug(traceback.format_exc())
+            return []
 
-            if not match_data:
-                logger.warning(f"  Failed to scrape match data")
-                continue
+        if not games:
+            logger.error("Failed to get games from Sportsbet")
+            return []
 
-            # Safely extract attributes with defaults
-            all_markets = getattr(match_data, 'all_markets', []) or []
-            match_insights = getattr(match_data, 'match_insights', []) or []
-            match_stats = getattr(match_data, 'match_stats', None)
+        # Limit to actual games available
+        actual_max = min(max_games, len(games))
+        workers = min(max_concurrent, actual_max)
+        logger.info(f"Found {len(games)} games, analyzing {actual_max} ({workers} concurrent)")
 
-            # Extract player props from all markets
-            player_props, market_players = extract_player_props_from_markets(all_markets)
+        slate = list(enumerate(games[:actual_max], 1))
 
-            # Count player props from insights (they're embedded in insights, not separate markets)
-            player_props_from_insights = sum(1 for insight in match_insights if _is_player_prop_insight({
-                'fact': _safe_insight_get(insight, 'fact', ''),
-                'market': _safe_insight_get(insight, 'market', ''),
-                'result': _safe_insight_get(insight, 'result', '')
-            }))
-            
-            total_player_props = len(player_props) + player_props_from_insights
+        def scrape_one(item, worker_pool: BrowserPool) -> Optional[Dict]:
+            index, game = item
+            logger.debug(f"Game {index}/{actual_max}: {game['away_team']} @ {game['home_team']}")
+            try:
+                return _scrape_single_game(game, worker_pool)
+            except Exception as e:
+                logger.error(f"  Error scraping game: {e}")
+                return None
+
+        # Throttle between games on the same worker
+        game_results, worker_stats = map_with_pools(
+            scrape_one,
+            slate,
+            max_workers=max_concurrent,
+            headless=headless,
+            pool=pool,
+            throttle_seconds=2.0
+        )
+        pool_stats = combine_stats([pool.get_stats(), worker_stats])
+
+    logger.info(f"Browser pools: {format_pool_stats(pool_stats)}")
+    logger.info(f"Page waits: {format_wait_summary()}")
+    logger.info(f"Request blocking: {format_blocking_summary()}")
+    doc_stats = get_document_stats()
+    logger.info(
+        f"Page documents: {doc_stats['serializations']} serialization(s), "
+        f"{doc_stats['parses']} parse(s), "
+        f"{doc_stats['html_hits'] + doc_stats['soup_hits']} reuse(s) ({doc_stats['parser']})"
+    )
 
-            logger.debug(f"  Retrieved {len(all_markets)} markets, {len(match_insights)} insights, {total_player_props} player props")
+    return [result for result in game_results if result]
 
-            # Convert match_stats to dict if it's an object
-            match_stats_dict = None
-            if match_stats:
-                if hasattr(match_stats, 'to_dict'):
-                    match_stats_dict = match_stats.to_dict()
-                elif isinstance(match_stats, dict):
-                    match_stats_dict = match_stats
-                else:
-                    # Try to extract as dict manually
-                    try:
-                        match_stats_dict = {
-                            'away_team_stats': getattr(match_stats, 'away_team_stats', None),
-                            'home_team_stats': getattr(match_stats, 'home_team_stats', None),
-                            'data_range': getattr(match_stats, 'data_range', '')
-                        }
-                        # Convert team stats to dict if they're objects
-                        if match_stats_dict['away_team_stats'] and hasattr(match_stats_dict['away_team_stats'], 'to_dict'):
-                            match_stats_dict['away_team_stats'] = match_stats_dict['away_team_stats'].to_dict()
-                        if match_stats_dict['home_team_stats'] and hasattr(match_stats_dict['home_team_stats'], 'to_dict'):
-                            match_stats_dict['home_team_stats'] = match_stats_dict['home_team_stats'].to_dict()
-                    except Exception as e:
-                        logger.debug(f"  Could not convert match_stats to dict: {e}")
-                        match_stats_dict = None
-            
-            results.append({
-                'game_info': game or {},
-                'team_markets': all_markets or [],
-                'team_insights': match_insights or [],
-                'match_stats': match_stats_dict,  # Store as dict for easier access
-                'player_props': player_props or [],
-                'market_players': market_players or []  # Players seen in markets
-            })
-            
-            if match_stats_dict:
-                logger.debug(f"  Match stats available: away={match_stats_dict.get('away_team_stats', {}).get('team_name', 'Unknown')}, home={match_stats_dict.get('home_team_stats', {}).get('team_name', 'Unknown')}")
-            else:
-                logger.debug(f"  No match stats available for {game.get('away_team', 'Unknown')} @ {game.get('home_team', 'Unknown')}")
 
-            # Throttle between games
-            if i < actual_max:
-                time.sleep(2)
+def _scrape_single_game(game: Dict, pool: BrowserPool) -> Optional[Dict]:
+    """
+    Scrape one match page and shape it into the pipeline's game dict.
 
-        except Exception as e:
-            logger.error(f"  Error scraping game: {e}")
-            continue
+    Returns:
+        Game dict, or None if the match could not be scraped
+    """
+    # Get complete match data
+    match_data = scrape_match_complete(game['url'], pool=pool)
+
+    if not match_data:
+        logger.warning(f"  Failed to scrape match data")
+        return None
 
-    return results
+    # Safely extract attributes with defaults
+    all_markets = getattr(match_data, 'all_markets', []) or []
+    match_insights = getattr(match_data, 'match_insights', []) or []
+    match_stats = getattr(match_data, 'match_stats', None)
+
+    # Extract player props from all markets
+    player_props, market_players = extract_player_props_from_markets(all_markets)
+
+    # Count player props from insights (they're embedded in insights, not separate markets)
+    player_props_from_insights = sum(1 for insight in match_insights if _is_player_prop_insight({
+        'fact': _safe_insight_get(insight, 'fact', ''),
+        'market': _safe_insight_get(insight, 'market', ''),
+        'result': _safe_insight_get(insight, 'result', '')
+    }))
+    
+    total_player_props = len(player_props) + player_props_from_insights
+
+    logger.debug(f"  Retrieved {len(all_markets)} markets, {len(match_insights)} insights, {total_player_props} player props")
+
+    # Convert match_stats to dict if it's an object
+    match_stats_dict = None
+    if match_stats:
+        if hasattr(match_stats, 'to_dict'):
+            match_stats_dict = match_stats.to_dict()
+        elif isinstance(match_stats, dict):
+            match_stats_dict = match_stats
+        else:
+            # Try to extract as dict manually
+            try:
+                match_stats_dict = {
+                    'away_team_stats': getattr(match_stats, 'away_team_stats', None),
+                    'home_team_stats': getattr(match_stats, 'home_team_stats', None),
+                    'data_range': getattr(match_stats, 'data_range', '')
+                }
+                # Convert team stats to dict if they're objects
+                if match_stats_dict['away_team_stats'] and hasattr(match_stats_dict['away_team_stats'], 'to_dict'):
+                    match_stats_dict['away_team_stats'] = match_stats_dict['away_team_stats'].to_dict()
+                if match_stats_dict['home_team_stats'] and hasattr(match_stats_dict['home_team_stats'], 'to_dict'):
+                    match_stats_dict['home_team_stats'] = match_stats_dict['home_team_stats'].to_dict()
+            except Exception as e:
+                logger.debug(f"  Could not convert match_stats to dict: {e}")
+                match_stats_dict = None
+    
+    game_result = {
+        'game_info': game or {},
+        'team_markets': all_markets or [],
+        'team_insights': match_insights or [],
+        'match_stats': match_stats_dict,  # Store as dict for easier access
+        'player_props': player_props or [],
+        'market_players': market_players or []  # Players seen in markets
+    }
+    
+    if match_stats_dict:
+        logger.debug(f"  Match stats available: away={match_stats_dict.get('away_team_stats', {}).get('team_name', 'Unknown')}, home={match_stats_dict.get('home_team_stats', {}).get('team_name', 'Unknown')}")
+    else:
+        logger.debug(f"  No match stats available for {game.get('away_team', 'Unknown')} @ {game.get('home_team', 'Unknown')}")
+
+    return game_result
 
 
 def _safe_insight_get(insight, key: str, default=None):
@@ -951,6 +1262,17 @@ def analyze_team_bets(game_data: Dict, headless: bool = True) -> List[Dict]:
     analyzed_props = []
     if player_prop_insights:
         projection_model = PlayerProjectionModel()
+        player_contexts = {}
+        # Matchup adjustments use the game's match stats (same for every prop)
+        team_stats = match_stats_for_projection(game_data.get('match_stats'))
+        # Every prop insight of the game in one vectorized pass
+        batch_projections = project_props(
+            projection_model,
+            [info for info in map(_extract_prop_info_from_insight, player_prop_insights) if info],
+            player_contexts,
+            team_stats=team_stats,
+            headless=headless
+        )
         
         for insight in player_prop_insights:
             prop_info = _extract_prop_info_from_insight(insight)
@@ -998,50 +1320,31 @@ def analyze_team_bets(game_data: Dict, headless: bool = True) -> List[Dict]:
                 
                 # Apply projection model - must succeed
                 try:
-                    # Get team stats for matchup adjustments
-                    # Convert dict to MatchStats object if needed
-                    team_stats = game_data.get('match_stats')
-                    if team_stats and isinstance(team_stats, dict):
-                        # Convert dict to MatchStats object for projection model
-                        try:
-                            from scrapers.sportsbet_final_enhanced import MatchStats, TeamStats
-                            away_stats_dict = team_stats.get('away_team_stats', {})
-                            home_stats_dict = team_stats.get('home_team_stats', {})
-                            
-                            if away_stats_dict and home_stats_dict:
-                                # Convert dicts to TeamStats objects
-                                away_stats = TeamStats(**away_stats_dict) if isinstance(away_stats_dict, dict) else away_stats_dict
-                                home_stats = TeamStats(**home_stats_dict) if isinstance(home_stats_dict, dict) else home_stats_dict
-                                
-                                # Create MatchStats object
-                                team_stats = MatchStats(
-                                    away_team_stats=away_stats,
-                                    home_team_stats=home_stats,
-                                    data_range=team_stats.get('data_range', '')
-                                )
-                                logger.debug(f"  Team stats converted to MatchStats object for {prop_info['player']}")
-                            else:
-                                team_stats = None
-                        except Exception as e:
-                            logger.debug(f"  Could not convert team_stats dict to MatchStats: {e}")
-                            team_stats = None
-                    
                     if team_stats:
                         logger.debug(f"  Team stats available for {prop_info['player']} - will calculate matchup adjustments")
                     else:
                         logger.debug(f"  No team stats for {prop_info['player']} - matchup adjustments will be 1.0x")
                     
                     try:
-                        projection = projection_model.project_stat(
-                            player_name=prop_info['player'],
-                            stat_type=prop_info['stat'],
-                            game_log=game_log,
-                            prop_line=prop_info['line'],
-                            opponent_team=None,  # Will try to infer from match_stats
-                            player_team=None,
-                            team_stats=team_stats,
-                            min_games=5
-                        )
+                        batch_key = (prop_info['player'], prop_info['stat'], prop_info['line'])
+                        if batch_key in batch_projections:
+                            projection = batch_projections[batch_key]
+                        else:
+                            context = get_player_context(
+                                projection_model, prop_info['player'], game_log, player_contexts
+                            )
+                            projection = projection_model.project_stat(
+                                player_name=prop_info['player'],
+                                stat_type=prop_info['stat'],
+                                game_log=game_log,
+                                prop_line=prop_info['line'],
+                                opponent_team=None,  # Will try to infer from match_stats
+                                player_team=None,
+                                team_stats=team_stats,
+                                min_games=5,
+                                context=context,
+                                io_free=True
+                            )
                     except Exception as proj_error:
                         logger.warning(f"  [PROJECTION ERROR] Failed to project {prop_info['player']} {prop_info['stat']}: {proj_error}")
                         import traceback
@@ -1271,6 +1574,7 @@ def analyze_player_props(game_data: Dict, headless: bool = True) -> Tuple[List[D
     """
     predictions = []
     projection_model = PlayerProjectionModel()
+    player_contexts = {}  # player -> PlayerContext, resolved once for all of a player's props
 
     player_props = game_data.get('player_props', []) or []
     game_info = game_data.get('game_info', {}) or {}
@@ -1295,6 +1599,11 @@ def analyze_player_props(game_data: Dict, headless: bool = True) -> Tuple[List[D
         'insight-derived': 0  # Derived from insights (handled elsewhere)
     }
 
+    # Every prop of the game (alt lines included) in one vectorized pass
+    batch_projections = project_props(
+        projection_model, player_props, player_contexts, team_stats=match_stats, headless=headless
+    )
+
     for prop in player_props:
         try:
             player_name = prop['player']
@@ -1312,6 +1621,8 @@ def analyze_player_props(game_data: Dict, headless: bool = True) -> Tuple[List[D
                 retries=3,
                 use_cache=True
             )
+            # Past its TTL (served while refreshing, or every source failed)
+            stale_log = is_last_fetch_stale()
             
             # Convert dicts to GameLogEntry if needed (for projection model compatibility)
             if game_log and len(game_log) > 0 and isinstance(game_log[0], dict):
@@ -1339,16 +1650,24 @@ def analyze_player_props(game_data: Dict, headless: bool = True) -> Tuple[List[D
             
             # Use projection model (PRIMARY SIGNAL - 70% weight)
             try:
-                projection = projection_model.project_stat(
-                    player_name=player_name,
-                    stat_type=stat_type,
-                    game_log=game_log,
-                    prop_line=line,
-                    opponent_team=opponent_team,
-                    player_team=player_team,
-                    team_stats=match_stats,
-                    min_games=5
-                )
+                if (player_name, stat_type, line) in batch_projections:
+                    projection = batch_projections[(player_name, stat_type, line)]
+                else:
+                    context = get_player_context(
+                        projection_model, player_name, game_log, player_contexts, player_team=player_team
+                    )
+                    projection = projection_model.project_stat(
+                        player_name=player_name,
+                        stat_type=stat_type,
+                        game_log=game_log,
+                        prop_line=line,
+                        opponent_team=opponent_team,
+                        player_team=player_team,
+                        team_stats=match_stats,
+                        min_games=5,
+                        context=context,
+                        io_free=True
+                    )
             except Exception as proj_err:
                 logger.warning(f"  [PROJECTION ERROR] Failed to project {player_name} {stat_type}: {proj_err}")
                 import traceback
@@ -1449,7 +1768,8 @@ def analyze_player_props(game_data: Dict, headless: bool = True) -> Tuple[List[D
                     'ev_per_100': round(ev_per_100, 2),
                     'game': f"{away_team} @ {home_team}",
                     'market_name': prop.get('market_name', ''),
-                    'projection_source': 'blended'  # P1: Track projection source (model + market blend)
+                    'projection_source': 'blended',  # P1: Track projection source (model + market blend)
+                    'stale_data': stale_log  # Game log past its TTL, may be missing recent games
                 }
                 
                 # P1: Count projection source
@@ -1759,6 +2079,24 @@ def rank_all_bets(team_bets: List[Dict], player_props: List[Dict]) -> List[Dict]
     
     # Initialize projection model for insight props
     model = PlayerProjectionModel()
+    player_contexts = {}
+
+    # Insight props without projection details, projected together up front
+    missing_projections = []
+    for bet in team_bets:
+        if not isinstance(bet, dict) or bet.get('_bet_type', 'team_bet') != 'player_prop':
+            continue
+        projection_details = (bet.get('analysis') or {}).get('projection_details')
+        if projection_details and isinstance(projection_details, dict):
+            continue
+        prop_info = _extract_prop_info_from_insight(bet.get('insight', {}))
+        if prop_info and prop_info.get('player', '').strip() not in ('', 'Unknown') and prop_info.get('line', 0) > 0:
+            missing_projections.append({
+                'player': prop_info['player'].strip(),
+                'stat': prop_info.get('stat', 'points'),
+                'line': prop_info['line']
+            })
+    batch_projections = project_props(model, missing_projections, player_contexts)
 
     # Convert team bets to unified format
     for bet in team_bets:
@@ -1807,8 +2145,14 @@ def rank_all_bets(team_bets: List[Dict], player_props: List[Dict]) -> List[Dict]
                             from scrapers.data_models import GameLogEntry
                             games = [GameLogEntry(**g) if isinstance(g, dict) else g for g in games]
                         if games and len(games) >= 5:
-                            # Run projection
-                            proj = model.project_stat(player_name, stat_type, games, line)
+                            # Run projection (batched above; project_stat if the batch left it out)
+                            if (player_name, stat_type, line) in batch_projections:
+                                proj = batch_projections[(player_name, stat_type, line)]
+                            else:
+                                context = get_player_context(model, player_name, games, player_contexts)
+                                proj = model.project_stat(
+                                    player_name, stat_type, games, line, context=context, io_free=True
+                                )
                             if proj:
                                 # Update analysis with REAL model data
                                 analysis['projection_details'] = {
@@ -2996,6 +3340,13 @@ def main():
     else:
         logger.info(f"Starting analysis of {max_games} game(s)...")
 
+    # Optional: purge expired cache rows in the background (CACHE_SWEEP_INTERVAL_HOURS)
+    try:
+        from scrapers.data_cache import get_cache
+        get_cache().start_sweeper()
+    except Exception as e:
+        logger.debug(f"Cache sweeper not started: {e}")
+
     # Step 1: Scrape Sportsbet data
     logger.info("Step 1: Scraping games, markets, insights, and player props")
 
@@ -3012,6 +3363,12 @@ def main():
         return
 
     logger.info(f"Successfully scraped {len(games_data)} game(s)")
+
+    # Fetch every player's game log once for the whole slate
+    try:
+        prefetch_slate_players(games_data)
+    except Exception as e:
+        logger.warning(f"Player prefetch failed, analysis will fetch on demand: {e}")
     
     # Generate post-scraping health snapshot (if bets exist)
     if 'all_bets' in locals() and all_bets:
@@ -3257,6 +3614,8 @@ def main():
             logger.debug(traceback.format_exc())
             continue
 
+    logger.info(f"Tiered cache after analysis: {format_tiered_summary()}")
+
     # Step 3: Filter and rank bets
     print("\n" + "-"*70)
     print("STEP 3: [DISPLAY] Filtering and ranking (Quality over Quantity)")
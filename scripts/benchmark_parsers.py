@@ -0,0 +1,166 @@
+"""
+Parser Benchmark
+================
+Time every extractor over the recorded fixture corpus (no browser, no network).
+
+Record fixtures first with FIXTURE_MODE=record (see scrapers/fixtures.py).
+
+Usage:
+    python scripts/benchmark_parsers.py [--repeat N] [--source SOURCE]
+"""
+
+import argparse
+import logging
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scrapers.fixtures import (
+    SPORTSBET_MATCH, STATMUSE_GAME_LOG, DATABALLR_GAME_LOG, Fixture, list_fixtures
+)
+from scrapers.page_documents import HtmlDocument, parse_html, HTML_PARSER
+
+
+def _sportsbet_extractors(fixture: Fixture) -> Dict[str, Callable[[], object]]:
+    from scrapers.sportsbet_final_enhanced import (
+        extract_markets_from_soup, extract_match_insights, extract_team_stats_from_soup,
+        extract_markets_from_payloads, extract_match_insights_from_payloads,
+        extract_team_stats_from_payloads, extract_match_data, match_teams
+    )
+
+    url = fixture.meta.get('url', fixture.key)
+    title = fixture.meta.get('title')
+    payloads = fixture.payload_values
+    soup = parse_html(fixture.html)
+    # Same team names extract_match_data derives, so the market/stats extractors match real selections
+    away, home = match_teams(url, HtmlDocument(fixture.html, title))
+
+    extractors = {
+        'parse_html': lambda: parse_html(fixture.html),
+        'extract_markets_from_soup': lambda: extract_markets_from_soup(soup, away, home),
+        'extract_match_insights': lambda: extract_match_insights(fixture.html),
+        'extract_team_stats_from_soup': lambda: extract_team_stats_from_soup(soup, away, home),
+        'extract_match_data (html)': lambda: extract_match_data(url, HtmlDocument(fixture.html, title), [], True),
+    }
+    if payloads:
+        extractors.update({
+            'extract_markets_from_payloads': lambda: extract_markets_from_payloads(payloads, away, home),
+            'extract_match_insights_from_payloads': lambda: extract_match_insights_from_payloads(payloads),
+            'extract_team_stats_from_payloads': lambda: extract_team_stats_from_payloads(payloads, away, home),
+            'extract_match_data (network)': lambda: extract_match_data(url, HtmlDocument(fixture.html, title), fixture.payloads, True),
+        })
+    return extractors
+
+
+def _statmuse_extractors(fixture: Fixture) -> Dict[str, Callable[[], object]]:
+    from scrapers.statmuse_player_scraper import parse_player_game_log_html
+
+    player_name = fixture.meta.get('player_name', fixture.key)
+    return {
+        'parse_player_game_log_html': lambda: parse_player_game_log_html(fixture.html, player_name),
+    }
+
+
+_databallr_scraper = None
+
+
+def _databallr_extractors(fixture: Fixture) -> Dict[str, Callable[[], object]]:
+    global _databallr_scraper
+    if _databallr_scraper is None:
+        from scrapers.databallr_robust.databallr.players import DataballrPlayerScraper
+        _databallr_scraper = DataballrPlayerScraper()
+
+    return {
+        'DataballrPlayerScraper.parse_game_log_html': lambda: _databallr_scraper.parse_game_log_html(fixture.html),
+    }
+
+
+EXTRACTORS = {
+    SPORTSBET_MATCH: _sportsbet_extractors,
+    STATMUSE_GAME_LOG: _statmuse_extractors,
+    DATABALLR_GAME_LOG: _databallr_extractors,
+}
+
+
+def _result_size(result) -> int:
+    """Rough item count of an extractor result for the report"""
+    if result is None:
+        return 0
+    if isinstance(result, (list, tuple, dict)):
+        return len(result)
+    return 1
+
+
+def benchmark(fixtures: List[Fixture], repeat: int) -> Dict[str, Dict[str, float]]:
+    """Run every extractor `repeat` times per fixture and collect timings"""
+    results: Dict[str, Dict[str, float]] = {}
+
+    for fixture in fixtures:
+        if fixture.source not in EXTRACTORS:
+            continue
+        for name, extractor in EXTRACTORS[fixture.source](fixture).items():
+            timings = []
+            items = 0
+            failed = False
+            for _ in range(repeat):
+                start = time.perf_counter()
+                try:
+                    items = _result_size(extractor())
+                except Exception as e:
+                    print(f"  ! {name} failed on {fixture.source}/{fixture.key}: {e}")
+                    failed = True
+                    break
+                timings.append(time.perf_counter() - start)
+            if failed or not timings:
+                continue
+
+            entry = results.setdefault(f"{fixture.source}: {name}", {
+                'fixtures': 0, 'runs': 0, 'total': 0.0, 'best': float('inf'), 'medians': [], 'items': 0
+            })
+            entry['fixtures'] += 1
+            entry['runs'] += len(timings)
+            entry['total'] += sum(timings)
+            entry['best'] = min(entry['best'], min(timings))
+            entry['medians'].append(statistics.median(timings))
+            entry['items'] += items
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time extractors over recorded fixtures")
+    parser.add_argument('--repeat', type=int, default=5, help="Runs per extractor per fixture (default: 5)")
+    parser.add_argument('--source', choices=list(EXTRACTORS), default=None, help="Only benchmark one fixture source")
+    args = parser.parse_args()
+
+    # Extractors log every step at INFO; keep the report readable
+    logging.disable(logging.WARNING)
+
+    fixtures = list_fixtures(args.source)
+    if not fixtures:
+        print("No fixtures found. Record some with FIXTURE_MODE=record first.")
+        return
+
+    print("=" * 90)
+    print(f"Parser Benchmark ({len(fixtures)} fixtures, {args.repeat} runs each, parser={HTML_PARSER})")
+    print("=" * 90)
+
+    results = benchmark(fixtures, max(1, args.repeat))
+
+    print(f"\n{'Extractor':<60} {'Fixt':>5} {'Median ms':>10} {'Best ms':>9} {'Items':>6}")
+    print("-" * 90)
+    for name, entry in sorted(results.items()):
+        median_ms = statistics.median(entry['medians']) * 1000
+        print(
+            f"{name:<60} {entry['fixtures']:>5} {median_ms:>10.2f} "
+            f"{entry['best'] * 1000:>9.2f} {entry['items']:>6}"
+        )
+    print("\n" + "=" * 90)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Build Player Index Script
+=========================
+Compile data/cache/databallr_player_cache.json and player_stats_cache.json
+into data/cache/player_index.db (see scrapers/player_index_db.py).
+
+The JSON files stay the editable source; the pipeline rebuilds the index
+on its own when they change (PLAYER_INDEX_AUTO_BUILD), so running this is
+only needed to pay the compile cost ahead of time or to check status.
+
+Usage:
+    python scripts/build_player_index.py            # rebuild if a source changed
+    python scripts/build_player_index.py --force    # always rebuild
+    python scripts/build_player_index.py --status   # show compiled sources
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import argparse
+import time
+
+from scrapers.player_index_db import get_player_index
+
+
+def print_status() -> int:
+    index = get_player_index()
+    status = index.get_status() if index.db_path.exists() else []
+    if not status:
+        print(f"No compiled index at {index.db_path}")
+        return 1
+
+    print(f"Index: {index.db_path} ({index.db_path.stat().st_size / 1024:.1f} KB)\n")
+    print(f"{'SOURCE':<14} {'ROWS':>6}  {'BUILT':<17} STATE")
+    for entry in status:
+        state = 'fresh' if entry['fresh'] else 'stale'
+        print(f"{entry['source']:<14} {entry['rows']:>6}  {entry['built_at'][:16].replace('T', ' '):<17} {state}")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compile the player JSON caches into a SQLite index")
+    parser.add_argument('--force', action='store_true', help="Rebuild even if no source changed")
+    parser.add_argument('--status', action='store_true', help="Show compiled sources and exit")
+    args = parser.parse_args()
+
+    if args.status:
+        sys.exit(print_status())
+
+    start = time.perf_counter()
+    counts = get_player_index().build(force=args.force)
+    elapsed = time.perf_counter() - start
+
+    if not counts:
+        print("✓ Player index is up to date")
+    else:
+        for source, rows in counts.items():
+            print(f"✓ {source}: {rows} rows")
+        print(f"✓ Compiled in {elapsed:.2f}s")
+    sys.exit(print_status())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+Cache Admin Script
+==================
+Inspect and maintain the persistent player data cache (data/cache/player_data.db).
+
+Usage:
+    python scripts/cache_admin.py report
+    python scripts/cache_admin.py sweep [--vacuum]
+    python scripts/cache_admin.py vacuum
+    python scripts/cache_admin.py negative list [--all]
+    python scripts/cache_admin.py negative clear [--player NAME] [--source SOURCE] [--expired]
+
+Background sweeping while the pipeline runs: set CACHE_SWEEP_INTERVAL_HOURS.
+Stored game logs are swept by retention: CACHE_GAME_LOG_SEASONS, CACHE_GAME_LOG_RETENTION_DAYS.
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import argparse
+
+from scrapers.data_cache import get_cache
+
+
+def _format_bytes(nbytes: int) -> str:
+    if nbytes >= 1024 * 1024:
+        return f"{nbytes / (1024 * 1024):.1f} MB"
+    return f"{nbytes / 1024:.1f} KB"
+
+
+def cmd_report(args) -> int:
+    report = get_cache().get_size_report()
+    print(f"Database: {get_cache().db_path} ({_format_bytes(report['file_bytes'])} on disk)\n")
+
+    print(f"{'TABLE':<20} {'ROWS':>10}")
+    for table, rows in report['tables'].items():
+        print(f"{table:<20} {rows:>10}")
+
+    print(f"\n{'DATA TYPE':<18} {'SOURCE':<14} {'ROWS':>8} {'EXPIRED':>8} {'BYTES':>10}")
+    for data_type, sources in sorted(report['by_type'].items()):
+        for source, entry in sorted(sources.items(), key=lambda item: -item[1]['bytes']):
+            print(
+                f"{data_type:<18} {source:<14} {entry['rows']:>8} {entry['expired']:>8} "
+                f"{_format_bytes(entry['bytes']):>10}"
+            )
+
+    if report['game_log_seasons']:
+        print(f"\n{'GAME LOG SEASON':<18} {'PLAYERS':>8} {'GAMES':>8}")
+        for season, entry in report['game_log_seasons'].items():
+            print(f"{season:<18} {entry['players']:>8} {entry['rows']:>8}")
+    return 0
+
+
+def cmd_sweep(args) -> int:
+    cache = get_cache()
+    deleted = cache.sweep_expired()
+    total = sum(deleted.values())
+    print(f"✓ Removed {total} expired row(s)")
+    for data_type, count in sorted(deleted.items()):
+        print(f"  {data_type}: {count}")
+    if args.vacuum:
+        return cmd_vacuum(args)
+    return 0
+
+
+def cmd_vacuum(args) -> int:
+    result = get_cache().vacuum()
+    print(
+        f"✓ Vacuumed: {_format_bytes(result['bytes_before'])} -> {_format_bytes(result['bytes_after'])}"
+    )
+    return 0
+
+
+def cmd_negative_list(args) -> int:
+    entries = get_cache().list_negative(include_expired=args.all)
+    if not entries:
+        print("No negative cache entries")
+        return 0
+
+    print(f"{'PLAYER':<28} {'SEASON':<8} {'SOURCE':<14} {'REASON':<11} EXPIRES")
+    for entry in entries:
+        print(
+            f"{entry['player_name']:<28} {entry['season']:<8} {entry['source']:<14} "
+            f"{entry['reason']:<11} {entry['expires_at'][:16].replace('T', ' ')}"
+        )
+    print(f"\n{len(entries)} entr{'y' if len(entries) == 1 else 'ies'}")
+    return 0
+
+
+def cmd_negative_clear(args) -> int:
+    deleted = get_cache().clear_negative(player_name=args.player, source=args.source, expired_only=args.expired)
+    print(f"✓ Cleared {deleted} negative cache entr{'y' if deleted == 1 else 'ies'}")
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Inspect and maintain the player data cache")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    report = commands.add_parser('report', help="Row and byte counts by data type and source")
+    report.set_defaults(func=cmd_report)
+
+    sweep = commands.add_parser('sweep', help="Delete rows past their TTL/staleness window and game logs past retention (baselines kept)")
+    sweep.add_argument('--vacuum', action='store_true', help="Compact the database afterwards")
+    sweep.set_defaults(func=cmd_sweep)
+
+    vacuum = commands.add_parser('vacuum', help="Compact the database file")
+    vacuum.set_defaults(func=cmd_vacuum)
+
+    negative = commands.add_parser('negative', help="Players a source could not find or resolve")
+    negative_commands = negative.add_subparsers(dest='action', required=True)
+
+    negative_list = negative_commands.add_parser('list', help="List negative cache entries")
+    negative_list.add_argument('--all', action='store_true', help="Include expired entries")
+    negative_list.set_defaults(func=cmd_negative_list)
+
+    negative_clear = negative_commands.add_parser('clear', help="Delete negative cache entries (default: all)")
+    negative_clear.add_argument('--player', help="Only this player")
+    negative_clear.add_argument('--source', help="Only this source (statsmuse, databallr, databallr_old)")
+    negative_clear.add_argument('--expired', action='store_true', help="Only entries that have expired")
+    negative_clear.set_defaults(func=cmd_negative_clear)
+
+    return parser
+
+
+def main():
+    args = build_parser().parse_args()
+    sys.exit(args.func(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Shared fixtures: every test gets its own cache database"""
+
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scrapers import data_cache
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    """A fresh DataCache installed as the global get_cache() instance"""
+    instance = data_cache.DataCache(tmp_path / "nba_cache.db")
+    monkeypatch.setattr(data_cache, '_cache_instance', instance)
+    return instance
+
+
+@pytest.fixture
+def make_game_log():
+    """Builder for GameLogEntry lists (most recent first), stat values per game"""
+    from scrapers.data_models import GameLogEntry
+
+    def build(count=10, **stats):
+        games = []
+        for i in range(count):
+            values = {stat: (value[i] if isinstance(value, (list, tuple)) else value) for stat, value in stats.items()}
+            games.append(GameLogEntry(
+                game_date=f"2025-01-{28 - i:02d}", game_id=f"00224{i:05d}",
+                matchup="LAL vs. BOS", home_away="HOME", opponent="BOS", opponent_id=1610612738,
+                won=i % 2 == 0, minutes=values.pop('minutes', 32.0),
+                points=values.pop('points', 20 + i % 7), rebounds=values.pop('rebounds', 6 + i % 4),
+                assists=values.pop('assists', 5 + i % 3), steals=values.pop('steals', 1),
+                blocks=values.pop('blocks', i % 2), turnovers=values.pop('turnovers', 3),
+                fg_made=8, fg_attempted=17, three_pt_made=values.pop('three_pt_made', 2 + i % 3),
+                three_pt_attempted=6, ft_made=4, ft_attempted=5, plus_minus=3,
+                team_points=112, opponent_points=108, total_points=220,
+            ))
+        return games
+
+    return build
+
+
+@pytest.fixture
+def install_sources(monkeypatch):
+    """
+    Replace the three game-log sources with callables: install_sources(statmuse=...,
+    databallr=..., databallr_old=..., statmuse_batch=names -> [(name, logs), ...])
+    """
+    def install(statmuse, databallr, databallr_old, statmuse_batch=None):
+        statmuse_module = types.ModuleType('scrapers.statmuse_player_scraper')
+        statmuse_module.scrape_player_game_log = lambda *args, **kwargs: statmuse()
+        statmuse_module.scrape_player_game_logs = lambda names, **kwargs: iter(statmuse_batch(names))
+
+        robust_package = types.ModuleType('scrapers.databallr_robust')
+        robust_module = types.ModuleType('scrapers.databallr_robust.integration')
+        robust_module.get_player_game_log = lambda *args, **kwargs: databallr()
+
+        old_module = types.ModuleType('scrapers.databallr_scraper')
+        old_module.get_player_game_log = lambda *args, **kwargs: databallr_old()
+        old_module._get_player_id = lambda name: 1234
+
+        monkeypatch.setitem(sys.modules, 'scrapers.statmuse_player_scraper', statmuse_module)
+        monkeypatch.setitem(sys.modules, 'scrapers.databallr_robust', robust_package)
+        monkeypatch.setitem(sys.modules, 'scrapers.databallr_robust.integration', robust_module)
+        monkeypatch.setitem(sys.modules, 'scrapers.databallr_scraper', old_module)
+
+    return install
@@ -0,0 +1,88 @@
+"""Batch prefetch: the slate's StatsMuse misses share one scrape, failures fall through to DataballR"""
+
+from datetime import date, datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from scrapers import player_data_fetcher, tiered_cache
+from scrapers.tiered_cache import TieredCache
+
+SEASON = "2024-25"
+PLAYERS = {"Cold Player": 1629001, "Missing Player": 1629002, "Failed Player": 1629003, "Cached Player": 1629004}
+
+
+def statmuse_log(count=3):
+    """StatMuse PlayerGameLog stand-ins, most recent first, all completed"""
+    return [
+        SimpleNamespace(
+            date=(date.today() - timedelta(days=2 + i)).isoformat(), opponent="BOS", home_away="HOME",
+            win_loss="W", points=20, rebounds=5, assists=4, steals=1, blocks=0, turnovers=2,
+            minutes=31.0, fg_made=8, fg_attempted=15, three_made=2, three_attempted=5,
+            ft_made=2, ft_attempted=2, plus_minus=4,
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def slate(cache, make_game_log, monkeypatch):
+    cache._player_ids.update(PLAYERS)
+    monkeypatch.setattr(tiered_cache, '_tiered_cache', TieredCache(cache))
+    cache.set_game_log("Cached Player", SEASON, make_game_log(5), 'statsmuse', 0.9)
+    return list(PLAYERS)
+
+
+def test_batch_fetches_only_misses_and_stores_them(cache, slate, install_sources):
+    batches = []
+
+    def batch(names):
+        batches.append(list(names))
+        return [("Cold Player", statmuse_log()), ("Missing Player", []), ("Failed Player", None)]
+
+    install_sources(statmuse=pytest.fail, databallr=lambda: None, databallr_old=lambda: None, statmuse_batch=batch)
+
+    results = player_data_fetcher.fetch_game_logs_batch(slate, SEASON)
+
+    # One scrape for every player without a fresh stored log
+    assert batches == [["Cold Player", "Missing Player", "Failed Player"]]
+    assert len(results["Cold Player"]) == 3
+    assert (results["Missing Player"], results["Failed Player"]) == ([], None)
+    assert "Cached Player" not in results
+
+    # Stored like a per-player fetch: the next lookup is a memory hit
+    assert len(cache.get_game_log_entries("Cold Player", SEASON)) == 3
+    assert len(player_data_fetcher.get_player_game_log("Cold Player", SEASON)) == 3
+    assert player_data_fetcher.get_last_fetch_source() == 'session'
+
+    # Only the empty answer is negative-cached
+    assert set(cache.get_negative("Missing Player", SEASON)) == {'statsmuse'}
+    assert cache.get_negative("Failed Player", SEASON) == {}
+
+
+def test_skipped_statmuse_falls_through_to_databallr(cache, slate, install_sources, make_game_log):
+    install_sources(statmuse=pytest.fail, databallr=lambda: make_game_log(4), databallr_old=lambda: None)
+
+    games = player_data_fetcher.get_player_game_log("Failed Player", SEASON, skip_sources=('statsmuse',))
+
+    assert len(games) == 4
+    assert player_data_fetcher.get_last_fetch_source() == 'databallr'
+    # Skipping is not a "not found" answer
+    assert cache.get_negative("Failed Player", SEASON) == {}
+
+
+def test_batch_leaves_stale_servable_logs_to_the_per_player_path(cache, slate, install_sources):
+    with cache._transaction(write=True) as conn:
+        conn.execute("UPDATE game_log_sync SET last_updated = ?", (
+            (datetime.now() - timedelta(hours=cache.TTL_GAME_LOG + 24)).isoformat(),
+        ))
+    batches = []
+    install_sources(
+        statmuse=pytest.fail, databallr=lambda: None, databallr_old=lambda: None,
+        statmuse_batch=lambda names: batches.append(list(names)) or []
+    )
+
+    player_data_fetcher.fetch_game_logs_batch(["Cached Player"], SEASON)
+
+    # Served stale and refreshed in the background instead of blocking the batch
+    assert batches == []
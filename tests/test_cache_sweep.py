@@ -0,0 +1,69 @@
+"""Sweep: stored game logs are removed by season and by time since their last refresh"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from config.settings import Config
+
+PLAYERS = {"Old Season": 1629001, "Idle Player": 1629002, "Stale Player": 1629003, "Active Player": 1629004}
+
+
+@pytest.fixture
+def stored(cache, make_game_log, monkeypatch):
+    monkeypatch.setattr(Config, 'CACHE_GAME_LOG_SEASONS', 2)
+    monkeypatch.setattr(Config, 'CACHE_GAME_LOG_RETENTION_DAYS', 30.0)
+    cache._player_ids.update(PLAYERS)
+    cache.set_game_log("Old Season", "2022-23", make_game_log(3), 'statsmuse', 0.85)
+    for name in ("Idle Player", "Stale Player", "Active Player"):
+        cache.set_game_log(name, "2024-25", make_game_log(4), 'statsmuse', 0.85)
+    cache.set_game_log("Active Player", "2023-24", make_game_log(2), 'databallr', 0.9)
+
+    def age(name, hours):
+        with cache._transaction(write=True) as conn:
+            conn.execute("UPDATE game_log_sync SET last_updated = ? WHERE player_id = ?", (
+                (datetime.now() - timedelta(hours=hours)).isoformat(), PLAYERS[name],
+            ))
+    return age
+
+
+def stored_logs(cache):
+    with cache._transaction() as conn:
+        sync = {tuple(row) for row in conn.execute("SELECT player_id, season FROM game_log_sync")}
+        rows = {tuple(row) for row in conn.execute("SELECT DISTINCT player_id, season FROM game_logs")}
+    return sync, rows
+
+
+def test_sweep_removes_old_seasons_and_idle_players(cache, stored):
+    stored("Idle Player", 31 * 24)
+    # Past its TTL but still servable stale / the base for an incremental refresh
+    stored("Stale Player", cache.TTL_GAME_LOG + 24)
+
+    deleted = cache.sweep_expired()
+
+    assert deleted == {'game_logs': 3 + 4, 'game_log_sync': 2}
+    kept = {
+        (PLAYERS["Stale Player"], 2025), (PLAYERS["Active Player"], 2025), (PLAYERS["Active Player"], 2024),
+    }
+    assert stored_logs(cache) == (kept, kept)
+
+
+def test_retention_never_undercuts_the_stale_window(cache, stored, monkeypatch):
+    monkeypatch.setattr(Config, 'CACHE_GAME_LOG_SEASONS', 0)
+    monkeypatch.setattr(Config, 'CACHE_GAME_LOG_RETENTION_DAYS', 1.0)
+    stored("Stale Player", cache.MAX_STALE_GAME_LOG - 24)
+
+    assert cache.sweep_expired() == {}
+
+
+def test_size_report_covers_stored_game_logs(cache, stored):
+    stored("Stale Player", cache.TTL_GAME_LOG + 24)
+
+    report = cache.get_size_report()
+
+    assert report['by_type']['game_log_sync']['statsmuse']['rows'] == 4
+    assert report['by_type']['game_log_sync']['statsmuse']['expired'] == 1
+    assert report['by_type']['game_log_rows']['statsmuse']['expired'] == 4
+    assert report['game_log_seasons'] == {
+        2023: {'players': 1, 'rows': 3}, 2024: {'players': 1, 'rows': 2}, 2025: {'players': 3, 'rows': 12},
+    }
@@ -0,0 +1,47 @@
+"""Game log storage: only completed, properly dated games reach the append-only table"""
+
+from datetime import date, timedelta
+
+from scrapers import player_data_fetcher
+
+PLAYER = "Test Player"
+PLAYER_ID = 1629029
+SEASON = "2024-25"
+
+
+def dated(games, dates):
+    for game, game_date in zip(games, dates):
+        game.game_date = game_date
+    return games
+
+
+def test_full_store_skips_todays_game_and_bad_dates(cache, make_game_log):
+    cache._player_ids[PLAYER] = PLAYER_ID
+    today = date.today()
+    games = dated(make_game_log(4), [
+        today.isoformat(),                          # in progress
+        (today - timedelta(days=1)).isoformat(),
+        "1/5/2025",                                 # not normalized
+        (today - timedelta(days=3)).isoformat(),
+    ])
+
+    player_data_fetcher._store_game_log(PLAYER, SEASON, games, 'databallr', 0.9, 'databallr', None, True)
+
+    stored = [game.game_date for game in cache.get_game_log_entries(PLAYER, SEASON)]
+    assert stored == [(today - timedelta(days=1)).isoformat(), (today - timedelta(days=3)).isoformat()]
+    assert cache.get_game_log_sync(PLAYER, SEASON)['newest_game_date'] == (today - timedelta(days=1)).isoformat()
+
+
+def test_incremental_store_only_adds_newer_completed_games(cache, make_game_log):
+    cache._player_ids[PLAYER] = PLAYER_ID
+    today = date.today()
+    since = (today - timedelta(days=5)).isoformat()
+    games = dated(make_game_log(3), [
+        today.isoformat(), (today - timedelta(days=2)).isoformat(), since,
+    ])
+
+    player_data_fetcher._store_game_log(PLAYER, SEASON, games, 'databallr', 0.9, 'databallr', None, True, since)
+
+    assert [game.game_date for game in cache.get_game_log_entries(PLAYER, SEASON)] == [
+        (today - timedelta(days=2)).isoformat()
+    ]
@@ -0,0 +1,83 @@
+"""Negative cache: only a source's real "no games" answer is remembered"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from config.settings import Config
+from scrapers import player_data_fetcher
+
+PLAYER = "Test Player"
+SEASON = "2024-25"
+
+
+def raise_timeout():
+    raise TimeoutError("Timeout 30000ms exceeded")
+
+
+def test_failed_fetches_are_not_negative_cached(cache, install_sources):
+    # Exception, timeout (None) and browser failure (None) from each source
+    install_sources(statmuse=raise_timeout, databallr=lambda: None, databallr_old=lambda: None)
+
+    assert player_data_fetcher._fetch_player_game_log(PLAYER, SEASON) == []
+    assert cache.get_negative(PLAYER, SEASON) == {}
+
+
+def test_empty_answers_are_negative_cached(cache, install_sources):
+    install_sources(statmuse=list, databallr=list, databallr_old=list)
+
+    assert player_data_fetcher._fetch_player_game_log(PLAYER, SEASON) == []
+    negative = cache.get_negative(PLAYER, SEASON)
+    assert set(negative) == {'statsmuse', 'databallr', 'databallr_old'}
+    assert all(entry['reason'] == 'not_found' for entry in negative.values())
+
+
+def test_negative_sources_are_skipped(cache, install_sources):
+    calls = []
+
+    def statmuse():
+        calls.append('statsmuse')
+        return []
+
+    install_sources(statmuse=statmuse, databallr=list, databallr_old=list)
+    player_data_fetcher._fetch_player_game_log(PLAYER, SEASON)
+    player_data_fetcher._fetch_player_game_log(PLAYER, SEASON)
+
+    assert calls == ['statsmuse']
+
+
+def test_negative_ttl_by_reason(cache, monkeypatch):
+    monkeypatch.setattr(Config, 'NEGATIVE_CACHE_NOT_FOUND_TTL', 6.0)
+    monkeypatch.setattr(Config, 'NEGATIVE_CACHE_UNRESOLVED_TTL', 12.0)
+    cache.set_negative(PLAYER, SEASON, 'statsmuse', 'not_found')
+    cache.set_negative(PLAYER, SEASON, 'databallr', 'unresolved')
+
+    negative = cache.get_negative(PLAYER, SEASON)
+    for source, hours in (('statsmuse', 6), ('databallr', 12)):
+        entry = negative[source]
+        ttl = datetime.fromisoformat(entry['expires_at']) - datetime.fromisoformat(entry['created_at'])
+        assert ttl == timedelta(hours=hours)
+
+
+def test_expired_negative_entries_are_ignored(cache, install_sources):
+    cache.set_negative(PLAYER, SEASON, 'statsmuse', 'not_found', ttl_hours=-1)
+    cache.set_negative(PLAYER, SEASON, 'databallr', 'not_found', ttl_hours=1)
+
+    assert set(cache.get_negative(PLAYER, SEASON)) == {'databallr'}
+    assert len(cache.list_negative()) == 1
+    assert len(cache.list_negative(include_expired=True)) == 2
+
+    # An expired entry no longer skips its source
+    calls = []
+    install_sources(statmuse=lambda: calls.append('statsmuse') or [], databallr=list, databallr_old=list)
+    player_data_fetcher._fetch_player_game_log(PLAYER, SEASON)
+    assert calls == ['statsmuse']
+
+    # The new miss replaced the expired row
+    assert cache.clear_negative(expired_only=True) == 0
+    assert cache.clear_negative(PLAYER, source='statsmuse') == 1
+
+
+def test_unknown_negative_reason_is_rejected(cache):
+    with pytest.raises(ValueError):
+        cache.set_negative(PLAYER, SEASON, 'statsmuse', 'timeout')
@@ -0,0 +1,87 @@
+"""Page waits: readiness signals, ceilings and quiet-window resets"""
+
+import pytest
+
+from scrapers import page_waits
+
+
+class FakePage:
+    """Records wait calls; selectors in `ready` appear, everything else times out"""
+
+    def __init__(self, ready=(), network_idle=True):
+        self.ready = set(ready)
+        self.network_idle = network_idle
+        self.calls = []
+
+    def wait_for_selector(self, selector, state="visible", timeout=None):
+        self.calls.append(('selector', selector, timeout))
+        if selector not in self.ready:
+            raise TimeoutError(f"Timeout {timeout}ms exceeded")
+
+    def wait_for_load_state(self, state, timeout=None):
+        self.calls.append(('load_state', state, timeout))
+        if not self.network_idle:
+            raise TimeoutError(f"Timeout {timeout}ms exceeded")
+
+    def evaluate(self, script):
+        self.calls.append(('evaluate', script, None))
+
+    def wait_for_function(self, script, arg=None, timeout=None, polling=None):
+        self.calls.append(('function', arg, timeout))
+
+
+@pytest.fixture(autouse=True)
+def clean_stats():
+    page_waits.reset_wait_stats()
+    yield
+    page_waits.reset_wait_stats()
+
+
+def test_content_selector_is_the_readiness_signal():
+    # networkidle is already met after an in-page click, so it must not end the wait
+    page = FakePage(ready={'text=/Season Results/i'})
+
+    assert page_waits.wait_for_content(page, budget=20.0, selector='text=/Season Results/i', label="tab")
+    assert page.calls == [('selector', 'text=/Season Results/i', 20000)]
+
+
+def test_content_selector_timeout_is_reported():
+    page = FakePage()
+
+    assert not page_waits.wait_for_content(page, budget=20.0, selector='text=/Season Results/i', label="tab")
+    stats = page_waits.get_wait_stats()['by_label']['tab']
+    assert (stats['count'], stats['timeouts'], stats['budget_seconds']) == (1, 1, 20.0)
+
+
+def test_content_without_selector_waits_for_a_quiet_dom():
+    page = FakePage()
+
+    assert page_waits.wait_for_content(page, budget=5.0, quiet_ms=1000)
+    kinds = [call[0] for call in page.calls]
+    assert kinds == ['load_state', 'evaluate', 'evaluate', 'function']
+    assert page.calls[-1][1] == 1000
+
+
+def test_dom_settle_restarts_the_quiet_window_every_call():
+    page = FakePage()
+
+    page_waits.wait_for_dom_settle(page, budget=1.0, quiet_ms=2000)
+    page_waits.wait_for_dom_settle(page, budget=1.0)
+
+    scripts = [call[1] for call in page.calls if call[0] == 'evaluate']
+    assert scripts == [page_waits._MUTATION_PROBE, page_waits._QUIET_WINDOW_RESET] * 2
+    # The quiet window never exceeds the ceiling
+    assert [call[1] for call in page.calls if call[0] == 'function'] == [1000, page_waits.DEFAULT_QUIET_MS]
+
+
+def test_wait_stats_compare_against_the_fixed_budget():
+    page = FakePage(ready={'#ready'})
+
+    page_waits.wait_for_selector(page, '#ready', budget=2.0, label="ready")
+    page_waits.wait_for_selector(page, '#missing', budget=1.0, timeout=0.5, label="missing")
+
+    stats = page_waits.get_wait_stats()
+    assert stats['budget_seconds'] == 3.0
+    assert stats['by_label']['missing']['timeouts'] == 1
+    assert page.calls[-1] == ('selector', '#missing', 500)
+    assert "2 wait(s)" in page_waits.format_wait_summary()
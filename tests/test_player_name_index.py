@@ -0,0 +1,101 @@
+"""Player name index: candidate buckets resolve exactly like a full fuzzy scan"""
+
+from difflib import SequenceMatcher
+
+import pytest
+
+from scrapers import player_name_index
+from scrapers.player_name_index import build_name_index, normalize_player_name
+
+NAMES = [
+    "LeBron James", "Anthony Davis", "Austin Reaves", "D'Angelo Russell", "Rui Hachimura",
+    "Jayson Tatum", "Jaylen Brown", "Jrue Holiday", "Kristaps Porzingis", "Derrick White",
+    "Nikola Jokic", "Jamal Murray", "Michael Porter Jr.", "Aaron Gordon", "Nikola Vucevic",
+    "Shai Gilgeous-Alexander", "Nickeil Alexander-Walker", "Jalen Williams", "Jaylin Williams",
+    "Tim Hardaway Jr.", "Gary Trent Jr.", "Jaren Jackson Jr.", "Wendell Carter Jr.",
+    "John Collins", "Zach Collins", "Giannis Antetokounmpo", "Thanasis Antetokounmpo",
+    "Bojan Bogdanovic", "Bogdan Bogdanovic", "Marcus Morris Sr.", "Robert Williams III",
+    "Trey Murphy III", "Jabari Smith Jr.", "Mikal Bridges", "Miles Bridges", "Jalen Brunson",
+    "Jalen Green", "Jalen Duren", "Jalen Suggs", "Jalen Johnson", "Cameron Johnson",
+    "Keldon Johnson", "Jaden Ivey", "Jaden McDaniels", "Jaime Jaquez Jr.", "Scottie Barnes",
+]
+
+QUERIES = [
+    # exact, format and suffix variants
+    "LeBron James", "lebron james", "Michael Porter", "Tim Hardaway Jr", "Robert Williams",
+    "Shai Gilgeous Alexander", "DAngelo Russell",
+    # swapped tokens and typos
+    "Collins John", "James LeBron", "Nikola Jokich", "Kristaps Porzingas", "Giannis Antetokounpo",
+    "Jaylen Browne", "Jalen Wiliams", "Bogdan Bogdanovich", "Mikal Bridgess", "Scotty Barnes",
+    # typos in every word (no whole-token candidate)
+    "Nikolla Jokich", "Giannes Antetokounpo", "Krystaps Porzingas", "Lebrn Jaems", "Jaylenn Browne",
+    "Shay Gilgeous Alexandr", "Derick Whyte", "Jamall Murrey",
+    # close to several cached names
+    "Jalen Johnson", "Jaden Johnson", "Jalen Brown", "Jaylin Williams",
+    # not cached
+    "Victor Wembanyama", "Stephen Curry", "Jamal", "", "xyz",
+]
+
+
+def full_scan(name_to_id, normalized_name, threshold):
+    """Reference: score the query against every cached name"""
+    best_id, best_score = None, 0.0
+    name_tokens = set(normalized_name.split())
+    for cached_name, player_id in name_to_id.items():
+        if normalized_name == cached_name:
+            return player_id
+        score = SequenceMatcher(None, normalized_name, cached_name).ratio()
+        if name_tokens == set(cached_name.split()):
+            score = max(score, 0.95)
+        if score > best_score:
+            best_score, best_id = score, player_id
+    return best_id if best_score >= threshold else None
+
+
+@pytest.mark.parametrize('threshold', [0.95, 0.90, 0.80])
+def test_index_matches_full_scan(threshold):
+    name_to_id = {normalize_player_name(name): 1000 + i for i, name in enumerate(NAMES)}
+    index = build_name_index(name_to_id.items())
+
+    for query in QUERIES:
+        normalized = normalize_player_name(query)
+        if not normalized:
+            assert index.find(normalized, threshold) is None
+            continue
+        assert index.find(normalized, threshold) == full_scan(name_to_id, normalized, threshold), query
+
+
+def test_index_scores_fewer_names_than_a_full_scan():
+    index = build_name_index((normalize_player_name(name), i) for i, name in enumerate(NAMES))
+    index.find(normalize_player_name("Nikola Jokich"))
+
+    assert 0 < index.stats['scored'] < len(NAMES)
+
+
+def test_lookups_are_memoized_including_misses():
+    index = build_name_index((normalize_player_name(name), i) for i, name in enumerate(NAMES))
+    assert index.resolve("Victor Wembanyama") is None
+    assert index.resolve("Victor Wembanyama") is None
+
+    assert index.stats['misses'] == 1
+    assert index.stats['memo_hits'] == 1
+
+
+def test_last_name_rule_rejects_near_miss_players():
+    # "nikola jokic" is not cached, "nikola jovic" scores 0.92 against it
+    index = build_name_index([("nikola jovic", 1631107), ("john collins", 1628381)])
+
+    assert index.resolve("Nikola Jokic") == 1631107
+    assert index.resolve("Nikola Jokic", match_last_name=True) is None
+    assert index.resolve("Nikolla Jovic", match_last_name=True) == 1631107
+    assert index.resolve("Collins John", match_last_name=True) == 1628381
+
+
+def test_memo_keeps_the_most_recent_lookups(monkeypatch):
+    monkeypatch.setattr(player_name_index, 'MEMO_MAX_ENTRIES', 3)
+    index = build_name_index((normalize_player_name(name), i) for i, name in enumerate(NAMES))
+
+    for query in ("Victor Wembanyama", "Stephen Curry", "Jamal", "Victor Wembanyama", "xyz"):
+        index.resolve(query)
+
+    assert [key[0] for key in index._memo] == ["jamal", "victor wembanyama", "xyz"]
@@ -0,0 +1,116 @@
+"""project_many: vectorized slate projections match project_stat"""
+
+import math
+from dataclasses import asdict
+
+import pytest
+
+projection_model = pytest.importorskip(
+    'scrapers.player_projection_model', reason="projection model dependencies not installed"
+)
+from scrapers.role_modifier import PlayerContext
+
+STATS = ['points', 'rebounds', 'assists', 'three_pt_made']
+
+
+def assert_same(expected, actual, path='projection'):
+    """Recursive equality with float tolerance"""
+    if isinstance(expected, float) or isinstance(actual, float):
+        assert expected is not None and actual is not None, path
+        assert math.isclose(expected, actual, rel_tol=1e-9, abs_tol=1e-9), f"{path}: {expected} != {actual}"
+    elif isinstance(expected, dict):
+        assert isinstance(actual, dict) and set(expected) == set(actual), path
+        for key in expected:
+            assert_same(expected[key], actual[key], f"{path}.{key}")
+    elif isinstance(expected, (list, tuple)):
+        assert len(expected) == len(actual), path
+        for i, (e, a) in enumerate(zip(expected, actual)):
+            assert_same(e, a, f"{path}[{i}]")
+    else:
+        assert expected == actual, f"{path}: {expected!r} != {actual!r}"
+
+
+@pytest.fixture
+def slate(make_game_log):
+    game_logs = {
+        # 20+ games: every rolling window
+        "Star Guard": make_game_log(24, points=[18 + (i * 7) % 15 for i in range(24)]),
+        # 10-19 games, minutes trending up
+        "Rotation Wing": make_game_log(12, minutes=[30 - i for i in range(12)]),
+        # Fewer than min_games valid games (low minutes)
+        "Deep Bench": make_game_log(8, minutes=[8.0] * 6 + [20.0] * 2),
+        # A missing stat value takes the scalar path for that stat
+        "Spot Up": make_game_log(15, three_pt_made=[None] + [3] * 14),
+    }
+    contexts = {
+        "Star Guard": PlayerContext(
+            player_name="Star Guard", team="Lakers", date="2025-01-28",
+            usage_rate=31.0, usage_confidence=0.9, teammate_roster=[]
+        ),
+    }
+    props = []
+    for player in game_logs:
+        for stat in STATS:
+            for line in (0.5, 2.5, 6.5, 19.5, 24.5):
+                props.append({'player': player, 'stat': stat, 'line': line, 'player_team': "Lakers", 'opponent_team': "Celtics"})
+    props.append({'player': "Not In Logs", 'stat': 'points', 'line': 10.5})
+    return props, game_logs, contexts
+
+
+def test_project_many_matches_project_stat(cache, slate):
+    props, game_logs, contexts = slate
+    model = projection_model.PlayerProjectionModel()
+
+    batch = model.project_many(props, game_logs, contexts)
+
+    assert len(batch) == len(props)
+    for prop, projection in zip(props, batch):
+        expected = model.project_stat(
+            player_name=prop['player'],
+            stat_type=prop['stat'],
+            game_log=game_logs.get(prop['player'], []),
+            prop_line=prop['line'],
+            opponent_team=prop.get('opponent_team'),
+            player_team=prop.get('player_team'),
+            context=contexts.get(prop['player']),
+            io_free=True
+        )
+        label = f"{prop['player']} {prop['stat']} {prop['line']}"
+        if expected is None:
+            assert projection is None, label
+        else:
+            assert projection is not None, label
+            assert_same(asdict(expected), asdict(projection), label)
+
+
+def test_project_many_skips_players_without_enough_games(cache, slate):
+    props, game_logs, contexts = slate
+    model = projection_model.PlayerProjectionModel()
+
+    batch = model.project_many(props, game_logs, contexts)
+
+    assert all(p is None for prop, p in zip(props, batch) if prop['player'] in ("Deep Bench", "Not In Logs"))
+    assert all(p is not None for prop, p in zip(props, batch) if prop['player'] == "Star Guard")
+
+
+def test_pipeline_projects_props_in_one_batch(cache, slate, monkeypatch):
+    pipeline = pytest.importorskip('scrapers.unified_analysis_pipeline', reason="pipeline dependencies not installed")
+    props, game_logs, contexts = slate
+    model = projection_model.PlayerProjectionModel()
+    resolved = []
+    monkeypatch.setattr(pipeline, 'get_player_game_log', lambda player_name, **kwargs: game_logs.get(player_name, []))
+    monkeypatch.setattr(model, 'resolve_context', lambda name, *args, **kwargs: resolved.append(name) or contexts.get(name))
+    monkeypatch.setattr(model, 'project_stat', lambda *args, **kwargs: pytest.fail("projected one prop at a time"))
+
+    # Repeated props are projected once
+    batch = pipeline.project_props(model, props + props[:3], {})
+
+    assert sorted(resolved) == sorted(game_logs)
+    # Unknown players are left to the caller
+    assert len(batch) == len(props) - 1
+    expected = model.project_many(props[:-1], game_logs, contexts, min_games=5)
+    for prop, projection in zip(props[:-1], expected):
+        actual = batch[(prop['player'], prop['stat'], prop['line'])]
+        assert (actual is None) == (projection is None)
+        if projection is not None:
+            assert_same(asdict(projection), asdict(actual))
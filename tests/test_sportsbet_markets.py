@@ -0,0 +1,66 @@
+"""Sportsbet markets: a complete network capture skips the HTML parse, captures are scoped to the match"""
+
+import pytest
+
+sportsbet = pytest.importorskip(
+    'scrapers.sportsbet_final_enhanced', reason="Sportsbet scraper dependencies not installed"
+)
+
+URL = "https://www.sportsbet.com.au/betting/basketball-us/nba/boston-celtics-at-los-angeles-lakers-8675309"
+EVENT_ID = "8675309"
+
+
+def market_payload(event_id, *groups):
+    return {'event': {'id': int(event_id), 'markets': [
+        {'name': name, 'selections': [{'name': selection, 'price': {'winPrice': odds}} for selection, odds in selections]}
+        for name, selections in groups
+    ]}}
+
+
+HEAD_TO_HEAD = ("Head to Head", [("Boston Celtics", 1.65), ("Los Angeles Lakers", 2.25)])
+LINE = ("Line", [("Boston Celtics (-4.5)", 1.9), ("Los Angeles Lakers (+4.5)", 1.9)])
+TOTAL = ("Total Points", [("Over 224.5", 1.87), ("Under 224.5", 1.93)])
+
+
+class Document:
+    """Fixture-like document that records whether its HTML was parsed"""
+
+    def __init__(self):
+        self.parsed = False
+        self.html = ""
+        self.title = "Boston Celtics at Los Angeles Lakers"
+
+    @property
+    def soup(self):
+        self.parsed = True
+        return sportsbet.parse_html(self.html)
+
+
+def test_complete_capture_skips_the_html_parse():
+    document = Document()
+    records = [{'url': f"https://www.sportsbet.com.au/apigw/events/{EVENT_ID}",
+                'payload': market_payload(EVENT_ID, HEAD_TO_HEAD, LINE, TOTAL)}]
+
+    data = sportsbet.extract_match_data(URL, document, records, stats_clicked=False)
+
+    assert not document.parsed
+    assert sorted(m.market_category for m in data.all_markets) == ['handicap'] * 2 + ['moneyline'] * 2 + ['total'] * 2
+
+
+def test_incomplete_capture_falls_back_to_html():
+    document = Document()
+    records = [{'url': "https://www.sportsbet.com.au/apigw/x", 'payload': market_payload(EVENT_ID, HEAD_TO_HEAD)}]
+
+    sportsbet.extract_match_data(URL, document, records, stats_clicked=False)
+
+    assert document.parsed
+
+
+def test_other_events_do_not_complete_the_capture():
+    records = [{'url': "https://www.sportsbet.com.au/apigw/x", 'payload': market_payload("1234", HEAD_TO_HEAD, LINE, TOTAL)}]
+
+    payloads = sportsbet.payloads_for_event(records, sportsbet.match_event_id(URL))
+    markets = sportsbet.extract_markets_from_payloads(payloads, "Boston Celtics", "Los Angeles Lakers", EVENT_ID)
+
+    assert payloads == []
+    assert not sportsbet.network_markets_complete(markets)
@@ -0,0 +1,67 @@
+"""Stale-while-revalidate: stale game logs are served at once and flagged as stale"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from scrapers import player_data_fetcher, tiered_cache
+from scrapers.tiered_cache import TieredCache
+
+PLAYER = "Test Player"
+PLAYER_ID = 1629029
+SEASON = "2024-25"
+
+
+@pytest.fixture
+def stored_log(cache, make_game_log, monkeypatch):
+    """A 5-game stored log and a way to age it; background refreshes are recorded, not run"""
+    cache._player_ids[PLAYER] = PLAYER_ID
+    monkeypatch.setattr(tiered_cache, '_tiered_cache', TieredCache(cache))
+    cache.set_game_log(PLAYER, SEASON, make_game_log(5), 'statsmuse', 0.9)
+    cache.hot_cache.clear()
+
+    refreshes = []
+    monkeypatch.setattr(cache, 'schedule_refresh', lambda key, *args: refreshes.append(key) or True)
+
+    def age(hours):
+        with cache._transaction(write=True) as conn:
+            conn.execute("UPDATE game_log_sync SET last_updated = ?", (
+                (datetime.now() - timedelta(hours=hours)).isoformat(),
+            ))
+    return age, refreshes
+
+
+def test_fresh_log_is_not_stale(cache, stored_log):
+    games = player_data_fetcher.get_player_game_log(PLAYER, SEASON)
+
+    assert len(games) == 5
+    assert player_data_fetcher.get_last_fetch_source() == 'cache'
+    assert not player_data_fetcher.is_last_fetch_stale()
+
+
+def test_expired_log_within_max_staleness_is_served_stale(cache, stored_log, install_sources):
+    age, refreshes = stored_log
+    age(cache.TTL_GAME_LOG + 24)
+    calls = []
+    install_sources(statmuse=lambda: calls.append(1), databallr=lambda: None, databallr_old=lambda: None)
+
+    games = player_data_fetcher.get_player_game_log(PLAYER, SEASON)
+
+    assert len(games) == 5
+    assert player_data_fetcher.get_last_fetch_source() == 'stale'
+    assert player_data_fetcher.is_last_fetch_stale()
+    # Served without a blocking fetch, refreshed in the background
+    assert calls == []
+    assert refreshes == [(PLAYER, SEASON, 'game_log')]
+
+
+def test_expired_fallback_is_flagged_stale(cache, stored_log, install_sources):
+    age, refreshes = stored_log
+    age(cache.MAX_STALE_GAME_LOG + 24)
+    install_sources(statmuse=lambda: None, databallr=lambda: None, databallr_old=lambda: None)
+
+    games = player_data_fetcher.get_player_game_log(PLAYER, SEASON)
+
+    assert len(games) == 5
+    assert player_data_fetcher.is_last_fetch_stale()
+    assert refreshes == []
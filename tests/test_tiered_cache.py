@@ -0,0 +1,213 @@
+"""Tiered cache: memory → SQLite → origin, promotion and coalescing"""
+
+import threading
+from datetime import datetime, timedelta
+
+from scrapers.single_flight import SingleFlight
+from scrapers.tiered_cache import TieredCache
+
+PLAYER = "Test Player"
+PLAYER_ID = 1629029
+SEASON = "2024-25"
+PROFILE = {'usage': 0.31, 'minutes': 35.5}
+
+
+def make_tiered(cache):
+    # Resolve the test player without the player ID lookup
+    cache._player_ids[PLAYER] = PLAYER_ID
+    return TieredCache(cache)
+
+
+def test_tiers_in_order(cache):
+    tiered = make_tiered(cache)
+    calls = []
+
+    def origin():
+        calls.append(1)
+        return dict(PROFILE)
+
+    assert tiered.get('player', PLAYER, SEASON, 'full_profile', origin=origin) == PROFILE
+    assert tiered.last_tier() == 'origin'
+
+    assert tiered.get('player', PLAYER, SEASON, 'full_profile', origin=origin) == PROFILE
+    assert tiered.last_tier() == 'memory'
+
+    # Memory dropped: served from SQLite, then promoted back into memory
+    cache.hot_cache.clear()
+    assert tiered.get('player', PLAYER, SEASON, 'full_profile', origin=origin) == PROFILE
+    assert tiered.last_tier() == 'sqlite'
+    assert tiered.get('player', PLAYER, SEASON, 'full_profile', origin=origin) == PROFILE
+    assert tiered.last_tier() == 'memory'
+
+    assert calls == [1]
+    stats = tiered.get_stats()
+    assert (stats['origin'], stats['memory'], stats['sqlite']) == (1, 2, 1)
+
+
+def test_memory_tier_is_the_data_cache_hot_cache(cache):
+    tiered = make_tiered(cache)
+    tiered.get('player', PLAYER, SEASON, 'full_profile', origin=lambda: dict(PROFILE))
+
+    # One copy per key: what DataCache.get serves from memory is the tier's entry
+    key = tiered.key_for('player', PLAYER, SEASON, 'full_profile')
+    assert tiered.memory is cache.hot_cache
+    assert len(cache.hot_cache) == 1
+    assert cache.get(key, 'N/A', SEASON, 'full_profile')['data'] == PROFILE
+
+
+def test_promoted_game_log_keeps_its_age(cache, make_game_log):
+    tiered = make_tiered(cache)
+    cache.set_game_log(PLAYER, SEASON, make_game_log(5), 'statsmuse', 0.9)
+    cache.hot_cache.clear()
+
+    games = tiered.get('player', PLAYER, SEASON, 'game_log')
+    assert tiered.last_tier() == 'sqlite'
+    assert len(games) == 5
+
+    key = tiered._memory_key(tiered.key_for('player', PLAYER, SEASON, 'game_log'), SEASON, 'game_log')
+    entry = cache.hot_cache.get(key, 'game_log')
+    assert entry.last_updated == cache.get_game_log_updated(PLAYER, SEASON)
+
+
+def test_expired_memory_entry_is_not_served(cache):
+    tiered = make_tiered(cache)
+    key = tiered.key_for('player', PLAYER, SEASON, 'full_profile')
+    tiered._memory_put(key, SEASON, 'full_profile', dict(PROFILE), datetime.now() - timedelta(hours=30))
+
+    assert tiered.get('player', PLAYER, SEASON, 'full_profile', max_age_hours=24) is None
+    assert tiered.last_tier() == 'miss'
+
+
+def test_empty_origin_result_is_not_cached(cache):
+    tiered = make_tiered(cache)
+    results = iter([{}, dict(PROFILE)])
+
+    assert tiered.get('player', PLAYER, SEASON, 'full_profile', origin=lambda: next(results)) == {}
+    assert tiered.get('player', PLAYER, SEASON, 'full_profile', origin=lambda: next(results)) == PROFILE
+    assert tiered.last_tier() == 'origin'
+
+
+def test_single_flight_coalesces_concurrent_calls():
+    group = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return ['game']
+
+    results = []
+    leader = threading.Thread(target=lambda: results.append(group.do((PLAYER, SEASON, 'game_log'), fetch)))
+    leader.start()
+    assert started.wait(5)
+
+    waiters = [
+        threading.Thread(target=lambda: results.append(group.do((PLAYER, SEASON, 'game_log'), fetch)))
+        for _ in range(3)
+    ]
+    for waiter in waiters:
+        waiter.start()
+    # Waiters are counted before they block on the leader
+    while group.get_stats()['coalesced'] < 3:
+        pass
+    release.set()
+    for thread in [leader] + waiters:
+        thread.join(5)
+
+    assert calls == [1]
+    assert results == [['game']] * 4
+    assert group.in_flight() == 0
+    assert group.get_stats()['by_type']['game_log'] == {'executed': 1, 'coalesced': 3, 'errors': 0}
+
+
+def test_single_flight_shares_the_leader_error():
+    group = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    errors = []
+
+    def fetch():
+        started.set()
+        release.wait(5)
+        raise TimeoutError("Timeout 30000ms exceeded")
+
+    def call():
+        try:
+            group.do((PLAYER, SEASON, 'game_log'), fetch)
+        except TimeoutError as e:
+            errors.append(e)
+
+    leader = threading.Thread(target=call)
+    leader.start()
+    assert started.wait(5)
+    waiter = threading.Thread(target=call)
+    waiter.start()
+    while group.get_stats()['coalesced'] < 1:
+        pass
+    release.set()
+    leader.join(5)
+    waiter.join(5)
+
+    assert len(errors) == 2
+    # The key is free again after a failure
+    assert group.do((PLAYER, SEASON, 'game_log'), lambda: 'retried') == 'retried'
+
+
+def test_origin_served_from_storage_keeps_its_age(cache):
+    tiered = make_tiered(cache)
+    fetched = datetime.now() - timedelta(hours=10)
+
+    value = tiered.get('player', PLAYER, SEASON, 'full_profile', origin=lambda: dict(PROFILE),
+                       origin_updated=lambda: fetched)
+    assert value == PROFILE
+
+    key = tiered._memory_key(tiered.key_for('player', PLAYER, SEASON, 'full_profile'), SEASON, 'full_profile')
+    assert cache.hot_cache.get(key, 'full_profile').last_updated == fetched
+    # Not persisted again as a new fetch
+    assert cache.get(tiered.key_for('player', PLAYER, SEASON, 'full_profile'), 'N/A', SEASON, 'full_profile',
+                     check_hot=False) is None
+
+
+def test_expired_origin_value_is_not_promoted(cache):
+    tiered = make_tiered(cache)
+
+    value = tiered.get('player', PLAYER, SEASON, 'full_profile', origin=lambda: dict(PROFILE),
+                       origin_updated=lambda: datetime.now() - timedelta(hours=30))
+    assert value == PROFILE
+    assert len(cache.hot_cache) == 0
+
+
+def test_set_game_log_drops_the_memory_copy(cache, make_game_log):
+    tiered = make_tiered(cache)
+    tiered.put('player', PLAYER, SEASON, 'game_log', make_game_log(3))
+    assert tiered.get('player', PLAYER, SEASON, 'game_log') is not None
+
+    cache.set_game_log(PLAYER, SEASON, make_game_log(5), 'statsmuse', 0.9)
+    cache_key = tiered._memory_key(tiered.key_for('player', PLAYER, SEASON, 'game_log'), SEASON, 'game_log')
+    assert cache.hot_cache.get(cache_key, 'game_log') is None
+    assert len(tiered.get('player', PLAYER, SEASON, 'game_log')) == 5
+
+
+def test_expired_fallback_log_is_not_served_as_fresh(cache, make_game_log, install_sources, monkeypatch):
+    from scrapers import player_data_fetcher, tiered_cache
+
+    tiered = make_tiered(cache)
+    monkeypatch.setattr(tiered_cache, '_tiered_cache', tiered)
+    cache.set_game_log(PLAYER, SEASON, make_game_log(5), 'statsmuse', 0.9)
+    cache.hot_cache.clear()
+    # Past the stale-serving limit, so the fetcher tries the sources first
+    fetched = datetime.now() - timedelta(hours=cache.MAX_STALE_GAME_LOG + 24)
+    with cache._transaction(write=True) as conn:
+        conn.execute("UPDATE game_log_sync SET last_updated = ?", (fetched.isoformat(),))
+    install_sources(statmuse=lambda: None, databallr=lambda: None, databallr_old=lambda: None)
+
+    games = player_data_fetcher.get_player_game_log(PLAYER, SEASON)
+
+    assert len(games) == 5
+    assert tiered.last_tier() == 'origin'
+    # Sources still down: the next lookup tries them again instead of a "fresh" memory hit
+    player_data_fetcher.get_player_game_log(PLAYER, SEASON)
+    assert tiered.last_tier() == 'origin'